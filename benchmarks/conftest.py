@@ -1,21 +1,203 @@
+"""Fixtures for the benchmarks.
+
+Most benchmarks run against a synthetic repository that is generated on the fly, so
+that they run offline and without any external checkout. Its size can be configured
+with the ``--synthetic-*`` options. The end-to-end benchmarks of
+:file:`test_check_dev_files.py` and :file:`test_serve.py` run against a real repository
+that is passed with ``--benchmark-target`` and are skipped without it.
+"""
+
+import json
+import os
+import subprocess
+from collections.abc import Iterator
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
 from _pytest.config.argparsing import Parser
 
+from compwa_policy.utilities.caching import clear_repository_caches
+from compwa_policy.utilities.precommit.revisions import get_revision_resolver
+
 
 def pytest_addoption(parser: Parser) -> None:
     parser.addoption("--benchmark-target", type=Path)
+    parser.addoption(
+        "--fleet-size",
+        type=int,
+        default=4,
+        help="Number of synthetic repositories for the fleet benchmark",
+    )
+    group = parser.getgroup("synthetic repository")
+    for option, default, help_text in [
+        ("files", 200, "Python modules"),
+        ("notebooks", 10, "Jupyter notebooks"),
+        ("hooks", 40, "pre-commit hooks"),
+        ("dependency-groups", 5, "dependency groups"),
+        ("poe-tasks", 20, "Poe the Poet tasks"),
+    ]:
+        group.addoption(
+            f"--synthetic-{option}",
+            type=int,
+            default=default,
+            help=f"Number of {help_text} in the synthetic repository",
+        )
+
+
+@dataclass(frozen=True)
+class RepositorySize:
+    """Number of each kind of entry in a synthetic repository."""
+
+    files: int
+    notebooks: int
+    hooks: int
+    dependency_groups: int
+    poe_tasks: int
+
+
+def create_synthetic_repository(directory: Path, size: RepositorySize) -> Path:
+    """Write and commit a Python repository that the checks can run against."""
+    package = directory / "src" / "synthetic"
+    package.mkdir(parents=True)
+    (package / "__init__.py").touch()
+    for i in range(size.files):
+        (package / f"module{i}.py").write_text(
+            f"def function{i}() -> int:\n    return {i}\n"
+        )
+    (directory / "tests").mkdir()
+    (directory / "tests" / "test_module.py").write_text(
+        "def test_nothing():\n    pass\n"
+    )
+    (directory / "docs").mkdir()
+    (directory / "docs" / "index.md").write_text("# Synthetic\n")
+    for i in range(size.notebooks):
+        notebook = {
+            "cells": [
+                {
+                    "cell_type": "code",
+                    "execution_count": None,
+                    "id": f"cell{i}",
+                    "metadata": {},
+                    "outputs": [],
+                    "source": [
+                        f"from synthetic.module{i % max(size.files, 1)} import *"
+                    ],
+                }
+            ],
+            "metadata": {},
+            "nbformat": 4,
+            "nbformat_minor": 5,
+        }
+        (directory / "docs" / f"notebook{i}.ipynb").write_text(json.dumps(notebook))
+    (directory / ".pre-commit-config.yaml").write_text(_create_precommit_config(size))
+    (directory / "pyproject.toml").write_text(_create_pyproject(size))
+    (directory / "README.md").write_text("# Synthetic\n")
+    subprocess.run(["git", "init", "-q"], cwd=directory, check=True)
+    subprocess.run(["git", "add", "-A"], cwd=directory, check=True)
+    subprocess.run(
+        ["git", "commit", "-qm", "init", "--no-verify"],
+        cwd=directory,
+        check=True,
+        env={
+            **os.environ,
+            "GIT_AUTHOR_NAME": "ComPWA",
+            "GIT_AUTHOR_EMAIL": "compwa@example.com",
+            "GIT_COMMITTER_NAME": "ComPWA",
+            "GIT_COMMITTER_EMAIL": "compwa@example.com",
+            "GIT_CONFIG_GLOBAL": os.devnull,
+        },
+    )
+    return directory
+
 
+def _create_precommit_config(size: RepositorySize) -> str:
+    hooks_per_repo = 4
+    n_repos = -(-size.hooks // hooks_per_repo)
+    lines = ["repos:"]
+    for i in range(n_repos):
+        lines += [
+            f"  - repo: https://github.com/synthetic/hooks{i}",
+            "    rev: v1.0.0",
+            "    hooks:",
+        ]
+        first = i * hooks_per_repo
+        last = min(first + hooks_per_repo, size.hooks)
+        lines += [f"      - id: hook{j}" for j in range(first, last)]
+        lines.append("")
+    return "\n".join(lines).rstrip() + "\n"
 
-def pytest_configure(config: pytest.Config) -> None:
-    target = config.getoption("benchmark_target")
-    writes_benchmark_results = config.getoption(
-        "benchmark_autosave"
-    ) or config.getoption("benchmark_json")
-    if writes_benchmark_results and target is None:
-        msg = "benchmark mode requires --benchmark-target=PATH"
-        raise pytest.UsageError(msg)
+
+def _create_pyproject(size: RepositorySize) -> str:
+    lines = [
+        "[build-system]",
+        'build-backend = "setuptools.build_meta"',
+        'requires = ["setuptools>=61.2"]',
+        "",
+        "[project]",
+        "classifiers = [",
+        '    "Programming Language :: Python :: 3.12",',
+        '    "Programming Language :: Python :: 3.13",',
+        "]",
+        'dependencies = ["attrs", "numpy"]',
+        'description = "Synthetic repository for benchmarks"',
+        'name = "synthetic"',
+        'requires-python = ">=3.12"',
+        'version = "0.1.0"',
+        "",
+        "[dependency-groups]",
+    ]
+    lines += [
+        f'group{i} = ["package{i}-a", "package{i}-b>=1.0"]'
+        for i in range(size.dependency_groups)
+    ]
+    lines += [
+        "",
+        "[tool.compwa.policy]",
+        'dev-python-version = "3.12"',
+        'package-manager = "uv"',
+        "",
+        "[tool.poe.tasks]",
+    ]
+    standard_tasks = ["doc", "doclive", "docnb", "docnblive", "nb", "test"]
+    lines += [f'{task}.cmd = "echo {task}"' for task in standard_tasks]
+    lines += [f'task{i}.cmd = "echo {i}"' for i in range(size.poe_tasks)]
+    return "\n".join(lines) + "\n"
+
+
+@pytest.fixture(scope="session")
+def repository_size(request: pytest.FixtureRequest) -> RepositorySize:
+    option = request.config.getoption
+    return RepositorySize(
+        files=option("synthetic_files"),
+        notebooks=option("synthetic_notebooks"),
+        hooks=option("synthetic_hooks"),
+        dependency_groups=option("synthetic_dependency_groups"),
+        poe_tasks=option("synthetic_poe_tasks"),
+    )
+
+
+@pytest.fixture(scope="session")
+def _synthetic_repository(
+    tmp_path_factory: pytest.TempPathFactory, repository_size: RepositorySize
+) -> Path:
+    directory = tmp_path_factory.mktemp("synthetic")
+    return create_synthetic_repository(directory, repository_size)
+
+
+@pytest.fixture
+def synthetic_repository(
+    _synthetic_repository: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Iterator[Path]:
+    """Work offline in the synthetic repository."""
+    monkeypatch.chdir(_synthetic_repository)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+    monkeypatch.setattr(get_revision_resolver(), "offline", True)
+    clear_repository_caches()
+    yield _synthetic_repository
+    clear_repository_caches()
 
 
 @pytest.fixture
@@ -31,3 +213,8 @@ def benchmark_target(request: pytest.FixtureRequest) -> Path:
         )
         raise RuntimeError(msg)
     return target
+
+
+@pytest.fixture
+def fleet_size(request: pytest.FixtureRequest) -> int:
+    return request.config.getoption("fleet_size")
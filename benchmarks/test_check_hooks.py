@@ -0,0 +1,49 @@
+import contextlib
+import subprocess
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from compwa_policy.cli._checks import CHECK_HOOKS, compute_context
+from compwa_policy.cli._options import build_arguments
+from compwa_policy.errors import PolicyError
+from compwa_policy.utilities.check_hook import LazyCheckHook
+from compwa_policy.utilities.precommit import ModifiablePrecommit
+from compwa_policy.utilities.pyproject import ModifiablePyproject
+from compwa_policy.utilities.session import Session
+
+
+@pytest.mark.benchmark(group="check-hooks")
+@pytest.mark.parametrize(
+    "hook", CHECK_HOOKS, ids=lambda hook: hook.module.removeprefix("compwa_policy.")
+)
+def test_check_hook(
+    benchmark: BenchmarkFixture, hook: LazyCheckHook, synthetic_repository: Path
+) -> None:
+    """Run one check in-process against a session with preloaded config files."""
+    args = build_arguments()
+    context = compute_context(args)
+    check = hook.load()
+
+    def create_session() -> tuple[tuple[Session], dict]:
+        session = Session(
+            precommit=ModifiablePrecommit.load(),
+            pyproject=ModifiablePyproject.load(),
+            dry_run=True,
+        )
+        return (session,), {}
+
+    def run(session: Session) -> None:
+        with session, contextlib.suppress(PolicyError):
+            check(session, args, context)
+
+    benchmark.pedantic(run, setup=create_session, rounds=5, warmup_rounds=1)
+    status = subprocess.run(
+        ["git", "status", "--porcelain"],
+        cwd=synthetic_repository,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert not status.stdout, f"{hook.module} wrote to the repository"
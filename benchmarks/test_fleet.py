@@ -0,0 +1,40 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from compwa_policy.cli.fleet import run_fleet
+from compwa_policy.utilities.precommit.revisions import get_revision_resolver
+
+
+def _create_repository(directory: Path) -> Path:
+    (directory / "src" / directory.name).mkdir(parents=True)
+    (directory / "src" / directory.name / "__init__.py").write_text("x = 1\n")
+    (directory / ".pre-commit-config.yaml").write_text("repos: []\n")
+    (directory / "pyproject.toml").write_text(
+        f'[project]\nname = "{directory.name}"\nrequires-python = ">=3.12"\n'
+    )
+    subprocess.run(["git", "init", "-q"], cwd=directory, check=True)
+    subprocess.run(["git", "add", "-A"], cwd=directory, check=True)
+    return directory
+
+
+@pytest.mark.benchmark(group="fleet")
+def test_fleet_throughput(
+    benchmark: BenchmarkFixture,
+    fleet_size: int,
+    tmp_path_factory: pytest.TempPathFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+    monkeypatch.setattr(get_revision_resolver(), "offline", True)
+
+    def create_fleet() -> tuple[tuple[list[Path]], dict]:
+        root = tmp_path_factory.mktemp("fleet")
+        directories = [_create_repository(root / f"repo{i}") for i in range(fleet_size)]
+        return (directories,), {"use_cache": False}
+
+    benchmark.extra_info["repositories"] = fleet_size
+    reports = benchmark.pedantic(run_fleet, setup=create_fleet, rounds=2)
+    assert [report.exit_code for report in reports] == [1] * fleet_size
@@ -0,0 +1,42 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from compwa_policy.utilities.match import matches_files, select_matching_patterns
+
+PATTERNS = [
+    "**/*.bib",
+    "**/*.ipynb",
+    "**/*.json",
+    "**/*.lock",
+    "**/*.svg",
+    "**/.cspell.json",
+    "**/.vscode/**",
+    "**/node_modules/**",
+    "*.egg-info",
+    ".constraints/*.txt",
+    "docs/_build",
+    "docs/_static/*.css",
+    "pixi.lock",
+    "tests/output/**",
+    "uv.lock",
+]
+FILES = [
+    f"src/package{i}/module{j}.{extension}"
+    for i in range(10)
+    for j in range(100)
+    for extension in ("py", "pyi", "md")
+] + ["pixi.lock", "docs/_static/style.css"]
+
+
+@pytest.mark.benchmark(group="filter-patterns")
+def test_per_pattern_matching(benchmark: BenchmarkFixture) -> None:
+    result = benchmark(
+        lambda: [pattern for pattern in PATTERNS if matches_files(pattern, FILES)]
+    )
+    assert result == ["**/*.lock", "docs/_static/*.css", "pixi.lock"]
+
+
+@pytest.mark.benchmark(group="filter-patterns")
+def test_batched_matching(benchmark: BenchmarkFixture) -> None:
+    result = benchmark(select_matching_patterns, PATTERNS, FILES)
+    assert result == ["**/*.lock", "docs/_static/*.css", "pixi.lock"]
@@ -0,0 +1,54 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from compwa_policy.utilities.precommit import ModifiablePrecommit
+from compwa_policy.utilities.precommit.getters import find_hook, find_repo
+
+CONFIG = "repos:\n" + "".join(
+    f"  - repo: https://github.com/example/repo{i}\n"
+    "    rev: v1.0.0\n"
+    "    hooks:\n" + "".join(f"      - id: hook{i}-{j}\n" for j in range(4))
+    for i in range(20)
+)
+SEARCHES = [
+    *(rf".*/repo{i}$" for i in range(0, 20, 3)),
+    r".*/(ComPWA\-)?policy",
+    r".*/nbhooks",
+]
+REMOVED_HOOKS = [f"hook{i}-9" for i in range(20)] + ["mypy", "pyright", "ruff"]
+
+
+def _scan_document(precommit: ModifiablePrecommit) -> None:
+    for pattern in SEARCHES:
+        find_repo(precommit.document, pattern)
+        find_hook(precommit.document, pattern)
+    for hook_id in REMOVED_HOOKS:
+        any(
+            hook.get("id") == hook_id
+            for repo in precommit.document.get("repos", [])
+            for hook in repo.get("hooks", [])
+        )
+
+
+def _use_index(precommit: ModifiablePrecommit) -> None:
+    for pattern in SEARCHES:
+        precommit.find_repo(pattern)
+        precommit.find_hook(pattern)
+    with precommit:
+        for hook_id in REMOVED_HOOKS:
+            precommit.remove_hook(hook_id)
+
+
+@pytest.mark.benchmark(group="precommit-lookups")
+def test_document_scan(benchmark: BenchmarkFixture) -> None:
+    """Scan the round-trip document for every lookup, like before the index."""
+    precommit = ModifiablePrecommit.load(CONFIG)
+    assert len(precommit.document["repos"]) == 20
+    benchmark(_scan_document, precommit)
+
+
+@pytest.mark.benchmark(group="precommit-lookups")
+def test_indexed_lookups(benchmark: BenchmarkFixture) -> None:
+    precommit = ModifiablePrecommit.load(CONFIG)
+    assert precommit.index.find_hook_position("hook19-3") == (19, 3)
+    benchmark(_use_index, precommit)
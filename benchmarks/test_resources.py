@@ -0,0 +1,143 @@
+from pathlib import Path
+
+import pytest
+import tomlkit
+import yaml
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from compwa_policy.utilities import CONFIG_PATH
+from compwa_policy.utilities.precommit import ModifiablePrecommit
+from compwa_policy.utilities.pyproject import (
+    ModifiablePyproject,
+    Pyproject,
+    has_dependency,
+)
+
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@pytest.fixture
+def pyproject_toml(synthetic_repository: Path) -> str:
+    return (synthetic_repository / CONFIG_PATH.pyproject).read_text()
+
+
+@pytest.fixture
+def large_pyproject_toml(pyproject_toml: str) -> str:
+    tasks = [f'large{i}.cmd = "echo {i}"' for i in range(2_000)]
+    return pyproject_toml + "\n".join(tasks) + "\n"
+
+
+@pytest.fixture
+def precommit_yaml(synthetic_repository: Path) -> str:
+    return (synthetic_repository / CONFIG_PATH.precommit).read_text()
+
+
+@pytest.mark.benchmark(group="toml")
+def test_parse_toml_readonly(benchmark: BenchmarkFixture, pyproject_toml: str) -> None:
+    pyproject = benchmark(Pyproject.load, pyproject_toml)
+    assert pyproject.get_package_name() == "synthetic"
+
+
+@pytest.mark.benchmark(group="toml")
+def test_parse_toml_roundtrip(benchmark: BenchmarkFixture, pyproject_toml: str) -> None:
+    pyproject = benchmark(ModifiablePyproject.load, pyproject_toml)
+    assert pyproject.get_package_name() == "synthetic"
+
+
+@pytest.mark.benchmark(group="toml")
+def test_dump_toml_roundtrip(benchmark: BenchmarkFixture, pyproject_toml: str) -> None:
+    pyproject = ModifiablePyproject.load(pyproject_toml)
+    assert benchmark(pyproject.dumps) == pyproject_toml
+
+
+@pytest.mark.benchmark(group="toml")
+def test_query_toml_dependencies(
+    benchmark: BenchmarkFixture, pyproject_toml: str
+) -> None:
+    pyproject = ModifiablePyproject.load(pyproject_toml)
+
+    def query() -> bool:
+        with pyproject:
+            pyproject.remove_dependencies(["black", "flake8", "pylint", "tox"])
+            return all(
+                has_dependency(pyproject, package)
+                for package in ("attrs", "numpy", "package0-a")
+            )
+
+    assert benchmark(query)
+    assert not pyproject.is_materialized
+
+
+def _query_toml(pyproject: ModifiablePyproject) -> bool:
+    """Read from a :code:`pyproject.toml` like a check that does not modify it."""
+    with pyproject:
+        tasks = pyproject.get_table("tool.poe.tasks", create=True)
+        return (
+            pyproject.get_package_name() == "synthetic"
+            and "large0" in tasks
+            and has_dependency(pyproject, "attrs")
+        )
+
+
+@pytest.mark.benchmark(group="toml-large")
+def test_query_large_toml_copy_on_write(
+    benchmark: BenchmarkFixture, large_pyproject_toml: str
+) -> None:
+    def query() -> bool:
+        pyproject = ModifiablePyproject.load(large_pyproject_toml)
+        return _query_toml(pyproject) and not pyproject.is_materialized
+
+    assert benchmark(query)
+
+
+@pytest.mark.benchmark(group="toml-large")
+def test_query_large_toml_roundtrip(
+    benchmark: BenchmarkFixture, large_pyproject_toml: str
+) -> None:
+    def query() -> bool:
+        pyproject = ModifiablePyproject(tomlkit.loads(large_pyproject_toml))
+        return _query_toml(pyproject)
+
+    assert benchmark(query)
+
+
+def _modify_toml(pyproject: ModifiablePyproject) -> str:
+    """Modify one table of a :code:`pyproject.toml` and render it again."""
+    with pyproject:
+        ruff = pyproject.get_table("tool.ruff", create=True)
+        ruff["preview"] = not ruff.get("preview", False)
+    return pyproject.dumps()
+
+
+@pytest.mark.benchmark(group="toml-large")
+def test_dump_large_toml_incremental(
+    benchmark: BenchmarkFixture, large_pyproject_toml: str
+) -> None:
+    pyproject = ModifiablePyproject.load(large_pyproject_toml)
+    assert "large1999.cmd" in benchmark(_modify_toml, pyproject)
+
+
+@pytest.mark.benchmark(group="toml-large")
+def test_dump_large_toml_roundtrip(
+    benchmark: BenchmarkFixture, large_pyproject_toml: str
+) -> None:
+    pyproject = ModifiablePyproject(tomlkit.loads(large_pyproject_toml))
+    assert "large1999.cmd" in benchmark(_modify_toml, pyproject)
+
+
+@pytest.mark.benchmark(group="yaml")
+def test_parse_yaml_readonly(benchmark: BenchmarkFixture, precommit_yaml: str) -> None:
+    config = benchmark(yaml.load, precommit_yaml, Loader=_YAML_LOADER)
+    assert config["repos"]
+
+
+@pytest.mark.benchmark(group="yaml")
+def test_parse_yaml_roundtrip(benchmark: BenchmarkFixture, precommit_yaml: str) -> None:
+    precommit = benchmark(ModifiablePrecommit.load, precommit_yaml)
+    assert precommit.document["repos"]
+
+
+@pytest.mark.benchmark(group="yaml")
+def test_dump_yaml_roundtrip(benchmark: BenchmarkFixture, precommit_yaml: str) -> None:
+    precommit = ModifiablePrecommit.load(precommit_yaml)
+    assert benchmark(precommit.dumps) == precommit_yaml
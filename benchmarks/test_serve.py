@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+_CLIENT = [sys.executable, "-m", "compwa_policy.client"]
+
+
+@pytest.fixture(scope="module")
+def socket_path(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Start a :program:`policy serve` daemon for the warm runs."""
+    path = tmp_path_factory.mktemp("daemon") / "policy.sock"
+    daemon = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "from compwa_policy.cli import main; main()",
+            "serve",
+            f"--socket={path}",
+        ],
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 60
+        while not path.exists():
+            if daemon.poll() is not None or time.monotonic() > deadline:
+                msg = "The policy daemon did not start"
+                raise RuntimeError(msg)
+            time.sleep(0.05)
+        yield path
+    finally:
+        daemon.terminate()
+        daemon.wait()
+
+
+def _run_client(benchmark_target: Path, socket_path: Path) -> None:
+    environment = {
+        **os.environ,
+        "COMPWA_POLICY_DEBUG": "0",
+        "COMPWA_POLICY_SOCKET": str(socket_path),
+    }
+    result = subprocess.run(
+        _CLIENT,
+        cwd=benchmark_target,
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+@pytest.mark.benchmark(group="daemon", min_rounds=5)
+def test_cold_start(
+    benchmark: BenchmarkFixture, benchmark_target: Path, tmp_path: Path
+) -> None:
+    """Run the checks in the client process, because no daemon is listening."""
+    benchmark(_run_client, benchmark_target, tmp_path / "missing.sock")
+
+
+@pytest.mark.benchmark(group="daemon", min_rounds=5)
+def test_warm_daemon(
+    benchmark: BenchmarkFixture, benchmark_target: Path, socket_path: Path
+) -> None:
+    """Forward the run to a daemon that has already imported the checks."""
+    _run_client(benchmark_target, socket_path)
+    benchmark(_run_client, benchmark_target, socket_path)
@@ -3,15 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from functools import cache
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import rtoml
-import yaml
-
 from compwa_policy.utilities import CONFIG_PATH
+from compwa_policy.utilities.caching import repository_cache
 from compwa_policy.utilities.match import is_committed
+from compwa_policy.utilities.precommit import load_precommit_config
+from compwa_policy.utilities.pyproject import load_pyproject_toml
+from compwa_policy.utilities.storage import get_storage
 
 if TYPE_CHECKING:
     from compwa_policy.config import PackageManagerChoice, TypeChecker
@@ -26,7 +25,7 @@ class RepositoryCharacterization:
     type_checkers: frozenset[TypeChecker]
 
 
-@cache
+@repository_cache
 def has_documentation() -> bool:
     if is_committed("docs/**", untracked=True):
         return True
@@ -35,12 +34,12 @@ def has_documentation() -> bool:
     return is_committed("conf.py", "**/conf.py", ":!:tests", untracked=True)
 
 
-@cache
+@repository_cache
 def has_notebooks() -> bool:
     return is_committed("*.ipynb", "**/*.ipynb", untracked=True)
 
 
-@cache
+@repository_cache
 def has_python_code() -> bool:
     return is_committed(
         "*.ipynb",
@@ -102,7 +101,8 @@ def detect_type_checkers(
 
 
 def _has_file(*paths: str) -> bool:
-    return any(Path(path).exists() for path in paths)
+    storage = get_storage()
+    return any(storage.exists(path) for path in paths)
 
 
 def _has_table(document: dict[str, Any], dotted_key: str) -> bool:
@@ -115,15 +115,15 @@ def _has_table(document: dict[str, Any], dotted_key: str) -> bool:
 
 
 def _load_pyproject() -> dict[str, Any]:
-    if not CONFIG_PATH.pyproject.exists():
+    if not get_storage().exists(CONFIG_PATH.pyproject):
         return {}
-    return rtoml.load(CONFIG_PATH.pyproject)
+    return load_pyproject_toml(CONFIG_PATH.pyproject, modifiable=False)
 
 
 def _precommit_hook_ids() -> set[str]:
-    if not CONFIG_PATH.precommit.exists():
+    if not get_storage().exists(CONFIG_PATH.precommit):
         return set()
-    document = yaml.safe_load(CONFIG_PATH.precommit.read_text()) or {}
+    document = load_precommit_config(CONFIG_PATH.precommit)
     return {
         hook["id"]
         for repo in document.get("repos", [])
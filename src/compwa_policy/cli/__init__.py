@@ -10,37 +10,79 @@ running
 
 The per-check modules in :mod:`compwa_policy` are unchanged; only the dispatch and
 option parsing live here. Running :program:`policy` without a subcommand runs every
-check, exactly like the :doc:`/check-dev-files` pre-commit hook.
+check, exactly like the :doc:`/check-dev-files` pre-commit hook. The
+:program:`check-dev-files` command itself additionally accepts the modified files that
+pre-commit passes, so that it only runs the checks that these files trigger. Arguments
+that only :program:`policy` understands, a subcommand or ``--rev``, are still forwarded
+to it, because :program:`check-dev-files` used to be an alias of :program:`policy`.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import json
+import sys
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
 
 import rich
 import typer
 from rich.tree import Tree
 from typer.core import TyperGroup
 
-from compwa_policy.cli import bootstrap, env, github, migrate, nb, python, repo
+from compwa_policy.cli import (
+    bootstrap,
+    env,
+    fleet,
+    github,
+    migrate,
+    nb,
+    python,
+    repo,
+    serve,
+    watch,
+)
 from compwa_policy.cli import format as _format
 from compwa_policy.cli._checks import run_all
 from compwa_policy.cli._options import (
+    AllChecks,
     DevPythonVersion,
+    Diff,
     DocAptPackages,
+    Filenames,
+    Jobs,
+    MirrorDir,
+    NoCache,
     NoRuff,
+    Offline,
     PackageManager,
+    Profile,
+    ProfileJson,
+    ProfileTrace,
     PytestSingleThreaded,
     Python,
     RepoName,
     RepoOrganization,
     RepoTitle,
+    Rev,
+    RevisionTtl,
     build_arguments,
 )
+from compwa_policy.utilities.instrumentation import (
+    format_table,
+    profiling,
+    to_chrome_trace,
+    to_json,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
     from typer._click import Command, Context, HelpFormatter
 
+    from compwa_policy.utilities.instrumentation import HookProfile
+
 
 class _HelpGroup(TyperGroup):
     """Append a Rich tree of the command hierarchy to the top-level help."""
@@ -79,6 +121,9 @@ app.command("format", no_args_is_help=False)(_format.format_)
 app.command("repo", no_args_is_help=False)(repo.repo)
 app.command("migrate", no_args_is_help=False)(migrate.migrate)
 app.command("bootstrap", no_args_is_help=False)(bootstrap.bootstrap)
+app.command("fleet")(fleet.fleet)
+app.command("serve")(serve.serve)
+app.command("watch")(watch.watch)
 
 
 @app.callback(invoke_without_command=True)
@@ -93,6 +138,16 @@ def run_everything(  # noqa: PLR0917
     no_ruff: NoRuff = None,
     pytest_single_threaded: PytestSingleThreaded = None,
     doc_apt_packages: DocAptPackages = None,
+    no_cache: NoCache = False,
+    diff: Diff = False,
+    rev: Rev = None,
+    jobs: Jobs = None,
+    offline: Offline = False,
+    mirror_dir: MirrorDir = None,
+    revision_ttl: RevisionTtl = 24,
+    profile: Profile = False,
+    profile_json: ProfileJson = None,
+    profile_trace: ProfileTrace = None,
 ) -> None:
     """Run every check at once (this is what the ``check-dev-files`` hook does).
 
@@ -103,7 +158,17 @@ def run_everything(  # noqa: PLR0917
     """
     if ctx.invoked_subcommand is not None:
         return
-    args = build_arguments(
+    _run_all(
+        use_cache=not no_cache,
+        diff=diff,
+        rev=rev,
+        jobs=jobs,
+        offline=offline,
+        mirror_dir=mirror_dir,
+        revision_ttl=revision_ttl,
+        profile=profile,
+        profile_json=profile_json,
+        profile_trace=profile_trace,
         python=python,
         dev_python_version=dev_python_version,
         package_manager=package_manager,
@@ -114,7 +179,132 @@ def run_everything(  # noqa: PLR0917
         pytest_single_threaded=pytest_single_threaded,
         doc_apt_packages=doc_apt_packages,
     )
-    raise typer.Exit(code=run_all(args))
+
+
+hook_app = typer.Typer(
+    help="Standardize the developer setup for the files that were modified.",
+    add_completion=False,
+)
+
+
+@hook_app.command()
+def check_dev_files(  # noqa: PLR0917
+    filenames: Filenames = None,
+    all_checks: AllChecks = False,
+    python: Python = None,
+    dev_python_version: DevPythonVersion = None,
+    package_manager: PackageManager = None,
+    repo_name: RepoName = None,
+    repo_organization: RepoOrganization = None,
+    repo_title: RepoTitle = None,
+    no_ruff: NoRuff = None,
+    pytest_single_threaded: PytestSingleThreaded = None,
+    doc_apt_packages: DocAptPackages = None,
+    no_cache: NoCache = False,
+    diff: Diff = False,
+    jobs: Jobs = None,
+    offline: Offline = False,
+    mirror_dir: MirrorDir = None,
+    revision_ttl: RevisionTtl = 24,
+    profile: Profile = False,
+    profile_json: ProfileJson = None,
+    profile_trace: ProfileTrace = None,
+) -> None:
+    """Run the checks that are triggered by the modified files.
+
+    This is the entry point of the ``check-dev-files`` pre-commit hook. It accepts the
+    same options as :program:`policy` without a subcommand, plus the file names that
+    pre-commit passes. Checks whose trigger files were not modified are skipped, unless
+    ``--all`` is given or no file names are passed at all.
+    """
+    _run_all(
+        filenames=None if all_checks or not filenames else filenames,
+        use_cache=not no_cache,
+        diff=diff,
+        jobs=jobs,
+        offline=offline,
+        mirror_dir=mirror_dir,
+        revision_ttl=revision_ttl,
+        profile=profile,
+        profile_json=profile_json,
+        profile_trace=profile_trace,
+        python=python,
+        dev_python_version=dev_python_version,
+        package_manager=package_manager,
+        repo_name=repo_name,
+        repo_organization=repo_organization,
+        repo_title=repo_title,
+        no_ruff=no_ruff,
+        pytest_single_threaded=pytest_single_threaded,
+        doc_apt_packages=doc_apt_packages,
+    )
+
+
+def _run_all(
+    filenames: list[Path] | None = None,
+    *,
+    use_cache: bool = True,
+    diff: bool = False,
+    rev: str | None = None,
+    jobs: int | None = None,
+    offline: bool = False,
+    mirror_dir: Path | None = None,
+    revision_ttl: float = 24,
+    profile: bool = False,
+    profile_json: Path | None = None,
+    profile_trace: Path | None = None,
+    **options: Any,
+) -> None:
+    from compwa_policy.utilities.precommit.revisions import get_revision_resolver  # noqa: PLC0415
+
+    resolver = get_revision_resolver()
+    resolver.offline = offline
+    resolver.mirror_dir = mirror_dir
+    resolver.ttl = timedelta(hours=revision_ttl)
+    enabled = profile or profile_json is not None or profile_trace is not None
+    with _open_storage(rev), profiling(enabled) as profiler:
+        args = build_arguments(**options)
+        exit_code = run_all(
+            args,
+            filenames,
+            use_cache=use_cache,
+            diff=diff,
+            dry_run=rev is not None,
+            jobs=jobs,
+        )
+    if profiler is not None:
+        _report_profiles(profiler.profiles, profile, profile_json, profile_trace)
+    raise typer.Exit(code=exit_code)
+
+
+@contextmanager
+def _open_storage(rev: str | None) -> Generator[None, None, None]:
+    """Read the files of the commit *rev*, if given, instead of the working tree."""
+    if rev is None:
+        yield
+        return
+    from compwa_policy.utilities.storage import GitTree, use_storage  # noqa: PLC0415
+
+    try:
+        tree = GitTree(rev)
+    except ValueError as exception:
+        raise typer.BadParameter(str(exception), param_hint="--rev") from exception
+    with tree, use_storage(tree):
+        yield
+
+
+def _report_profiles(
+    profiles: list[HookProfile],
+    table: bool,
+    json_path: Path | None,
+    trace_path: Path | None,
+) -> None:
+    if table:
+        print(format_table(profiles), file=sys.stderr)  # noqa: T201
+    if json_path is not None:
+        json_path.write_text(json.dumps(to_json(profiles), indent=2) + "\n")
+    if trace_path is not None:
+        trace_path.write_text(json.dumps(to_chrome_trace(profiles)) + "\n")
 
 
 def get_click_command() -> Command:
@@ -131,5 +321,28 @@ def main() -> None:
     app()
 
 
+def check_dev_files_main() -> None:
+    if _is_policy_invocation(sys.argv[1:]):
+        app(prog_name="check-dev-files")
+        return
+    hook_app()
+
+
+def _is_policy_invocation(argv: list[str]) -> bool:
+    """Check whether *argv* uses a subcommand or an option that only `app` has.
+
+    >>> _is_policy_invocation(["nb", "--no-binder"])
+    True
+    >>> _is_policy_invocation(["--rev=origin/main"])
+    True
+    >>> _is_policy_invocation(["--all", "pyproject.toml"])
+    False
+    """
+    commands = {command.name for command in app.registered_commands}
+    if argv and argv[0] in commands:
+        return True
+    return any(arg == "--rev" or arg.startswith("--rev=") for arg in argv)
+
+
 if __name__ == "__main__":
     main()
@@ -1,57 +1,54 @@
-"""Canonical check dispatch shared by the run-all hook and the :program:`policy` subcommands.
+"""Canonical check dispatch shared by the hook and the :program:`policy` subcommands.
 
 :data:`CHECK_HOOKS` lists every check exactly once, in the order the original
 ``check-dev-files`` hook ran them. Each definition carries its subcommand group and the
-file metadata declared by its check module. :func:`run_all` runs every group; a
-subcommand runs only its own. The union of the same definitions produces the pre-commit
-file filter.
+files that trigger it, which are declared nowhere else, but the check module itself is
+only imported once its hook runs. This keeps :program:`policy --help` and the
+subcommands that run a single group from importing every check module and its
+dependencies. :func:`run_all` runs every group; a subcommand runs only its own. The
+union of the same definitions produces the pre-commit file filter, and each individual
+definition decides whether the hook is triggered by the files that pre-commit passes on
+a commit.
 """
 
 from __future__ import annotations
 
-from typing import get_args
+from typing import TYPE_CHECKING, get_args
 
 import typer
 
 from compwa_policy import Arguments, _get_environment_variables, _to_list
-from compwa_policy.characterization import has_notebooks, has_python_code
-from compwa_policy.env import conda, direnv, pixi, uv
-from compwa_policy.errors import PolicyError
-from compwa_policy.format import cspell, editorconfig, precommit, prettier, toml
-from compwa_policy.github import (
-    dependabot,
-    labels,
-    release_drafter,
-    upgrade_lock,
-    workflows,
-)
-from compwa_policy.nb import binder, jupyter, nbstripout
-from compwa_policy.python import (
-    black,
-    mypy,
-    pyproject,
-    pyright,
-    pytest,
-    pyupgrade,
-    ruff,
-    ty,
-)
-from compwa_policy.repo import (
-    citation,
-    commitlint,
-    deprecated,
-    gitpod,
-    poe,
-    readthedocs,
-    vscode,
+from compwa_policy.cli._fingerprint import (
+    compute_fingerprint,
+    has_fingerprint,
+    store_fingerprint,
 )
+from compwa_policy.errors import PolicyError
 from compwa_policy.utilities import CONFIG_PATH
-from compwa_policy.utilities.check_hook import CheckContext, FileSet, Group
-from compwa_policy.utilities.pyproject import Pyproject
-from compwa_policy.utilities.session import Session
+from compwa_policy.utilities.caching import get_repository_cache_dir, get_user_cache_dir
+from compwa_policy.utilities.check_hook import (
+    CheckContext,
+    FileSet,
+    Group,
+    LazyCheckHook,
+)
+from compwa_policy.utilities.instrumentation import measure
+from compwa_policy.utilities.parse_cache import get_parse_cache
+from compwa_policy.utilities.schedule import build_dependencies, run_in_parallel
+from compwa_policy.utilities.storage import get_storage
+from compwa_policy.utilities.templates import get_template_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+    from compwa_policy.cli._memo import HookMemo
+    from compwa_policy.utilities.session import Session
 
 
 def compute_context(args: Arguments) -> CheckContext:
+    from compwa_policy.characterization import has_notebooks, has_python_code  # noqa: PLC0415
+
     return CheckContext(
         is_python_repo=has_python_code() if args.python is None else args.python,
         has_notebooks=has_notebooks(),
@@ -62,7 +59,9 @@ def compute_context(args: Arguments) -> CheckContext:
 
 def check_dev_python_version(args: Arguments) -> int:
     """Return ``1`` if the requested dev Python version is not supported."""
-    if CONFIG_PATH.pyproject.exists():
+    from compwa_policy.utilities.pyproject import Pyproject  # noqa: PLC0415
+
+    if get_storage().exists(CONFIG_PATH.pyproject):
         supported_versions = Pyproject.load().get_supported_python_versions()
         if supported_versions and args.dev_python_version not in supported_versions:
             print(  # noqa: T201
@@ -76,47 +75,556 @@ def check_dev_python_version(args: Arguments) -> int:
 
 ALL_GROUPS: frozenset[Group] = frozenset(get_args(Group))
 CHECK_HOOKS = (
-    citation.check,
-    commitlint.check,
-    conda.check,
-    editorconfig.check,
-    labels.check,
-    workflows.check,
-    binder.check,
-    jupyter.check,
-    nbstripout.check,
-    pixi.check,
-    direnv.check,
-    toml.check,
-    poe.check,
-    prettier.check,
-    black.check,
-    release_drafter.check,
-    pyproject.check,
-    mypy.check,
-    pyright.check,
-    ty.check,
-    pytest.check,
-    pyupgrade.check,
-    ruff.check,
-    upgrade_lock.check,
-    dependabot.check,
-    readthedocs.check,
-    deprecated.check,
-    vscode.check,
-    gitpod.check,
-    precommit.check,
-    uv.check,
-    cspell.check,
+    LazyCheckHook(
+        "compwa_policy.repo.citation",
+        group="repo",
+        files=FileSet.create(
+            CONFIG_PATH.citation,
+            CONFIG_PATH.zenodo,
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.vscode_settings,
+        ),
+        writes=FileSet.create(
+            CONFIG_PATH.citation,
+            CONFIG_PATH.zenodo,
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.vscode_extensions,
+            CONFIG_PATH.vscode_settings,
+        ),
+        precommit_repos=("https://github.com/python-jsonschema/check-jsonschema",),
+    ),
+    LazyCheckHook(
+        "compwa_policy.repo.commitlint",
+        group="repo",
+        files=FileSet.create("commitlint.config.js"),
+        writes=FileSet.create("commitlint.config.js"),
+    ),
+    LazyCheckHook(
+        "compwa_policy.env.conda",
+        group="env",
+        files=FileSet.create(
+            CONFIG_PATH.conda,
+            CONFIG_PATH.gitignore,
+            CONFIG_PATH.pyproject,
+            directories=[CONFIG_PATH.pip_constraints],
+        ),
+        writes=FileSet.create(CONFIG_PATH.conda, CONFIG_PATH.gitignore),
+    ),
+    LazyCheckHook(
+        "compwa_policy.format.editorconfig",
+        group="format",
+        files=FileSet.create(CONFIG_PATH.editorconfig, CONFIG_PATH.precommit),
+        writes=FileSet.create(CONFIG_PATH.precommit),
+        precommit_repos=(
+            "https://github.com/editorconfig-checker/editorconfig-checker.python",
+        ),
+    ),
+    LazyCheckHook(
+        "compwa_policy.github.labels",
+        group="github",
+        files=FileSet.create(
+            "labels.toml", patterns=["(.*/)?requirements.*\\.(in|txt)"]
+        ),
+        writes=FileSet.create(
+            "labels.toml", patterns=["(.*/)?requirements.*\\.(in|txt)"]
+        ),
+    ),
+    LazyCheckHook(
+        "compwa_policy.github.workflows",
+        group="github",
+        files=FileSet.create(
+            CONFIG_PATH.codecov,
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.readthedocs,
+            ".python-version",
+            directories=[
+                CONFIG_PATH.github_workflow_dir.parent,
+                CONFIG_PATH.pip_constraints,
+            ],
+        ),
+        writes=FileSet.create(
+            CONFIG_PATH.vscode_extensions,
+            CONFIG_PATH.vscode_settings,
+            directories=[CONFIG_PATH.github_workflow_dir],
+        ),
+        probes=FileSet.create("tests", "tests/output"),
+    ),
+    LazyCheckHook(
+        "compwa_policy.nb.binder",
+        group="nb",
+        files=FileSet.create(
+            CONFIG_PATH.pixi_toml,
+            CONFIG_PATH.pyproject,
+            directories=[CONFIG_PATH.binder],
+        ),
+        writes=FileSet.create(directories=[CONFIG_PATH.binder]),
+    ),
+    LazyCheckHook(
+        "compwa_policy.nb.jupyter",
+        group="nb",
+        files=FileSet.create(
+            CONFIG_PATH.precommit, CONFIG_PATH.pyproject, CONFIG_PATH.vscode_extensions
+        ),
+        writes=FileSet.create(CONFIG_PATH.pyproject, CONFIG_PATH.vscode_extensions),
+    ),
+    LazyCheckHook(
+        "compwa_policy.nb.nbstripout",
+        group="nb",
+        files=FileSet.create(CONFIG_PATH.precommit),
+        writes=FileSet.create(CONFIG_PATH.precommit),
+        precommit_repos=("https://github.com/kynan/nbstripout",),
+    ),
+    LazyCheckHook(
+        "compwa_policy.env.pixi",
+        group="env",
+        files=FileSet.create(
+            CONFIG_PATH.conda,
+            CONFIG_PATH.gitattributes,
+            CONFIG_PATH.gitignore,
+            CONFIG_PATH.pixi_lock,
+            CONFIG_PATH.pixi_toml,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.vscode_settings,
+        ),
+        writes=FileSet.create(
+            CONFIG_PATH.gitattributes,
+            CONFIG_PATH.gitignore,
+            CONFIG_PATH.pixi_lock,
+            CONFIG_PATH.pixi_toml,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.readme,
+            CONFIG_PATH.vscode_settings,
+        ),
+    ),
+    LazyCheckHook(
+        "compwa_policy.env.direnv",
+        group="env",
+        files=FileSet.create(
+            CONFIG_PATH.envrc,
+            CONFIG_PATH.conda,
+            CONFIG_PATH.pixi_toml,
+            CONFIG_PATH.pyproject,
+        ),
+        writes=FileSet.create(CONFIG_PATH.envrc),
+    ),
+    LazyCheckHook(
+        "compwa_policy.format.toml",
+        group="format",
+        files=FileSet.create(
+            CONFIG_PATH.pixi_toml,
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.taplo,
+            CONFIG_PATH.vscode_extensions,
+            "taplo.toml",
+            ".tombi.toml",
+            "tombi.toml",
+            patterns=[".*\\.toml"],
+        ),
+        writes=FileSet.create(
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.taplo,
+            CONFIG_PATH.vscode_extensions,
+            CONFIG_PATH.vscode_settings,
+            "taplo.toml",
+            ".tombi.toml",
+            "tombi.toml",
+        ),
+        probes=FileSet.create("compwa-policy.schema.json"),
+        precommit_repos=(
+            "https://github.com/ComPWA/taplo-pre-commit",
+            "https://github.com/pappasam/toml-sort",
+            "https://github.com/tombi-toml/tombi-pre-commit",
+        ),
+    ),
+    LazyCheckHook(
+        "compwa_policy.repo.poe",
+        group="repo",
+        files=FileSet.create(
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.gitignore,
+            CONFIG_PATH.precommit,
+            patterns=["(.*/)?_quarto\\.yml"],
+        ),
+        writes=FileSet.create(CONFIG_PATH.gitignore, CONFIG_PATH.pyproject),
+        probes=FileSet.create("tests"),
+    ),
+    LazyCheckHook(
+        "compwa_policy.format.prettier",
+        group="format",
+        files=FileSet.create(
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.prettier_ignore,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.readme,
+            CONFIG_PATH.vscode_extensions,
+            CONFIG_PATH.pixi_lock,
+        ),
+        writes=FileSet.create(
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.prettier_ignore,
+            CONFIG_PATH.readme,
+            CONFIG_PATH.vscode_extensions,
+            ".prettierrc",
+            ".prettierrc.json",
+            ".prettierrc.json5",
+            ".prettierrc.toml",
+            ".prettierrc.yaml",
+            ".prettierrc.yml",
+        ),
+    ),
+    LazyCheckHook(
+        "compwa_policy.python.black",
+        group="python",
+        files=FileSet.create(
+            CONFIG_PATH.precommit, CONFIG_PATH.pyproject, CONFIG_PATH.vscode_settings
+        ),
+        writes=FileSet.create(
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.vscode_extensions,
+            CONFIG_PATH.vscode_settings,
+        ),
+        precommit_repos=("https://github.com/psf/black-pre-commit-mirror",),
+    ),
+    LazyCheckHook(
+        "compwa_policy.github.release_drafter",
+        group="github",
+        files=FileSet.create(
+            CONFIG_PATH.readthedocs,
+            directories=[CONFIG_PATH.github_workflow_dir.parent],
+        ),
+        writes=FileSet.create(
+            CONFIG_PATH.release_drafter_config, CONFIG_PATH.release_drafter_workflow
+        ),
+    ),
+    LazyCheckHook(
+        "compwa_policy.python.pyproject",
+        group="python",
+        files=FileSet.create(CONFIG_PATH.pyproject),
+        writes=FileSet.create(CONFIG_PATH.pyproject),
+        probes=FileSet.create("LICENSE", "tests"),
+    ),
+    LazyCheckHook(
+        "compwa_policy.python.mypy",
+        group="python",
+        files=FileSet.create(
+            CONFIG_PATH.gitignore,
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.readme,
+            CONFIG_PATH.vscode_extensions,
+            CONFIG_PATH.vscode_settings,
+        ),
+        writes=FileSet.create(
+            CONFIG_PATH.gitignore,
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.readme,
+            CONFIG_PATH.vscode_extensions,
+            CONFIG_PATH.vscode_settings,
+            ".mypy.ini",
+        ),
+    ),
+    LazyCheckHook(
+        "compwa_policy.python.pyright",
+        group="python",
+        files=FileSet.create(
+            CONFIG_PATH.gitignore,
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.vscode_extensions,
+            CONFIG_PATH.vscode_settings,
+            "pyrightconfig.json",
+        ),
+        writes=FileSet.create(
+            CONFIG_PATH.gitignore,
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.vscode_extensions,
+            CONFIG_PATH.vscode_settings,
+            "pyrightconfig.json",
+        ),
+    ),
+    LazyCheckHook(
+        "compwa_policy.python.ty",
+        group="python",
+        files=FileSet.create(
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.readme,
+            CONFIG_PATH.vscode_extensions,
+            CONFIG_PATH.vscode_settings,
+            "ty.toml",
+        ),
+        writes=FileSet.create(
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.readme,
+            CONFIG_PATH.vscode_extensions,
+            CONFIG_PATH.vscode_settings,
+            "ty.toml",
+        ),
+        precommit_repos=("https://github.com/astral-sh/ty-pre-commit",),
+    ),
+    LazyCheckHook(
+        "compwa_policy.python.pytest",
+        group="python",
+        files=FileSet.create(
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.pytest_ini,
+            CONFIG_PATH.vscode_settings,
+        ),
+        writes=FileSet.create(
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.pytest_ini,
+            CONFIG_PATH.vscode_extensions,
+            CONFIG_PATH.vscode_settings,
+        ),
+    ),
+    LazyCheckHook(
+        "compwa_policy.python.pyupgrade",
+        group="python",
+        files=FileSet.create(CONFIG_PATH.precommit, CONFIG_PATH.pyproject),
+        writes=FileSet.create(CONFIG_PATH.precommit),
+        precommit_repos=("https://github.com/asottile/pyupgrade",),
+    ),
+    LazyCheckHook(
+        "compwa_policy.python.ruff",
+        group="python",
+        files=FileSet.create(
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.readme,
+            CONFIG_PATH.vscode_extensions,
+            CONFIG_PATH.vscode_settings,
+            ".flake8",
+            ".pydocstyle",
+            ".pylintrc",
+            "docs/.pydocstyle",
+            "tests/.pydocstyle",
+        ),
+        writes=FileSet.create(
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.readme,
+            CONFIG_PATH.vscode_extensions,
+            CONFIG_PATH.vscode_settings,
+            ".flake8",
+            ".pydocstyle",
+            ".pylintrc",
+            "docs/.pydocstyle",
+            "tests/.pydocstyle",
+        ),
+        probes=FileSet.create(
+            "benchmarks", "docs", "docs/conf.py", "setup.py", "src", "tests"
+        ),
+        precommit_repos=("https://github.com/astral-sh/ruff-pre-commit",),
+    ),
+    LazyCheckHook(
+        "compwa_policy.github.dependabot",
+        group="github",
+        files=FileSet.create(
+            CONFIG_PATH.precommit,
+            "uv.lock",
+            directories=[CONFIG_PATH.github_workflow_dir.parent],
+            patterns=["(.*/)?Manifest\\.toml"],
+        ),
+        writes=FileSet.create(
+            CONFIG_PATH.github_workflow_dir.parent / "dependabot.yml"
+        ),
+    ),
+    LazyCheckHook(
+        "compwa_policy.github.upgrade_lock",
+        group="github",
+        files=FileSet.create(
+            CONFIG_PATH.precommit,
+            directories=[
+                CONFIG_PATH.github_workflow_dir.parent,
+                CONFIG_PATH.pip_constraints,
+            ],
+        ),
+        writes=FileSet.create(
+            CONFIG_PATH.precommit,
+            directories=[CONFIG_PATH.github_workflow_dir, CONFIG_PATH.pip_constraints],
+        ),
+    ),
+    LazyCheckHook(
+        "compwa_policy.repo.readthedocs",
+        group="repo",
+        files=FileSet.create(
+            CONFIG_PATH.readthedocs,
+            CONFIG_PATH.pyproject,
+            "docs/conf.py",
+            directories=[CONFIG_PATH.pip_constraints],
+            patterns=["(.*/)?_quarto\\.yml"],
+        ),
+        writes=FileSet.create(CONFIG_PATH.readthedocs),
+    ),
+    LazyCheckHook(
+        "compwa_policy.repo.deprecated",
+        group="repo",
+        files=FileSet.create(
+            CONFIG_PATH.gitignore,
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.vscode_extensions,
+            ".markdownlint.json",
+            ".markdownlint.yaml",
+            "doc/_relink_references.py",
+            "docs/_relink_references.py",
+            directories=[CONFIG_PATH.github_workflow_dir.parent],
+        ),
+        writes=FileSet.create(
+            CONFIG_PATH.gitignore,
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.vscode_extensions,
+            ".github/pull_request_template.md",
+            ".markdownlint.json",
+            ".markdownlint.yaml",
+            directories=[".github/ISSUE_TEMPLATE"],
+        ),
+    ),
+    LazyCheckHook(
+        "compwa_policy.repo.vscode",
+        group="repo",
+        files=FileSet.create(
+            CONFIG_PATH.envrc, directories=[CONFIG_PATH.pip_constraints, ".vscode"]
+        ),
+        writes=FileSet.create(directories=[".vscode"]),
+        probes=FileSet.create("docs", "tests"),
+    ),
+    LazyCheckHook(
+        "compwa_policy.repo.gitpod",
+        group="repo",
+        files=FileSet.create(
+            CONFIG_PATH.gitpod,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.readme,
+            CONFIG_PATH.vscode_extensions,
+            directories=[CONFIG_PATH.pip_constraints],
+        ),
+        writes=FileSet.create(CONFIG_PATH.gitpod, CONFIG_PATH.readme),
+    ),
+    LazyCheckHook(
+        "compwa_policy.format.precommit",
+        group="format",
+        files=FileSet.create(
+            CONFIG_PATH.precommit, CONFIG_PATH.conda, CONFIG_PATH.pyproject
+        ),
+        writes=FileSet.create(
+            CONFIG_PATH.conda, CONFIG_PATH.precommit, CONFIG_PATH.pyproject
+        ),
+        precommit_repos=("https://github.com/ComPWA/nbhooks",),
+    ),
+    LazyCheckHook(
+        "compwa_policy.env.uv",
+        group="env",
+        files=FileSet.create(
+            CONFIG_PATH.editorconfig,
+            CONFIG_PATH.pixi_toml,
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.readme,
+            CONFIG_PATH.vscode_settings,
+            ".python-version",
+            "CONTRIBUTING.md",
+            "uv.lock",
+            directories=[CONFIG_PATH.pip_constraints],
+        ),
+        writes=FileSet.create(
+            CONFIG_PATH.editorconfig,
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.readme,
+            CONFIG_PATH.vscode_settings,
+            ".python-version",
+            "CONTRIBUTING.md",
+            "uv.lock",
+            directories=[CONFIG_PATH.pip_constraints],
+        ),
+    ),
+    LazyCheckHook(
+        "compwa_policy.format.cspell",
+        group="format",
+        files=FileSet.create(
+            CONFIG_PATH.cspell,
+            CONFIG_PATH.editorconfig,
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.pyproject,
+            CONFIG_PATH.readme,
+            CONFIG_PATH.vscode_extensions,
+            "cspell.json",
+        ),
+        writes=FileSet.create(
+            CONFIG_PATH.cspell,
+            CONFIG_PATH.editorconfig,
+            CONFIG_PATH.precommit,
+            CONFIG_PATH.readme,
+            CONFIG_PATH.vscode_extensions,
+            "cspell.json",
+        ),
+        precommit_repos=("https://github.com/streetsidesoftware/cspell-cli",),
+    ),
 )
-CHECK_DEV_FILES_PATTERN = FileSet.union(
-    tuple(hook.files for hook in CHECK_HOOKS)
-).to_regex()
+CHECK_DEV_FILES = FileSet.union(tuple(hook.files for hook in CHECK_HOOKS))
+CHECK_DEV_FILES_PATTERN = CHECK_DEV_FILES.to_regex()
+
+
+def run_all(
+    args: Arguments,
+    filenames: Iterable[Path | str] | None = None,
+    *,
+    use_cache: bool = True,
+    diff: bool = False,
+    dry_run: bool = False,
+    jobs: int | None = None,
+) -> int:
+    """Run every check at once, as the ``check-dev-files`` hook does.
+
+    If *filenames* are given (as pre-commit passes them), only the checks whose
+    :class:`.FileSet` matches at least one of them are run.
+
+    A complete run that does not change anything stores a fingerprint of its inputs
+    (see ``_fingerprint``). The next complete run with the same fingerprint exits
+    immediately. Runs with *filenames* neither compute nor store the fingerprint,
+    because it covers all files in the repository. Otherwise, each check whose own
+    inputs did not change replays its recorded changes (see `.HookMemo`). Set
+    *use_cache* to `False` to ignore the stored fingerprint, the memo of the checks,
+    and the persistent parse cache.
 
+    With *diff*, the changes are printed as a unified diff instead of being written
+    (see `.Session.diff`). Such a run leaves the repository untouched, so it neither
+    writes to the caches nor stores a fingerprint. The same holds for a *dry_run*,
+    which only reports the changes. This is the only kind of run that is possible on a
+    `.GitTree` (see :func:`.use_storage`).
 
-def run_all(args: Arguments) -> int:
-    """Run every check at once, as the ``check-dev-files`` hook does."""
-    return _run(args, ALL_GROUPS)
+    Checks that do not share any files run in up to *jobs* threads (see
+    `.run_checks`).
+    """
+    if filenames is not None:
+        filenames = tuple(filenames)
+        if not select_hooks(ALL_GROUPS, filenames):
+            return 0
+    if not use_cache or dry_run or filenames is not None:
+        return _run(
+            args,
+            ALL_GROUPS,
+            filenames,
+            use_cache=use_cache,
+            diff=diff,
+            dry_run=dry_run,
+            jobs=jobs,
+        )
+    fingerprint = compute_fingerprint(args, CHECK_DEV_FILES)
+    if has_fingerprint(fingerprint):
+        return 0
+    exit_code = _run(args, ALL_GROUPS, diff=diff, jobs=jobs)
+    if exit_code == 0 and not diff:
+        store_fingerprint(fingerprint)
+    return exit_code
 
 
 def dispatch(args: Arguments, group: Group) -> None:
@@ -124,17 +632,64 @@ def dispatch(args: Arguments, group: Group) -> None:
     raise typer.Exit(code=_run(args, frozenset({group})))
 
 
-def _run(args: Arguments, groups: frozenset[Group]) -> int:
+def _run(
+    args: Arguments,
+    groups: frozenset[Group],
+    filenames: Iterable[Path | str] | None = None,
+    *,
+    use_cache: bool = True,
+    diff: bool = False,
+    dry_run: bool = False,
+    jobs: int | None = None,
+) -> int:
+    if filenames is not None:
+        filenames = tuple(filenames)
+        if not select_hooks(groups, filenames):
+            return 0
+    from compwa_policy.utilities.precommit.revisions import get_revision_resolver  # noqa: PLC0415
+
+    dry_run = dry_run or diff
+    parse_cache = get_parse_cache()
+    parse_cache.directory = (
+        get_repository_cache_dir() / "parsed" if use_cache and not dry_run else None
+    )
+    get_revision_resolver().path = (
+        get_user_cache_dir() / "latest-revs.json" if use_cache else None
+    )
+    get_template_cache().directory = (
+        get_user_cache_dir() / "templates" if use_cache else None
+    )
     if check_dev_python_version(args):
         return 1
+    from compwa_policy.cli._memo import HookMemo, get_memo_path  # noqa: PLC0415
+    from compwa_policy.utilities.session import Session  # noqa: PLC0415
+
     ctx = compute_context(args)
+    with measure("(prefetch revisions)"):
+        prefetch_revisions(args, ctx, select_hooks(groups, filenames))
+    memo = HookMemo(get_memo_path()) if use_cache and not dry_run else None
     try:
-        with Session.load() as session:
-            run_checks(session, args, ctx, groups=groups)
-            changes = session.flush()
+        with Session.load(dry_run=dry_run) as session:
+            run_checks(
+                session,
+                args,
+                ctx,
+                groups=groups,
+                filenames=filenames,
+                jobs=jobs,
+                memo=memo,
+            )
+            with measure("(flush)"):
+                changes = session.flush()
     except PolicyError as exception:
         print("\n".join(exception.args))  # noqa: T201
         return 1
+    finally:
+        if memo is not None:
+            memo.save()
+        parse_cache.prune()
+    if diff:
+        print(session.diff(), end="")  # noqa: T201
     if changes:
         print("\n--------------------\n".join(changes))  # noqa: T201
         return 1
@@ -147,6 +702,9 @@ def run_checks(
     ctx: CheckContext,
     *,
     groups: frozenset[Group] = ALL_GROUPS,
+    filenames: Iterable[Path | str] | None = None,
+    jobs: int | None = 1,
+    memo: HookMemo | None = None,
 ) -> None:
     """Dispatch the requested check *groups* in the canonical order.
 
@@ -156,10 +714,89 @@ def run_checks(
     Keeping one ordered sequence means a subcommand can never order a shared config
     file (such as ``.pre-commit-config.yaml``) differently from the full run.
 
+    If *filenames* is given, checks that are not triggered by any of these files are
+    skipped (see :meth:`.CheckHook.is_triggered_by`). `None` runs every check.
+
     Each check reports its modifications through the *session*: either by mutating a
     managed container (:attr:`~.Session.pyproject`, :attr:`~.Session.precommit`) or by
     appending to :attr:`~.Session.changelog`. Nothing is returned.
+
+    With *jobs* other than ``1``, checks that do not share any files run in a pool of
+    that many threads (`None` for one per CPU). Checks that modify a file that another
+    check inspects or modifies still run in the canonical order (see `.schedule`), and
+    each check runs in its own :meth:`.Session.scope`, so the session ends up with the
+    same changes as in a sequential run.
+
+    With a *memo*, checks whose inputs did not change since an earlier run replay their
+    recorded changes instead of running (see `.HookMemo`).
+    """
+    hooks = select_hooks(groups, filenames)
+    if jobs == 1:
+        for hook in hooks:
+            _run_hook(hook, session, args, ctx, memo)
+        return
+
+    def create_task(position: int, hook: LazyCheckHook) -> Callable[[], None]:
+        def run() -> None:
+            with session.scope(position):
+                _run_hook(hook, session, args, ctx, memo)
+
+        return run
+
+    run_in_parallel(
+        [create_task(position, hook) for position, hook in enumerate(hooks)],
+        build_dependencies(hooks),
+        max_workers=jobs,
+    )
+
+
+def _run_hook(
+    hook: LazyCheckHook,
+    session: Session,
+    args: Arguments,
+    ctx: CheckContext,
+    memo: HookMemo | None,
+) -> None:
+    if memo is None:
+        hook(session, args, ctx)
+    else:
+        memo.run(hook, session, args, ctx)
+
+
+def prefetch_revisions(
+    args: Arguments, ctx: CheckContext, hooks: Iterable[LazyCheckHook]
+) -> None:
+    """Resolve the latest revisions of the pre-commit repos that *hooks* may add.
+
+    Only the :attr:`~.LazyCheckHook.precommit_repos` of enabled hooks that are not yet
+    listed in :code:`.pre-commit-config.yaml` are resolved, all at once in a thread
+    pool, so that the checks do not have to wait for one network round trip each.
     """
-    for hook in CHECK_HOOKS:
-        if hook.group in groups:
-            hook(session, args, ctx)
+    if not get_storage().exists(CONFIG_PATH.precommit):
+        return
+    from compwa_policy.utilities.precommit import Precommit  # noqa: PLC0415
+    from compwa_policy.utilities.precommit.revisions import get_revision_resolver  # noqa: PLC0415
+
+    precommit = Precommit.load()
+    get_revision_resolver().prefetch(
+        url
+        for hook in hooks
+        if hook.load().enabled(args, ctx)
+        for url in hook.precommit_repos
+        if precommit.find_repo(url) is None
+    )
+
+
+def select_hooks(
+    groups: frozenset[Group] = ALL_GROUPS,
+    filenames: Iterable[Path | str] | None = None,
+) -> tuple[LazyCheckHook, ...]:
+    """Select the :data:`CHECK_HOOKS` to run, preserving the canonical order."""
+    if filenames is not None:
+        filenames = tuple(filenames)
+    return tuple(
+        hook
+        for hook in CHECK_HOOKS
+        if hook.group in groups
+        if hook.is_triggered_by(filenames)
+    )
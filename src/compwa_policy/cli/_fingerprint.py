@@ -0,0 +1,132 @@
+"""Skip a complete run of the checks if none of their inputs have changed.
+
+Most runs of :program:`check-dev-files` find nothing to change. A run that does not
+change anything stores a fingerprint of its inputs in the cache directory of the user
+for the repository (see :func:`.get_repository_cache_dir`), so that the next run with
+the same inputs can exit immediately. The fingerprint covers:
+
+- the content of every file that triggers one of the checks, as well as the list of all
+  files in the repository (so that for instance adding a first notebook is noticed);
+- the resolved `.Arguments`;
+- the installed version of :code:`compwa-policy` and the content of its templates.
+
+Some checks also depend on remote state, such as the latest revisions of pre-commit
+hooks. A stored fingerprint therefore expires after :data:`MAX_AGE`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from datetime import timedelta
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol
+
+from attrs import asdict
+
+from compwa_policy.utilities import COMPWA_POLICY_DIR
+from compwa_policy.utilities.caching import (
+    create_cache_directory,
+    get_repository_cache_dir,
+)
+from compwa_policy.utilities.match import get_repository_index
+
+if TYPE_CHECKING:
+    from compwa_policy import Arguments
+    from compwa_policy.utilities.check_hook import FileSet
+
+MAX_AGE = timedelta(days=1)
+TEMPLATE_DIRECTORIES = (
+    COMPWA_POLICY_DIR / ".github",
+    COMPWA_POLICY_DIR / ".template",
+)
+
+
+def compute_fingerprint(args: Arguments, trigger_files: FileSet) -> str:
+    """Hash all inputs of a complete run of the checks."""
+    digest = hashlib.sha256()
+    update_digest(digest, "policy", hash_policy())
+    update_digest(digest, "arguments", serialize_arguments(args))
+    index = get_repository_index()
+    tracked = set(index.git_ls_files())
+    trigger_paths = {path.as_posix() for path in trigger_files.paths}
+    for path in sorted(trigger_paths.union(index.git_ls_files(untracked=True))):
+        update_digest(digest, path, "tracked" if path in tracked else "untracked")
+        if path in trigger_paths or trigger_files.matches(path):
+            update_digest(digest, _read_bytes(Path(path)))
+    return digest.hexdigest()
+
+
+def hash_policy() -> str:
+    """Hash the installed version of :code:`compwa-policy` and its templates."""
+    digest = hashlib.sha256()
+    update_digest(digest, _get_policy_version())
+    for directory in TEMPLATE_DIRECTORIES:
+        for path in sorted(directory.rglob("*")):
+            if path.is_file():
+                update_digest(digest, path.relative_to(COMPWA_POLICY_DIR).as_posix())
+                update_digest(digest, path.read_bytes())
+    return digest.hexdigest()
+
+
+def get_fingerprint_path() -> Path:
+    """Get the file in which the fingerprint of the current repository is stored."""
+    return get_repository_cache_dir() / "fingerprint"
+
+
+def has_fingerprint(fingerprint: str) -> bool:
+    """Check whether the last run without changes had the same fingerprint."""
+    path = get_fingerprint_path()
+    try:
+        modified = path.stat().st_mtime
+        stored = path.read_text().strip()
+    except OSError:
+        return False
+    if time.time() - modified > MAX_AGE.total_seconds():
+        return False
+    return stored == fingerprint
+
+
+def store_fingerprint(fingerprint: str) -> None:
+    """Remember the fingerprint of a run that did not have to change anything."""
+    path = get_fingerprint_path()
+    try:
+        create_cache_directory(path.parent)
+        path.write_text(f"{fingerprint}\n")
+    except OSError:
+        return
+
+
+def _get_policy_version() -> str:
+    try:
+        return version("compwa-policy")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def serialize_arguments(args: Arguments) -> str:
+    """Serialize `.Arguments` independently of the iteration order of its sets."""
+    fields = asdict(args)
+    return json.dumps(fields, default=sorted, sort_keys=True)
+
+
+def _read_bytes(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return b"\0missing"
+
+
+class Digest(Protocol):
+    """Hash object of :mod:`hashlib`, like the one of :func:`hashlib.sha256`."""
+
+    def update(self, data: bytes, /) -> None: ...
+
+
+def update_digest(digest: Digest, *items: str | bytes) -> None:
+    for item in items:
+        data = item.encode() if isinstance(item, str) else item
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
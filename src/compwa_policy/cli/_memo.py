@@ -0,0 +1,347 @@
+"""Replay the changes of a check whose inputs have not changed.
+
+A stored fingerprint (see ``_fingerprint``) only helps if none of the files that trigger
+a check changed. Otherwise, each check is still looked up in a `HookMemo`, under a key
+that covers the inputs of just that check:
+
+- the content of the files that the check :attr:`~.LazyCheckHook.reads` (or, for a
+  directory that it :attr:`~.LazyCheckHook.probes`, only that it exists), as well as
+  the list of all files in the repository;
+- the state of the resources that earlier checks in the same run modified;
+- the resolved `.Arguments` and the `.CheckContext`;
+- the installed version of :code:`compwa-policy`, its templates, and its source files.
+
+On a hit, the resource states and changelog messages that the check produced before
+are replayed on the `.Session`, instead of running the check. So if only
+:file:`.cspell.json` was edited, the checks that do not read it do not have to run.
+
+The memo is kept in one file in the cache directory of the user for the repository (see
+:func:`.get_repository_cache_dir`), never in the repository itself, because it is a
+pickle and loading a pickle can run arbitrary code. Once the recorded
+changes exceed :data:`MAX_SIZE`, the least recently used entries are evicted. Like the
+fingerprint, an entry expires after :data:`~._fingerprint.MAX_AGE`, because some checks
+depend on remote state.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle  # noqa: S403
+import threading
+import time
+from functools import cache
+from typing import TYPE_CHECKING, cast, final
+
+from attrs import asdict, evolve, field, frozen
+
+from compwa_policy.cli._fingerprint import (
+    MAX_AGE,
+    hash_policy,
+    serialize_arguments,
+    update_digest,
+)
+from compwa_policy.utilities import COMPWA_POLICY_DIR
+from compwa_policy.utilities.caching import (
+    create_cache_directory,
+    get_repository_cache_dir,
+)
+from compwa_policy.utilities.instrumentation import measure
+from compwa_policy.utilities.match import get_repository_index
+from compwa_policy.utilities.resource import ModifiablePath
+from compwa_policy.utilities.storage import get_storage
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+    from pathlib import Path
+
+    from compwa_policy import Arguments
+    from compwa_policy.utilities.check_hook import CheckContext, FileSet, LazyCheckHook
+    from compwa_policy.utilities.resource import ModifiableResource
+    from compwa_policy.utilities.session import Session
+
+MAX_SIZE = 8 * 1024**2
+"""Number of bytes of recorded changes above which the memo evicts entries."""
+
+
+def get_memo_path() -> Path:
+    """Get the file in which the memo of the current repository is persisted."""
+    return get_repository_cache_dir() / "hooks.pickle"
+
+
+@frozen
+class HookResult:
+    """Changes that one check made to a `.Session`."""
+
+    usage: tuple[tuple[Hashable, ...], ...]
+    """Keys of the resources that the check used, in the order of first use."""
+    snapshots: tuple[tuple[tuple[Hashable, ...], bytes], ...]
+    """The :meth:`~.ModifiableResource.snapshot` of each resource that changed."""
+    changelogs: tuple[tuple[tuple[Hashable, ...], tuple[str, ...]], ...]
+    """Messages that the check added to the changelog of each resource."""
+    messages: tuple[str, ...]
+    """Messages that the check added to :attr:`.Session.changelog`."""
+
+    def replay(self, session: Session) -> None:
+        """Apply the recorded changes to a *session* that has the same inputs."""
+        for key in self.usage:
+            session._track(key)  # noqa: SLF001
+        for key, snapshot in self.snapshots:
+            _get_resource(session, key).restore(snapshot)
+        for key, messages in self.changelogs:
+            _get_resource(session, key).changelog.extend(messages)
+        session.changelog.extend(self.messages)
+
+
+@frozen
+class _Entry:
+    result: HookResult
+    size: int
+    created: float = field(factory=time.time)
+    used: float = field(factory=time.time)
+
+
+@final
+class HookMemo:
+    """Results of the checks by a digest of their inputs.
+
+    The memo is loaded from its :attr:`path` on first use and written back by
+    :meth:`save`. It assumes that the files in the repository do not change while it is
+    in use, so create one per run of the checks.
+    """
+
+    def __init__(self, path: Path | None = None, max_size: int = MAX_SIZE) -> None:
+        self.path = path
+        """File in which the memo is persisted; `None` to keep it in memory only."""
+        self.max_size = max_size
+        self.__entries: dict[str, _Entry] | None = None
+        self.__modified = False
+        self.__lock = threading.Lock()
+        self.__digests: dict[str, bytes] = {}
+        self.__files: list[str] | None = None
+        self.__base_key: str | None = None
+
+    @property
+    def size(self) -> int:
+        """Number of bytes of the recorded changes."""
+        return sum(entry.size for entry in self.__load().values())
+
+    def run(
+        self,
+        hook: LazyCheckHook,
+        session: Session,
+        args: Arguments,
+        context: CheckContext,
+    ) -> None:
+        """Replay the recorded changes of *hook*, or run it and record its changes."""
+        key = self.compute_key(hook, session, args, context)
+        if key is not None:
+            entry = self.__lookup(key)
+            if entry is not None:
+                with measure(hook.module.removeprefix("compwa_policy.")):
+                    entry.result.replay(session)
+                return
+        before = {
+            resource_key: len(resource.changelog)
+            for resource_key, resource in session.resources.items()
+        }
+        n_messages = len(session.changelog)
+        with session.record_usage() as usage:
+            hook(session, args, context)
+        if key is None:
+            return
+        result = _record(hook, session, usage, before, n_messages)
+        if result is not None:
+            self.__store(key, result)
+
+    def compute_key(
+        self,
+        hook: LazyCheckHook,
+        session: Session,
+        args: Arguments,
+        context: CheckContext,
+    ) -> str | None:
+        """Hash the inputs of *hook*, or `None` if they cannot be hashed."""
+        digest = hashlib.sha256()
+        update_digest(digest, self.__get_base_key(), hook.module)
+        update_digest(digest, serialize_arguments(args))
+        update_digest(digest, json.dumps(asdict(context), sort_keys=True))
+        for path in self.__select_files(hook.reads):
+            update_digest(digest, path, self.__hash_file(path))
+        changed = {
+            _format_key(key): resource
+            for key, resource in session.resources.items()
+            if resource.changed and _is_input(hook, resource)
+        }
+        for name in sorted(changed):
+            snapshot = changed[name].snapshot()
+            if snapshot is None:
+                return None
+            update_digest(digest, name, snapshot)
+        return digest.hexdigest()
+
+    def save(self) -> None:
+        """Persist the most recently used entries that fit in :attr:`max_size`."""
+        if self.path is None or not self.__modified:
+            return
+        entries = sorted(
+            self.__load().items(), key=lambda item: item[1].used, reverse=True
+        )
+        kept: dict[str, _Entry] = {}
+        size = 0
+        for key, entry in entries:
+            if size + entry.size > self.max_size:
+                continue
+            kept[key] = entry
+            size += entry.size
+        temporary_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            create_cache_directory(self.path.parent)
+            temporary_path.write_bytes(
+                pickle.dumps(kept, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+            temporary_path.replace(self.path)
+        except OSError:
+            return
+        self.__entries = kept
+        self.__modified = False
+
+    def __lookup(self, key: str) -> _Entry | None:
+        with self.__lock:
+            entries = self.__load()
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry.created > MAX_AGE.total_seconds():
+                del entries[key]
+                self.__modified = True
+                return None
+            entries[key] = evolve(entry, used=time.time())
+            self.__modified = True
+            return entry
+
+    def __store(self, key: str, result: HookResult) -> None:
+        size = len(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        if size > self.max_size:
+            return
+        with self.__lock:
+            self.__load()[key] = _Entry(result, size)
+            self.__modified = True
+
+    def __load(self) -> dict[str, _Entry]:
+        if self.__entries is not None:
+            return self.__entries
+        entries = None
+        if self.path is not None:
+            try:
+                entries = pickle.loads(self.path.read_bytes())
+            except Exception:  # noqa: BLE001
+                entries = None
+        if not isinstance(entries, dict):
+            entries = {}
+        self.__entries = entries
+        return entries
+
+    def __get_base_key(self) -> str:
+        if self.__base_key is None:
+            digest = hashlib.sha256()
+            update_digest(digest, hash_policy(), _hash_source_files())
+            index = get_repository_index()
+            tracked = set(index.git_ls_files())
+            for path in self.__list_files():
+                update_digest(digest, path, "tracked" if path in tracked else "")
+            self.__base_key = digest.hexdigest()
+        return self.__base_key
+
+    def __list_files(self) -> list[str]:
+        if self.__files is None:
+            self.__files = sorted(get_repository_index().git_ls_files(untracked=True))
+        return self.__files
+
+    def __select_files(self, files: FileSet) -> list[str]:
+        paths = {path.as_posix() for path in files.paths}
+        paths.update(path for path in self.__list_files() if files.matches(path))
+        return sorted(paths)
+
+    def __hash_file(self, path: str) -> bytes:
+        digest = self.__digests.get(path)
+        if digest is None:
+            try:
+                content = get_storage().read_bytes(path)
+            except IsADirectoryError:
+                digest = b"\0directory"
+            except OSError:
+                digest = b"\0missing"
+            else:
+                digest = hashlib.sha256(content).digest()
+            self.__digests[path] = digest
+        return digest
+
+
+def _record(
+    hook: LazyCheckHook,
+    session: Session,
+    usage: list[tuple[Hashable, ...]],
+    before: dict[tuple[Hashable, ...], int],
+    n_messages: int,
+) -> HookResult | None:
+    """Collect the changes of a check, or `None` if they cannot be replayed."""
+    resources = session.resources
+    snapshots = []
+    changelogs = []
+    for key in usage:
+        resource = resources.get(key)
+        if resource is None:
+            continue
+        messages = resource.changelog[before.get(key, 0) :]
+        if messages and not _is_input(hook, resource):
+            return None
+        if messages:
+            changelogs.append((key, tuple(messages)))
+        if resource.changed and _is_input(hook, resource):
+            snapshot = resource.snapshot()
+            if snapshot is None:
+                return None
+            snapshots.append((key, snapshot))
+    return HookResult(
+        usage=tuple(usage),
+        snapshots=tuple(snapshots),
+        changelogs=tuple(changelogs),
+        messages=tuple(session.changelog[n_messages:]),
+    )
+
+
+def _is_input(hook: LazyCheckHook, resource: ModifiableResource) -> bool:
+    """Whether the state of a changed *resource* is part of the key of *hook*.
+
+    A resource whose files are not known may represent any file.
+    """
+    files = resource.files
+    return not files or any(hook.reads.matches(path) for path in files)
+
+
+def _get_resource(session: Session, key: tuple[Hashable, ...]) -> ModifiableResource:
+    if key[0] is ModifiablePath:
+        return session.get_path(cast("Path", key[1]))
+    return session.get(cast("type[ModifiableResource]", key[0]))
+
+
+def _format_key(key: tuple[Hashable, ...]) -> str:
+    resource_type = cast("type", key[0])
+    name = f"{resource_type.__module__}.{resource_type.__qualname__}"
+    return ":".join([name, *map(str, key[1:])])
+
+
+@cache
+def _hash_source_files() -> str:
+    """Hash the size and modification time of the Python files of the package."""
+    digest = hashlib.sha256()
+    for path in sorted(COMPWA_POLICY_DIR.rglob("*.py")):
+        status = path.stat()
+        update_digest(
+            digest,
+            path.relative_to(COMPWA_POLICY_DIR).as_posix(),
+            f"{status.st_size}:{status.st_mtime_ns}",
+        )
+    return digest.hexdigest()
@@ -10,12 +10,12 @@ from __future__ import annotations
 
 import os
 from enum import Enum
+from pathlib import Path
 from typing import TYPE_CHECKING, Annotated
 
 import typer
 
 from compwa_policy import Arguments, TomlFormatter, _to_list
-from compwa_policy.cli._settings import load_settings
 from compwa_policy.config import (
     DEFAULT_DEV_PYTHON_VERSION,
     PackageManagerChoice,
@@ -99,6 +99,134 @@ EnvironmentVariables = Annotated[
     ),
 ]
 
+# Incremental runs ------------------------------------------------------------
+Filenames = Annotated[
+    list[Path] | None,
+    typer.Argument(
+        show_default=False,
+        help=(
+            "Modified files, as passed by pre-commit. Only the checks that are"
+            " triggered by at least one of these files are run. Without files, every"
+            " check is run."
+        ),
+    ),
+]
+AllChecks = Annotated[
+    bool,
+    typer.Option(
+        "--all",
+        help="Run every check, regardless of the files that were passed (e.g. in CI).",
+    ),
+]
+NoCache = Annotated[
+    bool,
+    typer.Option(
+        "--no-cache",
+        help=(
+            "Run the checks even if nothing changed since the last run, and do not"
+            " read or write the cache directory of the repository."
+        ),
+    ),
+]
+Diff = Annotated[
+    bool,
+    typer.Option(
+        "--diff",
+        help=(
+            "Print the changes as a unified diff instead of writing them. The diff can"
+            " be applied with git apply."
+        ),
+    ),
+]
+Rev = Annotated[
+    str | None,
+    typer.Option(
+        "--rev",
+        show_default=False,
+        help=(
+            "Check the files of this Git commit instead of the working tree and only"
+            " report the changes. The working tree is left untouched."
+        ),
+    ),
+]
+Jobs = Annotated[
+    int | None,
+    typer.Option(
+        "--jobs",
+        "-j",
+        min=1,
+        show_default=False,
+        help=(
+            "Number of threads that run checks that do not share any files. Use 1 to"
+            " run the checks one after the other. Defaults to a thread per CPU."
+        ),
+    ),
+]
+Offline = Annotated[
+    bool,
+    typer.Option(
+        "--offline",
+        envvar="COMPWA_POLICY_OFFLINE",
+        help=(
+            "Do not look up the latest revisions of new pre-commit hooks online. Use"
+            " cached revisions regardless of their age, or the --mirror-dir."
+        ),
+    ),
+]
+MirrorDir = Annotated[
+    Path | None,
+    typer.Option(
+        "--mirror-dir",
+        envvar="COMPWA_POLICY_MIRROR_DIR",
+        file_okay=False,
+        help=(
+            "Directory with bare clones of pre-commit hook repositories, laid out by"
+            " host and path (e.g. github.com/astral-sh/ruff-pre-commit.git), that"
+            " --offline uses to look up revisions."
+        ),
+    ),
+]
+RevisionTtl = Annotated[
+    float,
+    typer.Option(
+        "--revision-ttl",
+        min=0,
+        help=(
+            "Hours for which the latest revision of a pre-commit hook repository is"
+            " cached before it is looked up again."
+        ),
+    ),
+]
+Profile = Annotated[
+    bool,
+    typer.Option(
+        "--profile",
+        help=(
+            "Print the time, the number of files read, parsed, and written, and the"
+            " subprocesses of each check."
+        ),
+    ),
+]
+ProfileJson = Annotated[
+    Path | None,
+    typer.Option(
+        "--profile-json",
+        dir_okay=False,
+        help="Write the profile of each check to this JSON file.",
+    ),
+]
+ProfileTrace = Annotated[
+    Path | None,
+    typer.Option(
+        "--profile-trace",
+        dir_okay=False,
+        help=(
+            "Write the profile of each check to this file in the Chrome trace event"
+            " format, which can be inspected in chrome://tracing or Perfetto."
+        ),
+    ),
+]
+
 # Python group ----------------------------------------------------------------
 ExcludedPythonVersions = Annotated[
     str | None,
@@ -319,6 +447,8 @@ def build_arguments(**overrides: Any) -> Arguments:
     to the ``[tool.compwa.policy]`` table (if present) and then to the same default that
     the ``check-dev-files`` hook uses. See the ``_settings`` for the resolution order.
     """
+    from compwa_policy.cli._settings import load_settings  # noqa: PLC0415
+
     resolved_settings = load_settings(**overrides)
     settings = resolved_settings.model_dump()
     settings["toml_formatter_configured"] = (
@@ -56,6 +56,7 @@ from compwa_policy.config import (
 )
 from compwa_policy.utilities import CONFIG_PATH
 from compwa_policy.utilities.pyproject import Pyproject
+from compwa_policy.utilities.storage import get_storage
 
 T = TypeVar("T")
 SortedArray = Annotated[
@@ -145,7 +146,7 @@ def _read_policy_config() -> dict[str, Any]:
     table ``[tool.compwa.policy.setup.env]`` is folded into the ``environment_variables``
     option.
     """
-    if not CONFIG_PATH.pyproject.exists():
+    if not get_storage().exists(CONFIG_PATH.pyproject):
         return {}
     root = Pyproject.load().get_table(POLICY_TABLE, fallback={})
     flattened: dict[str, Any] = {}
@@ -6,24 +6,20 @@ from typing import TYPE_CHECKING
 
 import rich
 
-from compwa_policy.characterization import (
-    RepositoryCharacterization,
-    characterize_repository,
-)
-from compwa_policy.cli._settings import POLICY_TABLE
 from compwa_policy.utilities import CONFIG_PATH
-from compwa_policy.utilities.precommit import ModifiablePrecommit
-from compwa_policy.utilities.precommit.struct import Hook, Repo
-from compwa_policy.utilities.pyproject import ModifiablePyproject
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from compwa_policy.characterization import RepositoryCharacterization
+
 _POLICY_REPO = "https://github.com/ComPWA/policy"
 
 
 def bootstrap() -> None:
     """Detect repository tooling, configure policy, and add its pre-commit hook."""
+    from compwa_policy.characterization import characterize_repository  # noqa: PLC0415
+
     characterization = characterize_repository()
     _write_policy_configuration(characterization)
     _add_check_dev_files_hook()
@@ -35,6 +31,9 @@ def bootstrap() -> None:
 def _write_policy_configuration(
     characterization: RepositoryCharacterization,
 ) -> None:
+    from compwa_policy.cli._settings import POLICY_TABLE  # noqa: PLC0415
+    from compwa_policy.utilities.pyproject import ModifiablePyproject  # noqa: PLC0415
+
     pyproject_path = CONFIG_PATH.pyproject
     pyproject = ModifiablePyproject.load(
         pyproject_path if pyproject_path.exists() else ""
@@ -54,6 +53,9 @@ def _write_policy_configuration(
 
 
 def _add_check_dev_files_hook() -> None:
+    from compwa_policy.utilities.precommit import ModifiablePrecommit  # noqa: PLC0415
+    from compwa_policy.utilities.precommit.struct import Hook, Repo  # noqa: PLC0415
+
     precommit_path = CONFIG_PATH.precommit
     source: Path | str = precommit_path if precommit_path.exists() else "repos: []\n"
     precommit = ModifiablePrecommit.load(source)
@@ -0,0 +1,227 @@
+"""``policy fleet`` — apply the policy to many repositories at once.
+
+Looping a shell script over :program:`check-dev-files` pays for the interpreter startup,
+the imports of all check modules, and the lookup of the latest pre-commit hook revisions
+in every repository. This command instead checks the repositories in a pool of worker
+processes. The revisions are resolved once, before the workers start, and each worker
+imports the check modules once and then checks one repository after the other. Each
+repository is checked in its own working directory and `.Session`, with the options
+from its own ``[tool.compwa.policy]`` table, exactly like :program:`policy` without a
+subcommand. The output of all repositories is collected into one report.
+
+The repositories of a fleet are often not the user's own. Unless the user opts in with
+``--repository-cache``, they are therefore checked without the caches that are kept for
+each repository (the fingerprint, the memo of the checks, and the parsed files), so
+that no state derived from one of them is stored or reused.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
+
+import typer
+from attrs import frozen
+
+from compwa_policy.cli._options import Diff, MirrorDir, NoCache, Offline, RevisionTtl  # noqa: TC001
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+Directories = Annotated[
+    list[Path],
+    typer.Argument(
+        exists=True,
+        file_okay=False,
+        resolve_path=True,
+        help="Root directories of the repositories to check.",
+    ),
+]
+Processes = Annotated[
+    int | None,
+    typer.Option(
+        "--jobs",
+        "-j",
+        min=1,
+        show_default=False,
+        help="Number of worker processes. Defaults to a process per CPU.",
+    ),
+]
+RepositoryCache = Annotated[
+    bool,
+    typer.Option(
+        "--repository-cache",
+        help=(
+            "Keep a fingerprint, the results of the checks, and the parsed files of each"
+            " repository in the cache directory of the user, like policy does for a"
+            " single repository."
+        ),
+    ),
+]
+
+
+@frozen
+class RepositoryReport:
+    """Outcome of checking one repository of the fleet."""
+
+    directory: Path
+    exit_code: int
+    output: str = ""
+
+
+def fleet(  # noqa: PLR0917
+    directories: Directories,
+    jobs: Processes = None,
+    no_cache: NoCache = False,
+    repository_cache: RepositoryCache = False,
+    diff: Diff = False,
+    offline: Offline = False,
+    mirror_dir: MirrorDir = None,
+    revision_ttl: RevisionTtl = 24,
+) -> None:
+    """Run every check in each of several repositories, using a pool of processes."""
+    from compwa_policy.utilities.precommit.revisions import get_revision_resolver  # noqa: PLC0415
+
+    resolver = get_revision_resolver()
+    resolver.offline = offline
+    resolver.mirror_dir = mirror_dir
+    resolver.ttl = timedelta(hours=revision_ttl)
+    reports = run_fleet(
+        directories,
+        max_workers=jobs,
+        use_cache=not no_cache,
+        repository_cache=repository_cache,
+        diff=diff,
+    )
+    print(format_reports(reports))  # noqa: T201
+    raise typer.Exit(code=max((r.exit_code for r in reports), default=0))
+
+
+def run_fleet(
+    directories: Sequence[Path],
+    *,
+    max_workers: int | None = None,
+    use_cache: bool = True,
+    repository_cache: bool = False,
+    diff: bool = False,
+) -> list[RepositoryReport]:
+    """Check each repository in a pool of worker processes.
+
+    The reports are returned in the order of the *directories*. The revisions of all
+    pre-commit repos that the checks may add are resolved in this process and passed on
+    to the workers, so that the workers do not look them up again. See
+    :func:`check_repository` for *repository_cache*.
+    """
+    from compwa_policy.cli._checks import CHECK_HOOKS  # noqa: PLC0415
+    from compwa_policy.utilities.caching import get_user_cache_dir  # noqa: PLC0415
+    from compwa_policy.utilities.precommit.revisions import get_revision_resolver  # noqa: PLC0415
+
+    resolver = get_revision_resolver()
+    resolver.path = get_user_cache_dir() / "latest-revs.json" if use_cache else None
+    resolver.prefetch(url for hook in CHECK_HOOKS for url in hook.precommit_repos)
+    with ProcessPoolExecutor(
+        max_workers,
+        initializer=_initialize_worker,
+        initargs=(
+            resolver.get_resolved(),
+            resolver.offline,
+            resolver.mirror_dir,
+            resolver.ttl,
+        ),
+    ) as executor:
+        check = partial(
+            check_repository,
+            use_cache=use_cache,
+            repository_cache=repository_cache,
+            diff=diff,
+        )
+        return list(executor.map(check, directories))
+
+
+def _initialize_worker(
+    revisions: Mapping[str, str | None],
+    offline: bool,
+    mirror_dir: Path | None,
+    ttl: timedelta,
+) -> None:
+    from compwa_policy.cli._checks import CHECK_HOOKS  # noqa: PLC0415
+    from compwa_policy.utilities.precommit.revisions import get_revision_resolver  # noqa: PLC0415
+
+    resolver = get_revision_resolver()
+    resolver.offline = offline
+    resolver.mirror_dir = mirror_dir
+    resolver.ttl = ttl
+    resolver.add_resolved(revisions)
+    for hook in CHECK_HOOKS:
+        hook.load()
+
+
+def check_repository(
+    directory: Path,
+    *,
+    use_cache: bool = True,
+    repository_cache: bool = False,
+    diff: bool = False,
+) -> RepositoryReport:
+    """Run every check in a repository and capture what it reports.
+
+    Without *repository_cache*, the caches of the repository are neither read nor
+    written, as if *use_cache* were `False`. The working directory is changed to the
+    *directory* and left there, so this function is meant for worker processes.
+    """
+    from compwa_policy.cli._checks import run_all  # noqa: PLC0415
+    from compwa_policy.cli._options import build_arguments  # noqa: PLC0415
+    from compwa_policy.utilities.caching import clear_repository_caches  # noqa: PLC0415
+    from compwa_policy.utilities.parse_cache import get_parse_cache  # noqa: PLC0415
+
+    os.chdir(directory)
+    clear_repository_caches()
+    get_parse_cache().clear()
+    with contextlib.redirect_stdout(io.StringIO()) as stdout:
+        try:
+            exit_code = run_all(
+                build_arguments(),
+                use_cache=use_cache and repository_cache,
+                diff=diff,
+                jobs=1,
+            )
+        except typer.Exit as exception:
+            exit_code = exception.exit_code
+        except Exception as exception:  # noqa: BLE001
+            print(f"{type(exception).__name__}: {exception}")  # noqa: T201
+            exit_code = 1
+    return RepositoryReport(directory, exit_code, stdout.getvalue().strip())
+
+
+def format_reports(reports: Iterable[RepositoryReport]) -> str:
+    """Combine the output of all repositories into one report with a summary.
+
+    >>> print(
+    ...     format_reports([
+    ...         RepositoryReport(Path("a"), 1, "Updated .cspell.json"),
+    ...         RepositoryReport(Path("b"), 0),
+    ...     ])
+    ... )
+    ==================== a ====================
+    Updated .cspell.json
+    <BLANKLINE>
+    Checked 2 repositories: 1 with changes or errors, 1 unchanged.
+    """
+    reports = list(reports)
+    sections = [
+        f"{'=' * 20} {report.directory} {'=' * 20}\n{report.output}\n"
+        for report in reports
+        if report.exit_code or report.output
+    ]
+    n_failed = sum(1 for report in reports if report.exit_code)
+    summary = (
+        f"Checked {len(reports)} repositories: {n_failed} with changes or errors,"
+        f" {len(reports) - n_failed} unchanged."
+    )
+    return "\n".join([*sections, summary])
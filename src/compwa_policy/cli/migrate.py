@@ -24,19 +24,13 @@ import typer
 from rich.syntax import Syntax
 
 from compwa_policy import _get_environment_variables
-from compwa_policy.cli._settings import POLICY_TABLE, Settings, policy_sub_table
 from compwa_policy.errors import PolicyError
-from compwa_policy.format.precommit import (
-    __NBHOOKS_REPO_URL,
-    NOTEBOOK_HOOK_IDS,
-    migrate_notebook_hooks_to_nbhooks,
-)
 from compwa_policy.utilities import CONFIG_PATH
-from compwa_policy.utilities.precommit import ModifiablePrecommit
-from compwa_policy.utilities.pyproject import ModifiablePyproject
 
 if TYPE_CHECKING:
+    from compwa_policy.utilities.precommit import ModifiablePrecommit
     from compwa_policy.utilities.precommit.struct import Hook
+    from compwa_policy.utilities.pyproject import ModifiablePyproject
 
 _HOOK_ID = "check-dev-files"
 
@@ -115,6 +109,8 @@ def migrate(
     dry_run: DryRunOption = False,
 ) -> None:
     """Migrate hook args into a pyproject.toml policy table and relocate nb hooks."""
+    from compwa_policy.utilities.precommit import ModifiablePrecommit  # noqa: PLC0415
+
     _assert_inputs_exist(config_file)
     precommit = ModifiablePrecommit.load(config_file)
     hook = _find_hook(precommit)
@@ -155,6 +151,8 @@ def _build_validated_policy(args: list[str]) -> dict[str, Any]:
 
 
 def _report_plan(policy: dict[str, Any], notebook_hooks: list[str]) -> None:
+    from compwa_policy.format.precommit import __NBHOOKS_REPO_URL  # noqa: PLC0415
+
     if policy:
         rich.print("[bold]Adding to pyproject.toml:[/bold]")
         rich.print(Syntax(_render(policy), "toml", background_color="default"))
@@ -166,6 +164,8 @@ def _report_plan(policy: dict[str, Any], notebook_hooks: list[str]) -> None:
 
 
 def _report_result(*, has_args: bool, notebook_hooks: list[str]) -> None:
+    from compwa_policy.format.precommit import __NBHOOKS_REPO_URL  # noqa: PLC0415
+
     if has_args:
         rich.print(
             f"[green]Moved the args of '{_HOOK_ID}' into {CONFIG_PATH.pyproject}.[/green]"
@@ -199,6 +199,8 @@ def _flag_to_field(flag: str) -> str:
 
 
 def _is_list_field(field_name: str) -> bool:
+    from compwa_policy.cli._settings import Settings  # noqa: PLC0415
+
     return get_origin(Settings.model_fields[field_name].annotation) is list
 
 
@@ -210,6 +212,8 @@ def _build_policy(args: list[str]) -> dict[str, Any]:
     >>> _build_policy(["--no-python", "--environment-variables=A=1,B=2"])
     {'python': False, 'setup': {'env': {'A': '1', 'B': '2'}}}
     """
+    from compwa_policy.cli._settings import policy_sub_table  # noqa: PLC0415
+
     policy: dict[str, Any] = {}
     environment_variables: dict[str, str] = {}
     for arg in args:
@@ -263,6 +267,8 @@ def _render(policy: dict[str, Any]) -> str:
 
 
 def _write_pyproject(policy: dict[str, Any]) -> None:
+    from compwa_policy.utilities.pyproject import ModifiablePyproject  # noqa: PLC0415
+
     pyproject = ModifiablePyproject.load(
         CONFIG_PATH.pyproject if CONFIG_PATH.pyproject.exists() else ""
     )
@@ -277,6 +283,8 @@ def _write_pyproject(policy: dict[str, Any]) -> None:
 
 
 def _apply(pyproject: ModifiablePyproject, policy: dict[str, Any]) -> None:
+    from compwa_policy.cli._settings import POLICY_TABLE  # noqa: PLC0415
+
     _apply_table(pyproject, POLICY_TABLE, policy)
 
 
@@ -301,6 +309,8 @@ def _apply_table(
 
 def _find_relocatable_notebook_hooks(precommit: ModifiablePrecommit) -> list[str]:
     """List the notebook hook IDs still served from the ComPWA/policy repo entry."""
+    from compwa_policy.format.precommit import NOTEBOOK_HOOK_IDS  # noqa: PLC0415
+
     policy_repo = precommit.find_repo(r".*/(ComPWA\-)?policy")
     if policy_repo is None:
         return []
@@ -312,6 +322,8 @@ def _find_relocatable_notebook_hooks(precommit: ModifiablePrecommit) -> list[str
 def _apply_precommit_changes(
     precommit: ModifiablePrecommit, hook: Hook, *, strip_args: bool, relocate: bool
 ) -> None:
+    from compwa_policy.format.precommit import migrate_notebook_hooks_to_nbhooks  # noqa: PLC0415
+
     with contextlib.suppress(PolicyError), precommit:
         if strip_args:
             del hook["args"]
@@ -0,0 +1,258 @@
+"""``policy serve`` — keep the checks loaded in a daemon between pre-commit runs.
+
+A pre-commit run of :program:`check-dev-files` spends most of its time on starting the
+interpreter and importing the check modules with their dependencies, before any check
+runs. This command starts a daemon that imports all check modules once and then
+listens on a Unix socket for runs of :program:`check-dev-files-client` (see
+:mod:`compwa_policy.client`). Each run is executed in the working directory of the
+client, with the arguments and the forwarded environment variables of the client,
+exactly like :program:`check-dev-files`.
+
+Between runs, the daemon keeps the imported modules, the bundled templates, and the
+parsed configuration files in memory. Parsed files are reused only if their modification
+time did not change (see `.ParseCache`). Results that depend on the contents of the
+repository are computed again for each run. So are the latest revisions of the
+pre-commit hooks, which are then looked up in the persisted cache of the
+`.RevisionResolver`, so that they expire like they do for separate runs.
+
+The runs change the working directory of the daemon, so they are handled one after the
+other.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import threading
+import traceback
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, BinaryIO
+
+import typer
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Mapping, Sequence
+
+SocketPath = Annotated[
+    Path | None,
+    typer.Option(
+        "--socket",
+        dir_okay=False,
+        show_default=False,
+        help=(
+            "Unix socket on which to listen. Defaults to $COMPWA_POLICY_SOCKET or to"
+            " compwa-policy.sock in $XDG_RUNTIME_DIR or in a private directory under"
+            " the temporary directory."
+        ),
+    ),
+]
+
+
+def serve(socket_path: SocketPath = None) -> None:
+    """Run a daemon to which check-dev-files-client forwards its runs."""
+    from compwa_policy.client import get_socket_path  # noqa: PLC0415
+
+    if socket_path is None:
+        socket_path = get_socket_path()
+    with PolicyServer(socket_path) as server:
+        print(f"Listening on {socket_path}", file=sys.stderr)  # noqa: T201
+        with contextlib.suppress(KeyboardInterrupt):
+            server.serve_forever()
+
+
+class PolicyServer(socketserver.UnixStreamServer):
+    """Daemon that runs :program:`check-dev-files` for each connecting client.
+
+    The socket is only accessible to the current user, because any client can run the
+    checks in any directory that the user can write to. It is created with mode 0600,
+    in a directory that other users cannot write to. The socket file is removed when the
+    server is closed.
+    """
+
+    def __init__(self, socket_path: Path) -> None:
+        _create_socket_directory(socket_path.parent)
+        _remove_stale_socket(socket_path)
+        previous_umask = os.umask(0o177)
+        try:
+            super().__init__(str(socket_path), _RequestHandler)
+        finally:
+            os.umask(previous_umask)
+        self.socket_path = socket_path
+        _preload()
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        request = json.loads(line)
+        lock = threading.Lock()
+        stdout = _MessageWriter(self.wfile, "stdout", lock)
+        stderr = _MessageWriter(self.wfile, "stderr", lock)
+        exit_code = run_request(
+            request["cwd"], request["argv"], stdout, stderr, request.get("env")
+        )
+        _send(self.wfile, {"exit_code": exit_code}, lock)
+
+
+def run_request(
+    cwd: Path | str,
+    argv: Sequence[str],
+    stdout: io.TextIOBase,
+    stderr: io.TextIOBase,
+    environment: Mapping[str, str] | None = None,
+) -> int:
+    """Run :program:`check-dev-files` with *argv* in *cwd* and return its exit code.
+
+    The forwarded variables of the *environment* replace those of the daemon (see
+    :func:`.is_forwarded_variable`). `None` keeps the environment of the daemon. The
+    working directory and the environment of the process are restored afterwards.
+    The revisions that earlier runs resolved are forgotten, so that they expire.
+    """
+    from compwa_policy.cli import hook_app  # noqa: PLC0415
+    from compwa_policy.utilities.caching import clear_repository_caches  # noqa: PLC0415
+    from compwa_policy.utilities.precommit.revisions import get_revision_resolver  # noqa: PLC0415
+
+    previous_cwd = Path.cwd()
+    os.chdir(cwd)
+    clear_repository_caches()
+    get_revision_resolver().clear()
+    try:
+        with (
+            _use_environment(environment),
+            contextlib.redirect_stdout(stdout),
+            contextlib.redirect_stderr(stderr),
+        ):
+            try:
+                hook_app(list(argv), prog_name="check-dev-files")
+            except SystemExit as exception:
+                return _to_exit_code(exception.code)
+            except Exception:  # noqa: BLE001
+                traceback.print_exc()
+                return 1
+            return 0
+    finally:
+        os.chdir(previous_cwd)
+
+
+@contextlib.contextmanager
+def _use_environment(
+    environment: Mapping[str, str] | None,
+) -> Generator[None, None, None]:
+    """Replace the forwarded environment variables of the daemon temporarily."""
+    if environment is None:
+        yield
+        return
+    from compwa_policy.client import is_forwarded_variable  # noqa: PLC0415
+
+    previous = {
+        name: value for name, value in os.environ.items() if is_forwarded_variable(name)
+    }
+    for name in previous:
+        del os.environ[name]
+    os.environ.update({
+        name: value
+        for name, value in environment.items()
+        if is_forwarded_variable(name)
+    })
+    try:
+        yield
+    finally:
+        for name in list(os.environ):
+            if is_forwarded_variable(name):
+                del os.environ[name]
+        os.environ.update(previous)
+
+
+def _to_exit_code(code: str | int | None) -> int:
+    """Convert the code of a `SystemExit` like the interpreter does.
+
+    >>> _to_exit_code(None), _to_exit_code(2), _to_exit_code("message")
+    (0, 2, 1)
+    """
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)  # noqa: T201
+    return 1
+
+
+class _MessageWriter(io.TextIOBase):
+    """Text stream that forwards each write to the client as a JSON message."""
+
+    def __init__(self, stream: BinaryIO, name: str, lock: threading.Lock) -> None:
+        self.__stream = stream
+        self.__name = name
+        self.__lock = lock
+
+    def writable(self) -> bool:  # noqa: PLR6301
+        return True
+
+    def write(self, text: str) -> int:
+        if text:
+            _send(self.__stream, {self.__name: text}, self.__lock)
+        return len(text)
+
+
+def _send(stream: BinaryIO, message: dict, lock: threading.Lock) -> None:
+    with lock:
+        stream.write(json.dumps(message).encode() + b"\n")
+        stream.flush()
+
+
+def _create_socket_directory(directory: Path) -> None:
+    """Create the *directory* of the socket, or check that other users cannot write to it.
+
+    Other users could otherwise replace the socket. Shared directories like
+    :file:`/tmp` are accepted if they have the sticky bit set.
+    """
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not hasattr(os, "getuid"):
+        return
+    status = directory.stat()
+    is_shared = status.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    if status.st_uid not in {0, os.getuid()} or (
+        is_shared and not status.st_mode & stat.S_ISVTX
+    ):
+        msg = f"Other users can write to the directory of the socket {directory}"
+        raise typer.BadParameter(msg, param_hint="--socket")
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    """Remove a socket file that was left behind by a daemon that no longer runs."""
+    from compwa_policy.client import is_owned_by_user  # noqa: PLC0415
+
+    if not socket_path.exists():
+        return
+    if not is_owned_by_user(socket_path):
+        msg = f"The socket {socket_path} belongs to another user"
+        raise typer.BadParameter(msg, param_hint="--socket")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()
+            return
+    msg = f"Another policy daemon is already listening on {socket_path}"
+    raise typer.BadParameter(msg, param_hint="--socket")
+
+
+def _preload() -> None:
+    """Import every check module, so that the first run does not have to."""
+    from compwa_policy.cli import hook_app  # noqa: F401, PLC0415
+    from compwa_policy.cli._checks import CHECK_HOOKS  # noqa: PLC0415
+
+    for hook in CHECK_HOOKS:
+        hook.load()
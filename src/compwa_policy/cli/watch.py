@@ -0,0 +1,243 @@
+"""``policy watch`` — run the affected checks whenever a trigger file is modified.
+
+The command polls the modification times of the files that trigger at least one check
+(see `.FileSet`), among the files that :code:`git ls-files` reports, including untracked
+files that are not ignored. The files are only listed again if one of the directories
+that contain them (or one of the :file:`.gitignore` files) changed, so a poll usually
+does not fork any process. When some of the files change, it runs only the checks that
+are triggered by those files, like the ``check-dev-files`` pre-commit hook does for the
+files of a commit. The files that the checks modify themselves do not trigger another
+run, but files that are modified otherwise while the checks run do.
+
+The process stays alive between runs, so the check modules are imported only once and
+the parsed configuration files are kept in memory (see `.ParseCache`). The options are
+read from ``[tool.compwa.policy]`` again for each run, so that changes to the
+configuration take effect immediately.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import sys
+import threading
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING, Annotated, Any
+
+import typer
+
+from compwa_policy.cli._options import Jobs, MirrorDir, NoCache, Offline, RevisionTtl  # noqa: TC001
+from compwa_policy.utilities.instrumentation import REMOVE_EVENT, WRITE_EVENT
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+    from compwa_policy.utilities.check_hook import FileSet
+
+Interval = Annotated[
+    float,
+    typer.Option(
+        "--interval",
+        min=0.01,
+        help="Seconds between two checks for modified files.",
+    ),
+]
+
+
+def watch(  # noqa: PLR0917
+    interval: Interval = 0.5,
+    no_cache: NoCache = False,
+    jobs: Jobs = None,
+    offline: Offline = False,
+    mirror_dir: MirrorDir = None,
+    revision_ttl: RevisionTtl = 24,
+) -> None:
+    """Run the checks that are triggered by each modification of their files."""
+    from compwa_policy.cli._checks import CHECK_DEV_FILES, CHECK_HOOKS  # noqa: PLC0415
+    from compwa_policy.utilities.precommit.revisions import get_revision_resolver  # noqa: PLC0415
+
+    resolver = get_revision_resolver()
+    resolver.offline = offline
+    resolver.mirror_dir = mirror_dir
+    resolver.ttl = timedelta(hours=revision_ttl)
+    for hook in CHECK_HOOKS:
+        hook.load()
+    watcher = FileWatcher(CHECK_DEV_FILES)
+    print("Watching for modified files, press Ctrl+C to stop", file=sys.stderr)  # noqa: T201
+    with contextlib.suppress(KeyboardInterrupt):
+        while True:
+            time.sleep(interval)
+            modified = watcher.poll()
+            if modified:
+                with watcher.accept_writes():
+                    run_modified(modified, use_cache=not no_cache, jobs=jobs)
+
+
+_Stamp = tuple[int, int]
+"""Modification time in nanoseconds and size of a file."""
+
+
+class FileWatcher:
+    """Poll the modification times of the files that belong to a `.FileSet`.
+
+    The files are listed with :code:`git ls-files` once. A poll only lists them again if
+    files were created, removed, or renamed in one of the directories of the listed
+    files, or if a :file:`.gitignore` file changed. Otherwise, it only gets the status of
+    the known files.
+    """
+
+    def __init__(self, files: FileSet) -> None:
+        self.files = files
+        self.__paths: list[str] = []
+        self.__listing_stamps: dict[str, _Stamp | None] = {}
+        self.__stamps = self.__scan()
+
+    def poll(self) -> list[str]:
+        """Get the files that were created, modified, or removed since the last poll."""
+        stamps = self.__scan()
+        modified = sorted(
+            path
+            for path in stamps.keys() | self.__stamps.keys()
+            if stamps.get(path) != self.__stamps.get(path)
+        )
+        self.__stamps = stamps
+        return modified
+
+    @contextlib.contextmanager
+    def accept_writes(self) -> Generator[None, None, None]:
+        """Accept the files that a `.FileTransaction` commits or removes in this block.
+
+        The state of the previous poll remains the reference for all other files, so
+        that the next poll reports files that were modified while the checks ran.
+        """
+        with _record_writes() as written:
+            yield
+        if not written:
+            return
+        stamps = self.__scan()
+        for path in self.__stamps.keys() | stamps.keys():
+            if not _is_written(path, written):
+                continue
+            stamp = stamps.get(path)
+            if stamp is None:
+                self.__stamps.pop(path, None)
+            else:
+                self.__stamps[path] = stamp
+
+    def __scan(self) -> dict[str, _Stamp]:
+        listing_stamps = {path: _stat(path) for path in self.__listing_stamps}
+        if not listing_stamps or listing_stamps != self.__listing_stamps:
+            self.__list_files(listing_stamps)
+        stamps: dict[str, _Stamp] = {}
+        for path in self.__paths:
+            stamp = _stat(path)
+            if stamp is not None:
+                stamps[path] = stamp
+        return stamps
+
+    def __list_files(self, listing_stamps: dict[str, _Stamp | None]) -> None:
+        """List the files again, taking the stamps that indicate a new listing."""
+        from compwa_policy.utilities.match import RepositoryIndex  # noqa: PLC0415
+
+        listed = RepositoryIndex.load().git_ls_files(untracked=True)
+        self.__paths = [path for path in listed if self.files.matches(path)]
+        watched = _get_directories(listed)
+        watched.update(p for p in listed if os.path.basename(p) == ".gitignore")
+        self.__listing_stamps = {
+            path: listing_stamps[path] if path in listing_stamps else _stat(path)
+            for path in sorted(watched)
+        }
+
+
+def _stat(path: str) -> _Stamp | None:
+    try:
+        status = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return status.st_mtime_ns, status.st_size
+
+
+def _get_directories(paths: Iterable[str]) -> set[str]:
+    """Get the directories that contain the *paths*, including their parents.
+
+    >>> sorted(_get_directories(["README.md", "docs/api/index.md"]))
+    ['.', 'docs', 'docs/api']
+    """
+    directories = {"."}
+    for path in paths:
+        directory = os.path.dirname(path)
+        while directory and directory not in directories:
+            directories.add(directory)
+            directory = os.path.dirname(directory)
+    return directories
+
+
+def _is_written(path: str, written: set[str]) -> bool:
+    """Check whether *path* or one of its parent directories was written.
+
+    >>> _is_written("docs/conf.py", {"docs"}), _is_written("docs.py", {"docs"})
+    (True, False)
+    """
+    return any(
+        path == written_path or path.startswith(f"{written_path}/")
+        for written_path in written
+    )
+
+
+_WRITTEN: set[str] | None = None
+_WRITTEN_LOCK = threading.Lock()
+_AUDIT_HOOK_INSTALLED = False
+
+
+def _audit_hook(event: str, args: tuple[Any, ...]) -> None:
+    written = _WRITTEN
+    if written is not None and event in {WRITE_EVENT, REMOVE_EVENT}:
+        path = os.path.relpath(os.path.abspath(args[0]))
+        with _WRITTEN_LOCK:
+            written.add(path.replace(os.sep, "/"))
+
+
+@contextlib.contextmanager
+def _record_writes() -> Generator[set[str], None, None]:
+    """Collect the files that are committed or removed in this block.
+
+    Audit hooks cannot be removed, so the hook is installed on first use and does
+    nothing outside this block.
+    """
+    global _AUDIT_HOOK_INSTALLED, _WRITTEN  # noqa: PLW0603
+    if not _AUDIT_HOOK_INSTALLED:
+        sys.addaudithook(_audit_hook)
+        _AUDIT_HOOK_INSTALLED = True
+    written: set[str] = set()
+    _WRITTEN = written
+    try:
+        yield written
+    finally:
+        _WRITTEN = None
+
+
+def run_modified(
+    filenames: list[str], *, use_cache: bool = True, jobs: int | None = None
+) -> int:
+    """Run the checks that are triggered by the modified *filenames*.
+
+    Errors are printed instead of raised, so that one invalid edit does not stop
+    :func:`watch`. The revisions that earlier runs resolved are forgotten, so that they
+    expire.
+    """
+    from compwa_policy.cli._checks import run_all  # noqa: PLC0415
+    from compwa_policy.cli._options import build_arguments  # noqa: PLC0415
+    from compwa_policy.utilities.caching import clear_repository_caches  # noqa: PLC0415
+    from compwa_policy.utilities.precommit.revisions import get_revision_resolver  # noqa: PLC0415
+
+    print(f"Modified {', '.join(filenames)}", file=sys.stderr)  # noqa: T201
+    clear_repository_caches()
+    get_revision_resolver().clear()
+    try:
+        return run_all(build_arguments(), filenames, use_cache=use_cache, jobs=jobs)
+    except typer.Exit as exception:
+        return exception.exit_code
+    except Exception as exception:  # noqa: BLE001
+        print(f"{type(exception).__name__}: {exception}")  # noqa: T201
+        return 1
@@ -0,0 +1,162 @@
+"""Thin client that forwards :program:`check-dev-files` runs to :program:`policy serve`.
+
+Each :program:`check-dev-files` run pays for the interpreter startup and for importing
+the check modules and their dependencies. The :program:`check-dev-files-client` entry
+point only imports the standard library. It forwards its working directory, its
+arguments (including the file names that pre-commit passes), and the environment
+variables that the checks read (see :func:`get_forwarded_environment`) to a running
+:program:`policy serve` daemon over a Unix socket and prints what the daemon sends back.
+If no daemon is running, it runs the checks itself, exactly like
+:program:`check-dev-files`.
+
+The messages are JSON objects, one per line. The client sends one request
+:code:`{"cwd": ..., "argv": [...], "env": {...}}`. The daemon answers with any number of
+:code:`{"stdout": ...}` and :code:`{"stderr": ...}` messages while the checks run, and
+finishes with :code:`{"exit_code": ...}`.
+
+Any client that can connect to the socket can run the checks in any directory of the
+user of the daemon, so the socket is created in a directory that only that user can
+access (see :func:`get_socket_path`). The client only connects to a socket that belongs
+to its own user, so that another user cannot squat the path of the socket and receive
+the runs.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+    from typing import TextIO
+
+SOCKET_VARIABLE = "COMPWA_POLICY_SOCKET"
+"""Environment variable that overwrites the path of the daemon socket."""
+FORWARDED_PREFIX = "COMPWA_POLICY_"
+"""Prefix of the environment variables that are forwarded to the daemon."""
+FORWARDED_VARIABLES = frozenset({"XDG_CACHE_HOME"})
+"""Other environment variables that the checks read and that are forwarded."""
+
+
+def get_socket_path() -> Path:
+    """Get the path of the Unix socket on which the daemon listens.
+
+    Without :code:`$XDG_RUNTIME_DIR`, the socket is put in a directory of the user under
+    the shared temporary directory, which the daemon creates with mode 0700.
+
+    >>> os.environ[SOCKET_VARIABLE] = "/tmp/policy.sock"
+    >>> get_socket_path().as_posix()
+    '/tmp/policy.sock'
+    >>> del os.environ[SOCKET_VARIABLE]
+    """
+    path = os.environ.get(SOCKET_VARIABLE)
+    if path:
+        return Path(path)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "compwa-policy.sock"
+    user = os.getuid() if hasattr(os, "getuid") else os.getlogin()
+    return Path(tempfile.gettempdir()) / f"compwa-policy-{user}" / "compwa-policy.sock"
+
+
+def is_owned_by_user(path: Path) -> bool:
+    """Check whether *path* exists and belongs to the current user.
+
+    >>> is_owned_by_user(Path(tempfile.gettempdir()) / "compwa-policy-missing.sock")
+    False
+    """
+    try:
+        status = path.stat()
+    except OSError:
+        return False
+    return not hasattr(os, "getuid") or status.st_uid == os.getuid()
+
+
+def is_forwarded_variable(name: str) -> bool:
+    """Check whether the client forwards the environment variable *name* to the daemon.
+
+    >>> is_forwarded_variable("COMPWA_POLICY_OFFLINE"), is_forwarded_variable("PATH")
+    (True, False)
+    """
+    return name.startswith(FORWARDED_PREFIX) or name in FORWARDED_VARIABLES
+
+
+def get_forwarded_environment() -> dict[str, str]:
+    """Get the environment variables of the client that the daemon should use.
+
+    The daemon runs with its own environment, so variables like
+    :code:`COMPWA_POLICY_OFFLINE` that are set in the shell of the client would
+    otherwise be ignored.
+    """
+    return {
+        name: value for name, value in os.environ.items() if is_forwarded_variable(name)
+    }
+
+
+def request(
+    argv: Sequence[str],
+    cwd: Path | str | None = None,
+    *,
+    environment: Mapping[str, str] | None = None,
+    socket_path: Path | None = None,
+    stdout: TextIO | None = None,
+    stderr: TextIO | None = None,
+) -> int | None:
+    """Run :program:`check-dev-files` with *argv* in the daemon and return its exit code.
+
+    The output of the run is written to *stdout* and *stderr* as it arrives. Returns
+    `None` if no daemon listens on the *socket_path*, or if the socket belongs to
+    another user. The *environment* defaults to :func:`get_forwarded_environment`.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    if socket_path is None:
+        socket_path = get_socket_path()
+    if not is_owned_by_user(socket_path):
+        return None
+    streams = {
+        "stdout": sys.stdout if stdout is None else stdout,
+        "stderr": sys.stderr if stderr is None else stderr,
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(str(socket_path))
+        except OSError:
+            return None
+        if environment is None:
+            environment = get_forwarded_environment()
+        message = {
+            "cwd": str(Path.cwd() if cwd is None else cwd),
+            "argv": list(argv),
+            "env": dict(environment),
+        }
+        connection.sendall(json.dumps(message).encode() + b"\n")
+        with connection.makefile(encoding="utf-8") as responses:
+            for line in responses:
+                response: dict = json.loads(line)
+                if "exit_code" in response:
+                    return response["exit_code"]
+                for name, text in response.items():
+                    streams[name].write(text)
+                    streams[name].flush()
+    msg = f"The policy daemon on {socket_path} closed the connection before finishing"
+    raise ConnectionError(msg)
+
+
+def main() -> None:
+    exit_code = request(sys.argv[1:])
+    if exit_code is None:
+        from compwa_policy.cli import check_dev_files_main  # noqa: PLC0415
+
+        check_dev_files_main()
+        return
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
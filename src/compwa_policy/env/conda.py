@@ -14,7 +14,7 @@ from compwa_policy.utilities.pyproject import (
     get_constraints_file,
     has_pyproject_package_name,
 )
-from compwa_policy.utilities.yaml import create_prettier_round_trip_yaml
+from compwa_policy.utilities.yaml import create_prettier_round_trip_yaml, dumps_yaml
 
 if TYPE_CHECKING:
     from compwa_policy import Arguments
@@ -22,11 +22,7 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Changelog, Session
 
 
-@check_hook(
-    group="env",
-    paths=[CONFIG_PATH.conda, CONFIG_PATH.gitignore, CONFIG_PATH.pyproject],
-    directories=[CONFIG_PATH.pip_constraints],
-)
+@check_hook(group="env")
 def check(session: Session, args: Arguments, _: CheckContext) -> None:
     if args.package_manager == "conda":
         update_conda_environment(session, args.dev_python_version)
@@ -43,8 +39,9 @@ def update_conda_environment(
         return
     yaml = create_prettier_round_trip_yaml()
     updated = False
-    if CONFIG_PATH.conda.exists():
-        conda_env: CommentedMap = yaml.load(CONFIG_PATH.conda)
+    conda_file = session.get_path(CONFIG_PATH.conda)
+    if conda_file.exists:
+        conda_env: CommentedMap = yaml.load(conda_file.read_text())
     else:
         conda_env = __create_conda_environment(session, python_version)
         updated = True
@@ -54,7 +51,7 @@ def update_conda_environment(
     updated |= __update_python_version(python_version, conda_deps)
     updated |= __update_pip_dependencies(python_version, conda_deps)
     if updated:
-        yaml.dump(conda_env, CONFIG_PATH.conda)
+        conda_file.write_text(dumps_yaml(yaml, conda_env))
         msg = f"Updated Conda environment for Python {python_version}"
         session.changelog.append(msg)
 
@@ -121,16 +118,15 @@ def __get_pip_dependencies(dependencies: CommentedSeq) -> CommentedSeq | None:
 
 
 def _remove_conda_configuration(session: Session, /) -> None:
-    session.changelog += __remove_environment_yml()
+    session.changelog += __remove_environment_yml(session)
     # cspell:ignore condaenv
     remove_lines(session, CONFIG_PATH.gitignore, r".*condaenv.*")
     remove_lines(session, CONFIG_PATH.gitignore, r".*environment\.yml.*")
 
 
-def __remove_environment_yml() -> Changelog:
-    if not CONFIG_PATH.conda.exists():
+def __remove_environment_yml(session: Session, /) -> Changelog:
+    if not session.get_path(CONFIG_PATH.conda).remove():
         return []
-    CONFIG_PATH.conda.unlink()
     msg = (
         "Removed Conda configuration, because conda was not selected as package manager"
     )
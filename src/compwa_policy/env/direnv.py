@@ -5,8 +5,6 @@ from __future__ import annotations
 from textwrap import dedent, indent
 from typing import TYPE_CHECKING
 
-import rtoml
-
 from compwa_policy.env.pixi import has_pixi_config
 from compwa_policy.utilities import CONFIG_PATH
 from compwa_policy.utilities.check_hook import check_hook
@@ -17,15 +15,7 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Changelog, Session
 
 
-@check_hook(
-    group="env",
-    paths=[
-        CONFIG_PATH.envrc,
-        CONFIG_PATH.conda,
-        CONFIG_PATH.pixi_toml,
-        CONFIG_PATH.pyproject,
-    ],
-)
+@check_hook(group="env")
 def check(session: Session, args: Arguments, ctx: CheckContext) -> None:
     package_manager = args.package_manager
     variables = ctx.environment_variables
@@ -33,16 +23,16 @@ def check(session: Session, args: Arguments, ctx: CheckContext) -> None:
         return
     if package_manager == "uv":
         script = __get_uv_direnv(variables) + "\n"
-        session.changelog += __update_envrc_content(script)
+        session.changelog += __update_envrc_content(session, script)
         return
     if package_manager == "pixi+uv":
         script = __get_pixi_direnv(session) + "\n"
         script += __get_uv_direnv(variables) + "\n"
-        session.changelog += __update_envrc_content(script)
+        session.changelog += __update_envrc_content(session, script)
         return
     if package_manager == "pixi":
         script = __get_pixi_direnv(session) + "\n"
-        session.changelog += __update_envrc_content(script)
+        session.changelog += __update_envrc_content(session, script)
         return
     statements: list[tuple[str | None, str]] = [
         (".venv", "source .venv/bin/activate"),
@@ -51,9 +41,9 @@ def check(session: Session, args: Arguments, ctx: CheckContext) -> None:
     if has_pixi_config(session):
         script = __get_pixi_direnv(session)
         statements.append((".pixi", script))
-    if CONFIG_PATH.conda.exists():
+    if session.get_path(CONFIG_PATH.conda).exists:
         statements.append((None, "layout anaconda"))
-    session.changelog += _update_envrc(statements)
+    session.changelog += _update_envrc(session, statements)
 
 
 def __get_pixi_direnv(session: Session, /) -> str:
@@ -92,16 +82,17 @@ def __determine_pixi_dev_environment(session: Session, /) -> str | None:
 
 
 def __get_pixi_environment_names(session: Session, /) -> set[str]:
-    if CONFIG_PATH.pixi_toml.exists():
-        pixi_config = rtoml.load(CONFIG_PATH.pixi_toml)
-        return set(pixi_config.get("environments", set()))
+    if session.exists(CONFIG_PATH.pixi_toml):
+        return set(session.pixi.get_table("environments", fallback={}))
     pyproject = session.pyproject
     if pyproject is not None and pyproject.has_table("tool.pixi.environments"):
         return set(pyproject.get_table("tool.pixi.environments"))
     return set()
 
 
-def _update_envrc(statements: list[tuple[str | None, str]]) -> Changelog:
+def _update_envrc(
+    session: Session, /, statements: list[tuple[str | None, str]]
+) -> Changelog:
     expected = ""
     for i, (trigger_path, script) in enumerate(statements):
         if trigger_path is not None:
@@ -112,20 +103,11 @@ def _update_envrc(statements: list[tuple[str | None, str]]) -> Changelog:
         script = dedent(script).strip()
         expected += indent(script, prefix="  ") + "\n"
     expected += "fi\n"
-    return __update_envrc_content(expected)
+    return __update_envrc_content(session, expected)
 
 
-def __update_envrc_content(expected: str) -> Changelog:
-    if __get_existing_envrc() == expected:
+def __update_envrc_content(session: Session, /, expected: str) -> Changelog:
+    if not session.get_path(CONFIG_PATH.envrc).write_text(expected):
         return []
-    with open(CONFIG_PATH.envrc, "w") as f:
-        f.write(expected)
     msg = f"Updated {CONFIG_PATH.envrc} for direnv"
     return [msg]
-
-
-def __get_existing_envrc() -> str | None:
-    if not CONFIG_PATH.envrc.exists():
-        return None
-    with open(CONFIG_PATH.envrc) as f:
-        return f.read()
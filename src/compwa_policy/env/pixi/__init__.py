@@ -7,7 +7,6 @@ from typing import TYPE_CHECKING
 from compwa_policy.env.pixi._helpers import has_pixi_config
 from compwa_policy.env.pixi._remove import remove_pixi_configuration
 from compwa_policy.env.pixi._update import update_pixi_configuration
-from compwa_policy.utilities import CONFIG_PATH
 from compwa_policy.utilities.check_hook import check_hook
 
 if TYPE_CHECKING:
@@ -21,18 +20,7 @@ __all__ = [
 ]
 
 
-@check_hook(
-    group="env",
-    paths=[
-        CONFIG_PATH.conda,
-        CONFIG_PATH.gitattributes,
-        CONFIG_PATH.gitignore,
-        CONFIG_PATH.pixi_lock,
-        CONFIG_PATH.pixi_toml,
-        CONFIG_PATH.pyproject,
-        CONFIG_PATH.vscode_settings,
-    ],
-)
+@check_hook(group="env")
 def check(session: Session, args: Arguments, ctx: CheckContext) -> None:
     if "pixi" in args.package_manager:
         update_pixi_configuration(
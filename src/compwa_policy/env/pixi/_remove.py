@@ -18,7 +18,7 @@ def remove_pixi_configuration(session: Session, /) -> None:
     vscode.remove_settings(
         session, {"files.associations": ["**/pixi.lock", "pixi.lock"]}
     )
-    if CONFIG_PATH.pyproject.exists():
+    if session.exists(CONFIG_PATH.pyproject):
         pyproject = session.pyproject
     else:
         return
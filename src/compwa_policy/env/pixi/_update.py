@@ -54,8 +54,8 @@ def update_pixi_configuration(
     )
     _rename_workspace_table(config)
     _define_minimal_project(session, package_manager)
-    _import_conda_dependencies(config)
-    _import_conda_environment(config)
+    _import_conda_dependencies(session, config)
+    _import_conda_environment(session, config)
     if package_manager == "pixi+uv":
         _define_combined_ci_job(config)
     else:
@@ -146,11 +146,11 @@ def _define_minimal_project(
         config.changelog.append(msg)
 
 
-def _import_conda_dependencies(config: ModifiablePyproject) -> None:
-    if not CONFIG_PATH.conda.exists():
+def _import_conda_dependencies(session: Session, config: ModifiablePyproject) -> None:
+    conda_path = session.get_path(CONFIG_PATH.conda)
+    if not conda_path.exists:
         return
-    with CONFIG_PATH.conda.open() as stream:
-        conda = yaml.safe_load(stream)
+    conda = yaml.safe_load(conda_path.read_text())
     conda_dependencies = conda.get("dependencies", [])
     if not conda_dependencies:
         return
@@ -194,11 +194,11 @@ def __to_pixi_dependency(conda_dependency: str) -> tuple[str, str]:
     return package, f"{operator}{version}"
 
 
-def _import_conda_environment(config: ModifiablePyproject) -> None:
-    if not CONFIG_PATH.conda.exists():
+def _import_conda_environment(session: Session, config: ModifiablePyproject) -> None:
+    conda_path = session.get_path(CONFIG_PATH.conda)
+    if not conda_path.exists:
         return
-    with CONFIG_PATH.conda.open() as stream:
-        conda = yaml.safe_load(stream)
+    conda = yaml.safe_load(conda_path.read_text())
     conda_variables = {k: str(v) for k, v in conda.get("variables", {}).items()}
     if not conda_variables:
         return
@@ -6,14 +6,11 @@ from pathlib import Path
 from textwrap import dedent
 from typing import TYPE_CHECKING
 
-import rtoml
-from jinja2 import Environment, FileSystemLoader
-
-from compwa_policy.utilities import COMPWA_POLICY_DIR, CONFIG_PATH, readme, vscode
+from compwa_policy.utilities import CONFIG_PATH, readme, vscode
 from compwa_policy.utilities.check_hook import check_hook
 from compwa_policy.utilities.match import is_committed
 from compwa_policy.utilities.precommit.struct import Hook, Repo
-from compwa_policy.utilities.pyproject.getters import has_sub_table
+from compwa_policy.utilities.templates import render_template
 
 if TYPE_CHECKING:
     from compwa_policy import Arguments
@@ -24,21 +21,7 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Changelog, Session
 
 
-@check_hook(
-    group="env",
-    paths=[
-        CONFIG_PATH.editorconfig,
-        CONFIG_PATH.pixi_toml,
-        CONFIG_PATH.precommit,
-        CONFIG_PATH.pyproject,
-        CONFIG_PATH.readme,
-        CONFIG_PATH.vscode_settings,
-        ".python-version",
-        "CONTRIBUTING.md",
-        "uv.lock",
-    ],
-    directories=[CONFIG_PATH.pip_constraints],
-)
+@check_hook(group="env")
 def check(session: Session, args: Arguments, _: CheckContext) -> None:
     precommit_config = session.precommit
     if "uv" in args.package_manager:
@@ -46,12 +29,12 @@ def check(session: Session, args: Arguments, _: CheckContext) -> None:
             session,
             "[![uv](https://img.shields.io/endpoint?url=https://raw.githubusercontent.com/astral-sh/uv/main/assets/badge/v0.json)](https://github.com/astral-sh/uv)",
         )
-        session.changelog += _update_editor_config()
+        session.changelog += _update_editor_config(session)
         _update_python_version_file(session, args.dev_python_version)
         _update_uv_lock_hook(precommit_config)
         if not args.keep_contributing_md:
             _update_contributing_file(session, args.repo_organization, args.repo_name)
-        session.changelog += _remove_pip_constraint_files()
+        session.changelog += _remove_pip_constraint_files(session)
         vscode.remove_settings(
             session,
             {"files.associations": ["**/.constraints/py*.txt"]},
@@ -67,7 +50,7 @@ def check(session: Session, args: Arguments, _: CheckContext) -> None:
         )
     else:
         _remove_uv_configuration(session.pyproject)
-        session.changelog += _remove_uv_lock()
+        session.changelog += _remove_uv_lock(session)
         precommit_config.remove_hook("uv-lock")
         readme.remove_badge(
             session,
@@ -76,15 +59,9 @@ def check(session: Session, args: Arguments, _: CheckContext) -> None:
         vscode.remove_settings(session, {"search.exclude": ["uv.lock", "**/uv.lock"]})
 
 
-def _remove_pip_constraint_files() -> Changelog:
-    if not CONFIG_PATH.pip_constraints.exists():
+def _remove_pip_constraint_files(session: Session, /) -> Changelog:
+    if not session.get_path(CONFIG_PATH.pip_constraints).remove():
         return []
-    for item in CONFIG_PATH.pip_constraints.iterdir():
-        if item.is_dir():
-            item.rmdir()
-        else:
-            item.unlink()
-    CONFIG_PATH.pip_constraints.rmdir()
     msg = f"Removed deprecated {CONFIG_PATH.pip_constraints}. Use uv.lock instead."
     return [msg]
 
@@ -100,17 +77,17 @@ def _remove_uv_configuration(pyproject: ModifiablePyproject | None) -> None:
     pyproject.changelog.append("Removed uv configuration from pyproject.toml.")
 
 
-def _remove_uv_lock() -> Changelog:
+def _remove_uv_lock(session: Session, /) -> Changelog:
     uv_lock_path = Path("uv.lock")
-    if uv_lock_path.exists():
-        uv_lock_path.unlink()
+    if session.get_path(uv_lock_path).remove():
         msg = f"Removed {uv_lock_path} file."
         return [msg]
     return []
 
 
-def _update_editor_config() -> Changelog:
-    if not CONFIG_PATH.editorconfig.exists():
+def _update_editor_config(session: Session, /) -> Changelog:
+    editorconfig = session.get_path(CONFIG_PATH.editorconfig)
+    if not editorconfig.exists:
         return []
     if not is_committed("uv.lock"):
         return []
@@ -118,11 +95,10 @@ def _update_editor_config() -> Changelog:
     [uv.lock]
     indent_size = 4
     """).strip()
-    existing_content = CONFIG_PATH.editorconfig.read_text()
+    existing_content = editorconfig.read_text()
     if expected_content in existing_content:
         return []
-    with open(CONFIG_PATH.editorconfig, "a") as stream:
-        stream.write("\n" + expected_content + "\n")
+    editorconfig.write_text(existing_content + "\n" + expected_content + "\n")
     return [f"Updated {CONFIG_PATH.editorconfig} for uv.lock"]
 
 
@@ -135,24 +111,22 @@ def _update_python_version_file(
     if pyproject is None:
         return
     python_version_file = Path(".python-version")
+    python_version = session.get_path(python_version_file)
     if pyproject.has_table("project"):
         requires_python = pyproject.get_table("project").get("requires-python", "")
         if "==" in requires_python or "~=" in requires_python:
-            if python_version_file.exists():
-                python_version_file.unlink()
+            if python_version.remove():
                 msg = f"Removed {python_version_file} file because requires-python already pins the Python version"
                 session.changelog.append(msg)
                 return
             return
 
     existing_python_version = ""
-    if python_version_file.exists():
-        with open(python_version_file) as stream:
-            existing_python_version = stream.read().strip()
+    if python_version.exists:
+        existing_python_version = python_version.read_text().strip()
     if existing_python_version == dev_python_version:
         return
-    with open(".python-version", "w") as stream:
-        stream.write(dev_python_version + "\n")
+    python_version.write_text(dev_python_version + "\n")
     msg = f"Updated {python_version_file} to {dev_python_version}"
     session.changelog.append(msg)
 
@@ -176,25 +150,17 @@ def _update_contributing_file(
     repo_name: str,
 ) -> None:
     contributing_file = Path("CONTRIBUTING.md")
-    if not contributing_file.exists():
+    contributing = session.get_path(contributing_file)
+    if not contributing.exists:
         return
-    template_dir = COMPWA_POLICY_DIR / ".template"
-    env = Environment(
-        autoescape=True,
-        loader=FileSystemLoader(template_dir),
-    )
-    template = env.get_template("CONTRIBUTING.md.jinja")
     context = {
         "ORGANIZATION": organization,
         "REPO_NAME": repo_name,
         "RUNNER": __get_runner_instructions(session).strip(),
     }
-    expected_content = template.render(context).strip() + "\n"
-    existing_content = ""
-    if contributing_file.exists():
-        existing_content = contributing_file.read_text()
-    if expected_content != existing_content:
-        contributing_file.write_text(expected_content)
+    expected_content = render_template("CONTRIBUTING.md.jinja", context)
+    expected_content = expected_content.strip() + "\n"
+    if contributing.write_text(expected_content):
         msg = f"Updated {contributing_file} to latest template"
         session.changelog.append(msg)
 
@@ -238,8 +204,6 @@ def __get_runner_instructions(session: Session, /) -> str:
             return poe_instructions
         if pyproject.has_table("tool.pixi.tasks"):
             return pixi_instructions
-    if CONFIG_PATH.pixi_toml.exists():
-        pixi_config = rtoml.load(CONFIG_PATH.pixi_toml)
-        if has_sub_table(pixi_config, "tasks"):
-            return pixi_instructions
+    if session.exists(CONFIG_PATH.pixi_toml) and session.pixi.has_table("tasks"):
+        return pixi_instructions
     return ""
@@ -5,25 +5,25 @@ See `cSpell <https://github.com/streetsidesoftware/cspell/tree/main/packages/csp
 
 from __future__ import annotations
 
-import json
-import os
-from copy import deepcopy
+import re
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from compwa_policy.utilities import COMPWA_POLICY_DIR, CONFIG_PATH, rename_file, vscode
+from compwa_policy.utilities import CONFIG_PATH, vscode
 from compwa_policy.utilities.check_hook import check_hook
+from compwa_policy.utilities.cspell import ModifiableCspellConfig, sort_section
 from compwa_policy.utilities.match import filter_patterns
 from compwa_policy.utilities.precommit.struct import Hook, Repo
 from compwa_policy.utilities.readme import add_badge, remove_badge
+from compwa_policy.utilities.templates import load_json_template
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
-    from pathlib import Path
+    from collections.abc import Sequence
 
     from compwa_policy import Arguments
     from compwa_policy.utilities.check_hook import CheckContext
     from compwa_policy.utilities.precommit import ModifiablePrecommit
-    from compwa_policy.utilities.session import Changelog, Session
+    from compwa_policy.utilities.session import Session
 
 __VSCODE_EXTENSION_NAME = "streetsidesoftware.code-spell-checker"
 
@@ -32,36 +32,21 @@ __BADGE = "[![Spelling checked](https://img.shields.io/badge/cspell-checked-brig
 __REPO_URL = "https://github.com/streetsidesoftware/cspell-cli"
 
 
-with open(COMPWA_POLICY_DIR / ".template" / CONFIG_PATH.cspell) as __STREAM:
-    __EXPECTED_CONFIG = json.load(__STREAM)
-
-
-@check_hook(
-    group="format",
-    paths=[
-        CONFIG_PATH.cspell,
-        CONFIG_PATH.editorconfig,
-        CONFIG_PATH.precommit,
-        CONFIG_PATH.pyproject,
-        CONFIG_PATH.readme,
-        CONFIG_PATH.vscode_extensions,
-        "cspell.json",
-    ],
-)
+@check_hook(group="format")
 def check(session: Session, args: Arguments, _: CheckContext) -> None:
     precommit = session.precommit
-    rename_file(session, "cspell.json", str(CONFIG_PATH.cspell))
+    config = session.get(ModifiableCspellConfig)
     _update_cspell_repo_url(precommit)
     has_cspell_hook = False
-    if CONFIG_PATH.cspell.exists():
+    if config.exists:
         has_cspell_hook = precommit.find_repo(__REPO_URL) is not None
     if not has_cspell_hook:
         _remove_configuration(session)
     else:
         _update_precommit_repo(precommit)
         if not args.no_cspell_update:
-            session.changelog += _update_config_content()
-        session.changelog += _sort_config_entries()
+            _update_config_content(config)
+        _sort_config_entries(config)
         add_badge(
             session,
             badge="[![Spelling checked](https://img.shields.io/badge/cspell-checked-brightgreen.svg)](https://github.com/streetsidesoftware/cspell/tree/main/packages/cspell)",
@@ -87,19 +72,18 @@ def _update_cspell_repo_url(precommit: ModifiablePrecommit) -> None:
 
 
 def _remove_configuration(session: Session, /) -> None:
-    if CONFIG_PATH.cspell.exists():
-        os.remove(CONFIG_PATH.cspell)
-        msg = f'"{CONFIG_PATH.cspell}" is no longer required and has been removed'
-        session.changelog.append(msg)
+    config = session.get(ModifiableCspellConfig)
+    msg = f'"{CONFIG_PATH.cspell}" is no longer required and has been removed'
+    if config.remove(msg):
         return
-    if CONFIG_PATH.editorconfig.exists():
-        with open(CONFIG_PATH.editorconfig) as stream:
-            prettier_ignore_content = stream.readlines()
-        expected_line = str(CONFIG_PATH.cspell) + "\n"
-        if expected_line in set(prettier_ignore_content):
-            prettier_ignore_content.remove(expected_line)
-            with open(CONFIG_PATH.editorconfig, "w") as stream:
-                stream.writelines(prettier_ignore_content)
+    if session.exists(CONFIG_PATH.editorconfig):
+        editorconfig = session.get_path(CONFIG_PATH.editorconfig)
+        pattern = rf"^{re.escape(str(CONFIG_PATH.cspell))}\n"
+        content, n_removed = re.subn(
+            pattern, "", editorconfig.read_text(), count=1, flags=re.MULTILINE
+        )
+        if n_removed:
+            editorconfig.write_text(content)
             msg = (
                 f'"{CONFIG_PATH.cspell}" in {CONFIG_PATH.editorconfig} is no longer'
                 " required and has been removed"
@@ -119,75 +103,58 @@ def _update_precommit_repo(precommit: ModifiablePrecommit) -> None:
     precommit.update_single_hook_repo(expected_hook)
 
 
-def _update_config_content() -> Changelog:
-    if not CONFIG_PATH.cspell.exists():
-        with open(CONFIG_PATH.cspell, "w") as stream:
-            stream.write("{}")
-    config = __get_config(CONFIG_PATH.cspell)
-    original_config = deepcopy(config)
-    for section_name in __EXPECTED_CONFIG:
+def _update_config_content(config: ModifiableCspellConfig) -> None:
+    expected_config = load_json_template(Path(".template") / CONFIG_PATH.cspell)
+    fixed_sections = []
+    for section_name in expected_config:
         if section_name in {"words", "ignoreWords"}:
-            if section_name not in config:
-                config[section_name] = []
-            continue
-        expected_section_content = __get_expected_content(config, section_name)
-        section_content = config.get(section_name)
-        if section_content == expected_section_content:
+            if config.deduplicate_section(section_name):
+                fixed_sections.append(section_name)
             continue
-        config[section_name] = expected_section_content
-    for section_name in list(config):
-        section_content = config[section_name]
-        if section_content in ([], {}):
-            config.pop(section_name)
-    if config != original_config:
-        __write_config(config)
-        fixed_sections = sorted(
-            section_name
-            for section_name, section in config.items()
-            if section != original_config.get(section_name)
+        is_sorted = section_name in config.document  # sorted by __get_expected_content
+        expected_section_content = __get_expected_content(
+            config.document, expected_config, section_name
         )
-        error_message = __express_list_of_sections(fixed_sections)
-        error_message += f" in {CONFIG_PATH.cspell} has been updated."
-        return [error_message]
-    return []
+        if config.set_section(
+            section_name, expected_section_content, is_sorted=is_sorted
+        ):
+            fixed_sections.append(section_name)
+    for section_name, section_content in list(config.document.items()):
+        if section_content in ([], {}) and config.remove_section(section_name):
+            fixed_sections.append(section_name)
+    if fixed_sections:
+        msg = __express_list_of_sections(sorted(set(fixed_sections)))
+        msg += f" in {CONFIG_PATH.cspell} has been updated."
+        config.changelog.append(msg)
 
 
-def _sort_config_entries() -> Changelog:
-    config = __get_config(CONFIG_PATH.cspell)
-    fixed_sections = []
-    for section, section_content in config.items():
-        if not isinstance(section_content, list):
-            continue
-        sorted_section_content = __sort_section(section_content, section)
-        if section_content == sorted_section_content:
-            continue
-        fixed_sections.append('"' + section + '"')
-        config[section] = sorted_section_content
+def _sort_config_entries(config: ModifiableCspellConfig) -> None:
+    fixed_sections = config.sort_sections()
     if fixed_sections:
-        __write_config(config)
-        error_message = __express_list_of_sections(fixed_sections)
-        error_message += f" in {CONFIG_PATH.cspell} has been sorted alphabetically."
-        return [error_message]
-    return []
+        msg = __express_list_of_sections([f'"{s}"' for s in fixed_sections])
+        msg += f" in {CONFIG_PATH.cspell} has been sorted alphabetically."
+        config.changelog.append(msg)
 
 
-def __get_expected_content(config: dict, section: str, *, extend: bool = False) -> Any:
+def __get_expected_content(
+    config: dict, expected_config: dict, section: str, *, extend: bool = False
+) -> Any:
     if section not in config:
-        return __EXPECTED_CONFIG[section]
+        return expected_config[section]
     section_content = config[section]
-    if section not in __EXPECTED_CONFIG:
+    if section not in expected_config:
         return section_content
-    expected_section_content = __EXPECTED_CONFIG[section]
+    expected_section_content = expected_config[section]
     if isinstance(expected_section_content, (bool, str)):
         return expected_section_content
     if isinstance(expected_section_content, list):
         if section == "ignorePaths":
             expected_section_content = filter_patterns(expected_section_content)
         if not extend:
-            return __sort_section(expected_section_content, section)
+            return sort_section(expected_section_content, section)
         expected_section_content_set = set(expected_section_content)
         expected_section_content_set.update(section_content)
-        return __sort_section(expected_section_content_set, section)
+        return sort_section(expected_section_content_set, section)
     msg = (
         "No implementation for section content of type"
         f' {section_content.__class__.__name__} (section: "{section}"'
@@ -219,36 +186,3 @@ def __express_list_of_sections(sections: Sequence[str]) -> str:
             sentence += ","
         sentence += " and " + sections[-1]
     return sentence
-
-
-def __get_config(path: str | Path) -> dict:
-    with open(path) as stream:
-        return json.load(stream)
-
-
-def __write_config(config: dict) -> None:
-    with open(CONFIG_PATH.cspell, "w") as stream:
-        json.dump(config, stream, indent=2, ensure_ascii=False)
-        stream.write("\n")
-
-
-def __sort_section(content: Iterable[Any], section_name: str) -> list[str]:
-    """Sort a list section.
-
-    >>> __sort_section({"one", "Two"}, section_name="words")
-    ['one', 'Two']
-    >>> __sort_section({"one", "Two"}, section_name="ignoreWords")
-    ['Two', 'one']
-    """
-    if section_name == "dictionaryDefinitions":
-
-        def sort_key(value: Any) -> str:
-            name = value.get("name", "")
-            return name.lower()
-
-        return sorted(content, key=sort_key)
-    if section_name == "ignoreWords":
-        return sorted(content)
-    str_content = [s for s in content if isinstance(s, str)]
-    other_content = [s for s in content if not isinstance(s, str)]
-    return sorted(str_content, key=str.casefold) + other_content
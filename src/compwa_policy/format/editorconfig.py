@@ -24,9 +24,9 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Session
 
 
-@check_hook(group="format", paths=[CONFIG_PATH.editorconfig, CONFIG_PATH.precommit])
+@check_hook(group="format")
 def check(session: Session, _args: Arguments, _ctx: CheckContext) -> None:
-    if CONFIG_PATH.editorconfig.exists():
+    if session.exists(CONFIG_PATH.editorconfig):
         _update_precommit_config(session.precommit)
 
 
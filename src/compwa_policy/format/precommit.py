@@ -8,11 +8,10 @@ from typing import TYPE_CHECKING, cast
 
 from ruamel.yaml.tokens import CommentToken
 
-from compwa_policy.utilities import CONFIG_PATH
 from compwa_policy.utilities.check_hook import check_hook
 from compwa_policy.utilities.precommit.getters import find_repo
 from compwa_policy.utilities.precommit.struct import Hook, Repo
-from compwa_policy.utilities.yaml import create_prettier_round_trip_yaml
+from compwa_policy.utilities.yaml import create_prettier_round_trip_yaml, dumps_yaml
 
 if TYPE_CHECKING:
     from ruamel.yaml.comments import CommentedMap
@@ -23,22 +22,18 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Session
 
 
-@check_hook(
-    group="format",
-    paths=[CONFIG_PATH.precommit, CONFIG_PATH.conda, CONFIG_PATH.pyproject],
-)
+@check_hook(group="format")
 def check(session: Session, _: Arguments, ctx: CheckContext) -> None:
     precommit = session.precommit
     _sort_hooks(precommit)
-    _update_conda_environment(precommit)
+    _update_conda_environment(session, precommit)
     _update_precommit_ci_autofix_commit_msg(precommit)
     _update_precommit_ci_autoupdate_commit_msg(precommit)
     _update_precommit_ci_skip(precommit)
     _update_notebook_hooks(precommit, ctx.has_notebooks)
     _update_repo_urls(precommit)
     if session.pyproject is not None:
-        session.pyproject.remove_dependency("pre-commit")
-        session.pyproject.remove_dependency("pre-commit-uv")
+        session.pyproject.remove_dependencies(["pre-commit", "pre-commit-uv"])
 
 
 def _sort_hooks(precommit: ModifiablePrecommit) -> None:
@@ -232,29 +227,30 @@ def get_non_functional_hooks(config: PrecommitConfig) -> list[str]:
     ]
 
 
-def _update_conda_environment(precommit: ModifiablePrecommit) -> None:
+def _update_conda_environment(session: Session, precommit: ModifiablePrecommit) -> None:
     """Temporary fix for Prettier v4 alpha releases.
 
     https://prettier.io/blog/2023/11/30/cli-deep-dive#installation
     """
     path = Path("environment.yml")
-    if not path.exists():
+    conda_file = session.get_path(path)
+    if not conda_file.exists:
         return
     yaml = create_prettier_round_trip_yaml()
-    conda_env: CommentedMap = yaml.load(path)
+    conda_env: CommentedMap = yaml.load(conda_file.read_text())
     variables: CommentedMap = conda_env.get("variables", {})
     key = "PRETTIER_LEGACY_CLI"
     if __has_prettier_v4alpha(precommit.document):
         if key not in variables:
             variables[key] = 1
             conda_env["variables"] = variables
-            yaml.dump(conda_env, path)
+            conda_file.write_text(dumps_yaml(yaml, conda_env))
             precommit.changelog.append(f"Set {key} environment variable in {path}")
     elif key in variables:
         del variables[key]
         if not variables:
             del conda_env["variables"]
-        yaml.dump(conda_env, path)
+        conda_file.write_text(dumps_yaml(yaml, conda_env))
         precommit.changelog.append(f"Removed {key} environment variable {path}")
 
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import os
 from typing import TYPE_CHECKING
 
 from compwa_policy.utilities import CONFIG_PATH, vscode
@@ -28,17 +27,7 @@ __GENERATED_LOCK_FILES = [
 ]
 
 
-@check_hook(
-    group="format",
-    paths=[
-        CONFIG_PATH.precommit,
-        CONFIG_PATH.prettier_ignore,
-        CONFIG_PATH.pyproject,
-        CONFIG_PATH.readme,
-        CONFIG_PATH.vscode_extensions,
-        CONFIG_PATH.pixi_lock,
-    ],
-)
+@check_hook(group="format")
 def check(session: Session, _args: Arguments, _ctx: CheckContext) -> None:
     precommit = session.precommit
     if precommit.find_repo(r".*/(mirrors-)?prettier(-pre-commit)?$") is None:
@@ -47,7 +36,7 @@ def check(session: Session, _args: Arguments, _ctx: CheckContext) -> None:
     add_badge(session, __BADGE)
     vscode.add_extension_recommendation(session, __VSCODE_EXTENSION_NAME)
     _update_prettier_hook(precommit)
-    session.changelog += _update_prettier_ignore()
+    session.changelog += _update_prettier_ignore(session)
 
 
 def _remove_configuration(session: Session, /) -> None:
@@ -59,11 +48,7 @@ def _remove_configuration(session: Session, /) -> None:
         ".prettierrc.yml",
         ".prettierrc",
     ]
-    removed_paths = []
-    for path in old_config_files:
-        if os.path.exists(path):
-            os.remove(path)
-            removed_paths.append(path)
+    removed_paths = [p for p in old_config_files if session.get_path(p).remove()]
     if removed_paths:
         removed_paths_str = ", ".join(removed_paths)
         msg = f"Removed redundant configuration files: {removed_paths_str}"
@@ -81,17 +66,17 @@ def _update_prettier_hook(precommit: ModifiablePrecommit) -> None:
     precommit.changelog.append("Updated URL for Prettier pre-commit hook")
 
 
-def _update_prettier_ignore() -> Changelog:
+def _update_prettier_ignore(session: Session, /) -> Changelog:
     changes: Changelog = []
-    changes += __remove_forbidden_paths()
-    changes += __insert_expected_paths()
+    changes += __remove_forbidden_paths(session)
+    changes += __insert_expected_paths(session)
     return changes
 
 
-def __remove_forbidden_paths() -> Changelog:
-    if not os.path.exists(CONFIG_PATH.prettier_ignore):
+def __remove_forbidden_paths(session: Session, /) -> Changelog:
+    if not session.get_path(CONFIG_PATH.prettier_ignore).exists:
         return []
-    existing = __get_existing_lines()
+    existing = __get_existing_lines(session)
     forbidden = {
         ".cspell.json",
         "cspell.config.yaml",
@@ -101,36 +86,34 @@ def __remove_forbidden_paths() -> Changelog:
         s for s in existing if s.split("#", maxsplit=1)[0].strip() not in forbidden
     ]
     if existing != expected:
-        __write_lines(expected)
+        __write_lines(session, expected)
         msg = f"Removed forbidden paths from {CONFIG_PATH.prettier_ignore}"
         return [msg]
     return []
 
 
-def __insert_expected_paths() -> Changelog:
-    existing = __get_existing_lines()
+def __insert_expected_paths(session: Session, /) -> Changelog:
+    existing = __get_existing_lines(session)
     obligatory = ["LICENSE", *__GENERATED_LOCK_FILES]
-    obligatory = [p for p in obligatory if os.path.exists(p)]
+    obligatory = [p for p in obligatory if session.exists(p)]
     expected = [*sorted(set(existing + obligatory) - {""}), ""]
-    if expected == [""] and os.path.exists(CONFIG_PATH.prettier_ignore):
-        os.remove(CONFIG_PATH.prettier_ignore)
+    if expected == [""] and session.get_path(CONFIG_PATH.prettier_ignore).remove():
         msg = f"{CONFIG_PATH.prettier_ignore} is not needed"
         return [msg]
     if existing != expected:
-        __write_lines(expected)
+        __write_lines(session, expected)
         msg = f"Added paths to {CONFIG_PATH.prettier_ignore}"
         return [msg]
     return []
 
 
-def __get_existing_lines() -> list[str]:
-    if not os.path.exists(CONFIG_PATH.prettier_ignore):
+def __get_existing_lines(session: Session, /) -> list[str]:
+    prettier_ignore = session.get_path(CONFIG_PATH.prettier_ignore)
+    if not prettier_ignore.exists:
         return [""]
-    with open(CONFIG_PATH.prettier_ignore) as f:
-        return f.read().split("\n")
+    return prettier_ignore.read_text().split("\n")
 
 
-def __write_lines(lines: Iterable[str]) -> None:
+def __write_lines(session: Session, /, lines: Iterable[str]) -> None:
     content = "\n".join(sorted(set(lines) - {""})) + "\n"
-    with open(CONFIG_PATH.prettier_ignore, "w") as f:
-        f.write(content)
+    session.get_path(CONFIG_PATH.prettier_ignore).write_text(content)
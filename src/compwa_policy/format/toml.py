@@ -2,23 +2,16 @@
 
 from __future__ import annotations
 
-import shutil
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import rtoml
 import tomlkit
 
-from compwa_policy.utilities import (
-    COMPWA_POLICY_DIR,
-    CONFIG_PATH,
-    remove_configs,
-    vscode,
-)
+from compwa_policy.utilities import CONFIG_PATH, remove_configs, vscode
 from compwa_policy.utilities.check_hook import check_hook
 from compwa_policy.utilities.match import filter_patterns, git_ls_files, is_committed
 from compwa_policy.utilities.precommit.struct import Hook, Repo
-from compwa_policy.utilities.pyproject.getters import has_sub_table
+from compwa_policy.utilities.templates import load_toml_template
 from compwa_policy.utilities.toml import to_toml_array
 from compwa_policy.utilities.yaml import read_preserved_yaml
 
@@ -33,19 +26,7 @@ __TOMBI_CONFIG_PATHS = [Path(".tombi.toml"), Path("tombi.toml")]
 __POLICY_SCHEMA_PATH = "compwa-policy.schema.json"
 
 
-@check_hook(
-    group="format",
-    paths=[
-        CONFIG_PATH.pixi_toml,
-        CONFIG_PATH.precommit,
-        CONFIG_PATH.pyproject,
-        CONFIG_PATH.taplo,
-        CONFIG_PATH.vscode_extensions,
-        *__INCORRECT_TAPLO_CONFIG_PATHS,
-        *__TOMBI_CONFIG_PATHS,
-    ],
-    patterns=[r".*\.toml"],
-)
+@check_hook(group="format")
 def check(session: Session, args: Arguments, _ctx: CheckContext) -> None:
     precommit = session.precommit
     has_toml_files = is_committed("*.toml")
@@ -62,10 +43,10 @@ def check(session: Session, args: Arguments, _ctx: CheckContext) -> None:
         *__INCORRECT_TAPLO_CONFIG_PATHS,
         *__TOMBI_CONFIG_PATHS,
     ]
-    if not has_toml_files and not any(f.exists() for f in trigger_files):
+    if not has_toml_files and not any(session.exists(f) for f in trigger_files):
         return
     if args.toml_formatter == "taplo":
-        session.changelog += _rename_taplo_config()
+        session.changelog += _rename_taplo_config(session)
         _update_taplo_config(session)
         _rename_precommit_url(precommit)
         _update_precommit_repo(precommit)
@@ -170,7 +151,7 @@ def _add_tombi_hook_and_config(
         for schema in tombi.get("schemas", [])
         if schema.get("root") != "tool.compwa.policy"
     ]
-    schema_path = _get_policy_schema_path(precommit)
+    schema_path = _get_policy_schema_path(session, precommit)
     if schema_path is not None:
         schemas.append({
             "root": "tool.compwa.policy",
@@ -185,7 +166,9 @@ def _add_tombi_hook_and_config(
     pyproject.changelog.append("Updated Tombi configuration")
 
 
-def _get_policy_schema_path(precommit: ModifiablePrecommit) -> str | None:
+def _get_policy_schema_path(
+    session: Session, precommit: ModifiablePrecommit
+) -> str | None:
     policy_repo = precommit.find_repo(r"github\.com/ComPWA/policy/?$")
     if policy_repo is not None and policy_repo.get("rev"):
         revision = policy_repo["rev"]
@@ -193,13 +176,13 @@ def _get_policy_schema_path(precommit: ModifiablePrecommit) -> str | None:
             f"https://raw.githubusercontent.com/ComPWA/policy/{revision}/"
             f"{__POLICY_SCHEMA_PATH}"
         )
-    if Path(__POLICY_SCHEMA_PATH).exists():
+    if session.exists(__POLICY_SCHEMA_PATH):
         return __POLICY_SCHEMA_PATH
     return None
 
 
 def _update_tomlsort_config(session: Session, /) -> None:
-    if not CONFIG_PATH.pyproject.exists():
+    if not session.exists(CONFIG_PATH.pyproject):
         return
     sort_first = [
         "build-system",
@@ -249,20 +232,20 @@ def _update_tomlsort_hook(precommit: ModifiablePrecommit) -> None:
     precommit.update_single_hook_repo(expected_hook)
 
 
-def _rename_taplo_config() -> Changelog:
+def _rename_taplo_config(session: Session, /) -> Changelog:
     for path in __INCORRECT_TAPLO_CONFIG_PATHS:
-        if not path.exists():
+        source = session.get_path(path)
+        if not source.exists:
             continue
-        shutil.move(path, CONFIG_PATH.taplo)
+        session.get_path(CONFIG_PATH.taplo).write_text(source.read_text())
+        source.remove()
         msg = f"Renamed {path} to {CONFIG_PATH.taplo}"
         return [msg]
     return []
 
 
 def _update_taplo_config(session: Session, /) -> None:
-    template_path = COMPWA_POLICY_DIR / ".template" / CONFIG_PATH.taplo
-    with open(template_path) as f:
-        expected = tomlkit.load(f)
+    expected = load_toml_template(Path(".template") / CONFIG_PATH.taplo)
 
     excludes = filter_patterns(expected["exclude"])
     if excludes:
@@ -272,11 +255,8 @@ def _update_taplo_config(session: Session, /) -> None:
         del expected["exclude"]
 
     rules = tomlkit.aot()
-    if CONFIG_PATH.pixi_toml.exists():
-        with open(CONFIG_PATH.pixi_toml) as stream:
-            pixi_config = rtoml.load(stream)
-        if has_sub_table(pixi_config, "tasks"):
-            rules.append(__taplo_rule(CONFIG_PATH.pixi_toml, ["tasks"]))
+    if session.exists(CONFIG_PATH.pixi_toml) and session.pixi.has_table("tasks"):
+        rules.append(__taplo_rule(CONFIG_PATH.pixi_toml, ["tasks"]))
     pyproject = session.pyproject
     if pyproject is not None:
         keys = [
@@ -290,18 +270,16 @@ def _update_taplo_config(session: Session, /) -> None:
         expected["rule"] = rules
 
     expected_str = tomlkit.dumps(expected, sort_keys=True).lstrip()
-    if not CONFIG_PATH.taplo.exists():
-        with open(CONFIG_PATH.taplo, "w") as stream:
-            stream.write(expected_str)
+    taplo_config = session.get_path(CONFIG_PATH.taplo)
+    if not taplo_config.exists:
+        taplo_config.write_text(expected_str)
         msg = f"Added {CONFIG_PATH.taplo} config for TOML formatting"
         session.changelog.append(msg)
         return
-    with open(CONFIG_PATH.taplo) as f:
-        existing = tomlkit.load(f)
+    existing = tomlkit.loads(taplo_config.read_text())
     existing_str = tomlkit.dumps(existing, sort_keys=True)
     if existing_str.strip() != expected_str.strip():
-        with open(CONFIG_PATH.taplo, "w") as stream:
-            stream.write(expected_str)
+        taplo_config.write_text(expected_str)
         msg = f"Updated {CONFIG_PATH.taplo} config file"
         session.changelog.append(msg)
 
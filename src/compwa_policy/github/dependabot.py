@@ -3,15 +3,15 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from functools import cache
 from typing import TYPE_CHECKING, Any, cast
 
 import yaml
 
-from compwa_policy.utilities import COMPWA_POLICY_DIR, CONFIG_PATH
+from compwa_policy.utilities import CONFIG_PATH
 from compwa_policy.utilities.check_hook import check_hook
 from compwa_policy.utilities.match import is_committed
-from compwa_policy.utilities.yaml import create_prettier_round_trip_yaml
+from compwa_policy.utilities.templates import load_yaml_template
+from compwa_policy.utilities.yaml import create_prettier_round_trip_yaml, dumps_yaml
 
 if TYPE_CHECKING:
     from compwa_policy import Arguments
@@ -19,18 +19,12 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Changelog, Session
 
 
-@check_hook(
-    group="github",
-    paths=[CONFIG_PATH.precommit, "uv.lock"],
-    directories=(CONFIG_PATH.github_workflow_dir.parent,),
-    patterns=("(.*/)?Manifest\\.toml",),
-)
+@check_hook(group="github")
 def check(session: Session, args: Arguments, _: CheckContext) -> None:  # noqa: C901
     frequency = args.upgrade_frequency
 
     def dump_dependabot_config() -> Changelog:
-        dependabot_path.parent.mkdir(exist_ok=True)
-        rt_yaml.dump(expected, dependabot_path)
+        dependabot_config.write_text(dumps_yaml(rt_yaml, expected))
         return [f"Updated {dependabot_path}"]
 
     def get_ecosystem(ecosystem_name: str, /) -> dict[str, Any]:
@@ -39,10 +33,10 @@ def check(session: Session, args: Arguments, _: CheckContext) -> None:  # noqa:
         return new_ecosystem
 
     dependabot_path = CONFIG_PATH.github_workflow_dir.parent / "dependabot.yml"
-    template_path = COMPWA_POLICY_DIR / dependabot_path
+    dependabot_config = session.get_path(dependabot_path)
     rt_yaml = create_prettier_round_trip_yaml()
 
-    expected = rt_yaml.load(template_path)
+    expected = load_yaml_template(dependabot_path)
     if frequency is not None:
         expected["multi-ecosystem-groups"]["lock"]["schedule"]["interval"] = frequency
     template_ecosystem = cast("dict[str, Any]", expected["updates"][0])
@@ -57,23 +51,22 @@ def check(session: Session, args: Arguments, _: CheckContext) -> None:  # noqa:
         package_ecosystems.append(get_ecosystem("uv"))
 
     if not package_ecosystems:
-        dependabot_path.unlink(missing_ok=True)
+        dependabot_config.remove()
         session.changelog.append(f"Removed {dependabot_path}")
         return
     expected["updates"] = package_ecosystems
-    if not dependabot_path.exists():
+    if not dependabot_config.exists:
         session.changelog += dump_dependabot_config()
         return
-    existing = rt_yaml.load(dependabot_path)
+    existing = rt_yaml.load(dependabot_config.read_text())
     if existing != expected:
         session.changelog += dump_dependabot_config()
 
 
-@cache
-def get_dependabot_ecosystems() -> set[str]:
+def get_dependabot_ecosystems(session: Session, /) -> set[str]:
     dependabot_path = CONFIG_PATH.github_workflow_dir.parent / "dependabot.yml"
-    if not dependabot_path.exists():
+    dependabot_config = session.get_path(dependabot_path)
+    if not dependabot_config.exists:
         return set()
-    with dependabot_path.open("r") as stream:
-        config = yaml.load(stream, Loader=yaml.SafeLoader)
+    config = yaml.load(dependabot_config.read_text(), Loader=yaml.SafeLoader)
     return {entry["package-ecosystem"] for entry in config["updates"]}
@@ -6,11 +6,10 @@ https://github.com/ComPWA/policy.
 
 from __future__ import annotations
 
-import os
-from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from compwa_policy.utilities.caching import repository_cache
 from compwa_policy.utilities.check_hook import check_hook
 from compwa_policy.utilities.match import git_ls_files
 
@@ -22,15 +21,11 @@ if TYPE_CHECKING:
 __LABELS_CONFIG_FILE = "labels.toml"
 
 
-@check_hook(
-    group="github",
-    paths=[__LABELS_CONFIG_FILE],
-    patterns=("(.*/)?requirements.*\\.(in|txt)",),
-    enabled=lambda args, _ctx: not args.allow_labels,
-)
+@check_hook(group="github", enabled=lambda args, _ctx: not args.allow_labels)
 def check(session: Session, _args: Arguments, _ctx: CheckContext) -> None:
-    if os.path.exists(__LABELS_CONFIG_FILE):
-        os.remove(__LABELS_CONFIG_FILE)
+    labels_config = session.get_path(__LABELS_CONFIG_FILE)
+    if labels_config.exists:
+        labels_config.remove()
         session.changelog.append(
             f'Repository contains a file "{__LABELS_CONFIG_FILE}" for the labels'
             " package (see https://pypi.org/project/labels). This file should not be"
@@ -39,21 +34,21 @@ def check(session: Session, _args: Arguments, _ctx: CheckContext) -> None:
         )
         return
     faulty_req_files = [
-        str(file.absolute())
+        file
         for file in _get_requirement_files()
-        if _check_has_labels_requirement(file)
+        if _check_has_labels_requirement(session, file)
     ]
     if faulty_req_files:
-        _remove_all_labels_requirement()
+        for file in faulty_req_files:
+            _remove_labels_requirement(session, file)
         session.changelog.append(
             "Repository lists the labels package (https://pypi.org/project/labels) as a"
             " developer requirement. Problems have been fixed, please re-stage files."
         )
 
 
-def _check_has_labels_requirement(path: Path) -> bool:
-    with open(path) as stream:
-        lines = stream.readlines()
+def _check_has_labels_requirement(session: Session, path: Path) -> bool:
+    lines = session.get_path(path).read_text().splitlines()
     for line in lines:
         requirement = _get_package_name(line)
         if requirement == "labels":
@@ -61,7 +56,7 @@ def _check_has_labels_requirement(path: Path) -> bool:
     return False
 
 
-@cache
+@repository_cache
 def _get_requirement_files() -> list[Path]:
     filenames = git_ls_files(
         "**/requirements*.in",
@@ -80,21 +75,17 @@ def _get_package_name(line: str) -> str:
     return package_name.strip()
 
 
-def _remove_all_labels_requirement() -> None:
-    for file in _get_requirement_files():
-        _remove_labels_requirement(file)
-
-
-def _remove_labels_requirement(path: Path) -> None:
-    with open(path) as stream:
-        original_lines = stream.readlines()
-    with open(path, "w") as stream:
-        for line in original_lines:
-            requirement = line
-            requirement = requirement.split("<")[0]
-            requirement = requirement.split(">")[0]
-            requirement = requirement.split("=")[0]
-            requirement = requirement.split("!")[0]
-            requirement = requirement.strip()
-            if requirement != "labels":
-                stream.write(line)
+def _remove_labels_requirement(session: Session, path: Path) -> None:
+    requirements = session.get_path(path)
+    lines = requirements.read_text().splitlines(keepends=True)
+    new_lines = []
+    for line in lines:
+        requirement = line
+        requirement = requirement.split("<")[0]
+        requirement = requirement.split(">")[0]
+        requirement = requirement.split("=")[0]
+        requirement = requirement.split("!")[0]
+        requirement = requirement.strip()
+        if requirement != "labels":
+            new_lines.append(line)
+    requirements.write_text("".join(new_lines))
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import os
 from typing import TYPE_CHECKING, Any
 
-from compwa_policy.utilities import COMPWA_POLICY_DIR, CONFIG_PATH, update_file
+from compwa_policy.utilities import CONFIG_PATH, update_file
 from compwa_policy.utilities.check_hook import check_hook
-from compwa_policy.utilities.yaml import create_prettier_round_trip_yaml
+from compwa_policy.utilities.templates import load_yaml_template
+from compwa_policy.utilities.yaml import create_prettier_round_trip_yaml, dumps_yaml
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -19,8 +19,6 @@ if TYPE_CHECKING:
 
 @check_hook(
     group="github",
-    paths=[CONFIG_PATH.readthedocs],
-    directories=(CONFIG_PATH.github_workflow_dir.parent,),
     enabled=lambda args, ctx: ctx.is_python_repo and (not args.no_github_actions),
 )
 def check(session: Session, args: Arguments, _: CheckContext) -> None:
@@ -29,44 +27,41 @@ def check(session: Session, args: Arguments, _: CheckContext) -> None:
             CONFIG_PATH.release_drafter_workflow,
             CONFIG_PATH.release_drafter_config,
         ]
-        paths_to_remove = [p for p in paths_to_remove if p.is_file()]
+        paths_to_remove = [p for p in paths_to_remove if session.get_path(p).remove()]
         if paths_to_remove:
-            for path in paths_to_remove:
-                path.unlink()
             session.changelog.append(
                 f"Removed {', '.join(str(p) for p in paths_to_remove)}"
             )
         return
     update_file(session, CONFIG_PATH.release_drafter_workflow)
     session.changelog += _update_draft(
-        args.repo_name, args.repo_title, args.repo_organization
+        session, args.repo_name, args.repo_title, args.repo_organization
     )
 
 
-def _update_draft(repo_name: str, repo_title: str, organization: str) -> Changelog:
+def _update_draft(
+    session: Session, /, repo_name: str, repo_title: str, organization: str
+) -> Changelog:
     yaml = create_prettier_round_trip_yaml()
-    expected = _get_expected_config(repo_name, repo_title, organization)
+    expected = _get_expected_config(session, repo_name, repo_title, organization)
     output_path = CONFIG_PATH.release_drafter_config
-    if not os.path.exists(output_path):
-        yaml.dump(expected, output_path)
-        return [f"Created {output_path}"]
-    existing = _get_existing_config()
-    if existing != expected:
-        yaml.dump(expected, output_path)
-        return [f"Updated {output_path}"]
-    return []
+    output = session.get_path(output_path)
+    verb = "Updated" if output.exists else "Created"
+    if output.exists and yaml.load(output.read_text()) == expected:
+        return []
+    output.write_text(dumps_yaml(yaml, expected))
+    return [f"{verb} {output_path}"]
 
 
 def _get_expected_config(
-    repo_name: str, repo_title: str, organization: str
+    session: Session, /, repo_name: str, repo_title: str, organization: str
 ) -> dict[str, Any]:
-    yaml = create_prettier_round_trip_yaml()
-    config = yaml.load(COMPWA_POLICY_DIR / CONFIG_PATH.release_drafter_config)
+    config = load_yaml_template(CONFIG_PATH.release_drafter_config)
     key = "name-template"
     config[key] = config[key].replace("<<REPO_TITLE>>", repo_title)
     key = "template"
     lines = config[key].split("\n")
-    if not os.path.exists(CONFIG_PATH.readthedocs):
+    if not session.exists(CONFIG_PATH.readthedocs):
         lines = lines[2:]
     config[key] = (
         "\n"
@@ -75,8 +70,3 @@ def _get_expected_config(
         .replace("<<REPO_NAME>>", repo_name)
     )
     return config
-
-
-def _get_existing_config() -> dict[str, Any]:
-    yaml = create_prettier_round_trip_yaml()
-    return yaml.load(CONFIG_PATH.release_drafter_config)
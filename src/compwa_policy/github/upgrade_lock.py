@@ -12,9 +12,10 @@ from typing import TYPE_CHECKING
 from compwa_policy.errors import PolicyError
 from compwa_policy.github.dependabot import get_dependabot_ecosystems
 from compwa_policy.github.workflows import remove_workflow, update_workflow
-from compwa_policy.utilities import COMPWA_POLICY_DIR, CONFIG_PATH
+from compwa_policy.utilities import CONFIG_PATH
 from compwa_policy.utilities.check_hook import check_hook
 from compwa_policy.utilities.match import filter_patterns
+from compwa_policy.utilities.templates import load_yaml_template
 from compwa_policy.utilities.yaml import create_prettier_round_trip_yaml
 
 if TYPE_CHECKING:
@@ -32,25 +33,19 @@ __CRON_SCHEDULES: dict[UpgradeFrequency, str] = {
 __TRIGGER_ECOSYSTEMS = {"julia", "pre-commit", "uv"}
 
 
-@check_hook(
-    group="github",
-    paths=[CONFIG_PATH.precommit],
-    directories=(CONFIG_PATH.github_workflow_dir.parent, CONFIG_PATH.pip_constraints),
-    enabled=lambda args, _ctx: args.upgrade_frequency != "no",
-)
+@check_hook(group="github", enabled=lambda args, _ctx: args.upgrade_frequency != "no")
 def check(session: Session, args: Arguments, _: CheckContext) -> None:
     frequency = args.upgrade_frequency
     precommit = session.precommit
-    _update_precommit_schedule(precommit, frequency)
-    session.changelog += _remove_script("pin_requirements.py")
-    session.changelog += _remove_script("upgrade.sh")
+    _update_precommit_schedule(session, precommit, frequency)
+    session.changelog += _remove_script(session, "pin_requirements.py")
+    session.changelog += _remove_script(session, "upgrade.sh")
     _update_lock_workflow(session, frequency, args.keep_workflow)
 
 
-def _remove_script(script_name: str) -> Changelog:
+def _remove_script(session: Session, /, script_name: str) -> Changelog:
     bash_script_name = CONFIG_PATH.pip_constraints / script_name
-    if bash_script_name.exists():
-        bash_script_name.unlink()
+    if session.get_path(bash_script_name).remove():
         msg = f'Removed deprecated "{bash_script_name}" script'
         return [msg]
     return []
@@ -62,11 +57,10 @@ def _update_lock_workflow(
     precommit = session.precommit
 
     def overwrite_workflow(workflow_file: str) -> None:
-        expected_workflow_path = (
-            COMPWA_POLICY_DIR / CONFIG_PATH.github_workflow_dir / workflow_file
-        )
         yaml = create_prettier_round_trip_yaml()
-        expected_data = yaml.load(expected_workflow_path)
+        expected_data = load_yaml_template(
+            CONFIG_PATH.github_workflow_dir / workflow_file
+        )
         original_paths = expected_data["on"]["pull_request"]["paths"]
         existing_paths = filter_patterns(original_paths)
         if not existing_paths:
@@ -76,20 +70,26 @@ def _update_lock_workflow(
             )
             raise ValueError(msg)
         expected_data["on"]["pull_request"]["paths"] = existing_paths
-        if (
-            get_dependabot_ecosystems() & __TRIGGER_ECOSYSTEMS
-            or "autoupdate_schedule" in precommit.document.get("ci", {})
+        if get_dependabot_ecosystems(
+            session
+        ) & __TRIGGER_ECOSYSTEMS or "autoupdate_schedule" in precommit.document.get(
+            "ci", {}
         ):
             del expected_data["on"]["schedule"]
         else:
             expected_data["on"]["schedule"][0]["cron"] = _to_cron_schedule(frequency)
         workflow_path = CONFIG_PATH.github_workflow_dir / workflow_file
-        if not workflow_path.exists():
-            session.changelog += update_workflow(yaml, expected_data, workflow_path)
+        workflow = session.get_path(workflow_path)
+        if not workflow.exists:
+            session.changelog += update_workflow(
+                session, yaml, expected_data, workflow_path
+            )
             return
-        existing_data = yaml.load(workflow_path)
+        existing_data = yaml.load(workflow.read_text())
         if existing_data != expected_data:
-            session.changelog += update_workflow(yaml, expected_data, workflow_path)
+            session.changelog += update_workflow(
+                session, yaml, expected_data, workflow_path
+            )
 
     if "lock.yml" not in keep_workflow:
         overwrite_workflow("lock.yml")
@@ -99,7 +99,7 @@ def _update_lock_workflow(
         "requirements-pr.yml",
     ):
         if workflow not in keep_workflow:
-            session.changelog += remove_workflow(workflow)
+            session.changelog += remove_workflow(session, workflow)
 
 
 def _to_cron_schedule(frequency: UpgradeFrequency) -> str:
@@ -110,13 +110,16 @@ def _to_cron_schedule(frequency: UpgradeFrequency) -> str:
 
 
 def _update_precommit_schedule(
-    precommit: ModifiablePrecommit, frequency: UpgradeFrequency
+    session: Session,
+    /,
+    precommit: ModifiablePrecommit,
+    frequency: UpgradeFrequency,
 ) -> None:
     ci_section = precommit.document.get("ci")
     if ci_section is None:
         return
     key = "autoupdate_schedule"
-    if get_dependabot_ecosystems() & __TRIGGER_ECOSYSTEMS:
+    if get_dependabot_ecosystems(session) & __TRIGGER_ECOSYSTEMS:
         frequency = "quarterly"
         if ci_section.get(key) == frequency:
             return
@@ -2,10 +2,7 @@
 
 from __future__ import annotations
 
-import os
 import re
-import shutil
-from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 from ruamel.yaml.scalarstring import DoubleQuotedScalarString
@@ -13,18 +10,16 @@ from ruamel.yaml.scalarstring import DoubleQuotedScalarString
 from compwa_policy import _to_list
 from compwa_policy.characterization import has_documentation, has_notebooks
 from compwa_policy.config import DEFAULT_DEV_PYTHON_VERSION
-from compwa_policy.utilities import (
-    COMPWA_POLICY_DIR,
-    CONFIG_PATH,
-    hash_file,
-    vscode,
-    write,
-)
+from compwa_policy.utilities import CONFIG_PATH, vscode
 from compwa_policy.utilities.check_hook import check_hook
+from compwa_policy.utilities.match import get_repository_index
 from compwa_policy.utilities.pyproject import PythonVersion, has_pyproject_package_name
-from compwa_policy.utilities.yaml import create_prettier_round_trip_yaml
+from compwa_policy.utilities.templates import load_yaml_template, read_template
+from compwa_policy.utilities.yaml import create_prettier_round_trip_yaml, dumps_yaml
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from ruamel.yaml.comments import CommentedMap
     from ruamel.yaml.main import YAML
 
@@ -34,21 +29,10 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Changelog, Session
 
 
-@check_hook(
-    group="github",
-    paths=[
-        CONFIG_PATH.codecov,
-        CONFIG_PATH.precommit,
-        CONFIG_PATH.pyproject,
-        CONFIG_PATH.readthedocs,
-        ".python-version",
-    ],
-    directories=(CONFIG_PATH.github_workflow_dir.parent, CONFIG_PATH.pip_constraints),
-    enabled=lambda args, _ctx: not args.no_github_actions,
-)
+@check_hook(group="github", enabled=lambda args, _ctx: not args.no_github_actions)
 def check(session: Session, args: Arguments, ctx: CheckContext) -> None:
     if args.no_cd:
-        session.changelog += remove_workflow("cd.yml")
+        session.changelog += remove_workflow(session, "cd.yml")
     else:
         _update_cd_workflow(
             session,
@@ -68,7 +52,7 @@ def check(session: Session, args: Arguments, ctx: CheckContext) -> None:
         _to_list(args.ci_skipped_tests),
     )
     if not args.keep_pr_linting:
-        session.changelog += _update_pr_linting()
+        session.changelog += _update_pr_linting(session)
     _recommend_vscode_extension(session)
 
 
@@ -82,7 +66,7 @@ def _update_cd_workflow(  # noqa: C901
     def update() -> Changelog:  # noqa: C901
         yaml = create_prettier_round_trip_yaml()
         workflow_path = CONFIG_PATH.github_workflow_dir / "cd.yml"
-        expected_data = yaml.load(COMPWA_POLICY_DIR / workflow_path)
+        expected_data = load_yaml_template(workflow_path)
         banned_jobs = set()
         if no_milestones:
             banned_jobs.add("milestone")
@@ -92,14 +76,15 @@ def _update_cd_workflow(  # noqa: C901
         if no_version_branches:
             banned_jobs.add("push")
         if not expected_data["jobs"]:
-            return remove_workflow("cd.yml")
+            return remove_workflow(session, "cd.yml")
         for name in banned_jobs:
             expected_data["jobs"].pop(name, None)
         if not expected_data["jobs"]:
-            return remove_workflow("cd.yml")
-        if not workflow_path.exists():
-            return update_workflow(yaml, expected_data, workflow_path)
-        existing_data = yaml.load(workflow_path)
+            return remove_workflow(session, "cd.yml")
+        workflow = session.get_path(workflow_path)
+        if not workflow.exists:
+            return update_workflow(session, yaml, expected_data, workflow_path)
+        existing_data = yaml.load(workflow.read_text())
         for name, job_def in existing_data["jobs"].items():
             if name in banned_jobs:
                 continue
@@ -107,20 +92,17 @@ def _update_cd_workflow(  # noqa: C901
                 continue
             expected_data["jobs"][name] = job_def
         if existing_data != expected_data:
-            return update_workflow(yaml, expected_data, workflow_path)
+            return update_workflow(session, yaml, expected_data, workflow_path)
         return []
 
     session.changelog += update()
-    session.changelog += remove_workflow("milestone.yml")
+    session.changelog += remove_workflow(session, "milestone.yml")
 
 
-def _update_pr_linting() -> Changelog:
+def _update_pr_linting(session: Session, /) -> Changelog:
     filename = "pr-linting.yml"
-    input_path = COMPWA_POLICY_DIR / CONFIG_PATH.github_workflow_dir / filename
     output_path = CONFIG_PATH.github_workflow_dir / filename
-    output_path.parent.mkdir(exist_ok=True)
-    if not output_path.exists() or hash_file(input_path) != hash_file(output_path):
-        shutil.copyfile(input_path, output_path)
+    if __write_workflow(session, output_path, read_template(output_path)):
         msg = f"Updated {output_path} workflow"
         return [msg]
     return []
@@ -139,10 +121,9 @@ def _update_ci_workflow(  # noqa: PLR0917
     skip_tests: list[str],
 ) -> None:
     def update() -> Changelog:
-        precommit = session.precommit
         yaml, expected_data = _get_ci_workflow(
-            COMPWA_POLICY_DIR / CONFIG_PATH.github_workflow_dir / "ci.yml",
-            precommit,
+            session,
+            CONFIG_PATH.github_workflow_dir / "ci.yml",
             doc_apt_packages,
             environment_variables,
             github_pages,
@@ -152,31 +133,32 @@ def _update_ci_workflow(  # noqa: PLR0917
             skip_tests,
         )
         workflow_path = CONFIG_PATH.github_workflow_dir / "ci.yml"
+        workflow = session.get_path(workflow_path)
         if not expected_data.get("jobs"):
-            if workflow_path.exists():
-                workflow_path.unlink()
+            if workflow.remove():
                 return ["Removed redundant CI workflows"]
         else:
-            if not workflow_path.exists():
-                return update_workflow(yaml, expected_data, workflow_path)
-            existing_data = yaml.load(workflow_path)
+            if not workflow.exists:
+                return update_workflow(session, yaml, expected_data, workflow_path)
+            existing_data = yaml.load(workflow.read_text())
             if existing_data != expected_data:
-                return update_workflow(yaml, expected_data, workflow_path)
+                return update_workflow(session, yaml, expected_data, workflow_path)
         return []
 
     session.changelog += update()
     if not allow_deprecated:
-        session.changelog += remove_workflow("ci-docs.yml")
-        session.changelog += remove_workflow("ci-style.yml")
-        session.changelog += remove_workflow("ci-tests.yml")
-        session.changelog += remove_workflow("linkcheck.yml")
+        session.changelog += remove_workflow(session, "ci-docs.yml")
+        session.changelog += remove_workflow(session, "ci-style.yml")
+        session.changelog += remove_workflow(session, "ci-tests.yml")
+        session.changelog += remove_workflow(session, "linkcheck.yml")
     _copy_workflow_file(session, "clean-caches.yml")
-    session.changelog += remove_workflow("clean-cache.yml")
+    session.changelog += remove_workflow(session, "clean-cache.yml")
 
 
 def _get_ci_workflow(  # noqa: PLR0917
+    session: Session,
+    /,
     path: Path,
-    precommit: Precommit,
     doc_apt_packages: list[str],
     environment_variables: dict[str, str],
     github_pages: bool,
@@ -186,11 +168,15 @@ def _get_ci_workflow(  # noqa: PLR0917
     skip_tests: list[str],
 ) -> tuple[YAML, dict]:
     yaml = create_prettier_round_trip_yaml()
-    config = yaml.load(path)
+    config = load_yaml_template(path)
     __update_env_section(config, environment_variables)
-    __update_doc_section(config, doc_apt_packages, python_version, github_pages)
-    __update_pytest_section(config, macos_python_version, single_threaded, skip_tests)
-    __update_style_section(config, python_version, precommit)
+    __update_doc_section(
+        session, config, doc_apt_packages, python_version, github_pages
+    )
+    __update_pytest_section(
+        session, config, macos_python_version, single_threaded, skip_tests
+    )
+    __update_style_section(config, python_version, session.precommit)
     return yaml, config
 
 
@@ -207,6 +193,7 @@ def __update_env_section(
 
 
 def __update_doc_section(
+    session: Session,
     config: CommentedMap,
     apt_packages: list[str],
     python_version: PythonVersion,
@@ -218,7 +205,7 @@ def __update_doc_section(
             with_section["python-version"] = DoubleQuotedScalarString(python_version)
         if apt_packages:
             with_section["apt-packages"] = " ".join(apt_packages)
-        if not CONFIG_PATH.readthedocs.exists() or github_pages:
+        if not session.exists(CONFIG_PATH.readthedocs) or github_pages:
             with_section["gh-pages"] = True
         if with_section:
             config["jobs"]["doc"]["with"] = with_section
@@ -246,18 +233,22 @@ def __is_remove_style_job(precommit: Precommit) -> bool:
 
 
 def __update_pytest_section(
+    session: Session,
+    /,
     config: CommentedMap,
     macos_python_version: PythonVersion | None,
     single_threaded: bool,
     skip_tests: list[str],
 ) -> None:
     test_dir = "tests"
-    if not os.path.exists(test_dir):
+    if not session.exists(test_dir):
         del config["jobs"]["test"]
     else:
         with_section = {}
-        if CONFIG_PATH.codecov.exists():
-            with_section["coverage-python-version"] = __get_coverage_python_version()
+        if session.exists(CONFIG_PATH.codecov):
+            with_section["coverage-python-version"] = __get_coverage_python_version(
+                session
+            )
             secrets = {
                 "CODECOV_TOKEN": "${{ secrets.CODECOV_TOKEN }}",
             }
@@ -271,7 +262,7 @@ def __update_pytest_section(
         if single_threaded:
             with_section["multithreaded"] = False
         output_path = f"{test_dir}/output/"
-        if os.path.exists(output_path):
+        if session.is_dir(output_path):
             with_section["test-output-path"] = output_path
         if with_section:
             config["jobs"]["test"]["with"] = with_section
@@ -287,34 +278,21 @@ def __update_with_section(config: dict, job_name: str) -> None:
         del with_section
 
 
-def __get_coverage_python_version() -> PythonVersion:
-    python_version_file = Path(".python-version")
-    if python_version_file.exists():
+def __get_coverage_python_version(session: Session, /) -> PythonVersion:
+    python_version_file = session.get_path(".python-version")
+    if python_version_file.exists:
         return python_version_file.read_text().strip()  # ty:ignore[invalid-return-type]
     return DEFAULT_DEV_PYTHON_VERSION
 
 
 def _copy_workflow_file(session: Session, /, filename: str) -> None:
-    expected_workflow_path = (
-        COMPWA_POLICY_DIR / CONFIG_PATH.github_workflow_dir / filename
-    )
-    with open(expected_workflow_path) as stream:
-        expected_content = stream.read()
-    if not CONFIG_PATH.pip_constraints.exists():
+    workflow_path = CONFIG_PATH.github_workflow_dir / filename
+    expected_content = read_template(workflow_path)
+    if not session.exists(CONFIG_PATH.pip_constraints):
         expected_content = __remove_constraint_pinning(expected_content)
-
-    workflow_path = f"{CONFIG_PATH.github_workflow_dir}/{filename}"
-    if not os.path.exists(workflow_path):
-        write(expected_content, target=workflow_path, session=session)
-        msg = f"Created {workflow_path} workflow"
-        session.changelog.append(msg)
-        return
-
-    with open(workflow_path) as stream:
-        existing_content = stream.read()
-    if existing_content != expected_content:
-        write(expected_content, target=workflow_path, session=session)
-        msg = f"Updated {workflow_path} workflow"
+    verb = "Updated" if session.get_path(workflow_path).exists else "Created"
+    if __write_workflow(session, workflow_path, expected_content):
+        msg = f"{verb} {workflow_path} workflow"
         session.changelog.append(msg)
 
 
@@ -333,31 +311,40 @@ def __remove_constraint_pinning(content: str) -> str:
 
 
 def _recommend_vscode_extension(session: Session, /) -> None:
-    if not CONFIG_PATH.github_workflow_dir.exists():
+    workflow_dir = CONFIG_PATH.github_workflow_dir
+    if not session.is_dir(workflow_dir) and not get_repository_index().is_dir(
+        workflow_dir.as_posix()
+    ):
         return
     # cspell:ignore cschleiden
     vscode.remove_extension_recommendation(session, "cschleiden.vscode-github-actions")
     vscode.add_extension_recommendation(session, "github.vscode-github-actions")
     ci_workflow = CONFIG_PATH.github_workflow_dir / "ci.yml"
-    if ci_workflow.exists():
+    if session.get_path(ci_workflow).exists:
         action_settings = {
             "github-actions.workflows.pinned.workflows": [str(ci_workflow)],
         }
         vscode.update_settings(session, action_settings)
 
 
-def remove_workflow(filename: str) -> Changelog:
+def remove_workflow(session: Session, /, filename: str) -> Changelog:
     path = CONFIG_PATH.github_workflow_dir / filename
-    if path.exists():
-        path.unlink()
+    if session.get_path(path).remove():
         msg = f"Removed deprecated {filename} workflow"
         return [msg]
     return []
 
 
-def update_workflow(yaml: YAML, config: dict, path: Path) -> Changelog:
-    path.parent.mkdir(exist_ok=True, parents=True)
-    yaml.dump(config, path)
-    verb = "Updated" if path.exists() else "Created"
+def update_workflow(
+    session: Session, /, yaml: YAML, config: dict, path: Path
+) -> Changelog:
+    verb = "Updated" if session.get_path(path).exists else "Created"
+    __write_workflow(session, path, dumps_yaml(yaml, config))
     msg = f"{verb} {path} workflow"
     return [msg]
+
+
+def __write_workflow(session: Session, /, path: Path, content: str) -> bool:
+    """Write a workflow file in the session and register it as an untracked file."""
+    get_repository_index().add_untracked(path.as_posix())
+    return session.get_path(path).write_text(content)
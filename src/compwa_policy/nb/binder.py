@@ -5,7 +5,6 @@ See also https://mybinder.readthedocs.io/en/latest/using/config_files.html.
 
 from __future__ import annotations
 
-import os
 from dataclasses import dataclass
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any
@@ -24,28 +23,25 @@ if TYPE_CHECKING:
 
 
 @check_hook(
-    group="nb",
-    paths=[CONFIG_PATH.pixi_toml, CONFIG_PATH.pyproject],
-    directories=(CONFIG_PATH.binder,),
-    enabled=lambda args, ctx: ctx.has_notebooks and (not args.no_binder),
+    group="nb", enabled=lambda args, ctx: ctx.has_notebooks and (not args.no_binder)
 )
 def check(session: Session, args: Arguments, ctx: CheckContext) -> None:
-    session.changelog += _update_apt_txt(ctx.doc_apt_packages)
+    session.changelog += _update_apt_txt(session, ctx.doc_apt_packages)
     _update_post_build(session, args.package_manager)
-    session.changelog += _make_executable(CONFIG_PATH.binder / "postBuild")
-    session.changelog += _update_runtime_txt(args.dev_python_version)
+    session.changelog += _make_executable(session, CONFIG_PATH.binder / "postBuild")
+    session.changelog += _update_runtime_txt(session, args.dev_python_version)
 
 
-def _update_apt_txt(apt_packages: list[str]) -> Changelog:
+def _update_apt_txt(session: Session, /, apt_packages: list[str]) -> Changelog:
     apt_txt = CONFIG_PATH.binder / "apt.txt"
     if not apt_packages:
-        if apt_txt.exists():
-            apt_txt.unlink()
+        if session.get_path(apt_txt).remove():
             msg = f"Removed {apt_txt}, because --doc-apt-packages does not specify any packages."
             return [msg]
         return []
     apt_packages = sorted(set(apt_packages))
     return __update_file(
+        session,
         expected_content="\n".join(apt_packages) + "\n",
         path=apt_txt,
     )
@@ -64,6 +60,7 @@ def _update_post_build(
         msg = f"Package manager {package_manager} is not supported."
         raise NotImplementedError(msg)
     session.changelog += __update_file(
+        session,
         expected_content=expected_content.strip() + "\n",
         path=CONFIG_PATH.binder / "postBuild",
     )
@@ -110,7 +107,7 @@ class PixiActivation:
 
 
 def ___get_pixi_activation(session: Session, /) -> PixiActivation:
-    if not CONFIG_PATH.pixi_toml.exists():
+    if not session.exists(CONFIG_PATH.pixi_toml):
         return PixiActivation()
     pixi = session.pixi
     if not pixi.has_table("activation"):
@@ -159,28 +156,25 @@ def ___safe_get_table(session: Session, /, dotted_header: str) -> Mapping[str, A
     return pyproject.get_table(dotted_header)
 
 
-def _make_executable(path: Path) -> Changelog:
-    if os.access(path, os.X_OK):
+def _make_executable(session: Session, /, path: Path) -> Changelog:
+    if not session.get_path(path).chmod(0o755):
         return []
     msg = f"{path} has been made executable"
-    path.chmod(0o755)
     return [msg]
 
 
-def _update_runtime_txt(python_version: PythonVersion) -> Changelog:
+def _update_runtime_txt(
+    session: Session, /, python_version: PythonVersion
+) -> Changelog:
     return __update_file(
+        session,
         expected_content=f"python-{python_version}\n",
         path=CONFIG_PATH.binder / "runtime.txt",
     )
 
 
-def __update_file(expected_content: str, path: Path) -> Changelog:
-    path.parent.mkdir(exist_ok=True)
-    if path.exists():
-        with open(path) as stream:
-            if stream.read() == expected_content:
-                return []
-    with open(path, "w") as stream:
-        stream.write(expected_content)
+def __update_file(session: Session, /, expected_content: str, path: Path) -> Changelog:
+    if not session.get_path(path).write_text(expected_content):
+        return []
     msg = f"Updated {path}"
     return [msg]
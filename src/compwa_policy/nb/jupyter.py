@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 
 from packaging.utils import canonicalize_name
 
-from compwa_policy.utilities import CONFIG_PATH, vscode
+from compwa_policy.utilities import vscode
 from compwa_policy.utilities.check_hook import check_hook
 
 if TYPE_CHECKING:
@@ -15,11 +15,7 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Session
 
 
-@check_hook(
-    group="nb",
-    paths=[CONFIG_PATH.precommit, CONFIG_PATH.pyproject, CONFIG_PATH.vscode_extensions],
-    enabled=lambda _args, ctx: ctx.has_notebooks,
-)
+@check_hook(group="nb", enabled=lambda _args, ctx: ctx.has_notebooks)
 def check(session: Session, args: Arguments, _: CheckContext) -> None:
     _update_dev_requirements(
         session,
@@ -70,8 +66,7 @@ def _update_dev_requirements(
         pyproject.remove_dependency(
             "black", ignored_sections=["doc", "notebooks", "test"]
         )
-        pyproject.remove_dependency("isort")
-        pyproject.remove_dependency("jupyterlab-code-formatter")
+        pyproject.remove_dependencies(["isort", "jupyterlab-code-formatter"])
         packages.add("jupyter-ruff")
     excluded_dependencies = {
         canonicalize_name(package) for package in excluded_dependencies
@@ -81,7 +76,5 @@ def _update_dev_requirements(
         for package in packages
         if canonicalize_name(package) not in excluded_dependencies
     }
-    for package in sorted(excluded_dependencies):
-        pyproject.remove_dependency(package)
-    for package in sorted(packages):
-        pyproject.add_dependency(package, dependency_group=["jupyter", "dev"])
+    pyproject.remove_dependencies(sorted(excluded_dependencies))
+    pyproject.add_dependencies(sorted(packages), dependency_group=["jupyter", "dev"])
@@ -7,7 +7,6 @@ from typing import TYPE_CHECKING
 from ruamel.yaml.scalarstring import LiteralScalarString
 
 from compwa_policy import _to_list
-from compwa_policy.utilities import CONFIG_PATH
 from compwa_policy.utilities.check_hook import check_hook
 from compwa_policy.utilities.precommit.struct import Hook, Repo
 
@@ -18,7 +17,7 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Session
 
 
-@check_hook(group="nb", paths=[CONFIG_PATH.precommit])
+@check_hook(group="nb")
 def check(session: Session, args: Arguments, ctx: CheckContext) -> None:
     precommit = session.precommit
     if not ctx.has_notebooks:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from compwa_policy.utilities import CONFIG_PATH, vscode
+from compwa_policy.utilities import vscode
 from compwa_policy.utilities.check_hook import check_hook
 from compwa_policy.utilities.precommit.struct import Hook, Repo
 from compwa_policy.utilities.pyproject import ModifiablePyproject, complies_with_subset
@@ -19,9 +19,7 @@ if TYPE_CHECKING:
 
 
 @check_hook(
-    group="python",
-    paths=[CONFIG_PATH.precommit, CONFIG_PATH.pyproject, CONFIG_PATH.vscode_settings],
-    enabled=lambda args, ctx: ctx.is_python_repo and args.no_ruff,
+    group="python", enabled=lambda args, ctx: ctx.is_python_repo and args.no_ruff
 )
 def check(session: Session, _: Arguments, ctx: CheckContext) -> None:
     precommit = session.precommit
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import os
 from typing import TYPE_CHECKING
 
 import rtoml
@@ -22,18 +21,7 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Session
 
 
-@check_hook(
-    group="python",
-    paths=[
-        CONFIG_PATH.gitignore,
-        CONFIG_PATH.precommit,
-        CONFIG_PATH.pyproject,
-        CONFIG_PATH.readme,
-        CONFIG_PATH.vscode_extensions,
-        CONFIG_PATH.vscode_settings,
-    ],
-    enabled=lambda _args, ctx: ctx.is_python_repo,
-)
+@check_hook(group="python", enabled=lambda _args, ctx: ctx.is_python_repo)
 def check(session: Session, args: Arguments, _: CheckContext) -> None:
     activate = "mypy" in args.type_checker
     _update_vscode_settings(session, activate)
@@ -42,7 +30,7 @@ def check(session: Session, args: Arguments, _: CheckContext) -> None:
         return
     if activate:
         config.add_dependency("mypy", dependency_group=["style", "dev"])
-        _merge_mypy_into_pyproject(config)
+        _merge_mypy_into_pyproject(session, config)
         _update_precommit_config(session.precommit)
         remove_badge(session, r"http://(www\.)?mypy\-lang\.org/")
         add_badge(
@@ -54,17 +42,19 @@ def check(session: Session, args: Arguments, _: CheckContext) -> None:
         remove_lines(session, CONFIG_PATH.gitignore, ".*mypy.*")
 
 
-def _merge_mypy_into_pyproject(pyproject: ModifiablePyproject) -> None:
+def _merge_mypy_into_pyproject(
+    session: Session, pyproject: ModifiablePyproject
+) -> None:
     old_config_path = ".mypy.ini"
-    if not os.path.exists(old_config_path):
+    old_config = session.get_path(old_config_path)
+    if not old_config.exists:
         return
-    with open(old_config_path) as stream:
-        original_contents = stream.read()
+    original_contents = old_config.read_text()
     toml_str = Translator().translate(original_contents, profile_name=old_config_path)
     mypy_config = rtoml.loads(toml_str)
     tool_table = pyproject.get_table("tool", create=True)
     tool_table.update(mypy_config)
-    os.remove(old_config_path)
+    old_config.remove()
     msg = f"Imported mypy configuration from {old_config_path}"
     pyproject.changelog.append(msg)
 
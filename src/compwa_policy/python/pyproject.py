@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-import os
 import re
+from collections import abc
 from typing import TYPE_CHECKING
 
-from compwa_policy.utilities import CONFIG_PATH
 from compwa_policy.utilities.check_hook import check_hook
 from compwa_policy.utilities.pyproject.getters import (
     _get_allowed_versions,
@@ -22,30 +21,27 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Session
 
 
-@check_hook(
-    group="python",
-    paths=[CONFIG_PATH.pyproject],
-    enabled=lambda _args, ctx: ctx.is_python_repo,
-)
+@check_hook(group="python", enabled=lambda _args, ctx: ctx.is_python_repo)
 def check(session: Session, args: Arguments, _: CheckContext) -> None:
     config = session.pyproject
     if config is None:
         return
     _update_pypi_link_names(config)
-    _update_license_files(config)
+    _update_license_files(session, config)
     _convert_to_dependency_groups(config)
     _rename_sty_to_style(config)
     _update_requires_python(config)
-    _update_python_version_classifiers(config, args.excluded_python_versions)
+    _update_python_version_classifiers(session, config, args.excluded_python_versions)
 
 
-def _update_license_files(pyproject: ModifiablePyproject) -> None:
+def _update_license_files(session: Session, pyproject: ModifiablePyproject) -> None:
     if not pyproject.has_table("project"):
         return
     project = pyproject.get_table("project")
     updated = False
     license_files = project.get("license-files", [])
-    if os.path.isfile("LICENSE") and "LICENSE" not in license_files:
+    is_file = session.exists("LICENSE") and not session.is_dir("LICENSE")
+    if is_file and "LICENSE" not in license_files:
         license_files = sorted([*license_files, "LICENSE"])
         project["license-files"] = to_toml_array(license_files)
         updated = True
@@ -144,7 +140,7 @@ def _rename_sty_to_style(pyproject: ModifiablePyproject) -> None:
     del dependency_groups["sty"]
     for dependencies in dependency_groups.values():
         for dependency in dependencies:
-            if not isinstance(dependency, dict):
+            if not isinstance(dependency, abc.Mapping):
                 continue
             include_group = dependency.get("include-group")
             if include_group == "sty":
@@ -208,12 +204,14 @@ def _update_requires_python(pyproject: ModifiablePyproject) -> None:
 
 
 def _update_python_version_classifiers(
-    pyproject: ModifiablePyproject, excluded_python_versions: set[PythonVersion]
+    session: Session,
+    pyproject: ModifiablePyproject,
+    excluded_python_versions: set[PythonVersion],
 ) -> None:
     if not pyproject.has_table("project"):
         return
     project = pyproject.get_table("project")
-    if "classifiers" not in project and not os.path.exists("tests/"):
+    if "classifiers" not in project and not session.exists("tests"):
         return
     requires_python = _get_requires_python(project)
     if not requires_python:
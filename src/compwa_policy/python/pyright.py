@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import json
-import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -20,18 +19,7 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Session
 
 
-@check_hook(
-    group="python",
-    paths=[
-        CONFIG_PATH.gitignore,
-        CONFIG_PATH.precommit,
-        CONFIG_PATH.pyproject,
-        CONFIG_PATH.vscode_extensions,
-        CONFIG_PATH.vscode_settings,
-        "pyrightconfig.json",
-    ],
-    enabled=lambda _args, ctx: ctx.is_python_repo,
-)
+@check_hook(group="python", enabled=lambda _args, ctx: ctx.is_python_repo)
 def check(session: Session, args: Arguments, _: CheckContext) -> None:
     activate = "pyright" in args.type_checker
     _update_vscode_settings(session, activate)
@@ -39,7 +27,7 @@ def check(session: Session, args: Arguments, _: CheckContext) -> None:
     if config is None:
         return
     if activate:
-        _merge_config_into_pyproject(config)
+        _merge_config_into_pyproject(session, config)
         _update_precommit(session.precommit)
         _remove_excludes(config)
         _update_settings(config)
@@ -48,22 +36,23 @@ def check(session: Session, args: Arguments, _: CheckContext) -> None:
 
 
 def _merge_config_into_pyproject(
+    session: Session,
     pyproject: ModifiablePyproject,
     path: Path = Path("pyrightconfig.json"),
     remove: bool = True,
 ) -> None:
     old_config_path = path
-    if not os.path.exists(old_config_path):
+    old_config = session.get_path(old_config_path)
+    if not old_config.exists:
         return
-    with open(old_config_path) as stream:
-        existing_config = json.load(stream)
+    existing_config = json.loads(old_config.read_text())
     for key, value in existing_config.items():
         if isinstance(value, list):
             existing_config[key] = to_toml_array(sorted(value))
     tool_table = pyproject.get_table("tool.pyright", create=True)
     tool_table.update(existing_config)
     if remove:
-        os.remove(old_config_path)
+        old_config.remove()
     msg = f"Imported pyright configuration from {old_config_path}"
     pyproject.changelog.append(msg)
 
@@ -138,8 +127,7 @@ def _remove_pyright(session: Session, /) -> None:
     if pyproject is None:
         return
     pyright_config = Path("pyrightconfig.json")
-    if pyright_config.exists():
-        os.remove(pyright_config)
+    if session.get_path(pyright_config).remove():
         msg = f"Removed old pyright configuration file {pyright_config}"
         pyproject.changelog.append(msg)
     if pyproject.has_table("tool.pyright"):
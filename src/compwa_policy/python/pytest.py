@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 from typing import TYPE_CHECKING, Any
 
 import rtoml
@@ -24,22 +25,13 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Session
 
 
-@check_hook(
-    group="python",
-    paths=[
-        CONFIG_PATH.precommit,
-        CONFIG_PATH.pyproject,
-        CONFIG_PATH.pytest_ini,
-        CONFIG_PATH.vscode_settings,
-    ],
-    enabled=lambda _args, ctx: ctx.is_python_repo,
-)
+@check_hook(group="python", enabled=lambda _args, ctx: ctx.is_python_repo)
 def check(session: Session, args: Arguments, _: CheckContext) -> None:
     config = session.pyproject
     if config is None or not has_dependency(config, "pytest"):
         return
-    _merge_coverage_into_pyproject(config)
-    _merge_pytest_into_pyproject(config)
+    _merge_coverage_into_pyproject(session, config)
+    _merge_pytest_into_pyproject(session, config)
     _deny_ini_options(config)
     _update_codecov_settings(config, args.branch_coverage)
     _update_settings(config)
@@ -52,10 +44,13 @@ def check(session: Session, args: Arguments, _: CheckContext) -> None:
         config.add_dependency("pytest-xdist", ["test", "dev"])
 
 
-def _merge_coverage_into_pyproject(pyproject: ModifiablePyproject) -> None:
-    if not CONFIG_PATH.pytest_ini.exists():
+def _merge_coverage_into_pyproject(
+    session: Session, pyproject: ModifiablePyproject
+) -> None:
+    pytest_ini_file = session.get_path(CONFIG_PATH.pytest_ini)
+    if not pytest_ini_file.exists:
         return
-    pytest_ini = open_config(CONFIG_PATH.pytest_ini)
+    pytest_ini = open_config(io.StringIO(pytest_ini_file.read_text()))
     section_name = "coverage:run"
     if not pytest_ini.has_section(section_name):
         return
@@ -71,17 +66,19 @@ def _merge_coverage_into_pyproject(pyproject: ModifiablePyproject) -> None:
     pyproject.changelog.append(msg)
 
 
-def _merge_pytest_into_pyproject(pyproject: ModifiablePyproject) -> None:
-    if not CONFIG_PATH.pytest_ini.exists():
+def _merge_pytest_into_pyproject(
+    session: Session, pyproject: ModifiablePyproject
+) -> None:
+    pytest_ini = session.get_path(CONFIG_PATH.pytest_ini)
+    if not pytest_ini.exists:
         return
-    with open(CONFIG_PATH.pytest_ini) as stream:
-        original_contents = stream.read()
+    original_contents = pytest_ini.read_text()
     toml_str = Translator().translate(original_contents, profile_name="pytest.ini")
     pytest_config = rtoml.loads(toml_str)
     pytest_config.pop("coverage:run", None)
     tool_table = pyproject.get_table("tool", create=True)
     tool_table.update(pytest_config)
-    CONFIG_PATH.pytest_ini.unlink()
+    pytest_ini.remove()
     msg = f"Imported pytest configuration from {CONFIG_PATH.pytest_ini}"
     pyproject.changelog.append(msg)
 
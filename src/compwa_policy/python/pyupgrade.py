@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from compwa_policy.utilities import CONFIG_PATH
 from compwa_policy.utilities.check_hook import check_hook
 from compwa_policy.utilities.precommit.struct import Hook, Repo
 from compwa_policy.utilities.yaml import read_preserved_yaml
@@ -18,11 +17,7 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Session
 
 
-@check_hook(
-    group="python",
-    paths=[CONFIG_PATH.precommit, CONFIG_PATH.pyproject],
-    enabled=lambda _args, ctx: ctx.is_python_repo,
-)
+@check_hook(group="python", enabled=lambda _args, ctx: ctx.is_python_repo)
 def check(session: Session, args: Arguments, _: CheckContext) -> None:
     precommit = session.precommit
     if args.no_ruff:
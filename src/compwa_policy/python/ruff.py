@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import os
 from collections import abc
 from typing import TYPE_CHECKING, Any
 
 from ruamel.yaml import YAML
 from setuptools import find_packages
 
-from compwa_policy.utilities import CONFIG_PATH, natural_sorting, remove_configs, vscode
+from compwa_policy.utilities import natural_sorting, remove_configs, vscode
 from compwa_policy.utilities.check_hook import check_hook
 from compwa_policy.utilities.precommit.struct import Hook, Repo
 from compwa_policy.utilities.pyproject import (
@@ -35,20 +34,7 @@ if TYPE_CHECKING:
 
 
 @check_hook(
-    group="python",
-    paths=[
-        CONFIG_PATH.precommit,
-        CONFIG_PATH.pyproject,
-        CONFIG_PATH.readme,
-        CONFIG_PATH.vscode_extensions,
-        CONFIG_PATH.vscode_settings,
-        ".flake8",
-        ".pydocstyle",
-        ".pylintrc",
-        "docs/.pydocstyle",
-        "tests/.pydocstyle",
-    ],
-    enabled=lambda args, ctx: ctx.is_python_repo and (not args.no_ruff),
+    group="python", enabled=lambda args, ctx: ctx.is_python_repo and (not args.no_ruff)
 )
 def check(session: Session, args: Arguments, ctx: CheckContext) -> None:
     has_notebooks = ctx.has_notebooks
@@ -70,7 +56,7 @@ def check(session: Session, args: Arguments, ctx: CheckContext) -> None:
     _move_ruff_lint_config(config)
     if has_notebooks and imports_on_top:
         _sort_imports_on_top(precommit, config)
-    _update_ruff_config(precommit, config, has_notebooks)
+    _update_ruff_config(session, config, has_notebooks)
     _update_precommit_hook(precommit, has_notebooks)
     if not has_dependency(config, "ruff"):
         _update_lint_dependencies(session)
@@ -102,8 +88,7 @@ def _remove_flake8(session: Session, /) -> None:
         return
     remove_configs(session, [".flake8"])
     __remove_nbqa_option(pyproject, "flake8")
-    pyproject.remove_dependency("flake8")
-    pyproject.remove_dependency("pep8-naming")
+    pyproject.remove_dependencies(["flake8", "pep8-naming"])
     vscode.remove_extension_recommendation(session, "ms-python.flake8", unwanted=True)
     precommit.remove_hook("autoflake")  # cspell:ignore autoflake
     precommit.remove_hook("flake8")
@@ -142,7 +127,7 @@ def __remove_nbqa_option(pyproject: ModifiablePyproject, option: str) -> None:
 
 def __remove_tool_table(pyproject: ModifiablePyproject, tool_table: str) -> None:
     tools = pyproject._document.get("tool")  # noqa: SLF001
-    if isinstance(tools, dict) and tool_table in tools:
+    if isinstance(tools, abc.MutableMapping) and tool_table in tools:
         tools.pop(tool_table)
         msg = f"Removed [tool.{tool_table}] table"
         pyproject.changelog.append(msg)
@@ -212,14 +197,15 @@ def _move_ruff_lint_config(pyproject: ModifiablePyproject) -> None:
 
 
 def _update_ruff_config(
-    precommit: ModifiablePrecommit,
+    session: Session,
     pyproject: ModifiablePyproject,
     has_notebooks: bool,
 ) -> None:
-    __update_global_settings(pyproject, has_notebooks)
+    precommit = session.precommit
+    __update_global_settings(session, pyproject, has_notebooks)
     __update_ruff_format_settings(pyproject)
     __update_ruff_lint_settings(pyproject)
-    __update_per_file_ignores(pyproject, has_notebooks)
+    __update_per_file_ignores(session, pyproject, has_notebooks)
     __remove_deprecated_rules(pyproject)
     if has_notebooks:
         __update_flake8_builtins(pyproject)
@@ -230,7 +216,7 @@ def _update_ruff_config(
 
 
 def __update_global_settings(
-    pyproject: ModifiablePyproject, has_notebooks: bool
+    session: Session, pyproject: ModifiablePyproject, has_notebooks: bool
 ) -> None:
     settings = pyproject.get_table("tool.ruff", create=True)
     minimal_settings: dict[str, Any] = {
@@ -252,7 +238,7 @@ def __update_global_settings(
             *settings.get(key, []),
         })
         minimal_settings[key] = to_toml_array(default_includes)
-    src_directories = ___get_src_directories()
+    src_directories = ___get_src_directories(session)
     if src_directories:
         minimal_settings["src"] = src_directories
     if not complies_with_subset(settings, minimal_settings):
@@ -277,17 +263,12 @@ def ___get_target_version(pyproject: Pyproject) -> str:
     return lowest_version
 
 
-def ___get_src_directories() -> list[str]:
+def ___get_src_directories(session: Session) -> list[str]:
     expected_directories = (
         "src",
         "tests",
     )
-    directories = tuple(
-        path
-        for path in expected_directories
-        if os.path.exists(path)
-        if os.path.isdir(path)
-    )
+    directories = tuple(path for path in expected_directories if session.is_dir(path))
     return to_toml_array(sorted(directories))
 
 
@@ -358,7 +339,7 @@ def ___get_task_tags(ruff_settings: Mapping[str, Any]) -> Array:
 
 
 def __update_per_file_ignores(
-    pyproject: ModifiablePyproject, has_notebooks: bool
+    session: Session, pyproject: ModifiablePyproject, has_notebooks: bool
 ) -> None:
     minimal_settings: dict[str, Array] = {}
     if has_notebooks:
@@ -391,7 +372,7 @@ def __update_per_file_ignores(
             },
         )
     docs_dir = "docs"
-    if os.path.exists(docs_dir) and os.path.isdir(docs_dir):
+    if session.is_dir(docs_dir):
         key = f"{docs_dir}/*"
         minimal_settings[key] = ___get_per_file_ignores(
             pyproject,
@@ -403,7 +384,7 @@ def __update_per_file_ignores(
             },
         )
     conf_path = f"{docs_dir}/conf.py"
-    if os.path.exists(conf_path):
+    if session.exists(conf_path):
         key = conf_path
         minimal_settings[key] = ___get_per_file_ignores(
             pyproject,
@@ -412,12 +393,10 @@ def __update_per_file_ignores(
                 "D100",  # no module docstring
             },
         )
-    if os.path.exists("setup.py"):
+    if session.exists("setup.py"):
         minimal_settings["setup.py"] = to_toml_array(["D100"])
     for tests_dir in ["benchmarks", "tests"]:
-        if not os.path.exists(tests_dir):
-            continue
-        if not os.path.isdir(tests_dir):
+        if not session.is_dir(tests_dir):
             continue
         key = f"{tests_dir}/*"
         minimal_settings[key] = ___get_per_file_ignores(
@@ -632,6 +611,8 @@ def __remove_nbqa(
 
 
 def ___remove_nbqa_settings(pyproject: ModifiablePyproject) -> None:
+    if not pyproject.has_table("tool.nbqa"):
+        return
     nbqa_addopts = pyproject.get_table("tool.nbqa.addopts", create=True)
     if "ruff" in nbqa_addopts:
         del nbqa_addopts["ruff"]
@@ -5,9 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
-from compwa_policy.utilities import CONFIG_PATH, vscode
+from compwa_policy.utilities import vscode
 from compwa_policy.utilities.check_hook import check_hook
-from compwa_policy.utilities.precommit.getters import find_hook
 from compwa_policy.utilities.precommit.struct import Hook, Repo
 from compwa_policy.utilities.readme import add_badge, remove_badge
 from compwa_policy.utilities.yaml import read_preserved_yaml
@@ -20,18 +19,7 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Session
 
 
-@check_hook(
-    group="python",
-    paths=[
-        CONFIG_PATH.precommit,
-        CONFIG_PATH.pyproject,
-        CONFIG_PATH.readme,
-        CONFIG_PATH.vscode_extensions,
-        CONFIG_PATH.vscode_settings,
-        "ty.toml",
-    ],
-    enabled=lambda _args, ctx: ctx.is_python_repo,
-)
+@check_hook(group="python", enabled=lambda _args, ctx: ctx.is_python_repo)
 def check(session: Session, args: Arguments, _: CheckContext) -> None:
     _update_vscode_settings(session, args.type_checker)
     config = session.pyproject
@@ -97,7 +85,7 @@ def _update_precommit_config(session: Session, /) -> None:
     pyproject = session.pyproject
     if pyproject is None:
         return
-    existing_hook = find_hook(precommit.document, r"^ty$")
+    existing_hook = precommit.find_hook(r"^ty$")
     exclude = existing_hook.get("exclude") if existing_hook else None
     precommit.remove_hook("ty", repo_url="local")
     hook = Hook(id="ty")
@@ -128,8 +116,7 @@ def _remove_ty(session: Session, /) -> None:
     if pyproject is None:
         return
     config_path = Path("ty.toml")
-    if config_path.exists():
-        config_path.unlink()
+    if session.get_path(config_path).remove():
         pyproject.changelog.append(f"Removed {config_path}")
     if pyproject.has_table("tool.ty"):
         del pyproject._document["tool"]["ty"]  # noqa: SLF001
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import json
-import os
 from textwrap import dedent
 from typing import TYPE_CHECKING, cast
 
@@ -16,45 +15,37 @@ from compwa_policy.errors import PolicyError
 from compwa_policy.utilities import CONFIG_PATH, vscode
 from compwa_policy.utilities.check_hook import check_hook
 from compwa_policy.utilities.precommit.struct import Hook, Repo
+from compwa_policy.utilities.yaml import dumps_yaml
 
 if TYPE_CHECKING:
     from compwa_policy import Arguments
     from compwa_policy.utilities.check_hook import CheckContext
-    from compwa_policy.utilities.precommit import ModifiablePrecommit
     from compwa_policy.utilities.session import Changelog, Session
 
 
-@check_hook(
-    group="repo",
-    paths=[
-        CONFIG_PATH.citation,
-        CONFIG_PATH.zenodo,
-        CONFIG_PATH.precommit,
-        CONFIG_PATH.vscode_settings,
-    ],
-)
+@check_hook(group="repo")
 def check(session: Session, _args: Arguments, _ctx: CheckContext) -> None:
     just_converted = False
-    if CONFIG_PATH.zenodo.exists():
-        if CONFIG_PATH.citation.exists():
-            session.changelog += remove_zenodo_json()
+    if session.get_path(CONFIG_PATH.zenodo).exists:
+        if session.get_path(CONFIG_PATH.citation).exists:
+            session.changelog += remove_zenodo_json(session)
         else:
-            session.changelog += convert_zenodo_json()
+            session.changelog += convert_zenodo_json(session)
             just_converted = True
-    if CONFIG_PATH.citation.exists():
+    if session.get_path(CONFIG_PATH.citation).exists:
         if not just_converted:
-            check_citation_keys()
-        add_json_schema_precommit(session.precommit)
+            check_citation_keys(session)
+        add_json_schema_precommit(session)
         vscode.add_extension_recommendation(session, "redhat.vscode-yaml")
         update_vscode_settings(session)
 
 
-def convert_zenodo_json() -> Changelog:
-    with open(CONFIG_PATH.zenodo) as f:
-        zenodo = json.load(f)
+def convert_zenodo_json(session: Session, /) -> Changelog:
+    zenodo_json = session.get_path(CONFIG_PATH.zenodo)
+    zenodo = json.loads(zenodo_json.read_text())
     citation_cff = _convert_zenodo(zenodo)
-    _write_citation_cff(citation_cff)
-    CONFIG_PATH.zenodo.unlink()
+    _write_citation_cff(session, citation_cff)
+    zenodo_json.remove()
     msg = f"""
     Converted {CONFIG_PATH.zenodo} to a {CONFIG_PATH.citation} config. For more info,
     see https://citation-file-format.github.io
@@ -63,8 +54,8 @@ def convert_zenodo_json() -> Changelog:
     return [msg]
 
 
-def remove_zenodo_json() -> Changelog:
-    CONFIG_PATH.zenodo.unlink()
+def remove_zenodo_json(session: Session, /) -> Changelog:
+    session.get_path(CONFIG_PATH.zenodo).remove()
     msg = (
         f"Removed {CONFIG_PATH.zenodo}, because a {CONFIG_PATH.citation} already exists"
     )
@@ -100,7 +91,7 @@ def _convert_zenodo(zenodo: dict) -> CommentedMap:
     return citation_cff
 
 
-def _write_citation_cff(citation_cff: CommentedMap) -> None:
+def _write_citation_cff(session: Session, citation_cff: CommentedMap) -> None:
     newline_key = None
     for key in citation_cff:
         if key in {"cff-version", "message", "title", "abstract"}:
@@ -114,8 +105,7 @@ def _write_citation_cff(citation_cff: CommentedMap) -> None:
     yaml.indent(mapping=2, sequence=4, offset=2)
     yaml.width = 88
     yaml.allow_unicode = True
-    with open(CONFIG_PATH.citation, "w") as stream:
-        yaml.dump(citation_cff, stream)
+    session.get_path(CONFIG_PATH.citation).write_text(dumps_yaml(yaml, citation_cff))
 
 
 def _get_authors(zenodo: dict) -> list[dict[str, str]] | None:
@@ -147,7 +137,7 @@ def __convert_author(creator: dict) -> dict:
     return author_info
 
 
-def check_citation_keys() -> None:
+def check_citation_keys(session: Session, /) -> None:
     expected = {
         "cff-version",
         "title",
@@ -158,11 +148,10 @@ def check_citation_keys() -> None:
         "license",
         "repository-code",
     }
-    if os.path.exists("docs/"):
+    if session.is_dir("docs"):
         expected.add("url")
-    with open(CONFIG_PATH.citation) as f:
-        yaml = YAML()
-        citation_cff = yaml.load(f)
+    yaml = YAML()
+    citation_cff = yaml.load(session.get_path(CONFIG_PATH.citation).read_text())
     if not citation_cff:
         msg = f"{CONFIG_PATH.citation} is empty"
         raise PolicyError(msg)
@@ -179,9 +168,10 @@ def check_citation_keys() -> None:
         raise PolicyError(msg)
 
 
-def add_json_schema_precommit(precommit: ModifiablePrecommit) -> None:
-    if not CONFIG_PATH.citation.exists():
+def add_json_schema_precommit(session: Session, /) -> None:
+    if not session.get_path(CONFIG_PATH.citation).exists:
         return
+    precommit = session.precommit
     # cspell:ignore jsonschema schemafile
     expected_hook = Hook(
         id="check-jsonschema",
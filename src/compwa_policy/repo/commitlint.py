@@ -5,7 +5,6 @@ See https://github.com/ComPWA/policy/issues/177.
 
 from __future__ import annotations
 
-import os
 from textwrap import dedent
 from typing import TYPE_CHECKING
 
@@ -17,12 +16,11 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Session
 
 
-@check_hook(group="repo", paths=["commitlint.config.js"])
+@check_hook(group="repo")
 def check(session: Session, _args: Arguments, _ctx: CheckContext) -> None:
     path = "commitlint.config.js"
-    if not os.path.exists(path):
+    if not session.get_path(path).remove():
         return
-    os.remove(path)
     msg = f"""
     Remove outdated {path}. Commitlint is now configured through
     https://github.com/ComPWA/commitlint-config.
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import os
 from typing import TYPE_CHECKING
 
 from compwa_policy.errors import PolicyError
@@ -15,25 +14,13 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Session
 
 
-@check_hook(
-    group="repo",
-    paths=[
-        CONFIG_PATH.gitignore,
-        CONFIG_PATH.precommit,
-        CONFIG_PATH.vscode_extensions,
-        ".markdownlint.json",
-        ".markdownlint.yaml",
-        "doc/_relink_references.py",
-        "docs/_relink_references.py",
-    ],
-    directories=(".github",),
-)
+@check_hook(group="repo")
 def check(session: Session, args: Arguments, _: CheckContext) -> None:
     if not args.keep_issue_templates:
         _remove_github_issue_templates(session)
     _remove_markdownlint(session)
     for directory in ["docs", "doc"]:
-        _remove_relink_references(directory)
+        _remove_relink_references(session, directory)
 
 
 def _remove_github_issue_templates(session: Session, /) -> None:
@@ -57,9 +44,9 @@ def _remove_markdownlint(session: Session, /) -> None:
     session.precommit.remove_hook("markdownlint")
 
 
-def _remove_relink_references(directory: str) -> None:
+def _remove_relink_references(session: Session, directory: str) -> None:
     path = f"{directory}/_relink_references.py"
-    if not os.path.exists(path):
+    if not session.exists(path):
         return
     msg = (
         f"Please remove {path!r} and use https://pypi.org/project/sphinx-api-relink"
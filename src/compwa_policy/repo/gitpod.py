@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import os
 from typing import TYPE_CHECKING
 
 import yaml
@@ -20,19 +19,10 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Changelog, Session
 
 
-@check_hook(
-    group="repo",
-    paths=[
-        CONFIG_PATH.gitpod,
-        CONFIG_PATH.pyproject,
-        CONFIG_PATH.readme,
-        CONFIG_PATH.vscode_extensions,
-    ],
-    directories=(CONFIG_PATH.pip_constraints,),
-)
+@check_hook(group="repo")
 def check(session: Session, args: Arguments, _: CheckContext) -> None:
     if not args.gitpod:
-        session.changelog += remove_gitpod_config()
+        session.changelog += remove_gitpod_config(session)
         remove_badge(
             session,
             badge_pattern=r"\[!\[GitPod\]\(https://img.shields.io/badge/gitpod",
@@ -40,15 +30,15 @@ def check(session: Session, args: Arguments, _: CheckContext) -> None:
         return
     error_message = ""
     expected_config = _generate_gitpod_config(session, args.dev_python_version)
-    if CONFIG_PATH.gitpod.exists():
-        with open(CONFIG_PATH.gitpod) as stream:
-            existing_config = yaml.load(stream, Loader=yaml.SafeLoader)
+    gitpod_config = session.get_path(CONFIG_PATH.gitpod)
+    if gitpod_config.exists:
+        existing_config = yaml.load(gitpod_config.read_text(), Loader=yaml.SafeLoader)
         if existing_config != expected_config:
             error_message = "GitPod config does not have expected content"
     else:
         error_message = f"GitPod config {CONFIG_PATH.gitpod} does not exist"
     if error_message:
-        write_yaml(expected_config, output_path=CONFIG_PATH.gitpod)
+        write_yaml(expected_config, output_path=CONFIG_PATH.gitpod, session=session)
         error_message += ". Problem has been fixed."
         session.changelog.append(error_message)
         return
@@ -65,9 +55,8 @@ def check(session: Session, args: Arguments, _: CheckContext) -> None:
         return
 
 
-def remove_gitpod_config() -> Changelog:
-    if CONFIG_PATH.gitpod.exists():
-        os.remove(CONFIG_PATH.gitpod)
+def remove_gitpod_config(session: Session, /) -> Changelog:
+    if session.get_path(CONFIG_PATH.gitpod).remove():
         return [f"Removed {CONFIG_PATH.gitpod} (add back by setting --gitpod)"]
     return []
 
@@ -5,7 +5,6 @@ from __future__ import annotations
 import os
 import re
 from collections.abc import Mapping, MutableMapping, Sequence
-from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 import tomlkit
@@ -55,11 +54,7 @@ _TEST_TASKS = frozenset({"benchmark", "cov", "test", "test-all"})
 _TEST_PY_PATTERN = re.compile(r"^test-py3\d+$")
 
 
-@check_hook(
-    group="repo",
-    paths=[CONFIG_PATH.pyproject, CONFIG_PATH.gitignore, CONFIG_PATH.precommit],
-    patterns=("(.*/)?_quarto\\.yml",),
-)
+@check_hook(group="repo")
 def check(session: Session, args: Arguments, ctx: CheckContext) -> None:
     config = session.pyproject
     if config is None:
@@ -69,12 +64,12 @@ def check(session: Session, args: Arguments, ctx: CheckContext) -> None:
         msg = f"Removed deprecated tool.tox section from {CONFIG_PATH.pyproject}"
         config.changelog.append(msg)
     if config.has_table("tool.poe"):
-        _check_expected_sections(config, ctx.has_notebooks)
+        _check_expected_sections(session, config, ctx.has_notebooks)
         if args.package_manager == "uv":
             _configure_uv_executor(config)
             _migrate_tasks_to_groups(config)
             _set_doc_group(config)
-            _set_test_group(config)
+            _set_test_group(session, config)
             _set_notebook_group(config, ctx.has_notebooks)
             _check_no_uv_run(config)
             if config.has_table("tool.poe.tasks"):
@@ -89,9 +84,7 @@ def check(session: Session, args: Arguments, ctx: CheckContext) -> None:
         if config.has_table("tool.poe.tasks"):
             _set_upgrade_task(config, args.package_manager)
     remove_lines(session, CONFIG_PATH.gitignore, pattern=r"\.tox/?")
-    config.remove_dependency("poethepoet")
-    config.remove_dependency("tox")
-    config.remove_dependency("tox-uv")
+    config.remove_dependencies(["poethepoet", "tox", "tox-uv"])
 
 
 def _get_all_poe_tasks(poe_table: Mapping) -> set[str]:
@@ -101,7 +94,9 @@ def _get_all_poe_tasks(poe_table: Mapping) -> set[str]:
     return tasks
 
 
-def _check_expected_sections(pyproject: Pyproject, has_notebooks: bool) -> None:
+def _check_expected_sections(
+    session: Session, pyproject: Pyproject, has_notebooks: bool
+) -> None:
     poe_table = pyproject.get_table("tool.poe")
     tasks = _get_all_poe_tasks(poe_table)
     expected_tasks: set[str] = set()
@@ -114,7 +109,7 @@ def _check_expected_sections(pyproject: Pyproject, has_notebooks: bool) -> None:
             expected_tasks.add("nb")
         if has_dependency(pyproject, "myst-nb"):
             expected_tasks.update({"docnb", "docnblive"})
-    if Path("tests").exists():
+    if session.exists("tests"):
         expected_tasks.add("test")
     missing_tasks = expected_tasks - tasks
     if missing_tasks:
@@ -194,8 +189,8 @@ def _set_doc_group(pyproject: ModifiablePyproject, /) -> None:
         pyproject.changelog.append(msg)
 
 
-def _set_test_group(pyproject: ModifiablePyproject, /) -> None:
-    if not Path("tests").exists():
+def _set_test_group(session: Session, pyproject: ModifiablePyproject, /) -> None:
+    if not session.exists("tests"):
         return
     test_group = pyproject.get_table("tool.poe.groups.test", create=True)
     if __safe_update(test_group, "heading", "Testing"):
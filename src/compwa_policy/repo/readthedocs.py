@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
+import io
 import os
 import re
-from functools import cache
 from pathlib import Path
 from textwrap import dedent, indent
 from typing import IO, TYPE_CHECKING, cast
@@ -12,10 +12,12 @@ from typing import IO, TYPE_CHECKING, cast
 from ruamel.yaml.scalarstring import DoubleQuotedScalarString, LiteralScalarString
 
 from compwa_policy.utilities import CONFIG_PATH, get_nested_dict
+from compwa_policy.utilities.caching import repository_cache
 from compwa_policy.utilities.check_hook import check_hook
 from compwa_policy.utilities.match import git_ls_files
 from compwa_policy.utilities.pyproject import get_constraints_file, has_dependency
-from compwa_policy.utilities.yaml import create_prettier_round_trip_yaml
+from compwa_policy.utilities.storage import get_storage
+from compwa_policy.utilities.yaml import create_prettier_round_trip_yaml, dumps_yaml
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -29,22 +31,15 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Changelog, Session
 
 
-@check_hook(
-    group="repo",
-    paths=[CONFIG_PATH.readthedocs, CONFIG_PATH.pyproject, "docs/conf.py"],
-    directories=(CONFIG_PATH.pip_constraints,),
-    patterns=("(.*/)?_quarto\\.yml",),
-)
+@check_hook(group="repo")
 def check(session: Session, args: Arguments, _: CheckContext) -> None:
     package_manager = args.package_manager
     python_version = args.dev_python_version
-    source = CONFIG_PATH.readthedocs
-    if isinstance(source, str):
-        source = Path(source)
-    if isinstance(source, Path) and not source.exists():
+    rtd_file = session.get_path(CONFIG_PATH.readthedocs)
+    if not rtd_file.exists:
         return
-    rtd = ReadTheDocs(source)
-    _set_sphinx_configuration(rtd)
+    rtd = ReadTheDocs(io.StringIO(rtd_file.read_text()))
+    _set_sphinx_configuration(session, rtd)
     _update_os(rtd)
     _update_python_version(rtd, python_version)
     if package_manager == "pixi+uv":
@@ -63,11 +58,14 @@ def check(session: Session, args: Arguments, _: CheckContext) -> None:
         _update_build_step_for_uv(rtd)
     else:
         _update_post_install(rtd, python_version, package_manager)
-    session.changelog += rtd.finalize()
+    changes = rtd.finalize()
+    if changes:
+        rtd_file.write_text(rtd.dumps())
+    session.changelog += changes
 
 
-def _set_sphinx_configuration(config: ReadTheDocs) -> None:
-    conf_path = __get_sphinx_config_path()
+def _set_sphinx_configuration(session: Session, config: ReadTheDocs) -> None:
+    conf_path = __get_sphinx_config_path(session)
     if conf_path is None:
         return
     conf_path = str(conf_path)
@@ -79,9 +77,9 @@ def _set_sphinx_configuration(config: ReadTheDocs) -> None:
         config.changelog.append(msg)
 
 
-def __get_sphinx_config_path() -> Path | None:
+def __get_sphinx_config_path(session: Session) -> Path | None:
     conf_path = Path("docs/conf.py")
-    if conf_path.exists():
+    if session.exists(conf_path):
         return conf_path
     candidate_paths = git_ls_files("**/conf.py")
     if not candidate_paths:
@@ -254,8 +252,9 @@ def _update_build_step_for_uv(config: ReadTheDocs) -> None:
     )
 
 
-@cache
+@repository_cache
 def _determine_docs_dir() -> str:
+    storage = get_storage()
     for path in git_ls_files(
         "conf.py",
         "**/conf.py",
@@ -263,7 +262,7 @@ def _determine_docs_dir() -> str:
         "**/_quarto.yml",
         untracked=True,
     ):
-        if os.path.isfile(path):
+        if storage.exists(path) and not storage.is_dir(path):
             parent = os.path.dirname(path)
             return parent or "."
     return "docs"
@@ -363,10 +362,12 @@ class ReadTheDocs:
             target.seek(0)
             self.__parser.dump(self.document, target)
 
+    def dumps(self) -> str:
+        return dumps_yaml(self.__parser, self.document)
+
     def finalize(self) -> Changelog:
         if not self.changelog:
             return []
         msg = f"Updated {CONFIG_PATH.readthedocs}:\n"
         msg += indent("\n".join(self.changelog), prefix="  - ")
-        self.dump(self.source)
         return [msg]
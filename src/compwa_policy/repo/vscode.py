@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import os
 from typing import TYPE_CHECKING
 
 from compwa_policy.utilities import CONFIG_PATH, vscode
@@ -16,11 +15,7 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.session import Session
 
 
-@check_hook(
-    group="repo",
-    paths=[CONFIG_PATH.envrc],
-    directories=(CONFIG_PATH.pip_constraints, ".vscode"),
-)
+@check_hook(group="repo")
 def check(session: Session, args: Arguments, ctx: CheckContext) -> None:
     _update_extensions(session)
     _update_settings(
@@ -103,7 +98,7 @@ def _update_settings(
                 "rewrap.wrappingColumn": 88,
             },
         )
-        if CONFIG_PATH.envrc.exists():
+        if session.get_path(CONFIG_PATH.envrc).exists:
             vscode.update_settings(
                 session, {"python.terminal.activateEnvironment": False}
             )
@@ -131,7 +126,7 @@ def _remove_outdated_settings(session: Session, /) -> None:
 
 
 def _update_doc_settings(session: Session, /) -> None:
-    if not os.path.exists("docs/"):
+    if not session.is_dir("docs"):
         return
     vscode.update_settings(
         session, {"livePreview.defaultPreviewPath": "docs/_build/html"}
@@ -145,13 +140,13 @@ def _update_doc_settings(session: Session, /) -> None:
 
 def _update_notebook_settings(session: Session, /) -> None:
     """https://code.visualstudio.com/updates/v1_83#_go-to-symbol-in-notebooks."""
-    if not os.path.exists("docs/"):
+    if not session.is_dir("docs"):
         return
     vscode.update_settings(session, {"notebook.gotoSymbols.showAllSymbols": True})
 
 
 def _update_pytest_settings(session: Session, /) -> None:
-    if not os.path.exists("tests/"):
+    if not session.is_dir("tests"):
         return
     vscode.update_settings(
         session,
@@ -184,12 +184,12 @@ def update_file(
     relative_path: Path,
     in_template_folder: bool = False,
 ) -> None:
+    from compwa_policy.utilities.templates import read_template  # noqa: PLC0415
+
     if in_template_folder:
-        template_dir = COMPWA_POLICY_DIR / ".template"
+        expected_content = read_template(Path(".template") / relative_path)
     else:
-        template_dir = COMPWA_POLICY_DIR
-    template_path = template_dir / relative_path
-    expected_content = template_path.read_text()
+        expected_content = read_template(relative_path)
     resource = _get_path_resource(session, relative_path)
     if not resource.exists:
         message = f"{relative_path} is missing, so created a new one. Please commit it."
@@ -0,0 +1,86 @@
+"""Caches of results that are derived from the repository in the working directory.
+
+Results like :func:`.has_notebooks` are computed once per run with
+:func:`functools.cache`. A process that checks several repositories, or the same
+repository several times (:program:`policy fleet`, :program:`policy serve`,
+:program:`policy watch`), has to forget them before each run. Such functions are
+therefore decorated with :func:`repository_cache`, which registers them for
+:func:`clear_repository_caches`.
+
+Results that are persisted between runs, like the parsed configuration files and the
+memo of the checks, are kept in the cache directory of the user (see
+:func:`get_repository_cache_dir`), never in the repository itself. Some of them are
+pickled, and a pickle that is committed to a repository could run arbitrary code when it
+is loaded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from functools import _lru_cache_wrapper
+
+T = TypeVar("T")
+
+_REPOSITORY_CACHES: list[_lru_cache_wrapper] = []
+_LOCK = threading.Lock()
+
+
+def repository_cache(function: Callable[..., T]) -> _lru_cache_wrapper[T]:
+    """Cache the results of *function* until :func:`clear_repository_caches`.
+
+    >>> @repository_cache
+    ... def get_answer() -> int:
+    ...     return 42
+    >>> get_answer() and get_answer.cache_info().currsize
+    1
+    >>> clear_repository_caches()
+    >>> get_answer.cache_info().currsize
+    0
+    """
+    cached = cache(function)
+    with _LOCK:
+        _REPOSITORY_CACHES.append(cached)
+    return cached
+
+
+def get_repository_caches() -> tuple[_lru_cache_wrapper, ...]:
+    """Get the functions that were decorated with :func:`repository_cache`."""
+    with _LOCK:
+        return tuple(_REPOSITORY_CACHES)
+
+
+def clear_repository_caches() -> None:
+    """Forget cached results that were derived from the previous working directory."""
+    for cached in get_repository_caches():
+        cached.cache_clear()
+
+
+def get_user_cache_dir() -> Path:
+    """Get the directory for caches that are shared by all repositories of a user."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "compwa-policy"
+
+
+def get_repository_cache_dir(directory: Path | str | None = None) -> Path:
+    """Get the cache directory of the user for the repository in *directory*.
+
+    The directory is keyed by the resolved path of the repository, which defaults to the
+    working directory.
+    """
+    repository = os.path.realpath(os.getcwd() if directory is None else directory)
+    key = hashlib.sha256(os.fsencode(repository)).hexdigest()[:32]
+    return get_user_cache_dir() / "repositories" / key
+
+
+def create_cache_directory(directory: Path) -> None:
+    """Create a cache *directory* that only the current user can access."""
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import importlib
 import re
 import sys
 from collections.abc import Callable, Iterable
+from functools import cache
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from attrs import frozen
 
 from compwa_policy import Arguments
-from compwa_policy.utilities.session import Session
+from compwa_policy.utilities.instrumentation import measure
+
+if TYPE_CHECKING:
+    from compwa_policy.utilities.session import Session
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -77,6 +82,52 @@ class FileSet:
         ]
         return "(?x)^(\n" + "\n".join(lines) + "\n)$"
 
+    def matches(self, filename: Path | str) -> bool:
+        """Whether a modification of *filename* should activate the check hook.
+
+        >>> files = FileSet.create("pyproject.toml", directories=[".github"])
+        >>> files.matches("pyproject.toml"), files.matches(".github/dependabot.yml")
+        (True, True)
+        >>> files.matches("src/pyproject.toml")
+        False
+        """
+        return _compile(self).match(Path(filename).as_posix()) is not None
+
+    def matches_any(self, filenames: Iterable[Path | str]) -> bool:
+        return any(self.matches(filename) for filename in filenames)
+
+    def overlaps(self, other: FileSet) -> bool:
+        """Whether some file can belong to both file sets.
+
+        Patterns are only compared to exact paths; a pattern is assumed to overlap with
+        any directory or other pattern.
+
+        >>> vscode = FileSet.create(directories=[".vscode"])
+        >>> vscode.overlaps(FileSet.create(".vscode/settings.json"))
+        True
+        >>> vscode.overlaps(FileSet.create("pyproject.toml"))
+        False
+        """
+        if any(other.matches(path) for path in self.paths):
+            return True
+        if any(self.matches(path) for path in other.paths):
+            return True
+        if any(
+            directory.is_relative_to(other_directory)
+            or other_directory.is_relative_to(directory)
+            for directory in self.directories
+            for other_directory in other.directories
+        ):
+            return True
+        if self.patterns and (other.directories or other.patterns):
+            return True
+        return bool(other.patterns and self.directories)
+
+
+@cache
+def _compile(files: FileSet) -> re.Pattern[str]:
+    return re.compile(files.to_regex())
+
 
 @frozen
 class CheckContext:
@@ -92,15 +143,18 @@ def _always_enabled(_args: Arguments, _ctx: CheckContext) -> bool:
     return True
 
 
-Check = Callable[[Session, Arguments, CheckContext], None]
+Check = Callable[["Session", Arguments, CheckContext], None]
 
 
 @frozen
 class CheckHook:
-    """One policy transformation together with its dispatch metadata."""
+    """One policy transformation together with its dispatch metadata.
+
+    The files that trigger the check are declared in the `LazyCheckHook` of the
+    module, so that they are known without importing it.
+    """
 
     group: Group
-    files: FileSet
     run: Check
     enabled: Callable[[Arguments, CheckContext], bool] = _always_enabled
 
@@ -111,25 +165,96 @@ class CheckHook:
         context: CheckContext,
     ) -> None:
         if self.enabled(args, context):
-            self.run(session, args, context)
+            with measure(self.name):
+                self.run(session, args, context)
+
+    @property
+    def name(self) -> str:
+        """Name of the check module, relative to the `compwa_policy` package."""
+        return self.run.__module__.removeprefix("compwa_policy.")
+
+
+@frozen
+class LazyCheckHook:
+    """Dispatch metadata of a `CheckHook` that imports its module on first use.
+
+    The group and trigger files are declared up front, so that hooks can be listed and
+    selected without importing the check modules and their dependencies. The trigger
+    files are only declared here. The module has to define its `CheckHook` under the
+    name ``check``, with the same group. The files that the check
+    modifies determine which hooks can run in parallel (see `.schedule`).
+    """
+
+    module: str
+    group: Group
+    files: FileSet
+    writes: FileSet = FileSet()
+    """Files that the check modifies, directly or through the `.Session`."""
+    probes: FileSet = FileSet()
+    """Paths of which the check only queries whether they exist, like :file:`tests`.
+
+    Unlike the trigger files, modifying a file below them does not activate the check.
+    """
+    precommit_repos: tuple[str, ...] = ()
+    """URLs of the pre-commit repositories that the check may add without a revision.
+
+    The latest revisions of these repositories are resolved before the checks run (see
+    `.RevisionResolver.prefetch`).
+    """
+
+    def __call__(
+        self,
+        session: Session,
+        args: Arguments,
+        context: CheckContext,
+    ) -> None:
+        self.load()(session, args, context)
+
+    def load(self) -> CheckHook:
+        """Import the check module and return its `CheckHook`."""
+        return _import_check_hook(self.module)
+
+    def is_triggered_by(self, filenames: Iterable[Path | str] | None) -> bool:
+        """Whether the hook should run for a set of modified files.
+
+        `None` means that the modified files are unknown, which triggers every hook.
+        """
+        if filenames is None:
+            return True
+        return self.files.matches_any(filenames)
+
+    @property
+    def reads(self) -> FileSet:
+        """Files that the check inspects.
+
+        The trigger files are by definition the files that the check inspects. Files
+        that it modifies or :attr:`probes` are inspected as well.
+        """
+        return FileSet.union((self.files, self.writes, self.probes))
+
+    def conflicts_with(self, other: LazyCheckHook) -> bool:
+        """Whether the order of this hook and the *other* hook affects the result."""
+        return self.writes.overlaps(other.reads) or other.writes.overlaps(self.reads)
+
+
+@cache
+def _import_check_hook(module_name: str) -> CheckHook:
+    module = importlib.import_module(module_name)
+    hook = getattr(module, "check", None)
+    if not isinstance(hook, CheckHook):
+        msg = f"Module {module_name} does not define a check hook named 'check'"
+        raise TypeError(msg)
+    return hook
 
 
 def check_hook(
     *,
     group: Group,
-    paths: Iterable[Path | str] = (),
-    directories: Iterable[Path | str] = (),
-    patterns: Iterable[str] = (),
     enabled: Callable[[Arguments, CheckContext], bool] = _always_enabled,
 ) -> Callable[[Check], CheckHook]:
-    """Attach dispatch and trigger metadata to a ``check`` function."""
+    """Attach dispatch metadata to a ``check`` function."""
 
     def register(run: Check) -> CheckHook:
-        return CheckHook(group, files, run, enabled)
+        return CheckHook(group, run, enabled)
 
-    files = FileSet.create(
-        *paths,
-        directories=directories,
-        patterns=patterns,
-    )
     return register
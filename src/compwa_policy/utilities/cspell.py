@@ -0,0 +1,203 @@
+"""In-memory representation of the cSpell configuration file.
+
+The `ModifiableCspellConfig` is parsed once per `.Session` and written at most once,
+however many sections the checks update. It remembers which list sections are known to
+be sorted, so that sorting the configuration only has to look at sections that changed.
+This matters for the :code:`words` section, which can contain thousands of entries.
+"""
+
+from __future__ import annotations
+
+import json
+import pickle  # noqa: S403
+import sys
+from itertools import pairwise
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from compwa_policy.utilities import CONFIG_PATH
+from compwa_policy.utilities.resource import Changelog, ModifiableResource
+from compwa_policy.utilities.storage import get_storage
+from compwa_policy.utilities.transaction import FileTransaction
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+class ModifiableCspellConfig(ModifiableResource):
+    """In-memory representation of :file:`.cspell.json`.
+
+    A legacy :file:`cspell.json` is loaded if there is no :file:`.cspell.json` and is
+    renamed when the resource is dumped.
+    """
+
+    path = CONFIG_PATH.cspell
+    legacy_path = Path("cspell.json")
+
+    def __init__(self, document: dict | None, *, source: Path | None = None) -> None:
+        self._document = document
+        self._source = source
+        self._sorted_sections: set[str] = set()
+        self._modified = False
+        self._changelog: Changelog = []
+        if source is not None and source != self.path:
+            self._changelog.append(f"File {source} has been renamed to {self.path}")
+
+    @classmethod
+    def load(cls) -> Self:
+        storage = get_storage()
+        for path in (cls.path, cls.legacy_path):
+            if storage.exists(path):
+                return cls(json.loads(storage.read_text(path)), source=path)
+        return cls(None)
+
+    @property
+    def changelog(self) -> Changelog:
+        return self._changelog
+
+    @property
+    def changed(self) -> bool:
+        return self._modified or bool(self._changelog)
+
+    @property
+    def files(self) -> tuple[Path, ...]:
+        return (self.path, self.legacy_path)
+
+    def snapshot(self) -> bytes:
+        return pickle.dumps((self._document, self._sorted_sections, self._modified))
+
+    def restore(self, snapshot: bytes) -> None:
+        state = pickle.loads(snapshot)
+        self._document, self._sorted_sections, self._modified = state
+
+    @property
+    def exists(self) -> bool:
+        return self._document is not None
+
+    @property
+    def document(self) -> dict[str, Any]:
+        """The parsed configuration; modify it through `set_section`."""
+        if self._document is None:
+            return {}
+        return self._document
+
+    def set_section(self, name: str, content: Any, *, is_sorted: bool = False) -> bool:
+        """Set the content of a section and return whether it changed.
+
+        Set *is_sorted* if a list section is already in its canonical order, so that
+        `sort_sections` does not have to check it again.
+        """
+        document = self.__get_document()
+        if name in document and document[name] == content:
+            return False
+        document[name] = content
+        self._modified = True
+        if is_sorted:
+            self._sorted_sections.add(name)
+        else:
+            self._sorted_sections.discard(name)
+        return True
+
+    def remove_section(self, name: str) -> bool:
+        if name not in self.document:
+            return False
+        del self.__get_document()[name]
+        self._sorted_sections.discard(name)
+        self._modified = True
+        return True
+
+    def deduplicate_section(self, name: str) -> bool:
+        """Remove repeated entries from a list section, keeping their first occurrence."""
+        content = self.document.get(name)
+        if not isinstance(content, list):
+            return False
+        seen: set[str] = set()
+        unique = []
+        for entry in content:
+            if isinstance(entry, str):
+                if entry in seen:
+                    continue
+                seen.add(entry)
+            unique.append(entry)
+        if len(unique) == len(content):
+            return False
+        self.__get_document()[name] = unique
+        self._modified = True
+        return True
+
+    def sort_sections(self) -> list[str]:
+        """Sort the list sections and return the names of those that were unsorted.
+
+        Sections that are known to be sorted are skipped. Others are only sorted if a
+        linear scan shows that they are not in order yet.
+        """
+        fixed_sections = []
+        for name, content in self.document.items():
+            if name in self._sorted_sections or not isinstance(content, list):
+                continue
+            if not is_sorted(content, name):
+                self.__get_document()[name] = sort_section(content, name)
+                self._modified = True
+                fixed_sections.append(name)
+            self._sorted_sections.add(name)
+        return fixed_sections
+
+    def remove(self, message: str) -> bool:
+        if not self.exists:
+            return False
+        self._document = None
+        self._sorted_sections.clear()
+        self._changelog.append(message)
+        return True
+
+    def dump(self) -> None:
+        with FileTransaction() as transaction:
+            self.stage(transaction)
+
+    def stage(self, transaction: FileTransaction) -> None:
+        if self._source is not None and (self._source != self.path or not self.exists):
+            transaction.remove(self._source)
+        if self._document is None:
+            return
+        content = json.dumps(self._document, indent=2, ensure_ascii=False) + "\n"
+        transaction.write_text(self.path, content)
+
+    def __get_document(self) -> dict[str, Any]:
+        if self._document is None:
+            self._document = {}
+        return self._document
+
+
+def sort_section(content: Iterable[Any], section_name: str) -> list[Any]:
+    """Sort a list section.
+
+    >>> sort_section({"one", "Two"}, section_name="words")
+    ['one', 'Two']
+    >>> sort_section({"one", "Two"}, section_name="ignoreWords")
+    ['Two', 'one']
+    """
+    return sorted(content, key=_get_sort_key(section_name))
+
+
+def is_sorted(content: list[Any], section_name: str) -> bool:
+    """Check in one pass whether a list section is sorted.
+
+    >>> is_sorted(["one", "Two"], section_name="words")
+    True
+    >>> is_sorted(["one", "Two"], section_name="ignoreWords")
+    False
+    """
+    key = _get_sort_key(section_name)
+    return all(key(a) <= key(b) for a, b in pairwise(content))
+
+
+def _get_sort_key(section_name: str) -> Callable[[Any], Any]:
+    if section_name == "dictionaryDefinitions":
+        return lambda value: value.get("name", "").lower()
+    if section_name == "ignoreWords":
+        return lambda value: value
+    return lambda value: (0, value.casefold()) if isinstance(value, str) else (1, "")
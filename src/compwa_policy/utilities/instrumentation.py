@@ -0,0 +1,300 @@
+"""Measure how much time and I/O each check hook takes.
+
+While a `Profiler` is :func:`enabled <profiling>`, every `.CheckHook` call is recorded as
+a `HookProfile`: its wall time, the CPU time of its thread, and the number of files it
+read, parsed, and wrote, and the subprocesses it spawned. File and process activity is
+counted through :pep:`578` audit hooks, so it covers every module that a check uses,
+without having to instrument them one by one. Parses are counted when the
+`.ParseCache` actually has to parse a file, through a custom
+:code:`compwa_policy.parse` audit event. Likewise, a `.FileTransaction` reports the size
+of each file it commits through a :code:`compwa_policy.write` audit event, and each
+file it removes through a :code:`compwa_policy.remove` audit event.
+
+The profiles can be printed as a table (:func:`format_table`), exported as JSON
+(:func:`to_json`), or exported in the `Trace Event Format
+<https://docs.google.com/document/d/1CvAClvFfyA5R-PWYyA5AAp-5d_6zBZsywGMjLZ3Ug3U>`_
+(:func:`to_chrome_trace`), which can be inspected in :code:`chrome://tracing` or
+`Perfetto <https://ui.perfetto.dev>`_.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, final
+
+from attrs import asdict, frozen
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+PARSE_EVENT = "compwa_policy.parse"
+"""Audit event that is raised when a configuration file is parsed."""
+WRITE_EVENT = "compwa_policy.write"
+"""Audit event that is raised with the path and size of each committed file."""
+REMOVE_EVENT = "compwa_policy.remove"
+"""Audit event that is raised with the path of each removed file or directory."""
+
+
+@frozen
+class HookProfile:
+    """Resources that one check hook (or another step of a run) used."""
+
+    name: str
+    start: float
+    """Seconds since the start of the profiler."""
+    wall_time: float
+    cpu_time: float
+    files_read: int = 0
+    files_parsed: int = 0
+    files_written: int = 0
+    subprocesses: tuple[str, ...] = ()
+    thread: str = ""
+    bytes_written: int = 0
+
+
+class _Counters:
+    def __init__(self) -> None:
+        self.files_read = 0
+        self.files_parsed = 0
+        self.files_written = 0
+        self.bytes_written = 0
+        self.subprocesses: list[str] = []
+
+
+@final
+class Profiler:
+    """Collect a `HookProfile` for each :meth:`measure` block."""
+
+    def __init__(self) -> None:
+        self.__origin = time.perf_counter()
+        self.__lock = threading.Lock()
+        self.__profiles: list[HookProfile] = []
+        self.__local = threading.local()
+
+    @property
+    def profiles(self) -> list[HookProfile]:
+        with self.__lock:
+            return list(self.__profiles)
+
+    @contextmanager
+    def measure(self, name: str) -> Generator[None, None, None]:
+        """Record the resources that the code in this block uses in this thread."""
+        outer = getattr(self.__local, "counters", None)
+        counters = _Counters()
+        self.__local.counters = counters
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            cpu_time = time.thread_time() - cpu_start
+            wall_time = time.perf_counter() - start
+            self.__local.counters = outer
+            profile = HookProfile(
+                name=name,
+                start=start - self.__origin,
+                wall_time=wall_time,
+                cpu_time=cpu_time,
+                files_read=counters.files_read,
+                files_parsed=counters.files_parsed,
+                files_written=counters.files_written,
+                subprocesses=tuple(counters.subprocesses),
+                thread=threading.current_thread().name,
+                bytes_written=counters.bytes_written,
+            )
+            with self.__lock:
+                self.__profiles.append(profile)
+
+    def _audit(self, event: str, args: tuple[Any, ...]) -> None:
+        counters: _Counters | None = getattr(self.__local, "counters", None)
+        if counters is None:
+            return
+        if event == "open":
+            if not _is_configuration_file(args[0]):
+                return
+            if _is_write(args[1], args[2]):
+                counters.files_written += 1
+            else:
+                counters.files_read += 1
+        elif event == PARSE_EVENT:
+            counters.files_parsed += 1
+        elif event == WRITE_EVENT:
+            counters.bytes_written += args[1]
+        elif event == "subprocess.Popen":
+            counters.subprocesses.append(_format_command(args[1]))
+
+
+def _is_configuration_file(path: Any) -> bool:
+    """Ignore file descriptors (like pipes) and compiled Python modules."""
+    if isinstance(path, int):
+        return False
+    return not os.fsdecode(path).endswith(".pyc")
+
+
+def _is_write(mode: str | None, flags: int) -> bool:
+    if mode is not None:
+        return any(character in mode for character in "wax+")
+    return bool(flags & (os.O_WRONLY | os.O_RDWR | os.O_APPEND | os.O_CREAT))
+
+
+def _format_command(args: Any) -> str:
+    if isinstance(args, (str, bytes, os.PathLike)):
+        return os.fsdecode(args)
+    return " ".join(os.fsdecode(arg) for arg in args)
+
+
+_PROFILER: Profiler | None = None
+_AUDIT_HOOK_INSTALLED = False
+
+
+def _audit_hook(event: str, args: tuple[Any, ...]) -> None:
+    profiler = _PROFILER
+    if profiler is not None:
+        profiler._audit(event, args)  # noqa: SLF001
+
+
+def get_profiler() -> Profiler | None:
+    """Get the enabled `Profiler`, or `None` if profiling is disabled."""
+    return _PROFILER
+
+
+@contextmanager
+def profiling(enabled: bool = True) -> Generator[Profiler | None, None, None]:
+    """Enable a new `Profiler` for the duration of this block.
+
+    Audit hooks cannot be removed, so the hook that feeds the profiler is installed on
+    first use and does nothing while profiling is disabled.
+    """
+    global _AUDIT_HOOK_INSTALLED, _PROFILER  # noqa: PLW0603
+    if not enabled:
+        yield None
+        return
+    if not _AUDIT_HOOK_INSTALLED:
+        sys.addaudithook(_audit_hook)
+        _AUDIT_HOOK_INSTALLED = True
+    outer = _PROFILER
+    _PROFILER = Profiler()
+    try:
+        yield _PROFILER
+    finally:
+        _PROFILER = outer
+
+
+@contextmanager
+def measure(name: str) -> Generator[None, None, None]:
+    """Record the block in the enabled `Profiler`, if any."""
+    profiler = _PROFILER
+    if profiler is None:
+        yield
+        return
+    with profiler.measure(name):
+        yield
+
+
+def format_table(profiles: Iterable[HookProfile]) -> str:
+    """Render profiles as a text table, sorted by wall time.
+
+    >>> print(
+    ...     format_table([
+    ...         HookProfile("python.ruff", 0.0, 0.25, 0.2, 3, 1, 1, ("git ls-files",)),
+    ...         HookProfile("repo.citation", 0.3, 0.5, 0.1, 2),
+    ...         HookProfile(
+    ...             "(flush)", 0.8, 0.1, 0.1, files_written=2, bytes_written=1234
+    ...         ),
+    ...     ])
+    ... )
+    check          wall [ms]  cpu [ms]  read  parsed  written  bytes  subprocesses
+    repo.citation      500.0     100.0     2       0        0      0             0
+    python.ruff        250.0     200.0     3       1        1      0             1
+    (flush)            100.0     100.0     0       0        2   1234             0
+    total              850.0     400.0     5       1        3   1234             1
+    """
+    profiles = sorted(profiles, key=lambda p: p.wall_time, reverse=True)
+    header = (
+        "check",
+        "wall [ms]",
+        "cpu [ms]",
+        "read",
+        "parsed",
+        "written",
+        "bytes",
+        "subprocesses",
+    )
+    rows = [_to_row(p.name, [p]) for p in profiles]
+    rows.append(_to_row("total", profiles))
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    lines = [
+        "  ".join(
+            cell.ljust(width) if i == 0 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths, strict=True))
+        )
+        for row in [header, *rows]
+    ]
+    return "\n".join(lines)
+
+
+def _to_row(name: str, profiles: list[HookProfile]) -> tuple[str, ...]:
+    return (
+        name,
+        f"{1e3 * sum(p.wall_time for p in profiles):.1f}",
+        f"{1e3 * sum(p.cpu_time for p in profiles):.1f}",
+        str(sum(p.files_read for p in profiles)),
+        str(sum(p.files_parsed for p in profiles)),
+        str(sum(p.files_written for p in profiles)),
+        str(sum(p.bytes_written for p in profiles)),
+        str(sum(len(p.subprocesses) for p in profiles)),
+    )
+
+
+def to_json(profiles: Iterable[HookProfile]) -> list[dict[str, Any]]:
+    """Convert profiles to JSON-serializable dictionaries."""
+    return [asdict(profile) for profile in profiles]
+
+
+def to_chrome_trace(profiles: Iterable[HookProfile]) -> dict[str, Any]:
+    """Convert profiles to complete events of the Chrome Trace Event Format.
+
+    >>> trace = to_chrome_trace([HookProfile("python.ruff", 0.5, 0.25, 0.2)])
+    >>> trace["traceEvents"][-1]["ts"], trace["traceEvents"][-1]["dur"]
+    (500000.0, 250000.0)
+    """
+    profiles = list(profiles)
+    pid = os.getpid()
+    thread_ids = {
+        name: i for i, name in enumerate(dict.fromkeys(p.thread for p in profiles))
+    }
+    metadata = [
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": pid,
+            "tid": tid,
+            "args": {"name": name},
+        }
+        for name, tid in thread_ids.items()
+    ]
+    events = [
+        {
+            "name": profile.name,
+            "cat": "check",
+            "ph": "X",
+            "ts": 1e6 * profile.start,
+            "dur": 1e6 * profile.wall_time,
+            "pid": pid,
+            "tid": thread_ids[profile.thread],
+            "args": {
+                "cpu_time": profile.cpu_time,
+                "files_read": profile.files_read,
+                "files_parsed": profile.files_parsed,
+                "files_written": profile.files_written,
+                "bytes_written": profile.bytes_written,
+                "subprocesses": list(profile.subprocesses),
+            },
+        }
+        for profile in profiles
+    ]
+    return {"traceEvents": [*metadata, *events], "displayTimeUnit": "ms"}
@@ -1,16 +1,35 @@
-"""Functions for checking whether files exist on disk."""
+"""Functions for checking whether files exist on disk.
+
+Queries about the files in the repository are answered by a `RepositoryIndex`: a single
+snapshot of :code:`git ls-files` that is taken once per working directory and
+`.Storage`. All pathspec
+matching then happens in-process, so that the checks do not fork a new :program:`git`
+process for each distinct set of patterns.
+"""
 
 from __future__ import annotations
 
+import os
+import re
 import subprocess  # noqa: S404
-from functools import cache
-from typing import TYPE_CHECKING
+from bisect import bisect_left
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from typing import TYPE_CHECKING, final
 
 from pathspec import PathSpec
+from pathspec.util import normalize_file
+
+from compwa_policy.utilities.caching import repository_cache
+from compwa_policy.utilities.storage import Storage, get_storage
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+_WILDCARD_CHARACTERS = frozenset("*?[")
+_EXCLUDE_PREFIXES = (":(exclude)", ":!", ":^")
+_NAMED_GROUP = re.compile(r"\(\?P<\w+>")
+
 
 def filter_patterns(patterns: list[str], files: list[str] | None = None) -> list[str]:
     """Filter patterns that match files.
@@ -21,27 +40,231 @@ def filter_patterns(patterns: list[str], files: list[str] | None = None) -> list
     ['**/*.json']
     """
     if files is None:
-        files = git_ls_files(untracked=True)
-    return [pattern for pattern in patterns if matches_files(pattern, files)]
+        return get_repository_index().filter_patterns(patterns)
+    return select_matching_patterns(patterns, files)
 
 
 def git_ls_files(*glob: str, untracked: bool = False) -> list[str]:
     """Get the tracked and untracked files, but excluding files in .gitignore."""
-    output = _git_ls_files_cmd(*glob, untracked=untracked)
-    return output.splitlines()
+    return get_repository_index().git_ls_files(*glob, untracked=untracked)
 
 
 def is_committed(*glob: str, untracked: bool = False) -> bool:
     """Check if any files matching the given git wild-match patterns are committed."""
-    return bool(_git_ls_files_cmd(*glob, untracked=untracked))
+    return get_repository_index().is_committed(*glob, untracked=untracked)
+
+
+def get_repository_index() -> RepositoryIndex:
+    """Get the `RepositoryIndex` of the current working directory and storage."""
+    return _load_repository_index(get_storage(), os.getcwd())
+
+
+@repository_cache
+def _load_repository_index(storage: Storage, directory: str) -> RepositoryIndex:
+    _ = directory
+    return storage.load_repository_index()
+
+
+@final
+class RepositoryIndex:
+    """In-memory snapshot of the files that :code:`git ls-files` reports.
+
+    The paths are stored as one sorted array. Every directory in a
+    :class:`_DirectoryNode` trie spans a contiguous slice of that array, so that a
+    pathspec only has to be matched against the files below its literal leading
+    directories.
+
+    >>> index = RepositoryIndex(
+    ...     tracked=["docs/conf.py", "pyproject.toml", "tests/conf.py"],
+    ...     untracked=["docs/index.md"],
+    ... )
+    >>> index.git_ls_files("docs")
+    ['docs/conf.py']
+    >>> index.git_ls_files("**/conf.py", ":!:tests", untracked=True)
+    ['docs/conf.py']
+    >>> index.is_committed("*.md"), index.is_committed("*.md", untracked=True)
+    (False, True)
+    """
+
+    def __init__(self, tracked: Iterable[str], untracked: Iterable[str] = ()) -> None:
+        self.__untracked = frozenset(untracked) - frozenset(tracked)
+        self.__paths = sorted({*tracked, *self.__untracked})
+        self.__root = _build_trie(self.__paths)
+
+    @classmethod
+    def load(cls, directory: str | None = None) -> RepositoryIndex:
+        """Run :code:`git ls-files` once and index its output."""
+        output = subprocess.check_output(
+            [  # noqa: S607
+                "git",
+                "ls-files",
+                "-t",
+                "-z",
+                "--cached",
+                "--others",
+                "--exclude-standard",
+            ],
+            cwd=directory,
+        ).decode("utf-8")
+        tracked: list[str] = []
+        untracked: list[str] = []
+        for entry in output.split("\0"):
+            if not entry:
+                continue
+            status, _, path = entry.partition(" ")
+            if status == "?":
+                untracked.append(path)
+            else:
+                tracked.append(path)
+        return cls(tracked, untracked)
+
+    def add_untracked(self, path: str) -> None:
+        """Record a file that a check created after the snapshot was taken.
+
+        >>> index = RepositoryIndex(tracked=["pyproject.toml"])
+        >>> index.add_untracked(".github/workflows/ci.yml")
+        >>> index.is_committed(".github/workflows/*.yml", untracked=True)
+        True
+        """
+        if path in self.__paths:
+            return
+        self.__untracked |= {path}
+        self.__paths = sorted([*self.__paths, path])
+        self.__root = _build_trie(self.__paths)
+
+    def git_ls_files(self, *glob: str, untracked: bool = False) -> list[str]:
+        """Get the files that match git pathspecs, like :code:`git ls-files`."""
+        return list(self.__iter_files(glob, untracked))
+
+    def is_committed(self, *glob: str, untracked: bool = False) -> bool:
+        """Check if any files match the given git pathspecs."""
+        return next(self.__iter_files(glob, untracked), None) is not None
+
+    def filter_patterns(self, patterns: list[str]) -> list[str]:
+        """Filter git wild-match patterns that match any tracked or untracked file."""
+        return select_matching_patterns(patterns, self.__paths)
+
+    def is_dir(self, path: str) -> bool:
+        """Check if a directory contains tracked or untracked files."""
+        return self.__find_directory(path) is not None
+
+    def __iter_files(self, glob: tuple[str, ...], untracked: bool) -> Iterable[str]:
+        includes = [spec for spec in glob if not spec.startswith(_EXCLUDE_PREFIXES)]
+        excludes = [
+            _strip_exclude_magic(spec)
+            for spec in glob
+            if spec.startswith(_EXCLUDE_PREFIXES)
+        ]
+        if includes:
+            candidates = sorted({p for spec in includes for p in self.__match(spec)})
+        else:
+            candidates = self.__paths
+        for path in candidates:
+            if not untracked and path in self.__untracked:
+                continue
+            if any(_matches_pathspec(path, spec) for spec in excludes):
+                continue
+            yield path
+
+    def __match(self, pathspec: str) -> Iterable[str]:
+        pathspec = pathspec.removeprefix("./")
+        start, stop = self.__get_range(pathspec)
+        return (
+            path
+            for path in self.__paths[start:stop]
+            if _matches_pathspec(path, pathspec)
+        )
+
+    def __get_range(self, pathspec: str) -> tuple[int, int]:
+        if not _has_wildcard(pathspec):
+            directory = self.__find_directory(pathspec)
+            if directory is not None:
+                return directory.start, directory.stop
+            idx = bisect_left(self.__paths, pathspec)
+            return idx, idx + 1
+        *directories, _ = pathspec.split("/")
+        literal_directories: list[str] = []
+        for name in directories:
+            if _has_wildcard(name):
+                break
+            literal_directories.append(name)
+        node = self.__find_directory("/".join(literal_directories))
+        if node is None:
+            return 0, 0
+        return node.start, node.stop
+
+    def __find_directory(self, path: str) -> _DirectoryNode | None:
+        node = self.__root
+        for name in path.strip("/").split("/"):
+            if not name:
+                continue
+            node = node.directories.get(name)
+            if node is None:
+                return None
+        return node
+
+
+def _build_trie(sorted_paths: list[str]) -> _DirectoryNode:
+    root = _DirectoryNode(0, len(sorted_paths))
+    for idx, path in enumerate(sorted_paths):
+        node = root
+        for name in path.split("/")[:-1]:
+            node = node.add_directory(name, idx)
+    return root
+
+
+class _DirectoryNode:
+    __slots__ = ("directories", "start", "stop")
+
+    def __init__(self, start: int, stop: int) -> None:
+        self.directories: dict[str, _DirectoryNode] = {}
+        self.start = start
+        self.stop = stop
 
+    def add_directory(self, name: str, idx: int) -> _DirectoryNode:
+        node = self.directories.get(name)
+        if node is None:
+            node = _DirectoryNode(idx, idx + 1)
+            self.directories[name] = node
+        else:
+            node.stop = idx + 1
+        return node
 
-@cache
-def _git_ls_files_cmd(*glob: str, untracked: bool = False) -> str:
-    cmd = ["git", "ls-files", *glob]
-    if untracked:
-        cmd.extend(["--cached", "--exclude-standard", "--others"])
-    return subprocess.check_output(cmd).decode("utf-8")  # noqa: S603
+
+def _has_wildcard(pathspec: str) -> bool:
+    return not _WILDCARD_CHARACTERS.isdisjoint(pathspec)
+
+
+def _matches_pathspec(path: str, pathspec: str) -> bool:
+    """Match a path against a git pathspec without magic signatures.
+
+    >>> _matches_pathspec("docs/conf.py", "docs")
+    True
+    >>> _matches_pathspec("docs/api/conf.py", "**/conf.py")
+    True
+    >>> _matches_pathspec("conf.py", "**/conf.py")
+    False
+    >>> _matches_pathspec("src/package/file.toml", "*.toml")
+    True
+    """
+    directory = pathspec.rstrip("/")
+    if path == directory or path.startswith(f"{directory}/"):
+        return True
+    return _has_wildcard(pathspec) and fnmatchcase(path, pathspec)
+
+
+def _strip_exclude_magic(pathspec: str) -> str:
+    """Remove the exclude magic signature from a git pathspec.
+
+    >>> _strip_exclude_magic(":!:tests")
+    'tests'
+    >>> _strip_exclude_magic(":(exclude)docs")
+    'docs'
+    """
+    for prefix in _EXCLUDE_PREFIXES:
+        if pathspec.startswith(prefix):
+            return pathspec.removeprefix(prefix).removeprefix(":")
+    return pathspec
 
 
 def matches_files(pattern: str, files: list[str]) -> bool:
@@ -54,7 +277,7 @@ def matches_files(pattern: str, files: list[str]) -> bool:
     >>> matches_files("*/*.json", ["some/random/path/.cspell.json"])
     False
     """
-    spec = PathSpec.from_lines("gitignore", [pattern])
+    spec = _compile_pathspec((pattern,))
     return any(spec.match_file(file) for file in files)
 
 
@@ -68,5 +291,74 @@ def matches_patterns(filename: str, patterns: Iterable[str]) -> bool:
     >>> matches_patterns("some/random/path/.cspell.json", patterns=["*/*.json"])
     False
     """
-    spec = PathSpec.from_lines("gitignore", patterns)
+    spec = _compile_pathspec(tuple(patterns))
     return spec.match_file(filename)
+
+
+def select_matching_patterns(
+    patterns: Iterable[str], files: Iterable[str]
+) -> list[str]:
+    """Select the git wild-match patterns that match any of the files.
+
+    This is equivalent to calling :func:`matches_files` for each pattern, but
+    the file list is traversed only once: each file is matched against one
+    alternation regex that combines all patterns that have not matched yet.
+
+    >>> select_matching_patterns(
+    ...     ["**/*.json", "**/*.txt", "docs/", "!*.yaml"],
+    ...     ["file.json", "docs/index.md", "file.yaml"],
+    ... )
+    ['**/*.json', 'docs/']
+    """
+    patterns = list(patterns)
+    remaining = tuple(
+        dict.fromkeys(p for p in patterns if _pattern_regex(p) is not None)
+    )
+    matched: set[str] = set()
+    for file in files:
+        if not remaining:
+            break
+        filename = normalize_file(file)
+        regex = _compile_alternation(remaining)
+        while (match := regex.match(filename)) is not None:
+            pattern = remaining[int(match.lastgroup[1:])]  # type:ignore[index]
+            matched.add(pattern)
+            remaining = tuple(p for p in remaining if p != pattern)
+            if not remaining:
+                break
+            regex = _compile_alternation(remaining)
+    return [pattern for pattern in patterns if pattern in matched]
+
+
+@lru_cache(maxsize=256)
+def _compile_pathspec(patterns: tuple[str, ...]) -> PathSpec:
+    return PathSpec.from_lines("gitignore", patterns)
+
+
+@lru_cache(maxsize=256)
+def _compile_alternation(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    alternatives = (
+        f"(?P<p{i}>{_pattern_regex(pattern)})" for i, pattern in enumerate(patterns)
+    )
+    return re.compile("|".join(alternatives))
+
+
+@lru_cache(maxsize=1024)
+def _pattern_regex(pattern: str) -> str | None:
+    """Get the regex of a single including git wild-match pattern.
+
+    Named groups are made anonymous, so that the regexes of several patterns can be
+    combined into one alternation.
+
+    >>> _pattern_regex("/docs/")
+    '^docs/'
+    >>> _pattern_regex("!docs/") is None
+    True
+    """
+    compiled = _compile_pathspec((pattern,)).patterns
+    if len(compiled) != 1:
+        return None
+    regex = compiled[0].regex
+    if not compiled[0].include or regex is None:
+        return None
+    return _NAMED_GROUP.sub("(?:", regex.pattern)
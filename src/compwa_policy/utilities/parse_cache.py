@@ -0,0 +1,208 @@
+"""Memoization of parsed configuration files, keyed by their content hash.
+
+Several checks and helpers parse the same file, for instance :code:`pyproject.toml` with
+:mod:`rtoml` for reading and with :mod:`tomlkit` for modifying. The `ParseCache` makes
+sure that each file is read and parsed at most once per parser *flavor*, for as long as
+its content does not change.
+
+Round-trip parsers like :mod:`tomlkit` and :mod:`ruamel.yaml` produce mutable documents,
+so their results are kept as pickled bytes and every caller gets its own copy.
+Unpickling is an order of magnitude faster than parsing, so the cache can also persist
+these bytes in a directory, which skips the round-trip parsing entirely on the next run.
+The checks use a directory in the cache of the user (see
+:func:`.get_repository_cache_dir`), so that no pickle is ever loaded from a repository.
+:meth:`ParseCache.prune` keeps that directory below :data:`MAX_SIZE` and removes files
+that were not used for :data:`MAX_AGE`.
+
+A long-running process, such as the :program:`policy serve` daemon, keeps the parsed
+documents in memory between runs. To avoid reading and hashing every file on each run,
+an entry is reused without reading the file if the modification time, size, and inode of
+the file did not change. As Git does for its index, this shortcut is not trusted for
+files that were modified shortly before they were cached, because a second modification
+within the resolution of the file system clock would not change the modification time.
+
+The files are read from the current `.Storage` (see :func:`.get_storage`), unless the
+cache was created for a specific storage.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle  # noqa: S403
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path  # noqa: TC003
+from typing import TYPE_CHECKING, Any, final
+
+from attrs import field, frozen
+
+from compwa_policy.utilities.caching import create_cache_directory
+from compwa_policy.utilities.instrumentation import PARSE_EVENT
+from compwa_policy.utilities.storage import Storage, get_storage
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+MAX_AGE = timedelta(days=30)
+"""Persisted files that were not used for this long are removed by `ParseCache.prune`."""
+MAX_SIZE = 64 * 1024**2
+"""Number of bytes of persisted files above which `ParseCache.prune` removes files."""
+_RACY_INTERVAL_NS = 2_000_000_000
+"""Files modified this shortly before they were cached are always read again."""
+
+
+@final
+class ParseCache:
+    """Parsed documents by file path and parser flavor.
+
+    >>> cache = ParseCache()
+    >>> path = Path("pyproject.toml")
+    >>> first = cache.parse(path, "text", bytes.decode)
+    >>> cache.parse(path, "text", bytes.decode) is first
+    True
+    """
+
+    def __init__(
+        self, directory: Path | None = None, storage: Storage | None = None
+    ) -> None:
+        self.directory = directory
+        self.storage = storage
+        """Storage from which the files are read; `None` for the current storage."""
+        self.__entries: dict[tuple[str, str], _Entry] = {}
+
+    def parse(
+        self,
+        path: Path,
+        flavor: str,
+        parser: Callable[[bytes], Any],
+        *,
+        mutable: bool = False,
+    ) -> Any:
+        """Parse a file, or reuse the result of an earlier parse of the same content.
+
+        The *flavor* identifies the *parser* and should contain its version. Results of
+        a *mutable* flavor are copied for each call and can be persisted in the cache
+        :attr:`directory`; others are shared and must not be modified.
+        """
+        storage = get_storage() if self.storage is None else self.storage
+        key = (os.path.abspath(path), flavor)
+        stamp = _stamp(storage.stat(path))
+        cached = self.__entries.get(key)
+        if cached is not None and cached.is_fresh(stamp):
+            return pickle.loads(cached.value) if mutable else cached.value
+        content = storage.read_bytes(path)
+        digest = _hash(flavor, content)
+        if cached is not None and cached.digest == digest:
+            self.__entries[key] = _Entry(stamp, digest, cached.value)
+            return pickle.loads(cached.value) if mutable else cached.value
+        sys.audit(PARSE_EVENT, str(path), flavor)
+        if not mutable:
+            value = parser(content)
+            self.__entries[key] = _Entry(stamp, digest, value)
+            return value
+        pickled = self.__read(digest)
+        value = _unpickle(pickled)
+        if value is not None:
+            self.__entries[key] = _Entry(stamp, digest, pickled)
+            return value
+        value = parser(content)
+        pickled = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self.__write(digest, pickled)
+        self.__entries[key] = _Entry(stamp, digest, pickled)
+        return value
+
+    def clear(self) -> None:
+        """Forget all in-memory results; the persisted files are kept."""
+        self.__entries.clear()
+
+    def prune(self, max_size: int = MAX_SIZE, max_age: timedelta = MAX_AGE) -> None:
+        """Remove the least recently used persisted files.
+
+        Files that were not used for *max_age* are removed, as well as the oldest files
+        once all files together exceed *max_size* bytes.
+        """
+        if self.directory is None:
+            return
+        try:
+            files = [(path, path.stat()) for path in self.directory.glob("*.pickle")]
+        except OSError:
+            return
+        files.sort(key=lambda item: item[1].st_mtime, reverse=True)
+        oldest = time.time() - max_age.total_seconds()
+        size = 0
+        for path, status in files:
+            size += status.st_size
+            if size > max_size or status.st_mtime < oldest:
+                try:
+                    path.unlink(missing_ok=True)
+                except OSError:
+                    return
+
+    def __read(self, digest: str) -> bytes | None:
+        if self.directory is None:
+            return None
+        path = self.directory / f"{digest}.pickle"
+        try:
+            pickled = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        return pickled
+
+    def __write(self, digest: str, pickled: bytes) -> None:
+        if self.directory is None:
+            return
+        path = self.directory / f"{digest}.pickle"
+        temporary_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            create_cache_directory(self.directory)
+            temporary_path.write_bytes(pickled)
+            temporary_path.replace(path)
+        except OSError:
+            return
+
+
+@frozen
+class _Entry:
+    """Parsed document, with the content digest and file stamp it was cached for."""
+
+    stamp: tuple[int, int, int]
+    digest: str
+    value: Any
+    cached_at: int = field(factory=time.time_ns)
+
+    def is_fresh(self, stamp: tuple[int, int, int]) -> bool:
+        """Check whether the file is unchanged, without reading it."""
+        mtime_ns = stamp[0]
+        return stamp == self.stamp and mtime_ns + _RACY_INTERVAL_NS < self.cached_at
+
+
+def _stamp(stat: os.stat_result) -> tuple[int, int, int]:
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _unpickle(pickled: bytes | None) -> Any:
+    """Load persisted bytes, or return `None` if they are missing or corrupt."""
+    if pickled is None:
+        return None
+    try:
+        return pickle.loads(pickled)
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def _hash(flavor: str, content: bytes) -> str:
+    python_version = ".".join(map(str, sys.version_info[:2]))
+    digest = hashlib.sha256(f"{flavor}\0{python_version}\0".encode())
+    digest.update(content)
+    return digest.hexdigest()
+
+
+_PARSE_CACHE = ParseCache()
+
+
+def get_parse_cache() -> ParseCache:
+    """Get the `ParseCache` that is shared by the loaders of the managed files."""
+    return _PARSE_CACHE
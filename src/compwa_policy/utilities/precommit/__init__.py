@@ -1,4 +1,11 @@
-"""Helper functions for modifying :file:`.pre-commit.config.yaml`."""
+"""Helper functions for modifying :file:`.pre-commit.config.yaml`.
+
+Building a round-trip :mod:`ruamel.yaml` document is many times slower than loading
+plain Python objects with the libyaml C loader of :mod:`yaml`. A `Precommit` that was
+loaded from a file therefore only builds its round-trip :attr:`~Precommit.document` when
+it is accessed. Until then, read-only queries like :meth:`~Precommit.find_repo` are
+answered from the plain document of `load_precommit_config`, through a `.PrecommitIndex`.
+"""
 
 from __future__ import annotations
 
@@ -6,21 +13,25 @@ import io
 import re
 import sys
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, TypeVar
+from typing import IO, TYPE_CHECKING, Any, TypeVar, cast
 
+import ruamel.yaml
+import yaml
 from ruamel.yaml.comments import CommentedMap, CommentedSeq
 from ruamel.yaml.error import CommentMark
 from ruamel.yaml.scalarstring import FoldedScalarString, LiteralScalarString
 from ruamel.yaml.tokens import CommentToken
 
 from compwa_policy.utilities import CONFIG_PATH
-from compwa_policy.utilities.precommit.getters import find_repo, find_repo_with_index
+from compwa_policy.utilities.parse_cache import get_parse_cache
+from compwa_policy.utilities.precommit.index import PrecommitIndex
 from compwa_policy.utilities.precommit.setters import (
     remove_precommit_hook,
     update_precommit_hook,
     update_single_hook_precommit_repo,
 )
 from compwa_policy.utilities.resource import Changelog, ModifiableResource
+from compwa_policy.utilities.transaction import FileTransaction
 from compwa_policy.utilities.yaml import create_prettier_round_trip_yaml
 
 if sys.version_info >= (3, 11):
@@ -36,24 +47,41 @@ if TYPE_CHECKING:
     from compwa_policy.utilities.precommit.struct import Hook, PrecommitConfig, Repo
 
 T = TypeVar("T", bound="Precommit")
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class Precommit:
-    """Read-only representation of a :code:`.pre-commit-config.yaml` file."""
+    """Read-only representation of a :code:`.pre-commit-config.yaml` file.
+
+    If the *document* is omitted, it is parsed from the *source* file on first access.
+    """
 
     def __init__(
-        self, document: PrecommitConfig, parser: YAML, source: IO | Path | None = None
+        self,
+        document: PrecommitConfig | None = None,
+        parser: YAML | None = None,
+        source: IO | Path | None = None,
     ) -> None:
+        if document is None and not isinstance(source, Path):
+            msg = "A document is required when the source is not a file"
+            raise ValueError(msg)
         self.__document = document
         self.__parser = parser
         self.__source = source
+        self.__index: PrecommitIndex | None = None
 
     @property
     def document(self) -> PrecommitConfig:
+        """The round-trip document, which preserves comments and formatting."""
+        if self.__document is None:
+            source = cast("Path", self.__source)
+            self.__document, self.__parser = _load_roundtrip_precommit_config(source)
         return self.__document
 
     @property
     def parser(self) -> YAML:
+        if self.__parser is None:
+            self.__parser = create_prettier_round_trip_yaml()
         return self.__parser
 
     @property
@@ -62,7 +90,12 @@ class Precommit:
 
     @classmethod
     def load(cls, source: IO | Path | str = CONFIG_PATH.precommit) -> Self:
-        """Load a :code:`pyproject.toml` file from a file, I/O stream, or `str`."""
+        """Load a :code:`pyproject.toml` file from a file, I/O stream, or `str`.
+
+        A file is only parsed once its content is needed.
+        """
+        if isinstance(source, Path):
+            return cls(source=source)
         config, parser = _load_roundtrip_precommit_config(source)
         if isinstance(source, str):
             return cls(config, parser)
@@ -73,27 +106,75 @@ class Precommit:
             self.parser.dump(self.document, stream)
             return stream.getvalue()
 
+    @property
+    def index(self) -> PrecommitIndex:
+        """Positions of the repos and hooks, for lookups without scanning the document."""
+        document = self._get_readonly_document()
+        if self.__index is None or not self.__index.is_current(document):
+            self.__index = PrecommitIndex(document)
+        return self.__index
+
+    def find_hook(self, search_pattern: str) -> Hook | None:
+        """Find pre-commit hook definition in pre-commit config."""
+        return self.index.find_hook(search_pattern)
+
     def find_repo(self, search_pattern: str) -> Repo | None:
         """Find pre-commit repo definition in pre-commit config."""
-        return find_repo(self.__document, search_pattern)
+        return self.index.find_repo(search_pattern)
 
     def find_repo_with_index(self, search_pattern: str) -> tuple[int, Repo] | None:
         """Find pre-commit repo definition and its index in pre-commit config."""
-        return find_repo_with_index(self.__document, search_pattern)
+        return self.index.find_repo_with_index(search_pattern)
+
+    def _get_readonly_document(self) -> PrecommitConfig:
+        """Get the round-trip document if it exists, else the faster plain document."""
+        if self.__document is None:
+            return load_precommit_config(cast("Path", self.__source))
+        return self.__document
+
+    def _replace_document(self, source: str) -> None:
+        """Parse the round-trip document from *source*, keeping the source file."""
+        self.__document, self.__parser = _load_roundtrip_precommit_config(source)
+        self.__index = None
 
 
 class ModifiablePrecommit(Precommit, ModifiableResource):
     def __init__(
-        self, document: PrecommitConfig, parser: YAML, source: IO | Path | None = None
+        self,
+        document: PrecommitConfig | None = None,
+        parser: YAML | None = None,
+        source: IO | Path | None = None,
     ) -> None:
         super().__init__(document, parser, source)
         self.__is_in_context = False
         self.__changelog: Changelog = []
+        self.__index: PrecommitIndex | None = None
 
     def __enter__(self) -> Self:
         self.__is_in_context = True
         return self
 
+    def _get_readonly_document(self) -> PrecommitConfig:
+        """The returned repos and hooks are modified, so they have to be round-trip."""
+        return self.document
+
+    @property
+    def index(self) -> PrecommitIndex:
+        """Positions of the repos and hooks, for lookups without scanning the document.
+
+        A new index is built if the :attr:`changelog` records modifications that the
+        index does not account for.
+        """
+        index = self.__index
+        changes = len(self.__changelog)
+        if (
+            index is None
+            or index.changes != changes
+            or not index.is_current(self.document)
+        ):
+            index = self.__index = PrecommitIndex(self.document, changes)
+        return index
+
     def __exit__(
         self,
         _exc_type: type[BaseException] | None,
@@ -118,12 +199,30 @@ class ModifiablePrecommit(Precommit, ModifiableResource):
             target.truncate()
             target.seek(current_position)
         elif isinstance(target, Path):
-            with open(target, "w") as stream:
-                self.parser.dump(self.document, stream)
+            with FileTransaction() as transaction:
+                transaction.write_text(target, self.dumps())
         else:
             msg = f"Target of type {type(target).__name__} is not supported"
             raise TypeError(msg)
 
+    def stage(self, transaction: FileTransaction) -> None:
+        if not isinstance(self.source, Path):
+            self.dump()
+            return
+        _normalize_repo_spacing(self.document)
+        transaction.write_text(self.source, self.dumps())
+
+    @property
+    def files(self) -> tuple[Path, ...]:
+        return (self.source,) if isinstance(self.source, Path) else ()
+
+    def snapshot(self) -> bytes:
+        return self.dumps().encode()
+
+    def restore(self, snapshot: bytes) -> None:
+        self._replace_document(snapshot.decode())
+        self.__index = None
+
     @property
     def changelog(self) -> Changelog:
         self.__assert_is_in_context()
@@ -147,6 +246,22 @@ class ModifiablePrecommit(Precommit, ModifiableResource):
         update_precommit_hook(self, repo_url, expected_hook)
 
 
+def load_precommit_config(path: Path = CONFIG_PATH.precommit) -> PrecommitConfig:
+    """Load a plain, read-only pre-commit config with the libyaml C loader.
+
+    The document is shared through the `.ParseCache`, so it must not be modified.
+    """
+    return get_parse_cache().parse(
+        path,
+        flavor=f"PyYAML=={yaml.__version__} ({_SafeLoader.__name__})",
+        parser=_load_plain_yaml,
+    )
+
+
+def _load_plain_yaml(content: bytes) -> Any:
+    return yaml.load(content, Loader=_SafeLoader) or {}  # noqa: S506
+
+
 def _load_roundtrip_precommit_config(
     source: IO | Path | str = CONFIG_PATH.precommit,
 ) -> tuple[PrecommitConfig, YAML]:
@@ -155,6 +270,13 @@ def _load_roundtrip_precommit_config(
     if isinstance(source, str):
         with io.StringIO(source) as stream:
             config = parser.load(stream)
+    elif isinstance(source, Path):
+        config = get_parse_cache().parse(
+            source,
+            flavor=f"ruamel.yaml=={ruamel.yaml.__version__} (prettier round-trip)",
+            parser=parser.load,
+            mutable=True,
+        )
     else:
         config = parser.load(source)
     return config, parser
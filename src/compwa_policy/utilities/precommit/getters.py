@@ -1,34 +1,41 @@
 # noqa: D100
 from __future__ import annotations
 
-import operator
 import re
-import subprocess  # noqa: S404
+from functools import cache
 from typing import TYPE_CHECKING
 
-from packaging.version import InvalidVersion, Version
+from compwa_policy.utilities.precommit.revisions import get_revision_resolver
 
 if TYPE_CHECKING:
     from compwa_policy.utilities.precommit.struct import Hook, PrecommitConfig, Repo
 
 
+@cache
+def compile_pattern(search_pattern: str) -> re.Pattern[str]:
+    """Compile a search pattern once, like the checks repeat the same patterns."""
+    return re.compile(search_pattern)
+
+
 def find_hook(config: PrecommitConfig, search_pattern: str) -> Hook | None:
     """Find pre-commit hook definition in pre-commit config."""
+    pattern = compile_pattern(search_pattern)
     repos = config.get("repos", [])
     for repo in repos:
         hooks = repo.get("hooks", [])
         for hook in hooks:
-            if re.search(search_pattern, hook.get("id", "")):
+            if pattern.search(hook.get("id", "")):
                 return hook
     return None
 
 
 def find_repo(config: PrecommitConfig, search_pattern: str) -> Repo | None:
     """Find pre-commit repo definition in pre-commit config."""
+    pattern = compile_pattern(search_pattern)
     repos = config.get("repos", [])
     for repo in repos:
         url = repo.get("repo", "")
-        if re.search(search_pattern, url):
+        if pattern.search(url):
             return repo
     return None
 
@@ -37,10 +44,11 @@ def find_repo_with_index(
     config: PrecommitConfig, search_pattern: str
 ) -> tuple[int, Repo] | None:
     """Find pre-commit repo definition and its index in pre-commit config."""
+    pattern = compile_pattern(search_pattern)
     repos = config.get("repos", [])
     for i, repo in enumerate(repos):
         url = repo.get("repo", "")
-        if re.search(search_pattern, url):
+        if pattern.search(url):
             return i, repo
     return None
 
@@ -50,28 +58,9 @@ def get_latest_rev(repo_url: str, fallback: str = "PLEASE-UPDATE") -> str:
 
     Returns the highest version tag found through ``git ls-remote``, or :code:`fallback`
     when the tags cannot be fetched (for example when there is no internet connection).
+    Resolved tags are cached, see `.revisions`.
     """
-    versions: list[tuple[Version, str]] = []
-    for line in _git_ls_remote_tags(repo_url).splitlines():
-        _, _, tag = line.partition("refs/tags/")
-        if not tag:
-            continue
-        try:
-            versions.append((Version(tag), tag))
-        except InvalidVersion:
-            continue
-    if not versions:
+    rev = get_revision_resolver().resolve(repo_url)
+    if rev is None:
         return fallback
-    return max(versions, key=operator.itemgetter(0))[1]
-
-
-def _git_ls_remote_tags(repo_url: str) -> str:
-    try:
-        return subprocess.check_output(  # noqa: S603
-            ["git", "ls-remote", "--tags", "--refs", repo_url],  # noqa: S607
-            stderr=subprocess.DEVNULL,
-            text=True,
-            timeout=10,
-        )
-    except (OSError, subprocess.SubprocessError):
-        return ""
+    return rev
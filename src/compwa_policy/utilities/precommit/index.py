@@ -0,0 +1,134 @@
+"""Look up repos and hooks in a pre-commit config without scanning the document.
+
+Reading the entries of a round-trip :mod:`ruamel.yaml` document is slow, and the checks
+search the same config for dozens of repos and hooks per run. A `PrecommitIndex`
+therefore reads the repo URLs and hook IDs once into plain lists, from which it derives
+a mapping of hook IDs to their positions. The results of lookups by regular expression
+are remembered per pattern.
+
+The setters in `.setters` keep the index up to date when they insert or remove repos and
+hooks. Any other modification is recorded in the :attr:`.ModifiablePrecommit.changelog`,
+which makes the `.ModifiablePrecommit` build a new index on the next lookup.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from compwa_policy.utilities.precommit.getters import compile_pattern
+
+if TYPE_CHECKING:
+    from compwa_policy.utilities.precommit.struct import Hook, PrecommitConfig, Repo
+
+
+class PrecommitIndex:
+    """Positions of the repos and hooks of a pre-commit config."""
+
+    def __init__(self, config: PrecommitConfig, changes: int = 0) -> None:
+        self.config = config
+        self.changes = changes
+        """Number of recorded modifications that this index accounts for."""
+        self.__repos = config.get("repos", [])
+        self.__urls: list[str] = []
+        self.__hook_ids: list[list[str]] = []
+        for repo in self.__repos:
+            self.__urls.append(repo.get("repo", ""))
+            self.__hook_ids.append([
+                hook.get("id", "") for hook in repo.get("hooks", [])
+            ])
+        self.__hook_positions: dict[str, list[tuple[int, int]]] | None = None
+        self.__repo_matches: dict[str, int | None] = {}
+        self.__hook_matches: dict[str, tuple[int, int] | None] = {}
+
+    def is_current(self, config: PrecommitConfig) -> bool:
+        """Check whether the index still describes the :code:`repos` of *config*."""
+        return config is self.config and config.get("repos", []) is self.__repos
+
+    def find_repo(self, search_pattern: str) -> Repo | None:
+        """Find the first repo of which the URL matches a regular expression."""
+        idx_and_repo = self.find_repo_with_index(search_pattern)
+        if idx_and_repo is None:
+            return None
+        return idx_and_repo[1]
+
+    def find_repo_with_index(self, search_pattern: str) -> tuple[int, Repo] | None:
+        """Find the first repo of which the URL matches, along with its position."""
+        if search_pattern not in self.__repo_matches:
+            pattern = compile_pattern(search_pattern)
+            self.__repo_matches[search_pattern] = next(
+                (i for i, url in enumerate(self.__urls) if pattern.search(url)), None
+            )
+        repo_idx = self.__repo_matches[search_pattern]
+        if repo_idx is None:
+            return None
+        return repo_idx, self.__repos[repo_idx]
+
+    def find_hook(self, search_pattern: str) -> Hook | None:
+        """Find the first hook of which the ID matches a regular expression."""
+        if search_pattern not in self.__hook_matches:
+            pattern = compile_pattern(search_pattern)
+            self.__hook_matches[search_pattern] = next(
+                (
+                    (repo_idx, hook_idx)
+                    for repo_idx, hook_ids in enumerate(self.__hook_ids)
+                    for hook_idx, hook_id in enumerate(hook_ids)
+                    if pattern.search(hook_id)
+                ),
+                None,
+            )
+        position = self.__hook_matches[search_pattern]
+        if position is None:
+            return None
+        repo_idx, hook_idx = position
+        return self.__repos[repo_idx]["hooks"][hook_idx]
+
+    def find_hook_position(
+        self, hook_id: str, repo_url: str | None = None
+    ) -> tuple[int, int] | None:
+        """Get the repo and hook index of the first hook with exactly this ID.
+
+        If a *repo_url* is given, only hooks of repos with exactly that URL count.
+        """
+        if self.__hook_positions is None:
+            self.__hook_positions = {}
+            for repo_idx, hook_ids in enumerate(self.__hook_ids):
+                for hook_idx, id_ in enumerate(hook_ids):
+                    positions = self.__hook_positions.setdefault(id_, [])
+                    positions.append((repo_idx, hook_idx))
+        for repo_idx, hook_idx in self.__hook_positions.get(hook_id, []):
+            if repo_url is None or self.__urls[repo_idx] == repo_url:
+                return repo_idx, hook_idx
+        return None
+
+    def insert_repo(self, repo_idx: int, repo: Repo) -> None:
+        """Register a repo that was inserted into the document at *repo_idx*."""
+        self.__urls.insert(repo_idx, repo.get("repo", ""))
+        hook_ids = [hook.get("id", "") for hook in repo.get("hooks", [])]
+        self.__hook_ids.insert(repo_idx, hook_ids)
+        self.__clear_lookups()
+
+    def remove_repo(self, repo_idx: int) -> None:
+        """Register that the repo at *repo_idx* was removed from the document."""
+        del self.__urls[repo_idx]
+        del self.__hook_ids[repo_idx]
+        self.__clear_lookups()
+
+    def replace_repo(self, repo_idx: int, repo: Repo) -> None:
+        """Register that the repo at *repo_idx* was replaced by another repo."""
+        self.remove_repo(repo_idx)
+        self.insert_repo(repo_idx, repo)
+
+    def insert_hook(self, repo_idx: int, hook_idx: int, hook: Hook) -> None:
+        """Register a hook that was inserted into the hooks of a repo."""
+        self.__hook_ids[repo_idx].insert(hook_idx, hook.get("id", ""))
+        self.__clear_lookups()
+
+    def remove_hook(self, repo_idx: int, hook_idx: int) -> None:
+        """Register that a hook was removed from the hooks of a repo."""
+        del self.__hook_ids[repo_idx][hook_idx]
+        self.__clear_lookups()
+
+    def __clear_lookups(self) -> None:
+        self.__hook_positions = None
+        self.__repo_matches.clear()
+        self.__hook_matches.clear()
@@ -0,0 +1,200 @@
+"""Resolve the latest release tags of pre-commit hook repositories.
+
+When a check adds a pre-commit repository without a pinned revision, the latest tag of
+that repository is looked up with :code:`git ls-remote`, which is a network round trip.
+The `RevisionResolver` remembers resolved tags in a JSON file under the user cache
+directory (:file:`~/.cache/compwa-policy/` or :code:`$XDG_CACHE_HOME/compwa-policy/`)
+for a configurable time, and can :meth:`~RevisionResolver.prefetch` the tags of several
+repositories concurrently before the checks run.
+
+In :attr:`~RevisionResolver.offline` mode, no network access is attempted: the tags
+come from the cache, regardless of their age, or from a local mirror directory with
+bare clones of the repositories, laid out by host and path. For instance, the mirror of
+:code:`https://github.com/astral-sh/ruff-pre-commit` is expected under
+:file:`<mirror>/github.com/astral-sh/ruff-pre-commit` or
+:file:`<mirror>/github.com/astral-sh/ruff-pre-commit.git`.
+"""
+
+from __future__ import annotations
+
+import json
+import operator
+import os
+import subprocess  # noqa: S404
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import TYPE_CHECKING, final
+from urllib.parse import urlparse
+
+from packaging.version import InvalidVersion, Version
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from pathlib import Path
+
+DEFAULT_TTL = timedelta(days=1)
+"""How long a resolved revision is used before it is fetched again."""
+
+
+@final
+class RevisionResolver:
+    """Latest release tags of pre-commit hook repositories by URL.
+
+    Each URL is resolved at most once per run. If :attr:`path` is set, resolved tags are
+    persisted in that JSON file and reused for :attr:`ttl`.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        *,
+        ttl: timedelta = DEFAULT_TTL,
+        offline: bool = False,
+        mirror_dir: Path | None = None,
+    ) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.offline = offline
+        self.mirror_dir = mirror_dir
+        self.__lock = threading.Lock()
+        self.__resolved: dict[str, str | None] = {}
+        self.__stored: dict[Path, dict[str, dict]] = {}
+
+    def resolve(self, repo_url: str) -> str | None:
+        """Get the highest version tag of a repository, or `None` if it is unknown."""
+        with self.__lock:
+            if repo_url in self.__resolved:
+                return self.__resolved[repo_url]
+            entry = self.__load().get(repo_url)
+        if entry is not None and (self.offline or self.__is_fresh(entry)):
+            rev = entry["rev"]
+        else:
+            rev = self.__fetch(repo_url)
+            if rev is None and entry is not None:
+                rev = entry["rev"]
+        with self.__lock:
+            self.__resolved[repo_url] = rev
+        return rev
+
+    def prefetch(
+        self, repo_urls: Iterable[str], max_workers: int | None = None
+    ) -> None:
+        """Resolve several repositories concurrently, so that `resolve` returns fast."""
+        repo_urls = sorted(set(repo_urls))
+        if not repo_urls:
+            return
+        with ThreadPoolExecutor(max_workers, thread_name_prefix="rev") as executor:
+            for _ in executor.map(self.resolve, repo_urls):
+                pass
+
+    def get_resolved(self) -> dict[str, str | None]:
+        """Get the revisions resolved in this run, for instance for a worker process."""
+        with self.__lock:
+            return dict(self.__resolved)
+
+    def add_resolved(self, revisions: Mapping[str, str | None]) -> None:
+        """Use revisions that were resolved elsewhere, such as in a parent process."""
+        with self.__lock:
+            self.__resolved.update(revisions)
+
+    def clear(self) -> None:
+        """Forget the revisions resolved in this run; the persisted file is kept."""
+        with self.__lock:
+            self.__resolved.clear()
+            self.__stored.clear()
+
+    def __is_fresh(self, entry: dict) -> bool:
+        return time.time() - entry["time"] < self.ttl.total_seconds()
+
+    def __fetch(self, repo_url: str) -> str | None:
+        if self.offline:
+            mirror = self.__find_mirror(repo_url)
+            if mirror is None:
+                return None
+            return _select_latest_tag(_git_ls_remote_tags(str(mirror)))
+        rev = _select_latest_tag(_git_ls_remote_tags(repo_url))
+        if rev is not None:
+            self.__store(repo_url, rev)
+        return rev
+
+    def __find_mirror(self, repo_url: str) -> Path | None:
+        if self.mirror_dir is None:
+            return None
+        url = urlparse(repo_url)
+        path = self.mirror_dir / url.netloc / url.path.strip("/")
+        for candidate in (path, path.with_name(f"{path.name}.git")):
+            if candidate.is_dir():
+                return candidate
+        return None
+
+    def __load(self) -> dict[str, dict]:
+        if self.path is None:
+            return {}
+        stored = self.__stored.get(self.path)
+        if stored is None:
+            try:
+                stored = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                stored = {}
+            if not isinstance(stored, dict):
+                stored = {}
+            self.__stored[self.path] = stored
+        return stored
+
+    def __store(self, repo_url: str, rev: str) -> None:
+        with self.__lock:
+            if self.path is None:
+                return
+            stored = self.__load()
+            stored[repo_url] = {"rev": rev, "time": time.time()}
+            temporary_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                temporary_path.write_text(json.dumps(stored, indent=2, sort_keys=True))
+                temporary_path.replace(self.path)
+            except OSError:
+                return
+
+
+def _select_latest_tag(ls_remote_output: str) -> str | None:
+    r"""Select the highest version tag from the output of :code:`git ls-remote`.
+
+    >>> _select_latest_tag("a\trefs/tags/v0.9.0\nb\trefs/tags/v0.10.0\n")
+    'v0.10.0'
+    >>> _select_latest_tag("c\trefs/tags/nightly\n") is None
+    True
+    """
+    versions: list[tuple[Version, str]] = []
+    for line in ls_remote_output.splitlines():
+        _, _, tag = line.partition("refs/tags/")
+        if not tag:
+            continue
+        try:
+            versions.append((Version(tag), tag))
+        except InvalidVersion:
+            continue
+    if not versions:
+        return None
+    return max(versions, key=operator.itemgetter(0))[1]
+
+
+def _git_ls_remote_tags(repo_url: str) -> str:
+    try:
+        return subprocess.check_output(  # noqa: S603
+            ["git", "ls-remote", "--tags", "--refs", repo_url],  # noqa: S607
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+_REVISION_RESOLVER = RevisionResolver()
+
+
+def get_revision_resolver() -> RevisionResolver:
+    """Get the `RevisionResolver` that is shared by all checks."""
+    return _REVISION_RESOLVER
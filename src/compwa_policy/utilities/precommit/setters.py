@@ -7,10 +7,7 @@ from ruamel.yaml.comments import CommentedMap, CommentedSeq
 from ruamel.yaml.scalarstring import PlainScalarString
 
 from compwa_policy.utilities import CONFIG_PATH
-from compwa_policy.utilities.precommit.getters import (
-    find_repo_with_index,
-    get_latest_rev,
-)
+from compwa_policy.utilities.precommit.getters import get_latest_rev
 
 if TYPE_CHECKING:
     from compwa_policy.utilities.precommit import ModifiablePrecommit
@@ -20,7 +17,8 @@ if TYPE_CHECKING:
 def remove_precommit_hook(
     precommit: ModifiablePrecommit, hook_id: str, repo_url: str | None = None
 ) -> None:
-    repo_and_hook_idx = __find_repo_and_hook_idx(precommit.document, hook_id, repo_url)
+    index = precommit.index
+    repo_and_hook_idx = index.find_hook_position(hook_id, repo_url)
     if repo_and_hook_idx is None:
         return
     repo_idx, hook_idx = repo_and_hook_idx
@@ -28,24 +26,13 @@ def remove_precommit_hook(
     hooks = repos[repo_idx]["hooks"]
     if len(hooks) <= 1:
         repos.pop(repo_idx)
+        index.remove_repo(repo_idx)
     else:
         hooks.pop(hook_idx)
+        index.remove_hook(repo_idx, hook_idx)
     msg = f"Removed {hook_id!r} hook"
     precommit.changelog.append(msg)
-
-
-def __find_repo_and_hook_idx(
-    config: PrecommitConfig, hook_id: str, repo_url: str | None = None
-) -> tuple[int, int] | None:
-    repos = config.get("repos", [])
-    for repo_idx, repo in enumerate(repos):
-        if repo_url is not None and repo.get("repo") != repo_url:
-            continue
-        hooks = repo.get("hooks", [])
-        for hook_idx, hook in enumerate(hooks):
-            if hook.get("id") == hook_id:
-                return repo_idx, hook_idx
-    return None
+    index.changes += 1
 
 
 def update_single_hook_precommit_repo(
@@ -58,13 +45,18 @@ def update_single_hook_precommit_repo(
     same as expected, the entry in the YAML config will be updated.
     """
     expected_yaml = CommentedMap(expected)
+    index = precommit.index
     repos = precommit.document.get("repos", [])
     repo_url = expected["repo"]
     hook_id = expected["hooks"][0]["id"]
     if repo_url == "local":
-        idx_and_repo = __find_local_repo_and_hook_idx(precommit.document, hook_id)
+        repo_and_hook_idx = index.find_hook_position(hook_id, repo_url)
+        idx_and_repo = None
+        if repo_and_hook_idx is not None:
+            idx = repo_and_hook_idx[0]
+            idx_and_repo = idx, repos[idx]
     else:
-        idx_and_repo = find_repo_with_index(precommit.document, repo_url)
+        idx_and_repo = index.find_repo_with_index(repo_url)
     if idx_and_repo is None:
         if not expected_yaml.get("rev") and repo_url != "local":
             expected_yaml.pop("rev", None)
@@ -72,6 +64,7 @@ def update_single_hook_precommit_repo(
         idx = _determine_expected_repo_index(precommit.document, hook_id)
         repos_yaml = cast("CommentedSeq", repos)
         repos_yaml.insert(idx, expected_yaml)
+        index.insert_repo(idx, expected_yaml)  # ty:ignore[invalid-argument-type]
         if isinstance(repos_yaml, CommentedSeq):
             repos_yaml.yaml_set_comment_before_after_key(
                 idx if idx + 1 == len(repos) else idx + 1,
@@ -79,32 +72,24 @@ def update_single_hook_precommit_repo(
             )
         msg = f"Added {hook_id} hook to {CONFIG_PATH.precommit}."
         precommit.changelog.append(msg)
+        index.changes += 1
     if idx_and_repo is None:
         return
     idx, existing_repo = idx_and_repo
     if repo_url == "local":
         __update_local_hook(precommit, existing_repo, expected["hooks"][0])
+        index.changes = len(precommit.changelog)
     elif not _is_equivalent_repo(existing_repo, expected):
         existing_rev = existing_repo.get("rev")
         if existing_rev is not None:
             expected_yaml.insert(1, "rev", PlainScalarString(existing_rev))
         repos[idx] = expected_yaml  # ty:ignore[invalid-assignment]
+        index.replace_repo(idx, expected_yaml)  # ty:ignore[invalid-argument-type]
         repos_map = cast("CommentedMap", repos)
         repos_map.yaml_set_comment_before_after_key(idx + 1, before="\n")
         msg = f"Updated {hook_id} hook"
         precommit.changelog.append(msg)
-
-
-def __find_local_repo_and_hook_idx(
-    config: PrecommitConfig, hook_id: str
-) -> tuple[int, Repo] | None:
-    repos = config.get("repos", [])
-    for idx, repo in enumerate(repos):
-        if repo.get("repo") != "local":
-            continue
-        if __find_hook_idx(repo.get("hooks", []), hook_id) is not None:
-            return idx, repo
-    return None
+        index.changes += 1
 
 
 def __update_local_hook(
@@ -149,7 +134,8 @@ def update_precommit_hook(
     This function updates the :code:`.pre-commit-config.yaml` file, but does this only
     for a specific hook definition *within* a pre-commit repository definition.
     """
-    idx_and_repo = find_repo_with_index(precommit.document, repo_url)
+    index = precommit.index
+    idx_and_repo = index.find_repo_with_index(repo_url)
     if idx_and_repo is None:
         return
     repo_idx, repo = idx_and_repo
@@ -159,16 +145,19 @@ def update_precommit_hook(
     if hook_idx is None:
         hook_idx = __determine_expected_hook_idx(hooks, expected_hook["id"])
         hooks.insert(hook_idx, expected_hook)
+        index.insert_hook(repo_idx, hook_idx, expected_hook)
         if hook_idx == len(hooks) - 1:
             repos = cast("CommentedMap", precommit.document["repos"][hook_idx])
             repos.yaml_set_comment_before_after_key(repo_idx + 1, before="\n")
         msg = f"Added {expected_hook['id']!r} to {repo_name} pre-commit config"
         precommit.changelog.append(msg)
+        index.changes += 1
 
     if hooks[hook_idx] != expected_hook:
         hooks[hook_idx] = expected_hook
         msg = f"Updated args of {expected_hook['id']!r} {repo_name} pre-commit hook"
         precommit.changelog.append(msg)
+        index.changes += 1
 
 
 def __find_hook_idx(hooks: list[Hook], hook_id: str) -> int | None:
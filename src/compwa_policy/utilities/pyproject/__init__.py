@@ -1,4 +1,11 @@
-"""Tools for loading, inspecting, and updating :code:`pyproject.toml`."""
+"""Tools for loading, inspecting, and updating :code:`pyproject.toml`.
+
+A `ModifiablePyproject` that was loaded from a file or `str` is parsed with :mod:`rtoml`
+and only builds its :mod:`tomlkit` document once it is modified (see `.LazyDocument`).
+A run of the checks that does not change the file therefore never pays for the slower
+round-trip parser. Once it is modified, the document is rendered again by re-rendering only
+the tables that changed (see `.IncrementalRenderer`).
+"""
 
 from __future__ import annotations
 
@@ -23,6 +30,9 @@ import tomlkit
 from attrs import field, frozen
 
 from compwa_policy.utilities import CONFIG_PATH
+from compwa_policy.utilities.parse_cache import get_parse_cache
+from compwa_policy.utilities.pyproject._dependencies import DependencyIndex
+from compwa_policy.utilities.pyproject._lazy import LazyDocument
 from compwa_policy.utilities.pyproject.getters import (
     PythonVersion,
     get_package_name,
@@ -32,12 +42,13 @@ from compwa_policy.utilities.pyproject.getters import (
     has_sub_table,
 )
 from compwa_policy.utilities.pyproject.setters import (
-    add_dependency,
+    add_dependencies,
     create_sub_table,
-    remove_dependency,
-    split_dependency_definition,
+    remove_dependencies,
 )
 from compwa_policy.utilities.resource import Changelog, ModifiableResource
+from compwa_policy.utilities.storage import get_storage, use_storage
+from compwa_policy.utilities.transaction import FileTransaction
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -51,6 +62,8 @@ if TYPE_CHECKING:
     from collections.abc import Iterable, Mapping, MutableMapping, Sequence
     from types import TracebackType
 
+    from tomlkit import TOMLDocument
+
     from compwa_policy.utilities.pyproject._struct import PyprojectTOML
     from compwa_policy.utilities.session import Session
 
@@ -64,6 +77,9 @@ class Pyproject:
 
     _document: PyprojectTOML
     _source: IO | Path | None = field(default=None)
+    _dependencies: DependencyIndex = field(
+        factory=DependencyIndex, init=False, eq=False, repr=False
+    )
 
     @classmethod
     def load(
@@ -138,11 +154,21 @@ class ModifiablePyproject(Pyproject, ModifiableResource):
 
     Use this class to apply multiple modifications to a :code:`pyproject.toml` file in
     separate sub-hooks. The modifications are dumped once the context is exited.
+
+    The *document* is either a :mod:`tomlkit` document or a `.LazyDocument` that builds
+    one on the first modification.
     """
 
     _is_in_context = False
     _changelog: Changelog = field(factory=list)
 
+    def __attrs_post_init__(self) -> None:
+        document = cast("TOMLDocument | LazyDocument", self._document)
+        if not isinstance(document, LazyDocument):
+            document = LazyDocument.from_roundtrip(document)
+        object.__setattr__(self, "_lazy", document)
+        object.__setattr__(self, "_document", document.root)
+
     @override
     @classmethod
     def load(
@@ -160,18 +186,36 @@ class ModifiablePyproject(Pyproject, ModifiableResource):
             source.seek(current_position)
             return cls(document, source)  # ty:ignore[invalid-argument-type]
         if isinstance(source, Path):
-            with open(source) as stream:
-                document = tomlkit.load(stream)
+            storage = get_storage()
+
+            def load_roundtrip() -> TOMLDocument:
+                if get_storage() is storage:
+                    return load_pyproject_toml(source, modifiable=True)  # ty:ignore[invalid-return-type]
+                with use_storage(storage):
+                    return load_pyproject_toml(source, modifiable=True)  # ty:ignore[invalid-return-type]
+
+            plain = load_pyproject_toml(source, modifiable=False)
+            document = LazyDocument(plain, load_roundtrip)
             return cls(document, source)  # ty:ignore[invalid-argument-type]
         if isinstance(source, str):
-            document = tomlkit.loads(source)
+            plain = load_pyproject_toml(source, modifiable=False)
+            document = LazyDocument(plain, lambda: tomlkit.loads(source), source)
             return cls(document)  # ty:ignore[invalid-argument-type]
         msg = f"Source of type {type(source).__name__} is not supported"
         raise TypeError(msg)
 
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the :mod:`tomlkit` document has been built, see `.LazyDocument`."""
+        return self.__lazy.is_materialized
+
+    @property
+    def __lazy(self) -> LazyDocument:
+        return self._lazy  # ty:ignore[unresolved-attribute]
+
     @override
     def dumps(self) -> str:
-        src = tomlkit.dumps(self._document)
+        src = self.__lazy.dumps()
         return f"{src.strip()}\n"
 
     def __enter__(self) -> Self:
@@ -189,26 +233,53 @@ class ModifiablePyproject(Pyproject, ModifiableResource):
         return False
 
     def dump(self, target: IO | Path | str | None = None) -> None:
-        if target is None:
-            target = self._source
-        if target is None and CONFIG_PATH.pyproject.exists():
-            target = CONFIG_PATH.pyproject
-        if target is None:
-            msg = "Target required when source is not a file or I/O stream"
-            raise ValueError(msg)
+        target = self.__get_target(target)
         if isinstance(target, io.IOBase):
             current_position = target.tell()
             target.seek(0)
-            tomlkit.dump(self._document, target)  # ty:ignore[invalid-argument-type]
+            tomlkit.dump(self.__lazy.roundtrip, target)  # ty:ignore[invalid-argument-type]
             target.seek(current_position)
         elif isinstance(target, (Path, str)):
-            src = self.dumps()
-            with open(target, "w") as stream:
-                stream.write(src)
+            with FileTransaction() as transaction:
+                transaction.write_text(target, self.dumps())
         else:
             msg = f"Target of type {type(target).__name__} is not supported"
             raise TypeError(msg)
 
+    def stage(self, transaction: FileTransaction) -> None:
+        target = self.__get_target()
+        if isinstance(target, (Path, str)):
+            transaction.write_text(target, self.dumps())
+        else:
+            self.dump(target)
+
+    @property
+    @override
+    def files(self) -> tuple[Path, ...]:
+        return (self._source,) if isinstance(self._source, Path) else ()
+
+    @override
+    def snapshot(self) -> bytes:
+        return self.dumps().encode()
+
+    @override
+    def restore(self, snapshot: bytes) -> None:
+        text = snapshot.decode()
+        plain = load_pyproject_toml(text, modifiable=False)
+        document = LazyDocument(plain, lambda: tomlkit.loads(text), text)
+        object.__setattr__(self, "_lazy", document)  # noqa: PLC2801
+        object.__setattr__(self, "_document", document.root)  # noqa: PLC2801
+
+    def __get_target(self, target: IO | Path | str | None = None) -> IO | Path | str:
+        if target is None:
+            target = self._source
+        if target is None and get_storage().exists(CONFIG_PATH.pyproject):
+            target = CONFIG_PATH.pyproject
+        if target is None:
+            msg = "Target required when source is not a file or I/O stream"
+            raise ValueError(msg)
+        return target
+
     @override
     def get_table(
         self, dotted_header: str, *, create: bool = False, fallback: Any = _NO_FALLBACK
@@ -225,20 +296,42 @@ class ModifiablePyproject(Pyproject, ModifiableResource):
         dependency_group: str | Sequence[str] | None = None,
         optional_key: str | Sequence[str] | None = None,
     ) -> None:
+        self.add_dependencies([package], dependency_group, optional_key)
+
+    def add_dependencies(
+        self,
+        packages: Iterable[str],
+        /,
+        dependency_group: str | Sequence[str] | None = None,
+        optional_key: str | Sequence[str] | None = None,
+    ) -> None:
+        """Add several packages to the same section with one modification."""
         self.__assert_is_in_context()
-        updated = add_dependency(
-            self._document, package, dependency_group, optional_key
+        added = add_dependencies(
+            self._document, packages, dependency_group, optional_key
         )
-        if updated:
+        for package in added:
             msg = f"Listed {package} as a dependency"
             self._changelog.append(msg)
 
     def remove_dependency(
         self, package: str, /, ignored_sections: Iterable[str] | None = None
     ) -> None:
+        self.remove_dependencies([package], ignored_sections)
+
+    def remove_dependencies(
+        self, packages: Iterable[str], /, ignored_sections: Iterable[str] | None = None
+    ) -> None:
+        """Remove several packages from all sections in one traversal."""
         self.__assert_is_in_context()
-        updated = remove_dependency(self._document, package, ignored_sections)
-        if updated:
+        index = self._dependencies.update(
+            self._document, modifiable=self.is_materialized
+        )
+        listed = [package for package in packages if index.get_sections(package)]
+        if not listed:
+            return
+        removed = remove_dependencies(self._document, listed, ignored_sections)
+        for package in removed:
             msg = f"Removed {package} from dependencies"
             self._changelog.append(msg)
 
@@ -265,7 +358,7 @@ class ModifiablePixi(ModifiablePyproject):
         session: Session | None = None,
     ) -> Self:
         _ = session
-        if source == CONFIG_PATH.pixi_toml and not CONFIG_PATH.pixi_toml.exists():
+        if source == CONFIG_PATH.pixi_toml and not get_storage().exists(source):
             return cls(tomlkit.document(), CONFIG_PATH.pixi_toml)  # ty:ignore[invalid-argument-type]
         return super().load(source)
 
@@ -323,24 +416,26 @@ def has_pyproject_package_name(session: Session, /) -> bool:
 
 
 def has_dependency(pyproject: Pyproject, package: str | tuple[str, ...]) -> bool:
+    """Check whether a package is listed in the dependencies or dependency groups.
+
+    The lower-case package names are compared to *package*.
+    """
     toml_document: PyprojectTOML = pyproject._document  # noqa: SLF001
-    dependencies = set(toml_document.get("project", {}).get("dependencies", []))
-    for group in toml_document.get("dependency-groups", {}).values():
-        dependencies |= {x for x in group if isinstance(x, str)}
-    if isinstance(package, str):
-        packages_to_search = {package}
-    else:
-        packages_to_search = set(package)
-    for dependency in dependencies:
-        dependency_name, *_ = split_dependency_definition(dependency)
-        if dependency_name.lower() in packages_to_search:
-            return True
-    return False
+    modifiable = (
+        isinstance(pyproject, ModifiablePyproject) and pyproject.is_materialized
+    )
+    index = pyproject._dependencies.update(toml_document, modifiable=modifiable)  # noqa: SLF001
+    packages_to_search = (package,) if isinstance(package, str) else package
+    return any(
+        section == ("project", "dependencies") or section[0] == "dependency-groups"
+        for name in packages_to_search
+        for section in index.get_sections(name, lower=True)
+    )
 
 
 def get_constraints_file(python_version: PythonVersion) -> Path | None:
     path = CONFIG_PATH.pip_constraints / f"py{python_version}.txt"
-    if path.exists():
+    if get_storage().exists(path):
         return path
     return None
 
@@ -354,6 +449,9 @@ def load_pyproject_toml(source: IO | Path | str, modifiable: bool) -> PyprojectT
       **faster**, but does not preserve comments and formatting.
     - `True`: uses :mod:`tomlkit`, which is **slower**, but preservers comments and
       formatting.
+
+    Files are parsed through the :class:`.ParseCache`, so that a file is parsed only
+    once per parser for as long as its content does not change.
     """
     parser = tomlkit if modifiable else rtoml
     if isinstance(source, io.IOBase):
@@ -363,8 +461,12 @@ def load_pyproject_toml(source: IO | Path | str, modifiable: bool) -> PyprojectT
         source.seek(current_position)
         return document  # ty:ignore[invalid-return-type]
     if isinstance(source, Path):
-        with open(source) as stream:
-            return parser.load(stream)  # ty:ignore[invalid-return-type]
+        return get_parse_cache().parse(
+            source,
+            flavor=f"{parser.__name__}=={parser.__version__}",
+            parser=lambda content: parser.loads(content.decode()),
+            mutable=modifiable,
+        )
     if isinstance(source, str):
         return parser.loads(source)  # ty:ignore[invalid-return-type]
     msg = f"Source of type {type(source).__name__} is not supported"
@@ -0,0 +1,117 @@
+"""Index of the dependencies that a :code:`pyproject.toml` lists, by package name.
+
+The checks ask dozens of times per run whether a package is listed, or remove packages
+that are usually not listed at all. Instead of parsing each dependency definition in
+each section for every such call, a `DependencyIndex` records in which sections each
+package is defined.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import abc
+from typing import TYPE_CHECKING, Any
+
+from compwa_policy.utilities.pyproject._lazy import peek
+from compwa_policy.utilities.pyproject.setters import get_dependency_name
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+Section = tuple[str, ...]
+"""Keys of an array of dependencies, like :code:`("dependency-groups", "test")`."""
+
+
+class DependencyIndex:
+    """Sections of a :code:`pyproject.toml` in which each package is defined.
+
+    Call :meth:`update` before a query. It compares the definitions in each section to
+    those of the previous update and only parses the sections that changed, so the index
+    follows modifications of the document, regardless of how they were made. A document
+    that cannot be modified is only indexed once.
+    """
+
+    def __init__(self) -> None:
+        self.__definitions: dict[Section, tuple[str | None, ...]] = {}
+        self.__names: dict[Section, tuple[str | None, ...]] = {}
+        self.__sections: dict[str, tuple[Section, ...]] = {}
+        self.__lower_sections: dict[str, tuple[Section, ...]] = {}
+        self.__frozen_source: object = None
+        self.__lock = threading.Lock()
+
+    def update(
+        self, document: Mapping[str, Any], *, modifiable: bool = True
+    ) -> DependencyIndex:
+        """Parse the sections of dependencies that changed since the previous update."""
+        source = peek(document)
+        if source is self.__frozen_source:
+            return self
+        with self.__lock:
+            definitions: dict[Section, tuple[str | None, ...]] = {}
+            names: dict[Section, tuple[str | None, ...]] = {}
+            changed = False
+            for section, dependencies in _iter_sections(source):
+                current = tuple(
+                    str(d) if isinstance(d, str) else None for d in dependencies
+                )
+                if self.__definitions.get(section) == current:
+                    names[section] = self.__names[section]
+                else:
+                    names[section] = tuple(map(_get_name, current))
+                    changed = True
+                definitions[section] = current
+            if changed or definitions.keys() != self.__definitions.keys():
+                self.__definitions = definitions
+                self.__names = names
+                self.__sections = _map_sections(names, lower=False)
+                self.__lower_sections = _map_sections(names, lower=True)
+            self.__frozen_source = None if modifiable else source
+        return self
+
+    def get_sections(self, package: str, *, lower: bool = False) -> tuple[Section, ...]:
+        """Get the sections in which *package* is defined.
+
+        If *lower* is `True`, the lower-case package names are compared to *package*.
+        """
+        if lower:
+            return self.__lower_sections.get(package, ())
+        return self.__sections.get(package, ())
+
+
+def _iter_sections(document: Mapping[str, Any]) -> Iterator[tuple[Section, Any]]:
+    project = document.get("project", {})
+    dependencies = project.get("dependencies")
+    if _is_array(dependencies):
+        yield ("project", "dependencies"), dependencies
+    optional_dependencies = project.get("optional-dependencies", {})
+    for key, dependencies in optional_dependencies.items():
+        if _is_array(dependencies):
+            yield ("project", "optional-dependencies", key), dependencies
+    for group, dependencies in document.get("dependency-groups", {}).items():
+        if _is_array(dependencies):
+            yield ("dependency-groups", group), dependencies
+
+
+def _get_name(definition: str | None) -> str | None:
+    """Get the package name of a definition, or `None` if it cannot be parsed."""
+    try:
+        return get_dependency_name(definition)
+    except ValueError:
+        return None
+
+
+def _is_array(value: Any) -> bool:
+    return isinstance(value, abc.Sequence) and not isinstance(value, str)
+
+
+def _map_sections(
+    names: dict[Section, tuple[str | None, ...]], *, lower: bool
+) -> dict[str, tuple[Section, ...]]:
+    sections: dict[str, dict[Section, None]] = {}
+    for section, section_names in names.items():
+        for name in section_names:
+            if name is None:
+                continue
+            key = name.lower() if lower else name
+            sections.setdefault(key, {})[section] = None
+    return {name: tuple(found) for name, found in sections.items()}
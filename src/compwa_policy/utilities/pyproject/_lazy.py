@@ -0,0 +1,390 @@
+"""Copy-on-write access to a TOML document.
+
+Parsing a round-trip :mod:`tomlkit` document is about a hundred times slower than
+parsing plain Python objects with :mod:`rtoml`. Most runs of the checks do not modify
+:file:`pyproject.toml` though, so a `LazyDocument` answers reads from the plain document
+and only builds the :mod:`tomlkit` document once a value is about to be modified.
+
+Reads return views of the tables and arrays of the document. On the first write, every
+view that is still alive is bound to the corresponding :mod:`tomlkit` item, so that
+modifications of a view that was obtained before show up in the rendered document, just
+like modifications of the :mod:`tomlkit` items themselves. Views that are written to the
+document, also as part of a new `dict` or `list`, are replaced by the items that they
+represent, so that these keep their formatting. Views are not registered as a
+:mod:`tomlkit` encoder though, so values that are passed to :mod:`tomlkit` directly
+should first go through :func:`unwrap_views`, as :func:`.to_toml_array` does.
+
+The views are a `~collections.abc.MutableMapping` or `~collections.abc.MutableSequence`,
+but not a `dict` or `list`. Callers should therefore check for the abstract base class,
+or get the underlying object with :func:`peek` before checking for a `dict` or `list`.
+
+Checks often assign a value that a table already has, before they compare the table to
+what they expect. Such a write of an equal value does not build the :mod:`tomlkit`
+document, but is replayed once something else does, because :mod:`tomlkit` may still
+format the new value differently.
+
+Once it is built, the :mod:`tomlkit` document is rendered with an
+`.IncrementalRenderer`, which the views tell which tables they modify.
+"""
+
+from __future__ import annotations
+
+import copy
+import sys
+import threading
+import weakref
+from collections import abc
+from typing import TYPE_CHECKING, Any
+
+from tomlkit.items import Item
+
+from compwa_policy.utilities.pyproject._render import IncrementalRenderer
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from tomlkit import TOMLDocument
+
+
+class LazyDocument:
+    """TOML document that is parsed with :mod:`tomlkit` only once it is modified.
+
+    The *plain* document is never modified, so it can be shared through the
+    `.ParseCache`. The *load* function should return a :mod:`tomlkit` document with the
+    same content. If the *text* that the documents were parsed from is given,
+    :meth:`dumps` returns it for as long as the document is not modified.
+    """
+
+    def __init__(
+        self,
+        plain: abc.Mapping[str, Any],
+        load: Callable[[], TOMLDocument],
+        text: str | None = None,
+    ) -> None:
+        self.__load = load
+        self.__text = text
+        self.__roundtrip: TOMLDocument | None = None
+        self.__views: weakref.WeakValueDictionary[int, _View] = (
+            weakref.WeakValueDictionary()
+        )
+        self.__pending: list[tuple[tuple[str | int, ...], str | int, Any]] = []
+        self.__lock = threading.RLock()
+        self._renderer = IncrementalRenderer()
+        self.root = _TableView(self, (), plain)
+        """View of the complete document."""
+
+    @classmethod
+    def from_roundtrip(cls, document: TOMLDocument) -> LazyDocument:
+        """Wrap a :mod:`tomlkit` document that already exists."""
+        lazy = cls(document, load=lambda: document)
+        lazy.materialize()
+        lazy._renderer.release(document, path=())
+        return lazy
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the :mod:`tomlkit` document has been built."""
+        return self.__roundtrip is not None
+
+    @property
+    def roundtrip(self) -> TOMLDocument:
+        """The :mod:`tomlkit` document, which is built if it does not exist yet."""
+        return self.materialize()
+
+    def materialize(self) -> TOMLDocument:
+        if self.__roundtrip is not None:
+            return self.__roundtrip
+        with self.__lock:
+            if self.__roundtrip is None:
+                document = self.__load()
+                for path, key, value in self.__pending:
+                    _resolve(document, path)[key] = value
+                for view in list(self.__views.values()):
+                    view._bind(document)  # noqa: SLF001
+                self.root._bind(document)  # noqa: SLF001
+                self.__roundtrip = document
+                self.__pending.clear()
+                self.__views.clear()
+        return self.__roundtrip
+
+    def dumps(self) -> str:
+        """Render the document exactly like :func:`tomlkit.dumps`."""
+        if self.__roundtrip is None and self.__text is not None and not self.__pending:
+            return self.__text
+        return self._renderer.render(self.materialize())
+
+    def _defer_write(self, view: _View, key: str | int, value: Any) -> bool:
+        """Record the assignment of a value that equals the current value, if any."""
+        if self.__roundtrip is not None:
+            return False
+        try:
+            current = view._target[key]  # noqa: SLF001
+        except (KeyError, IndexError, TypeError):
+            return False
+        if _get_type(current) is not _get_type(value) or current != value:
+            return False
+        if not isinstance(value, Item) and _get_type(value) in {dict, list}:
+            if not _is_plain(value):
+                return False
+            value = copy.deepcopy(value)
+        with self.__lock:
+            if self.__roundtrip is not None:
+                return False
+            self.__pending.append((view._path, key, value))  # noqa: SLF001
+        return True
+
+    def _create_view(self, path: tuple[str | int, ...], value: Any) -> Any:
+        """Wrap a table or array, so that it can be bound on materialization."""
+        if isinstance(value, abc.Mapping):
+            view: _View = _TableView(self, path, value)
+        elif isinstance(value, list):
+            view = _ArrayView(self, path, value)
+        else:
+            return value
+        if self.__roundtrip is not None:
+            return view
+        with self.__lock:
+            if self.__roundtrip is not None:
+                view._bind(self.__roundtrip)  # noqa: SLF001
+            else:
+                self.__views[id(view)] = view
+        return view
+
+
+class _View:
+    __slots__ = ("__weakref__", "_lazy", "_path", "_target")
+
+    def __init__(
+        self, lazy: LazyDocument, path: tuple[str | int, ...], target: Any
+    ) -> None:
+        self._lazy = lazy
+        self._path = path
+        self._target = target
+
+    def _bind(self, document: TOMLDocument) -> None:
+        self._target = _resolve(document, self._path)
+
+    def _get_writable_target(self) -> Any:
+        self._lazy.materialize()
+        self._lazy._renderer.touch(self._path)  # noqa: SLF001
+        return self._target
+
+    def _release(self) -> Any:
+        """Get the item, which can then be modified without going through the view."""
+        target = self._get_writable_target()
+        self._lazy._renderer.release(target, self._path)  # noqa: SLF001
+        return target
+
+    def _receive(self, key: str | int | None, value: Any) -> Any:
+        """Prepare a *value* that is about to be written to the item."""
+        value = unwrap_views(value)
+        path = self._path if key is None else (*self._path, key)
+        self._lazy._renderer.receive(path, value)  # noqa: SLF001
+        return value
+
+    def _pop(self, value: Any) -> Any:
+        """Return a removed *value*, which may be written to the document again."""
+        self._lazy._renderer.release(value)  # noqa: SLF001
+        return value
+
+    def _wrap(self, key: str | int, value: Any) -> Any:
+        return self._lazy._create_view((*self._path, key), value)  # noqa: SLF001
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward :mod:`tomlkit` methods, like :code:`multiline()`, to the item."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._release(), name)
+
+    def __repr__(self) -> str:
+        return repr(self._target)
+
+    def __str__(self) -> str:
+        return str(self._target)
+
+
+class _TableView(_View, abc.MutableMapping):
+    """View of a table, a `~collections.abc.MutableMapping` but not a `dict`."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        return self._wrap(key, self._target[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._target)
+
+    def __len__(self) -> int:
+        return len(self._target)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._target
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if not self._lazy._defer_write(self, key, value):  # noqa: SLF001
+            target = self._get_writable_target()
+            target[key] = self._receive(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        del self._get_writable_target()[key]
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key in self._target:
+            return self[key]
+        target = self._get_writable_target()
+        target.setdefault(key, self._receive(key, default))
+        return self[key]
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if default and key not in self._target:
+            return default[0]
+        return self._pop(self._get_writable_target().pop(key, *default))
+
+    def popitem(self) -> tuple[str, Any]:
+        key, value = self._get_writable_target().popitem()
+        return key, self._pop(value)
+
+    def clear(self) -> None:
+        self._get_writable_target().clear()
+
+
+class _ArrayView(_View, abc.MutableSequence):
+    """View of an array, a `~collections.abc.MutableSequence` but not a `list`."""
+
+    __slots__ = ()
+
+    def __getitem__(self, index: int | slice) -> Any:  # ty:ignore[invalid-method-override]
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self._target)
+        return self._wrap(index, self._target[index])
+
+    def __iter__(self) -> Iterator[Any]:
+        index = 0
+        while index < len(self._target):
+            yield self._wrap(index, self._target[index])
+            index += 1
+
+    def __len__(self) -> int:
+        return len(self._target)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._target
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, abc.Sequence) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # ty:ignore[invalid-assignment]
+
+    def __add__(self, other: Any) -> list[Any]:
+        return [*self, *other]
+
+    def __radd__(self, other: Any) -> list[Any]:
+        return [*other, *self]
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, int) and index < 0:
+            index += len(self._target)
+        if not self._lazy._defer_write(self, index, value):  # noqa: SLF001
+            target = self._get_writable_target()
+            target[index] = self._receive(None, value)
+
+    def __delitem__(self, index: Any) -> None:
+        del self._get_writable_target()[index]
+
+    def __iadd__(self, values: Any) -> Self:  # ty:ignore[invalid-method-override]
+        self.extend(values)
+        return self
+
+    def insert(self, index: int, value: Any) -> None:
+        target = self._get_writable_target()
+        target.insert(index, self._receive(None, value))
+
+    def append(self, value: Any) -> None:
+        target = self._get_writable_target()
+        target.append(self._receive(None, value))
+
+    def extend(self, values: Any) -> None:
+        target = self._get_writable_target()
+        target.extend([self._receive(None, value) for value in values])
+
+    def pop(self, index: int = -1) -> Any:
+        return self._pop(self._get_writable_target().pop(index))
+
+    def remove(self, value: Any) -> None:
+        self._get_writable_target().remove(value)
+
+    def clear(self) -> None:
+        self._get_writable_target().clear()
+
+    def reverse(self) -> None:
+        self._get_writable_target().reverse()
+
+    def sort(self, *, key: Any = None, reverse: bool = False) -> None:
+        self._get_writable_target().sort(key=key, reverse=reverse)
+
+
+def _resolve(document: TOMLDocument, path: tuple[str | int, ...]) -> Any:
+    target: Any = document
+    for key in path:
+        target = target[key]
+    return target
+
+
+def _get_type(value: Any) -> type | None:
+    if isinstance(value, abc.Mapping):
+        return dict
+    if isinstance(value, (list, tuple)):
+        return list
+    for scalar_type in (bool, int, float, str):
+        if isinstance(value, scalar_type):
+            return scalar_type
+    return None
+
+
+def _is_plain(value: Any) -> bool:
+    """Whether *value* consists of only built-in containers and scalars."""
+    if type(value) is dict:
+        return all(_is_plain(item) for item in value.values())
+    if type(value) in {list, tuple}:
+        return all(_is_plain(item) for item in value)
+    return type(value) in {bool, int, float, str}
+
+
+def resolve_view(value: Any) -> Any:
+    """Get the :mod:`tomlkit` item that a view represents, or *value* itself."""
+    if isinstance(value, _View):
+        return value._release()  # noqa: SLF001
+    return value
+
+
+def peek(value: Any) -> Any:
+    """Get the object that a view reads from, without building the document.
+
+    Unlike :func:`resolve_view`, the result should only be read.
+    """
+    if isinstance(value, _View):
+        return value._target  # noqa: SLF001
+    return value
+
+
+def unwrap_views(value: Any) -> Any:
+    """Replace views, also in plain containers, by the values that they represent.
+
+    This is needed because :func:`tomlkit.item` decides whether a `list` becomes an
+    array of tables by checking whether its elements are a `dict`.
+    """
+    if isinstance(value, _View):
+        return resolve_view(value)
+    if type(value) is dict:
+        return {key: unwrap_views(item) for key, item in value.items()}
+    if type(value) in {list, tuple}:
+        return type(value)(map(unwrap_views, value))
+    return value
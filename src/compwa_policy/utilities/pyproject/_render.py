@@ -0,0 +1,224 @@
+"""Render a :mod:`tomlkit` document again after some of its tables were modified.
+
+:func:`tomlkit.dumps` renders every item of a document, each time it is called. The
+checks only modify a few tables of :file:`pyproject.toml` though, while the document is
+rendered after every check that modified it (for the keys of the `.HookMemo`) and once
+more when the changes are written. An `IncrementalRenderer` therefore keeps the text of
+each top-level table, as well as of each table under a super table like
+:code:`[tool]`, and only renders the tables that were touched since the previous call.
+The texts are joined the way :meth:`tomlkit.container.Container.as_string` joins them, so
+that the output is identical to that of :func:`tomlkit.dumps`.
+
+Tables are touched through the views of a `.LazyDocument`. Items that leave the views,
+for instance through :func:`.resolve_view`, can be modified without any view noticing,
+so the tables that contain them are rendered on every call from then on.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import abc
+from typing import TYPE_CHECKING, Any, cast
+
+from tomlkit.items import AoT, Item, Null, Table, Whitespace
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from tomlkit import TOMLDocument
+    from tomlkit.items import Key
+
+_Section = tuple[str | int, ...]
+
+
+class IncrementalRenderer:
+    """Render a :mod:`tomlkit` document, reusing the text of untouched tables.
+
+    A section is the path to a top-level table or to a table one level deeper, like
+    :code:`("tool", "ruff")`. The path of a modified table or array is reduced to its
+    section, because :mod:`tomlkit` also adjusts the whitespace of the neighbors of an
+    item that is added to a table.
+    """
+
+    def __init__(self) -> None:
+        self.__texts: dict[int, tuple[Item, Key, str | None, str]] = {}
+        self.__touched: set[_Section] = set()
+        self.__volatile: set[_Section] = set()
+        self.__released: dict[int, Item] = {}
+        self.__render_all = False
+        self.__lock = threading.Lock()
+
+    def touch(self, path: tuple[str | int, ...]) -> None:
+        """Mark the table or array at *path* as modified."""
+        with self.__lock:
+            if path:
+                self.__touched.add(path[:2])
+            else:
+                self.__texts.clear()
+
+    def release(self, item: Any, path: tuple[str | int, ...] | None = None) -> None:
+        """Record that *item* can be modified outside the views from now on.
+
+        If the item is still part of the document at *path*, the section of that path
+        is rendered on every call.
+        """
+        with self.__lock:
+            if path is not None:
+                if not path:
+                    self.__render_all = True
+                    return
+                self.__volatile.add(path[:2])
+            for container in _iter_containers(item):
+                self.__released[id(container)] = container
+
+    def receive(self, path: tuple[str | int, ...], value: Any) -> None:
+        """Check whether a *value* that is written to *path* contains released items."""
+        if not self.__released:
+            return
+        with self.__lock:
+            if not any(id(item) in self.__released for item in _iter_containers(value)):
+                return
+            if path:
+                self.__volatile.add(path[:2])
+            else:
+                self.__render_all = True
+
+    def render(self, document: TOMLDocument) -> str:
+        """Render *document* like :meth:`tomlkit.container.Container.as_string`."""
+        with self.__lock:
+            if self.__render_all:
+                return document.as_string()
+            stale = self.__touched | self.__volatile
+            renderer = _Renderer(document, self.__texts, stale)
+            text = _Text()
+            for key, item in document.body:
+                if key is not None and isinstance(item, (Table, AoT)):
+                    text.separate(item)
+                    text.append(renderer.render_top_level(key, item))
+                else:
+                    text.append(document._render_simple_item(key, item))  # noqa: SLF001
+            self.__texts = renderer.texts
+            self.__touched.clear()
+            return str(text)
+
+
+class _Renderer:
+    """Render the tables of one call to `IncrementalRenderer.render`."""
+
+    def __init__(
+        self,
+        document: TOMLDocument,
+        previous: dict[int, tuple[Item, Key, str | None, str]],
+        stale: set[_Section],
+    ) -> None:
+        self.document = document
+        self.previous = previous
+        self.stale = stale
+        self.stale_tables = {section[0] for section in stale}
+        self.texts: dict[int, tuple[Item, Key, str | None, str]] = {}
+
+    def render_top_level(self, key: Key, item: Table | AoT) -> str:
+        if key.is_dotted():
+            return self.__render(key, item, prefix=None, reuse=False)
+        name = key.key
+        if isinstance(item, Table) and not _has_header(key, item):
+            if (name,) in self.stale:
+                return self.__render(key, item, prefix=None, reuse=False)
+            return self.__render_super_table(key, item)
+        reuse = name not in self.stale_tables
+        return self.__render(key, item, prefix=None, reuse=reuse)
+
+    def __render_super_table(self, key: Key, table: Table) -> str:
+        """Follow :code:`Container._render_table` for a table without a header."""
+        document = self.document
+        prefix = key.as_string() if table.display_name is None else table.display_name
+        text = _Text()
+        if table.trivia.indent == "\n":
+            text.append(table.trivia.indent)
+        for child_key, child in table.value.body:
+            if not isinstance(child, (Table, AoT)):
+                text.append(document._render_simple_item(child_key, child))  # noqa: SLF001
+                continue
+            text.separate(child)
+            sub_key = cast("Key", child_key)
+            if not sub_key.is_dotted():
+                reuse = (key.key, sub_key.key) not in self.stale
+                text.append(self.__render(sub_key, child, prefix, reuse=reuse))
+            elif isinstance(child, Table) and child.is_super_table():
+                text.append(document._render_table(sub_key, child))  # noqa: SLF001
+            else:
+                text.append(self.__render(sub_key, child, prefix, reuse=False))
+        return str(text)
+
+    def __render(
+        self, key: Key, item: Table | AoT, prefix: str | None, *, reuse: bool
+    ) -> str:
+        previous = self.previous.get(id(item))
+        if (
+            reuse
+            and previous is not None
+            and previous[0] is item
+            and previous[1] is key
+            and previous[2] == prefix
+        ):
+            text = previous[3]
+        elif isinstance(item, Table):
+            text = self.document._render_table(key, item, prefix=prefix)  # noqa: SLF001
+        else:
+            text = self.document._render_aot(key, item, prefix=prefix)  # noqa: SLF001
+        self.texts[id(item)] = (item, key, prefix, text)
+        return text
+
+
+class _Text:
+    """Joined text that knows whether a table needs a newline in front of it."""
+
+    def __init__(self) -> None:
+        self.__parts: list[str] = []
+        self.__has_content = False
+        self.__ends_with_newline = False
+
+    def append(self, text: str) -> None:
+        self.__parts.append(text)
+        stripped = text.rstrip(" ")
+        if stripped:
+            self.__has_content = True
+            self.__ends_with_newline = stripped.endswith("\n")
+
+    def separate(self, item: Item) -> None:
+        if (
+            self.__has_content
+            and not self.__ends_with_newline
+            and "\n" not in item.trivia.indent
+        ):
+            self.append("\n")
+
+    def __str__(self) -> str:
+        return "".join(self.__parts)
+
+
+def _has_header(key: Key, table: Table) -> bool:
+    """Whether :mod:`tomlkit` renders a :code:`[header]` for a top-level *table*."""
+    if not table.is_super_table():
+        return True
+    if key.is_dotted():
+        return False
+    body = table.value.body
+    if any(not isinstance(value, (Table, AoT, Whitespace, Null)) for _, value in body):
+        return True
+    return any(
+        k is not None and k.is_dotted() for k, value in body if isinstance(value, Table)
+    )
+
+
+def _iter_containers(value: Any) -> Iterator[Any]:
+    """Iterate over *value* and all tables and arrays that it contains."""
+    if isinstance(value, abc.Mapping):
+        children: Iterable[Any] = value.values()
+    elif isinstance(value, list):
+        children = value
+    else:
+        return
+    yield value
+    for child in children:
+        yield from _iter_containers(child)
@@ -11,6 +11,7 @@ from packaging.version import Version
 
 from compwa_policy.config import PYTHON_VERSIONS, PythonVersion
 from compwa_policy.errors import PolicyError
+from compwa_policy.utilities.storage import get_storage
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -121,9 +122,10 @@ def _get_requires_python(project: Mapping[str, Any]) -> str:
     requires_python = project.get("requires-python")
     if requires_python is not None:
         return requires_python
+    storage = get_storage()
     python_version_file = Path(".python-version")
-    if python_version_file.exists():
-        pinned_version = python_version_file.read_text().strip()
+    if storage.exists(python_version_file):
+        pinned_version = storage.read_text(python_version_file).strip()
         return f"~={pinned_version}"
     return ""
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 from collections import abc
+from functools import cache
 from itertools import pairwise
 from typing import TYPE_CHECKING, Any, cast
 
@@ -29,79 +30,91 @@ def add_dependency(
     dependency_group: str | Sequence[str] | None = None,
     optional_key: str | Sequence[str] | None = None,
 ) -> bool:
+    return bool(add_dependencies(pyproject, [package], dependency_group, optional_key))
+
+
+def add_dependencies(
+    pyproject: PyprojectTOML,
+    packages: Iterable[str],
+    dependency_group: str | Sequence[str] | None = None,
+    optional_key: str | Sequence[str] | None = None,
+) -> list[str]:
+    """Add several packages at once and return those that were not listed yet."""
+    packages = list(dict.fromkeys(packages))
     if optional_key is None and dependency_group is None:
-        return _add_direct_dependency(pyproject, package)
+        return _add_direct_dependencies(pyproject, packages)
     if dependency_group is not None:
-        return _add_to_dependency_group(pyproject, package, dependency_group)
+        return _add_to_dependency_group(pyproject, packages, dependency_group)
     if optional_key is not None:
-        return _add_to_optional_dependencies(pyproject, package, optional_key)
-    return False
+        return _add_to_optional_dependencies(pyproject, packages, optional_key)
+    return []
 
 
-def _add_direct_dependency(pyproject: PyprojectTOML, package: str) -> bool:
+def _add_direct_dependencies(
+    pyproject: PyprojectTOML, packages: list[str]
+) -> list[str]:
     project = get_sub_table(pyproject, "project")
     existing_dependencies = set(project.get("dependencies", []))
-    if package in existing_dependencies:
-        return False
-    existing_dependencies.add(package)
+    added = [package for package in packages if package not in existing_dependencies]
+    if not added:
+        return []
+    existing_dependencies.update(added)
     project["dependencies"] = to_toml_array(_sort_taplo(existing_dependencies))
-    return True
+    return added
 
 
 def _add_to_dependency_group(
-    pyproject: PyprojectTOML, package: str, dependency_group: str | Sequence[str]
-) -> bool:
+    pyproject: PyprojectTOML, packages: list[str], dependency_group: str | Sequence[str]
+) -> list[str]:
     if "dependency-groups" not in pyproject:
         pyproject["dependency-groups"] = tomlkit.table(is_super_table=False)
     dependency_groups = pyproject["dependency-groups"]
     if isinstance(dependency_group, str):
         dependencies = dependency_groups.get(dependency_group, [])
-        if package in dependencies:
-            return False
-        dependencies.append(package)
+        added = [package for package in packages if package not in dependencies]
+        if not added:
+            return []
+        dependencies.extend(added)
         dependency_groups[dependency_group] = to_toml_array(dependencies)
-        return True
+        return added
     if isinstance(dependency_group, abc.Sequence) and len(dependency_group):
-        updated = add_dependency(pyproject, package, dependency_group[0])
+        added = _add_to_dependency_group(pyproject, packages, dependency_group[0])
         for previous, current in pairwise(dependency_group):
             dependencies = dependency_groups.get(current, [])
             expected: IncludeGroup = {"include-group": previous}
             if expected in dependencies:
                 continue
-            updated &= True
             dependencies.append(expected)
-        return updated
+        return added
     msg = f"Unsupported type for dependency group: {type(dependency_group)}"
     raise NotImplementedError(msg)
 
 
 def _add_to_optional_dependencies(
-    pyproject: PyprojectTOML, package: str, optional_key: str | Sequence[str]
-) -> bool:
+    pyproject: PyprojectTOML, packages: list[str], optional_key: str | Sequence[str]
+) -> list[str]:
     if isinstance(optional_key, str):
         table_key = "project.optional-dependencies"
         optional_dependencies = get_sub_table(pyproject, table_key)
         existing_dependencies = set(optional_dependencies.get(optional_key, []))
-        if package in existing_dependencies:
-            return False
-        existing_dependencies.add(package)
-        existing_dependencies = set(existing_dependencies)
+        added = [p for p in packages if p not in existing_dependencies]
+        if not added:
+            return []
+        existing_dependencies.update(added)
         optional_dependencies[optional_key] = to_toml_array(
             _sort_taplo(existing_dependencies)
         )
-        return True
+        return added
     if isinstance(optional_key, abc.Sequence):
         if len(optional_key) == 0:
             msg = "Need at least one key to define nested optional dependencies"
             raise ValueError(msg)
         this_package = get_package_name(pyproject, raise_on_missing=True)
-        updated = False
-        updated &= add_dependency(pyproject, package, optional_key=optional_key[0])
+        added = _add_to_optional_dependencies(pyproject, packages, optional_key[0])
         for previous, key in pairwise(optional_key):
-            updated &= add_dependency(
-                pyproject, f"{this_package}[{previous}]", optional_key=key
-            )
-        return updated
+            extra = f"{this_package}[{previous}]"
+            _add_to_optional_dependencies(pyproject, [extra], key)
+        return added
     msg = f"Unsupported type for optional_key: {type(optional_key)}"
     raise NotImplementedError(msg)
 
@@ -130,22 +143,33 @@ def get_sub_table(
     return cast("MutableMapping[str, Any]", table)
 
 
-def remove_dependency(  # noqa: C901, PLR0912
+def remove_dependency(
     pyproject: PyprojectTOML,
     package: str,
     ignored_sections: Iterable[str] | None = None,
 ) -> bool:
+    return bool(remove_dependencies(pyproject, [package], ignored_sections))
+
+
+def remove_dependencies(  # noqa: C901, PLR0912
+    pyproject: PyprojectTOML,
+    packages: Iterable[str],
+    ignored_sections: Iterable[str] | None = None,
+) -> list[str]:
+    """Remove several packages at once and return those that were listed.
+
+    Each section of dependencies is traversed once, for all packages. The first
+    definition of each package is removed from each section.
+    """
     project = pyproject.get("project")
     if project is None:
-        return False
-    updated = False
+        return []
+    packages = list(dict.fromkeys(packages))
+    package_names = set(packages)
+    removed: set[str] = set()
     dependencies = project.get("dependencies")
     if dependencies is not None:
-        package_names = [split_dependency_definition(p)[0] for p in dependencies]
-        if package in set(package_names):
-            idx = package_names.index(package)
-            dependencies.pop(idx)
-            updated = True
+        removed.update(_remove_definitions(dependencies, package_names))
     if ignored_sections is None:
         ignored_sections = set()
     else:
@@ -155,12 +179,8 @@ def remove_dependency(  # noqa: C901, PLR0912
         for section, dependencies in optional_dependencies.items():
             if section in ignored_sections:
                 continue
-            package_names = [split_dependency_definition(p)[0] for p in dependencies]
-            if package in set(package_names):
-                idx = package_names.index(package)
-                dependencies.pop(idx)
-                updated = True
-        if updated:
+            removed.update(_remove_definitions(dependencies, package_names))
+        if removed:
             empty_sections = [k for k, v in optional_dependencies.items() if not v]
             for section in empty_sections:
                 del optional_dependencies[section]
@@ -171,21 +191,48 @@ def remove_dependency(  # noqa: C901, PLR0912
         for section, dependencies in dependency_groups.items():
             if section in ignored_sections:
                 continue
-            package_names = [
-                split_dependency_definition(p)[0] if isinstance(p, str) else p
-                for p in dependencies
-            ]
-            if package in package_names:
-                idx = package_names.index(package)
-                dependencies.pop(idx)
-                updated = True
-        if updated:
+            removed.update(_remove_definitions(dependencies, package_names))
+        if removed:
             empty_sections = [k for k, v in dependency_groups.items() if not v]
             for section in empty_sections:
                 del dependency_groups[section]
             if not dependency_groups:
                 del pyproject["dependency-groups"]
-    return updated
+    return [package for package in packages if package in removed]
+
+
+def _remove_definitions(dependencies: list[Any], packages: set[str]) -> list[str]:
+    """Remove the first definition of each package and return the removed packages."""
+    positions: dict[str, int] = {}
+    for position, definition in enumerate(dependencies):
+        package_name = get_dependency_name(definition)
+        if package_name in packages and package_name not in positions:
+            positions[package_name] = position
+    for position in sorted(positions.values(), reverse=True):
+        dependencies.pop(position)
+    return list(positions)
+
+
+def get_dependency_name(definition: object) -> str | None:
+    """Get the package name of a dependency definition, if it is one.
+
+    Definitions that are not a `str`, like an :code:`include-group` in
+    :code:`[dependency-groups]`, have no package name.
+
+    >>> get_dependency_name("pip > 19  # needed")
+    'pip'
+    >>> get_dependency_name({"include-group": "test"}) is None
+    True
+    """
+    if not isinstance(definition, str):
+        return None
+    return _get_dependency_name(str(definition))
+
+
+@cache
+def _get_dependency_name(definition: str) -> str:
+    package_name, *_ = split_dependency_definition(definition)
+    return package_name
 
 
 def split_dependency_definition(definition: str) -> tuple[str, str, str]:
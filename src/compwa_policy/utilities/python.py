@@ -1,16 +1,14 @@
 # noqa: D100
 from __future__ import annotations
 
-from pathlib import Path
-
 from compwa_policy.utilities import CONFIG_PATH
 from compwa_policy.utilities.pyproject import Pyproject, get_constraints_file
+from compwa_policy.utilities.storage import get_storage
 
 
 def has_constraint_files() -> bool:
-    if not CONFIG_PATH.pip_constraints.exists():
+    if not get_storage().exists(CONFIG_PATH.pip_constraints):
         return False
     python_versions = Pyproject.load().get_supported_python_versions()
     constraint_files = [get_constraints_file(v) for v in python_versions]
-    constraint_paths = [Path(path) for path in constraint_files if path is not None]
-    return any(path.exists() for path in constraint_paths)
+    return any(path is not None for path in constraint_files)
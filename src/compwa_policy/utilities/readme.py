@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import pickle  # noqa: S403
 import re
 from typing import TYPE_CHECKING
 
 from compwa_policy.errors import PolicyError
 from compwa_policy.utilities import CONFIG_PATH
 from compwa_policy.utilities.resource import Changelog, ModifiableResource
+from compwa_policy.utilities.storage import get_storage
+from compwa_policy.utilities.transaction import FileTransaction
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -28,20 +31,34 @@ class ModifiableReadme(ModifiableResource):
 
     @classmethod
     def load(cls, source: Path = CONFIG_PATH.readme) -> ModifiableReadme:
-        if not source.exists():
+        storage = get_storage()
+        if not storage.exists(source):
             return cls([], source, exists=False)
-        with source.open() as stream:
-            return cls(stream.readlines(), source, exists=True)
+        lines = storage.read_text(source).splitlines(keepends=True)
+        return cls(lines, source, exists=True)
 
     @property
     def changelog(self) -> Changelog:
         return self._changelog
 
+    @property
+    def files(self) -> tuple[Path, ...]:
+        return (self._source,)
+
+    def snapshot(self) -> bytes:
+        return pickle.dumps(self._lines)
+
+    def restore(self, snapshot: bytes) -> None:
+        self._lines = pickle.loads(snapshot)
+
     def dump(self) -> None:
+        with FileTransaction() as transaction:
+            self.stage(transaction)
+
+    def stage(self, transaction: FileTransaction) -> None:
         if not self._changelog:
             return
-        with self._source.open("w") as stream:
-            stream.writelines(self._lines)
+        transaction.write_text(self._source, "".join(self._lines))
 
     def add_badge(self, badge: str) -> None:
         if not self._exists:
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-import shutil
+import pickle  # noqa: S403
+import stat
 import sys
 from abc import ABC, abstractmethod
 from contextlib import AbstractContextManager
 from pathlib import Path
 from typing import TYPE_CHECKING, TypeAlias
 
+from compwa_policy.utilities.storage import get_storage
+from compwa_policy.utilities.transaction import FileTransaction
+
 if sys.version_info >= (3, 11):
     from typing import Self
 else:
@@ -29,7 +33,7 @@ class ModifiableResource(AbstractContextManager, ABC):
     @classmethod
     @abstractmethod
     def load(cls) -> Self:
-        """Load the resource from the working tree."""
+        """Load the resource from the current `.Storage`."""
 
     @property
     @abstractmethod
@@ -40,11 +44,37 @@ class ModifiableResource(AbstractContextManager, ABC):
     def dump(self) -> None:
         """Write the in-memory representation to the working tree."""
 
+    def stage(self, transaction: FileTransaction) -> None:
+        """Stage the in-memory representation in a `.FileTransaction`.
+
+        Resources that cannot be staged are dumped right away.
+        """
+        _ = transaction
+        self.dump()
+
     @property
     def changed(self) -> bool:
         """Whether the resource needs to be flushed."""
         return bool(self.changelog)
 
+    @property
+    def files(self) -> tuple[Path, ...]:
+        """Files that the resource represents; empty if they are not known."""
+        return ()
+
+    def snapshot(self) -> bytes | None:  # noqa: PLR6301
+        """Serialize the in-memory representation, without the changelog.
+
+        Returns `None` if the resource cannot be serialized, which is the default.
+        """
+        return None
+
+    def restore(self, snapshot: bytes) -> None:
+        """Replace the in-memory representation by an earlier :meth:`snapshot`."""
+        _ = snapshot
+        msg = f"{type(self).__name__} cannot be restored from a snapshot"
+        raise NotImplementedError(msg)
+
     def __enter__(self) -> Self:
         return self
 
@@ -66,12 +96,15 @@ class ModifiablePath(ModifiableResource):
         content: bytes | None,
         *,
         is_directory: bool = False,
+        mode: int | None = None,
     ) -> None:
         self.path = path
         self._original_content = content
         self._content = content
         self._is_directory = is_directory
         self._original_is_directory = is_directory
+        self._original_mode = mode
+        self._mode = mode
         self._changelog: Changelog = []
 
     @classmethod
@@ -82,11 +115,14 @@ class ModifiablePath(ModifiableResource):
     @classmethod
     def load_path(cls, path: Path | str) -> Self:
         path = Path(path)
-        if path.is_dir():
+        storage = get_storage()
+        try:
+            status = storage.stat(path)
+        except FileNotFoundError:
+            return cls(path, None)
+        if stat.S_ISDIR(status.st_mode):
             return cls(path, None, is_directory=True)
-        if path.exists():
-            return cls(path, path.read_bytes())
-        return cls(path, None)
+        return cls(path, storage.read_bytes(path), mode=stat.S_IMODE(status.st_mode))
 
     @property
     def changelog(self) -> Changelog:
@@ -97,17 +133,40 @@ class ModifiablePath(ModifiableResource):
         return (
             self._content != self._original_content
             or self._is_directory != self._original_is_directory
+            or self._mode != self._original_mode
         )
 
+    @property
+    def files(self) -> tuple[Path, ...]:
+        return (self.path,)
+
+    def snapshot(self) -> bytes:
+        return pickle.dumps((self._content, self._is_directory, self._mode))
+
+    def restore(self, snapshot: bytes) -> None:
+        self._content, self._is_directory, self._mode = pickle.loads(snapshot)
+
     @property
     def exists(self) -> bool:
         return self._is_directory or self._content is not None
 
-    def read_text(self) -> str:
+    @property
+    def is_directory(self) -> bool:
+        return self._is_directory
+
+    @property
+    def mode(self) -> int | None:
+        """Permission bits of the file, if they are known."""
+        return self._mode
+
+    def read_bytes(self) -> bytes:
         if self._content is None:
             msg = f"{self.path} does not exist or is a directory"
             raise FileNotFoundError(msg)
-        return self._content.decode()
+        return self._content
+
+    def read_text(self) -> str:
+        return self.read_bytes().decode()
 
     def write_text(self, content: str, message: str | None = None) -> bool:
         encoded = content.encode()
@@ -119,23 +178,34 @@ class ModifiablePath(ModifiableResource):
             self._changelog.append(message)
         return True
 
+    def chmod(self, mode: int, message: str | None = None) -> bool:
+        """Set the permission bits that the file gets when it is dumped."""
+        if self._mode is not None and self._mode & mode == mode:
+            return False
+        self._mode = mode if self._mode is None else self._mode | mode
+        if message is not None:
+            self._changelog.append(message)
+        return True
+
     def remove(self, message: str | None = None) -> bool:
         if not self.exists:
             return False
         self._content = None
         self._is_directory = False
+        self._mode = None
         if message is not None:
             self._changelog.append(message)
         return True
 
     def dump(self) -> None:
+        with FileTransaction() as transaction:
+            self.stage(transaction)
+
+    def stage(self, transaction: FileTransaction) -> None:
         if not self.exists:
-            if self.path.is_dir():
-                shutil.rmtree(self.path)
-            else:
-                self.path.unlink(missing_ok=True)
+            transaction.remove(self.path)
             return
         if not self.changed:
             return
-        self.path.parent.mkdir(exist_ok=True, parents=True)
-        self.path.write_bytes(self._content or b"")
+        mode = self._mode if self._mode != self._original_mode else None
+        transaction.write_bytes(self.path, self._content or b"", mode)
@@ -0,0 +1,95 @@
+"""Run check hooks that do not share any files in parallel threads.
+
+Each `.LazyCheckHook` declares the files it modifies (and, through its trigger files,
+the files it inspects). Two hooks *conflict* if one of them modifies a file that the
+other inspects or modifies. :func:`build_dependencies` turns these declarations into a
+dependency graph: every hook waits for the earlier hooks in the canonical order that it
+conflicts with. For example, all hooks that modify :code:`.pre-commit-config.yaml` keep
+their relative order, while :code:`citation` and :code:`binder` can run concurrently.
+
+:func:`run_in_parallel` then runs the independent branches of this graph in a thread
+pool. If a task fails, no tasks after it are started, but earlier tasks still run, so
+that the first failure in the canonical order is raised, just like in a sequential run.
+Each task runs in a copy of the context of the caller, so that it reads from the same
+`.Storage` (see :func:`.use_storage`).
+"""
+
+from __future__ import annotations
+
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from compwa_policy.utilities.check_hook import LazyCheckHook
+
+
+def build_dependencies(hooks: Sequence[LazyCheckHook]) -> list[frozenset[int]]:
+    """Get the positions of the earlier hooks that each hook has to wait for.
+
+    >>> from compwa_policy.utilities.check_hook import FileSet, LazyCheckHook
+    >>> precommit = FileSet.create(".pre-commit-config.yaml")
+    >>> hooks = [
+    ...     LazyCheckHook("a", group="format", files=precommit, writes=precommit),
+    ...     LazyCheckHook("b", group="repo", files=FileSet.create("CITATION.cff")),
+    ...     LazyCheckHook("c", group="python", files=precommit),
+    ... ]
+    >>> build_dependencies(hooks)
+    [frozenset(), frozenset(), frozenset({0})]
+    """
+    return [
+        frozenset(
+            i for i, earlier in enumerate(hooks[:j]) if earlier.conflicts_with(hook)
+        )
+        for j, hook in enumerate(hooks)
+    ]
+
+
+def run_in_parallel(
+    tasks: Sequence[Callable[[], None]],
+    dependencies: Sequence[frozenset[int]],
+    max_workers: int | None = None,
+) -> None:
+    """Run each task once the tasks at the positions it depends on have finished.
+
+    Ready tasks are started in the order of their positions. The exception of the
+    failed task with the lowest position is re-raised once all running tasks finished.
+    """
+    remaining = [set(positions) for positions in dependencies]
+    dependents = _get_dependents(dependencies)
+    errors: dict[int, BaseException] = {}
+    with ThreadPoolExecutor(max_workers, thread_name_prefix="check") as executor:
+        running: dict[Future[None], int] = {}
+
+        def submit(candidates: Iterable[int]) -> None:
+            cutoff = min(errors, default=len(tasks))
+            for position in sorted(candidates):
+                if not remaining[position] and position < cutoff:
+                    context = contextvars.copy_context()
+                    future = executor.submit(context.run, tasks[position])
+                    running[future] = position
+
+        submit(range(len(tasks)))
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                position = running.pop(future)
+                exception = future.exception()
+                if exception is not None:
+                    errors[position] = exception
+                    continue
+                for dependent in dependents[position]:
+                    remaining[dependent].discard(position)
+                submit(dependents[position])
+    if errors:
+        raise errors[min(errors)]
+
+
+def _get_dependents(dependencies: Sequence[frozenset[int]]) -> list[list[int]]:
+    dependents: list[list[int]] = [[] for _ in dependencies]
+    for position, positions in enumerate(dependencies):
+        for dependency in positions:
+            dependents[dependency].append(position)
+    return dependents
@@ -11,12 +11,38 @@ Resources are discovered lazily through :meth:`Session.get`; adding another file
 therefore requires implementing
 :class:`~compwa_policy.utilities.resource.ModifiableResource`, without modifying
 :class:`Session`.
+
+Checks that do not share any files can run in parallel threads (see
+:mod:`~compwa_policy.utilities.schedule`). Each of them then runs in a
+:meth:`Session.scope`, which attributes its changes to its position in the canonical
+order, so that the collected changes do not depend on which thread came first.
+
+A session that is created with :code:`dry_run=True` never writes to disk. Its changes
+can instead be rendered as a unified :meth:`Session.diff`.
+
+Checks query the files through :meth:`Session.exists`, :meth:`Session.is_dir`,
+:meth:`Session.stat`, and :meth:`Session.read_bytes`. Each directory is listed only
+once per session and the listing is overlaid with the pending changes of the
+`.ModifiablePath` resources, so that a check sees the files that earlier checks created
+or removed, and a repeated query is a dictionary lookup.
+
+Checks whose inputs did not change can be skipped and their changes replayed (see
+`.HookMemo`). The session therefore reports which resources a check uses
+(:meth:`Session.record_usage`) and which paths it queries
+(:meth:`Session.record_queries`), and it exposes its loaded :attr:`Session.resources`.
+
+The files are read from a `.Storage`, which is the working tree by default. A session
+on a `.GitTree` or a `.MemoryStorage` has to be a :code:`dry_run`, because it can only
+render its changes as a :meth:`Session.diff`.
 """
 
 from __future__ import annotations
 
+import os
+import stat
 import sys
-from contextlib import AbstractContextManager
+import threading
+from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, TypeVar, cast
 
@@ -28,6 +54,13 @@ from compwa_policy.utilities.resource import (
     ModifiablePath,
     ModifiableResource,
 )
+from compwa_policy.utilities.storage import (
+    Storage,
+    WorkingTree,
+    get_storage,
+    use_storage,
+)
+from compwa_policy.utilities.transaction import FileTransaction
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -35,14 +68,15 @@ else:
     from typing_extensions import Self
 
 if TYPE_CHECKING:
-    from collections.abc import Hashable
+    from collections.abc import Generator, Hashable
     from types import TracebackType
 
 
 R = TypeVar("R", bound=ModifiableResource)
+_SPECIAL_NAMES = {"", "..", "."}
 
 
-class Session(AbstractContextManager):
+class Session(AbstractContextManager):  # noqa: PLR0904
     """Shared, mutable working-tree state for all check hooks.
 
     Load the managed files with :meth:`load` (or pass them in directly, e.g. in tests)
@@ -54,55 +88,186 @@ class Session(AbstractContextManager):
         self,
         precommit: ModifiablePrecommit | None = None,
         pyproject: ModifiablePyproject | None = None,
+        *,
+        dry_run: bool = False,
+        storage: Storage | None = None,
     ) -> None:
+        self.dry_run = dry_run
+        self.storage = get_storage() if storage is None else storage
+        """Storage from which the resources are loaded; the current one by default."""
+        if not dry_run and not isinstance(self.storage, WorkingTree):
+            msg = "A session on a storage other than the working tree must be a dry run"
+            raise ValueError(msg)
         self._loaded: dict[tuple[Hashable, ...], ModifiableResource] = {}
+        self._order: dict[tuple[Hashable, ...], tuple[int, int]] = {}
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._scoped_changelogs: dict[int, Changelog] = {}
+        self._unscoped_position = -1
         if precommit is not None:
             key = (type(precommit),)
             self._loaded[key] = precommit
+            self._track(key)
         if pyproject is not None:
             key = (type(pyproject),)
             self._loaded[key] = pyproject
+            self._track(key)
         self._entered: set[tuple[Hashable, ...]] = set()
         self._flushed: set[tuple[Hashable, ...]] = set()
         self._is_in_context = False
-        self.changelog: Changelog = []
+        self._changelog: Changelog = []
+        self.written: dict[Path, int] = {}
+        """Number of bytes that :meth:`flush` wrote to each file."""
+        self._directories: dict[Path, dict[str, bool]] = {}
+
+    @property
+    def changelog(self) -> Changelog:
         """Change messages that do not belong to one of the managed containers."""
+        return getattr(self._local, "changelog", self._changelog)
+
+    @changelog.setter
+    def changelog(self, value: Changelog) -> None:
+        if hasattr(self._local, "changelog"):
+            self._local.changelog = value
+        else:
+            self._changelog = value
 
     @classmethod
-    def load(cls, precommit: ModifiablePrecommit | None = None) -> Session:
+    def load(
+        cls, precommit: ModifiablePrecommit | None = None, *, dry_run: bool = False
+    ) -> Session:
         """Create a lazy session, optionally with an injected pre-commit resource."""
-        return cls(precommit=precommit)
+        return cls(precommit=precommit, dry_run=dry_run)
 
     def get(self, resource: type[R], /) -> R:
         """Return the one session-owned instance of *resource*, loading it lazily."""
         key = (resource,)
-        loaded = self._loaded.get(key)
-        if loaded is None:
-            loaded = resource.load()
-            self._loaded[key] = loaded
-        if self._is_in_context and key not in self._entered:
-            loaded.__enter__()  # noqa: PLC2801
-            self._entered.add(key)
+        with self._lock:
+            loaded = self._loaded.get(key)
+            if loaded is None:
+                with use_storage(self.storage):
+                    loaded = resource.load()
+                self._loaded[key] = loaded
+            if self._is_in_context and key not in self._entered:
+                loaded.__enter__()  # noqa: PLC2801
+                self._entered.add(key)
+            self._track(key)
         return cast("R", loaded)
 
     def get_path(self, path: Path | str, /) -> ModifiablePath:
-        """Return the session-owned generic resource for one working-tree path."""
+        """Return the session-owned generic resource for one path in the repository."""
         normalized = Path(path)
         key = (ModifiablePath, normalized)
-        loaded = self._loaded.get(key)
-        if loaded is None:
-            loaded = ModifiablePath.load_path(normalized)
-            self._loaded[key] = loaded
-        if self._is_in_context and key not in self._entered:
-            loaded.__enter__()  # noqa: PLC2801
-            self._entered.add(key)
+        with self._lock:
+            loaded = self._loaded.get(key)
+            if loaded is None:
+                with use_storage(self.storage):
+                    loaded = ModifiablePath.load_path(normalized)
+                self._loaded[key] = loaded
+            if self._is_in_context and key not in self._entered:
+                loaded.__enter__()  # noqa: PLC2801
+                self._entered.add(key)
+            self._track(key)
         return cast("ModifiablePath", loaded)
 
+    def exists(self, path: Path | str, /) -> bool:
+        """Whether *path* exists once the pending changes of the session are written."""
+        path = self.__query(path)
+        if path.name in _SPECIAL_NAMES:
+            return self.storage.exists(path)
+        pending = self.__get_pending(path)
+        if pending is not None:
+            return pending.exists
+        if self.__get_entry(path) is None:
+            return self.__has_pending_children(path)
+        return True
+
+    def is_dir(self, path: Path | str, /) -> bool:
+        """Whether *path* is a directory once the pending changes are written."""
+        path = self.__query(path)
+        if path.name in _SPECIAL_NAMES:
+            return self.storage.is_dir(path)
+        pending = self.__get_pending(path)
+        if pending is not None and not pending.is_directory:
+            return False
+        if self.__get_entry(path):
+            return True
+        return self.__has_pending_children(path)
+
+    def read_bytes(self, path: Path | str, /) -> bytes:
+        """Read the content that *path* has once the pending changes are written."""
+        path = self.__query(path)
+        pending = self.__get_pending(path)
+        if pending is not None:
+            return pending.read_bytes()
+        return self.storage.read_bytes(path)
+
+    def stat(self, path: Path | str, /) -> os.stat_result:
+        """Get the status of *path*, with the size and mode of its pending changes.
+
+        Raises `FileNotFoundError` if *path* does not exist once the pending changes are
+        written.
+        """
+        path = self.__query(path)
+        if path.name in _SPECIAL_NAMES:
+            return self.storage.stat(path)
+        entry = self.__get_entry(path)
+        pending = self.__get_pending(path)
+        if pending is None and entry is not None:
+            return self.storage.stat(path)
+        if pending is None or not pending.exists:
+            msg = f"{path} does not exist"
+            raise FileNotFoundError(msg)
+        fields = list(self.storage.stat(path)) if entry is not None else [0] * 10
+        if pending.is_directory:
+            fields[stat.ST_MODE] = stat.S_IFDIR | 0o755
+            return os.stat_result(fields)
+        mode = pending.mode
+        if mode is None:
+            mode = stat.S_IMODE(fields[stat.ST_MODE]) if entry is not None else 0o644
+        fields[stat.ST_MODE] = stat.S_IFREG | mode
+        fields[stat.ST_SIZE] = len(pending.read_bytes())
+        return os.stat_result(fields)
+
+    def __query(self, path: Path | str) -> Path:
+        path = Path(path)
+        queries: set[Path] | None = getattr(self._local, "queries", None)
+        if queries is not None:
+            queries.add(path)
+        return path
+
+    def __get_pending(self, path: Path) -> ModifiablePath | None:
+        with self._lock:
+            pending = self._loaded.get((ModifiablePath, path))
+        return cast("ModifiablePath | None", pending)
+
+    def __has_pending_children(self, directory: Path) -> bool:
+        with self._lock:
+            pending = [
+                cast("ModifiablePath", resource)
+                for key, resource in self._loaded.items()
+                if key[0] is ModifiablePath
+            ]
+        return any(
+            resource.exists and directory in resource.path.parents
+            for resource in pending
+        )
+
+    def __get_entry(self, path: Path) -> bool | None:
+        """Whether *path* is a directory in the storage, or `None` if it is missing."""
+        with self._lock:
+            entries = self._directories.get(path.parent)
+        if entries is None:
+            listed = self.storage.list_directory(path.parent)
+            with self._lock:
+                entries = self._directories.setdefault(path.parent, listed)
+        return entries.get(path.name)
+
     @property
     def precommit(self) -> ModifiablePrecommit:
         """The managed :code:`.pre-commit-config.yaml` file."""
         if (
-            not CONFIG_PATH.precommit.exists()
+            not self.exists(CONFIG_PATH.precommit)
             and (ModifiablePrecommit,) not in self._loaded
         ):
             msg = "This session has no .pre-commit-config.yaml loaded"
@@ -113,7 +278,7 @@ class Session(AbstractContextManager):
     def pyproject(self) -> ModifiablePyproject | None:
         """The managed :code:`pyproject.toml` file, if the repository has one."""
         if (
-            not CONFIG_PATH.pyproject.exists()
+            not self.exists(CONFIG_PATH.pyproject)
             and (ModifiablePyproject,) not in self._loaded
         ):
             return None
@@ -124,6 +289,81 @@ class Session(AbstractContextManager):
         """The managed :code:`pixi.toml` file."""
         return self.get(ModifiablePixi)
 
+    @contextmanager
+    def scope(self, position: int) -> Generator[None, None, None]:
+        """Attribute the changes of the current thread to the check at *position*.
+
+        Free-form messages are collected per position and resources are ordered by the
+        first position that used them. The collected changes are therefore the same as
+        if the checks had run one after the other in the order of their positions.
+        """
+        self._local.position = position
+        self._local.changelog = []
+        self._local.used = set()
+        try:
+            yield
+        finally:
+            messages = self._local.changelog
+            del self._local.position, self._local.changelog, self._local.used
+            with self._lock:
+                self._scoped_changelogs[position] = messages
+                self._unscoped_position = max(self._unscoped_position, position + 1)
+
+    @property
+    def resources(self) -> dict[tuple[Hashable, ...], ModifiableResource]:
+        """The loaded resources by their identity key, in the order they were loaded."""
+        with self._lock:
+            return dict(self._loaded)
+
+    @contextmanager
+    def record_usage(self) -> Generator[list[tuple[Hashable, ...]], None, None]:
+        """Collect the keys of the resources that the current thread uses.
+
+        The keys are listed in the order in which they are first used, so that the
+        usage can be repeated with :meth:`_track` to reproduce the collected changes.
+        """
+        outer = getattr(self._local, "usage", None)
+        usage: list[tuple[Hashable, ...]] = []
+        self._local.usage = usage
+        try:
+            yield usage
+        finally:
+            self._local.usage = outer
+
+    @contextmanager
+    def record_queries(self) -> Generator[set[Path], None, None]:
+        """Collect the paths that the current thread queries.
+
+        These are the paths that are passed to :meth:`exists`, :meth:`is_dir`,
+        :meth:`stat`, and :meth:`read_bytes`. They are inputs of a check just like the
+        resources of :meth:`record_usage`.
+        """
+        outer = getattr(self._local, "queries", None)
+        queries: set[Path] = set()
+        self._local.queries = queries
+        try:
+            yield queries
+        finally:
+            self._local.queries = outer
+
+    def _track(self, key: tuple[Hashable, ...]) -> None:
+        """Record the first position and rank at which a resource was used."""
+        usage: list[tuple[Hashable, ...]] | None = getattr(self._local, "usage", None)
+        if usage is not None and key not in usage:
+            usage.append(key)
+        position = getattr(self._local, "position", None)
+        if position is None:
+            with self._lock:
+                self._order.setdefault(key, (self._unscoped_position, len(self._order)))
+            return
+        used: set[tuple[Hashable, ...]] = self._local.used
+        if key in used:
+            return
+        used.add(key)
+        order = (position, len(used))
+        with self._lock:
+            self._order[key] = min(self._order.get(key, order), order)
+
     def collect_changes(self) -> Changelog:
         """Aggregate every reported change.
 
@@ -131,20 +371,61 @@ class Session(AbstractContextManager):
         mirrors the historical flat dispatch: free-form messages first (in the order the
         checks ran), then the container changelogs.
         """
-        messages: Changelog = list(self.changelog)
-        for resource in self._loaded.values():
-            messages += resource.changelog
+        messages: Changelog = list(self._changelog)
+        for position in sorted(self._scoped_changelogs):
+            messages += self._scoped_changelogs[position]
+        for key in sorted(self._loaded, key=self._order.__getitem__):
+            messages += self._loaded[key].changelog
         return messages
 
     def flush(self) -> Changelog:
-        """Write each changed resource at most once and return the run changelog."""
+        """Write each changed resource at most once and return the run changelog.
+
+        The resources are staged in one `.FileTransaction`, so if staging fails, none of
+        them are written. Each file is then replaced atomically, one after the other
+        (see `.FileTransaction.commit`). The number of bytes that were written for each
+        file is recorded in :attr:`written`.
+
+        In a :attr:`dry_run`, nothing is written and the changes are only returned.
+        """
         messages = self.collect_changes()
-        for resource_type, resource in self._loaded.items():
-            if resource_type not in self._flushed and resource.changed:
-                resource.dump()
-                self._flushed.add(resource_type)
+        if self.dry_run:
+            return messages
+        transaction, staged = self._stage()
+        transaction.commit()
+        with self._lock:
+            self._directories.clear()
+        self._flushed.update(staged)
+        self.written.update(transaction.written)
         return messages
 
+    def diff(self) -> str:
+        """Render the changes that :meth:`flush` would write as a unified diff.
+
+        The paths in the diff are relative to the working directory, like those of
+        :command:`git diff`, so that the output can be applied with :command:`git
+        apply`.
+        """
+        transaction, _ = self._stage()
+        try:
+            with use_storage(self.storage):
+                return transaction.diff()
+        finally:
+            transaction.rollback()
+
+    def _stage(self) -> tuple[FileTransaction, list[tuple[Hashable, ...]]]:
+        transaction = FileTransaction()
+        staged: list[tuple[Hashable, ...]] = []
+        try:
+            for resource_type, resource in self._loaded.items():
+                if resource_type not in self._flushed and resource.changed:
+                    resource.stage(transaction)
+                    staged.append(resource_type)
+        except BaseException:
+            transaction.rollback()
+            raise
+        return transaction, staged
+
     def __enter__(self) -> Self:
         self._is_in_context = True
         for resource_type, resource in self._loaded.items():
@@ -0,0 +1,397 @@
+"""Backends from which the checks read the files of the repository.
+
+By default, the files are read from the working tree. The :class:`GitTree` backend
+instead reads the files of a Git commit, without checking it out, so that the changes
+that the checks would make to a commit can be reported without touching any working
+tree (see :program:`policy --rev`). The :class:`MemoryStorage` backend holds the files
+in memory, which is convenient in tests.
+
+The backend that is currently in use is returned by :func:`get_storage` and can be
+replaced temporarily with :func:`use_storage`. The loaders of the managed files, the
+`.ParseCache`, the `.RepositoryIndex`, and the `.Session` all read through it. The
+backend is a context variable, so that each thread (and each task of
+:func:`.run_in_parallel`) replaces it independently.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import posixpath
+import stat
+import subprocess  # noqa: S404
+import sys
+import threading
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, final
+
+from attrs import frozen
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+if sys.version_info >= (3, 12):
+    from typing import override
+else:
+    from typing_extensions import override
+if TYPE_CHECKING:
+    from collections.abc import Generator, Mapping
+    from types import TracebackType
+
+    from compwa_policy.utilities.match import RepositoryIndex
+
+_MAX_SYMLINK_DEPTH = 40
+
+
+class Storage(ABC):
+    """Read-only view of the files of a repository.
+
+    Paths are relative to the current working directory, like those of the working
+    tree.
+    """
+
+    @abstractmethod
+    def read_bytes(self, path: Path | str) -> bytes:
+        """Read the content of a file, or raise `FileNotFoundError`."""
+
+    @abstractmethod
+    def stat(self, path: Path | str) -> os.stat_result:
+        """Get the status of a file or directory, or raise `FileNotFoundError`."""
+
+    @abstractmethod
+    def list_directory(self, directory: Path | str) -> dict[str, bool]:
+        """Get the names in a directory and whether each of them is a directory.
+
+        A directory that does not exist is empty.
+        """
+
+    @abstractmethod
+    def load_repository_index(self) -> RepositoryIndex:
+        """Create a `.RepositoryIndex` of the files that Git would report."""
+
+    def exists(self, path: Path | str) -> bool:
+        try:
+            self.stat(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def is_dir(self, path: Path | str) -> bool:
+        try:
+            return stat.S_ISDIR(self.stat(path).st_mode)
+        except FileNotFoundError:
+            return False
+
+    def read_text(self, path: Path | str) -> str:
+        return self.read_bytes(path).decode()
+
+
+@final
+class WorkingTree(Storage):
+    """The files on disk."""
+
+    @override
+    def read_bytes(self, path: Path | str) -> bytes:
+        return Path(path).read_bytes()
+
+    @override
+    def stat(self, path: Path | str) -> os.stat_result:
+        return os.stat(path)
+
+    @override
+    def list_directory(self, directory: Path | str) -> dict[str, bool]:
+        try:
+            with os.scandir(directory) as iterator:
+                return {
+                    entry.name: entry.is_dir()
+                    for entry in iterator
+                    if not entry.is_symlink() or os.path.exists(entry.path)
+                }
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+
+    @override
+    def load_repository_index(self) -> RepositoryIndex:
+        from compwa_policy.utilities.match import RepositoryIndex  # noqa: PLC0415
+
+        return RepositoryIndex.load()
+
+    @override
+    def exists(self, path: Path | str) -> bool:
+        return os.path.exists(path)
+
+    @override
+    def is_dir(self, path: Path | str) -> bool:
+        return os.path.isdir(path)
+
+
+@final
+class GitTree(Storage, AbstractContextManager):
+    """The files of a Git commit, read without checking it out.
+
+    The tree of the commit is listed once with :code:`git ls-tree` and the content of
+    the files is read through one persistent :code:`git cat-file --batch` process, which
+    is stopped on :meth:`close`. Only the part of the tree below the current working
+    directory is visible, like in the working tree.
+    """
+
+    def __init__(self, rev: str, directory: Path | str | None = None) -> None:
+        self.rev = rev
+        self.directory = Path.cwd() if directory is None else Path(directory)
+        self.__entries: dict[str, _TreeEntry] = {}
+        self.__children: dict[str, dict[str, str]] = {".": {}}
+        self.__contents: dict[str, bytes] = {}
+        self.__process: subprocess.Popen[bytes] | None = None
+        self.__lock = threading.Lock()
+        for line in self.__list_tree().split("\0"):
+            if not line:
+                continue
+            header, _, path = line.partition("\t")
+            mode, object_type, oid, size = header.split()
+            self.__entries[path] = _TreeEntry(
+                mode=int(mode, 8),
+                is_tree=object_type != "blob",
+                oid=oid,
+                size=0 if size == "-" else int(size),
+            )
+            parent = posixpath.dirname(path) or "."
+            self.__children.setdefault(parent, {})[posixpath.basename(path)] = path
+
+    def __list_tree(self) -> str:
+        result = subprocess.run(  # noqa: S603
+            ["git", "ls-tree", "-r", "-t", "-z", "--long", f"{self.rev}^{{tree}}"],  # noqa: S607
+            capture_output=True,
+            check=False,
+            cwd=self.directory,
+        )
+        if result.returncode != 0:
+            msg = f"Cannot read the files of {self.rev!r}: {result.stderr.decode().strip()}"
+            raise ValueError(msg)
+        return result.stdout.decode("utf-8")
+
+    @override
+    def read_bytes(self, path: Path | str) -> bytes:
+        normalized = self.__resolve(path)
+        entry = self.__entries.get(normalized) if normalized != "." else None
+        if entry is None:
+            if normalized in self.__children:
+                raise IsADirectoryError(str(path))
+            raise FileNotFoundError(str(path))
+        if entry.is_tree:
+            raise IsADirectoryError(str(path))
+        return self.__read_blob(entry.oid)
+
+    @override
+    def stat(self, path: Path | str) -> os.stat_result:
+        normalized = self.__resolve(path)
+        if normalized == ".":
+            return _create_stat(stat.S_IFDIR | 0o755, size=0, content_id=self.rev)
+        entry = self.__entries.get(normalized)
+        if entry is None:
+            raise FileNotFoundError(str(path))
+        if entry.is_tree:
+            return _create_stat(stat.S_IFDIR | 0o755, size=0, content_id=entry.oid)
+        return _create_stat(entry.mode, entry.size, content_id=entry.oid)
+
+    @override
+    def list_directory(self, directory: Path | str) -> dict[str, bool]:
+        children = self.__children.get(self.__resolve(directory), {})
+        listing: dict[str, bool] = {}
+        for name, path in children.items():
+            resolved = self.__resolve(path)
+            if resolved == ".":
+                listing[name] = True
+            elif resolved in self.__entries:
+                listing[name] = self.__entries[resolved].is_tree
+        return listing
+
+    @override
+    def load_repository_index(self) -> RepositoryIndex:
+        from compwa_policy.utilities.match import RepositoryIndex  # noqa: PLC0415
+
+        return RepositoryIndex(
+            tracked=[
+                path for path, entry in self.__entries.items() if not entry.is_tree
+            ]
+        )
+
+    def close(self) -> None:
+        """Stop the :code:`git cat-file` process."""
+        with self.__lock:
+            process, self.__process = self.__process, None
+        if process is not None:
+            _get_pipe(process.stdin).close()
+            process.wait()
+            _get_pipe(process.stdout).close()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        tb: TracebackType | None,
+    ) -> bool:
+        self.close()
+        return False
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __resolve(self, path: Path | str) -> str:
+        """Normalize a path and follow the symbolic link that it may point to."""
+        normalized = _normalize(path, self.directory)
+        for _ in range(_MAX_SYMLINK_DEPTH):
+            entry = self.__entries.get(normalized)
+            if entry is None or not stat.S_ISLNK(entry.mode):
+                return normalized
+            target = self.__read_blob(entry.oid).decode()
+            normalized = posixpath.normpath(
+                posixpath.join(posixpath.dirname(normalized), target)
+            )
+        msg = f"Too many levels of symbolic links in {path}"
+        raise OSError(msg)
+
+    def __read_blob(self, oid: str) -> bytes:
+        with self.__lock:
+            content = self.__contents.get(oid)
+            if content is not None:
+                return content
+            if self.__process is None:
+                self.__process = subprocess.Popen(
+                    ["git", "cat-file", "--batch"],  # noqa: S607
+                    cwd=self.directory,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                )
+            stdin = _get_pipe(self.__process.stdin)
+            stdout = _get_pipe(self.__process.stdout)
+            stdin.write(f"{oid}\n".encode())
+            stdin.flush()
+            header = stdout.readline().split()
+            if len(header) != 3:  # noqa: PLR2004
+                msg = f"Object {oid} of {self.rev!r} is missing"
+                raise FileNotFoundError(msg)
+            content = stdout.read(int(header[2]))
+            stdout.read(1)
+            self.__contents[oid] = content
+            return content
+
+
+@frozen
+class _TreeEntry:
+    mode: int
+    is_tree: bool
+    oid: str
+    size: int
+
+
+@final
+class MemoryStorage(Storage):
+    r"""Files that are held in memory.
+
+    >>> storage = MemoryStorage({"docs/conf.py": "project = 'demo'\n"})
+    >>> storage.is_dir("docs"), storage.exists("docs/index.md")
+    (True, False)
+    >>> storage.read_text("docs/conf.py")
+    "project = 'demo'\n"
+    """
+
+    def __init__(self, files: Mapping[str, bytes | str]) -> None:
+        self.__directory = Path.cwd()
+        self.__files: dict[str, bytes] = {}
+        self.__children: dict[str, dict[str, bool]] = {".": {}}
+        for path, content in files.items():
+            normalized = _normalize(path, self.__directory)
+            self.__files[normalized] = (
+                content.encode() if isinstance(content, str) else content
+            )
+            is_dir = False
+            while normalized != ".":
+                parent = posixpath.dirname(normalized) or "."
+                self.__children.setdefault(parent, {})[
+                    posixpath.basename(normalized)
+                ] = is_dir
+                normalized, is_dir = parent, True
+
+    @override
+    def read_bytes(self, path: Path | str) -> bytes:
+        normalized = _normalize(path, self.__directory)
+        if normalized in self.__children:
+            raise IsADirectoryError(str(path))
+        try:
+            return self.__files[normalized]
+        except KeyError:
+            raise FileNotFoundError(str(path)) from None
+
+    @override
+    def stat(self, path: Path | str) -> os.stat_result:
+        normalized = _normalize(path, self.__directory)
+        if normalized in self.__children:
+            return _create_stat(stat.S_IFDIR | 0o755, size=0, content_id=normalized)
+        content = self.read_bytes(path)
+        content_id = hashlib.sha1(content, usedforsecurity=False).hexdigest()
+        return _create_stat(stat.S_IFREG | 0o644, len(content), content_id)
+
+    @override
+    def list_directory(self, directory: Path | str) -> dict[str, bool]:
+        return dict(self.__children.get(_normalize(directory, self.__directory), {}))
+
+    @override
+    def load_repository_index(self) -> RepositoryIndex:
+        from compwa_policy.utilities.match import RepositoryIndex  # noqa: PLC0415
+
+        return RepositoryIndex(tracked=self.__files)
+
+
+def _normalize(path: Path | str, directory: Path) -> str:
+    """Convert a path to a normalized POSIX path relative to *directory*.
+
+    >>> _normalize("./docs/../README.md", Path("/repo"))
+    'README.md'
+    >>> _normalize("/repo/docs", Path("/repo")), _normalize("", Path("/repo"))
+    ('docs', '.')
+    """
+    if os.path.isabs(path):
+        path = os.path.relpath(path, directory)
+    return posixpath.normpath(Path(path).as_posix())
+
+
+def _create_stat(mode: int, size: int, content_id: str) -> os.stat_result:
+    """Create a file status with an inode number that changes with the content.
+
+    The modification time is zero, because the content of a stored file never changes.
+    The `.ParseCache` therefore only has to compare the size and inode number.
+    """
+    inode = int(
+        hashlib.sha1(content_id.encode(), usedforsecurity=False).hexdigest()[:15], 16
+    )
+    return os.stat_result((mode, inode, 0, 1, 0, 0, size, 0, 0, 0), {"st_mtime_ns": 0})
+
+
+def _get_pipe(stream: IO[bytes] | None) -> IO[bytes]:
+    if stream is None:
+        msg = "The git cat-file process has no pipes"
+        raise RuntimeError(msg)
+    return stream
+
+
+_WORKING_TREE = WorkingTree()
+_STORAGE: ContextVar[Storage] = ContextVar("storage", default=_WORKING_TREE)
+
+
+def get_storage() -> Storage:
+    """Get the `Storage` from which the files of the repository are currently read."""
+    return _STORAGE.get()
+
+
+@contextmanager
+def use_storage(storage: Storage) -> Generator[Storage, None, None]:
+    """Read the files of the repository from *storage* within this context."""
+    token = _STORAGE.set(storage)
+    try:
+        yield storage
+    finally:
+        _STORAGE.reset(token)
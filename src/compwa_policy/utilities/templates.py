@@ -0,0 +1,103 @@
+"""Bundled templates, parsed once per process.
+
+The checks compare the files of a repository with the templates under the
+:file:`.github` and :file:`.template` directories of this package. Each template is
+read and parsed at most once per process, through a dedicated `.ParseCache`. The
+canonical form of a parsed JSON, TOML, or YAML template is its pickled document, from
+which `load_json_template`, `load_toml_template`, and `load_yaml_template` hand out a
+new copy on each call, so that a check can modify its copy freely. The CLI also
+persists these pickles in the user cache directory (see `get_template_cache`), so that
+later processes skip the parsing altogether.
+"""
+
+from __future__ import annotations
+
+import json
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from compwa_policy.utilities import COMPWA_POLICY_DIR
+from compwa_policy.utilities.parse_cache import ParseCache
+from compwa_policy.utilities.storage import WorkingTree
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+    from jinja2 import Environment
+    from tomlkit import TOMLDocument
+
+
+_TEMPLATE_CACHE = ParseCache(storage=WorkingTree())
+
+
+def get_template_cache() -> ParseCache:
+    """Get the `.ParseCache` of the bundled templates.
+
+    Its :attr:`~.ParseCache.directory` is set by the CLI, unless it runs with
+    :code:`--no-cache`.
+    """
+    return _TEMPLATE_CACHE
+
+
+def load_json_template(relative_path: Path | str) -> Any:
+    """Get a copy of a JSON template, relative to the package directory."""
+    return _TEMPLATE_CACHE.parse(
+        COMPWA_POLICY_DIR / relative_path,
+        flavor="json",
+        parser=json.loads,
+        mutable=True,
+    )
+
+
+def load_toml_template(relative_path: Path | str) -> TOMLDocument:
+    """Get a copy of a TOML template, parsed with :mod:`tomlkit`."""
+    import tomlkit  # noqa: PLC0415
+
+    return _TEMPLATE_CACHE.parse(
+        COMPWA_POLICY_DIR / relative_path,
+        flavor=f"tomlkit=={tomlkit.__version__}",
+        parser=lambda content: tomlkit.loads(content.decode()),
+        mutable=True,
+    )
+
+
+def load_yaml_template(relative_path: Path | str) -> Any:
+    """Get a copy of a YAML template, parsed with the prettier round-trip parser.
+
+    The *relative_path* is relative to the package directory, for instance
+    :code:`.github/workflows/ci.yml`.
+    """
+    import ruamel.yaml  # noqa: PLC0415
+
+    from compwa_policy.utilities.yaml import create_prettier_round_trip_yaml  # noqa: PLC0415
+
+    return _TEMPLATE_CACHE.parse(
+        COMPWA_POLICY_DIR / relative_path,
+        flavor=f"ruamel.yaml=={ruamel.yaml.__version__} (prettier round-trip)",
+        parser=create_prettier_round_trip_yaml().load,
+        mutable=True,
+    )
+
+
+def read_template(relative_path: Path | str) -> str:
+    """Get the content of a template, relative to the package directory."""
+    return _TEMPLATE_CACHE.parse(
+        COMPWA_POLICY_DIR / relative_path, flavor="text", parser=bytes.decode
+    )
+
+
+def render_template(name: str, context: Mapping[str, Any]) -> str:
+    """Render a Jinja template from the :file:`.template` directory."""
+    return _get_jinja_environment().get_template(name).render(context)
+
+
+@cache
+def _get_jinja_environment() -> Environment:
+    """Create the Jinja environment once, so that it keeps its compiled templates."""
+    from jinja2 import Environment, FileSystemLoader  # noqa: PLC0415
+
+    return Environment(
+        autoescape=True,
+        loader=FileSystemLoader(COMPWA_POLICY_DIR / ".template"),
+    )
@@ -14,8 +14,10 @@ if TYPE_CHECKING:
 
 
 def to_toml_array(items: Iterable[Any], multiline: bool | None = None) -> Array:
+    from compwa_policy.utilities.pyproject._lazy import unwrap_views  # noqa: PLC0415
+
     array = tomlkit.array()
-    array.extend(items)
+    array.extend(unwrap_views(items))
     if multiline is None:
         array.multiline(len(array) > 1)
     else:
@@ -24,11 +26,13 @@ def to_toml_array(items: Iterable[Any], multiline: bool | None = None) -> Array:
 
 
 def to_inline_table(value: Mapping[str, Any]) -> InlineTable:
+    from compwa_policy.utilities.pyproject._lazy import unwrap_views  # noqa: PLC0415
+
     table = tomlkit.inline_table()
     if value:
         table.append(None, tomlkit.ws(" "))
     for key, val in value.items():
-        table[key] = val
+        table[key] = unwrap_views(val)
     if value:
         table.append(None, tomlkit.ws(" "))
     return table
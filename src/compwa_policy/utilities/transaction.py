@@ -0,0 +1,335 @@
+"""Write several files at once, without ever leaving one of them half-written.
+
+A `FileTransaction` stages the new content of each file in memory. On
+:meth:`~FileTransaction.commit`, the content is written to a temporary file next to each
+target, all temporary files are synced to disk in one batch, and then moved into place
+with :func:`os.replace`, which is atomic. Finally, each affected directory is synced
+once, so that the renames are durable as well. If the run is interrupted before the
+commit, the original files are left untouched.
+
+Instead of committing them, the staged changes can also be rendered as a unified
+:meth:`~FileTransaction.diff` against the files of the current `.Storage`.
+"""
+
+from __future__ import annotations
+
+import difflib
+import os
+import shutil
+import stat
+import sys
+import tempfile
+from contextlib import AbstractContextManager, suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, final
+
+from compwa_policy.utilities.instrumentation import REMOVE_EVENT, WRITE_EVENT
+from compwa_policy.utilities.storage import Storage, get_storage
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import TracebackType
+
+
+@final
+class FileTransaction(AbstractContextManager):
+    """Stage file writes and removals, and apply them all on :meth:`commit`.
+
+    Used as a context manager, the transaction is committed on exit, or rolled back if
+    an exception was raised.
+    """
+
+    def __init__(self) -> None:
+        self.__staged: dict[Path, tuple[bytes, int | None]] = {}
+        self.__removed: set[Path] = set()
+        self.__written: dict[Path, int] = {}
+
+    @property
+    def written(self) -> dict[Path, int]:
+        """Number of bytes that were staged for each path."""
+        return dict(self.__written)
+
+    def write_bytes(
+        self, path: Path | str, content: bytes, mode: int | None = None
+    ) -> None:
+        """Stage the new *content* of a file.
+
+        The file keeps its permission bits, unless a *mode* is given. New files get the
+        default permissions of the current :func:`~os.umask`.
+        """
+        path = Path(path)
+        if path.is_symlink():
+            path = path.resolve()
+        self.__removed.discard(path)
+        self.__staged[path] = (content, mode)
+        self.__written[path] = len(content)
+
+    def write_text(
+        self, path: Path | str, content: str, mode: int | None = None
+    ) -> None:
+        self.write_bytes(path, content.encode(), mode)
+
+    def remove(self, path: Path | str) -> None:
+        """Stage the removal of a file or directory."""
+        path = Path(path)
+        self.__staged.pop(path, None)
+        self.__written.pop(path, None)
+        self.__removed.add(path)
+
+    def commit(self) -> None:
+        """Write the staged files and apply the staged removals.
+
+        Either all files are staged in temporary files or, if that fails, none of the
+        targets are touched. Each file is then replaced atomically, but not all files
+        at once: if one of the replacements fails, the files before it have already
+        been replaced. The remaining temporary files are removed in any case.
+        """
+        staged, self.__staged = self.__staged, {}
+        removed, self.__removed = self.__removed, set()
+        directories: set[Path] = set()
+        pending = _write_temporary_files(staged)
+        try:
+            for path, temporary_path in list(pending.items()):
+                os.replace(temporary_path, path)
+                del pending[path]
+                directories.add(path.parent)
+                sys.audit(WRITE_EVENT, str(path), len(staged[path][0]))
+        finally:
+            for temporary_path in pending.values():
+                temporary_path.unlink(missing_ok=True)
+        for path in sorted(removed):
+            if _remove(path):
+                directories.add(path.parent)
+                sys.audit(REMOVE_EVENT, str(path))
+        for directory in directories:
+            _fsync_directory(directory)
+
+    def rollback(self) -> None:
+        """Discard all staged changes and leave the files as they were."""
+        self.__staged.clear()
+        self.__removed.clear()
+        self.__written.clear()
+
+    def diff(self) -> str:
+        """Render the staged changes as a unified diff against the current storage."""
+        storage = get_storage()
+        changes: dict[Path, tuple[bytes | None, int | None]] = dict(self.__staged)
+        for path in self.__removed:
+            for file in _iter_files(storage, path):
+                changes[file] = (None, None)
+        return "".join(
+            _diff_file(
+                path,
+                _read_bytes(storage, path),
+                content,
+                old_mode=_read_mode(storage, path),
+                new_mode=mode,
+            )
+            for path, (content, mode) in sorted(changes.items())
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        _exc_value: BaseException | None,
+        _tb: TracebackType | None,
+    ) -> bool:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+
+def _write_temporary_files(
+    staged: dict[Path, tuple[bytes, int | None]],
+) -> dict[Path, Path]:
+    """Write each staged file next to its target and sync all of them as a batch."""
+    temporary_files: dict[Path, tuple[int, Path]] = {}
+    try:
+        for path, (content, mode) in staged.items():
+            temporary_files[path] = _write_temporary_file(path, content, mode)
+        for fd, _ in temporary_files.values():
+            os.fsync(fd)
+    except BaseException:
+        for _, temporary_path in temporary_files.values():
+            temporary_path.unlink(missing_ok=True)
+        raise
+    finally:
+        for fd, _ in temporary_files.values():
+            os.close(fd)
+    return {
+        path: temporary_path for path, (_, temporary_path) in temporary_files.items()
+    }
+
+
+def _write_temporary_file(
+    path: Path, content: bytes, mode: int | None
+) -> tuple[int, Path]:
+    """Write the content of *path* to a temporary file, which is left open for syncing."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temporary_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view) :]
+        os.chmod(temporary_path, _get_mode(path) if mode is None else mode)
+    except BaseException:
+        os.close(fd)
+        os.unlink(temporary_path)
+        raise
+    return fd, Path(temporary_path)
+
+
+def _remove(path: Path) -> bool:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+        return True
+    if path.exists() or path.is_symlink():
+        path.unlink()
+        return True
+    return False
+
+
+def _get_mode(path: Path) -> int:
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_get_umask()
+
+
+def _get_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Make renames in a directory durable; not supported on Windows."""
+    if os.name == "nt":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        with suppress(OSError):
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _iter_files(storage: Storage, path: Path) -> Iterator[Path]:
+    if not storage.is_dir(path):
+        if storage.exists(path):
+            yield path
+        return
+    for name, is_dir in sorted(storage.list_directory(path).items()):
+        if is_dir:
+            yield from _iter_files(storage, path / name)
+        else:
+            yield path / name
+
+
+def _read_bytes(storage: Storage, path: Path) -> bytes | None:
+    try:
+        return storage.read_bytes(path)
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+
+
+def _read_mode(storage: Storage, path: Path) -> int | None:
+    try:
+        return stat.S_IMODE(storage.stat(path).st_mode)
+    except FileNotFoundError:
+        return None
+
+
+def _diff_file(
+    path: Path,
+    old: bytes | None,
+    new: bytes | None,
+    *,
+    old_mode: int | None = None,
+    new_mode: int | None = None,
+) -> str:
+    r"""Render the changes to one file in the unified diff format of Git.
+
+    A *new_mode* of `None` means that the file keeps its permission bits. Like Git, only
+    the executable bit is compared.
+
+    >>> print(_diff_file(Path("a.txt"), b"one\ntwo\n", b"one\n2\n"), end="")
+    --- a/a.txt
+    +++ b/a.txt
+    @@ -1,2 +1,2 @@
+     one
+    -two
+    +2
+    >>> print(_diff_file(Path("new.txt"), None, b"text"), end="")
+    --- /dev/null
+    +++ b/new.txt
+    @@ -0,0 +1 @@
+    +text
+    \ No newline at end of file
+    >>> print(
+    ...     _diff_file(Path("run.sh"), b"", b"", old_mode=0o644, new_mode=0o755), end=""
+    ... )
+    diff --git a/run.sh b/run.sh
+    old mode 100644
+    new mode 100755
+    """
+    header = _format_mode_header(path, old, new, old_mode, new_mode)
+    if old == new:
+        return header
+    from_file = "/dev/null" if old is None else f"a/{path.as_posix()}"
+    to_file = "/dev/null" if new is None else f"b/{path.as_posix()}"
+    try:
+        old_lines = _split_lines(old)
+        new_lines = _split_lines(new)
+    except UnicodeDecodeError:
+        return f"{header}Binary files {from_file} and {to_file} differ\n"
+    diff = difflib.unified_diff(old_lines, new_lines, from_file, to_file)
+    return header + "".join(diff)
+
+
+def _format_mode_header(
+    path: Path,
+    old: bytes | None,
+    new: bytes | None,
+    old_mode: int | None,
+    new_mode: int | None,
+) -> str:
+    """Render the extended header of Git for a change of the executable bit."""
+    if new is None or new_mode is None:
+        return ""
+    git_path = path.as_posix()
+    header = f"diff --git a/{git_path} b/{git_path}\n"
+    if old is None or old_mode is None:
+        if not new_mode & 0o111:
+            return ""
+        return f"{header}new file mode {_to_git_mode(new_mode)}\n"
+    if _to_git_mode(old_mode) == _to_git_mode(new_mode):
+        return ""
+    return (
+        f"{header}old mode {_to_git_mode(old_mode)}\n"
+        f"new mode {_to_git_mode(new_mode)}\n"
+    )
+
+
+def _to_git_mode(mode: int) -> str:
+    return "100755" if mode & 0o111 else "100644"
+
+
+def _split_lines(content: bytes | None) -> list[str]:
+    if content is None:
+        return []
+    lines = content.decode().splitlines(keepends=True)
+    if lines and not lines[-1].endswith("\n"):
+        lines[-1] += "\n\\ No newline at end of file\n"
+    return lines
@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 import json
+import pickle  # noqa: S403
 import sys
 from collections import abc
 from collections.abc import Iterable, Sized
-from functools import cache
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from compwa_policy.utilities import CONFIG_PATH
 from compwa_policy.utilities.resource import Changelog, ModifiableResource
+from compwa_policy.utilities.storage import get_storage
+from compwa_policy.utilities.transaction import FileTransaction
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -40,20 +42,33 @@ class _ModifiableJsonResource(ModifiableResource):
 
     @classmethod
     def load(cls) -> Self:
-        if not cls.path.exists():
+        storage = get_storage()
+        if not storage.exists(cls.path):
             return cls({}, exists=False)
-        with cls.path.open() as stream:
-            return cls(json.load(stream), exists=True)
+        return cls(json.loads(storage.read_text(cls.path)), exists=True)
 
     @property
     def changelog(self) -> Changelog:
         return self._changelog
 
+    @property
+    def files(self) -> tuple[Path, ...]:
+        return (self.path,)
+
+    def snapshot(self) -> bytes:
+        return pickle.dumps(self._document)
+
+    def restore(self, snapshot: bytes) -> None:
+        self._document = pickle.loads(snapshot)
+
     def dump(self) -> None:
+        with FileTransaction() as transaction:
+            self.stage(transaction)
+
+    def stage(self, transaction: FileTransaction) -> None:
         if not self._changelog:
             return
-        self.path.parent.mkdir(exist_ok=True)
-        _dump_config(self._document, self.path)
+        transaction.write_text(self.path, _dumps_config(self._document))
 
 
 class ModifiableVscodeSettings(_ModifiableJsonResource):
@@ -136,13 +151,6 @@ def get_unwanted_extensions(session: Session, /) -> set[str]:
     return session.get(ModifiableVscodeExtensions).get_unwanted()
 
 
-@cache
-def _get_extension_recommendations(key: str) -> set[str]:
-    config = __load_config(CONFIG_PATH.vscode_extensions)
-    extensions = config.get(key, set())
-    return {ext.lower() for ext in extensions}
-
-
 def remove_settings(session: Session, /, keys: RemovedKeys) -> None:
     session.get(ModifiableVscodeSettings).remove(keys)
 
@@ -230,13 +238,6 @@ def _determine_new_value(old: V, new: V, sort: bool = False) -> V:
     return new
 
 
-def _update_settings_if_changed(old: dict, new: dict) -> Changelog:
-    if old == new:
-        return []
-    _dump_config(new, CONFIG_PATH.vscode_settings)
-    return ["Updated VS Code settings"]
-
-
 def add_extension_recommendation(session: Session, /, extension_name: str) -> None:
     session.get(ModifiableVscodeExtensions).add_recommendation(extension_name)
 
@@ -245,33 +246,6 @@ def add_unwanted_extension(session: Session, /, extension_name: str) -> None:
     session.get(ModifiableVscodeExtensions).add_unwanted(extension_name)
 
 
-def __add_extension(extension_name: str, key: str) -> Changelog:
-    config = __load_config(CONFIG_PATH.vscode_extensions, create=True)
-    recommended_extensions = _to_lower(config.get(key, []))
-    extension_name = extension_name.lower()
-    if extension_name not in set(recommended_extensions):
-        recommended_extensions.append(extension_name)
-        config[key] = sorted(recommended_extensions)
-        _dump_config(config, CONFIG_PATH.vscode_extensions)
-        return [f'Added VS Code extension recommendation "{extension_name}"']
-    return []
-
-
-def __remove_extension(extension_name: str, key: str) -> Changelog:
-    if not CONFIG_PATH.vscode_extensions.exists():
-        return []
-    with open(CONFIG_PATH.vscode_extensions) as stream:
-        config = json.load(stream)
-    recommended_extensions = _to_lower(config.get(key, []))
-    extension_name = extension_name.lower()
-    if extension_name in recommended_extensions:
-        recommended_extensions.remove(extension_name)
-        config[key] = sorted(recommended_extensions)
-        _dump_config(config, CONFIG_PATH.vscode_extensions)
-        return [f'Removed VS Code extension recommendation "{extension_name}"']
-    return []
-
-
 def remove_extension_recommendation(
     session: Session, /, extension_name: str, *, unwanted: bool = False
 ) -> None:
@@ -284,15 +258,5 @@ def _to_lower(lst: list[str]) -> list[str]:
     return [e.lower() for e in lst]
 
 
-def _dump_config(config: dict, path: Path) -> None:
-    with open(path, "w") as stream:
-        json.dump(config, stream, ensure_ascii=False, indent=2, sort_keys=True)
-        stream.write("\n")
-
-
-def __load_config(path: Path, create: bool = False) -> dict:
-    if not path.exists() and create:
-        path.parent.mkdir(exist_ok=True)
-        return {}
-    with open(path) as stream:
-        return json.load(stream)
+def _dumps_config(config: dict) -> str:
+    return json.dumps(config, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
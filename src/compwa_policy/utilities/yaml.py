@@ -13,6 +13,8 @@ from compwa_policy.utilities import write
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from compwa_policy.utilities.session import Session
+
 
 class _IncreasedYamlIndent(yaml.Dumper):
     def increase_indent(self, flow: bool = False, indentless: bool = False) -> None:  # noqa: ARG002
@@ -34,6 +36,13 @@ def create_prettier_round_trip_yaml() -> YAML:
     return yaml_parser
 
 
+def dumps_yaml(yaml_parser: YAML, data: Any) -> str:
+    """Serialize a YAML document with a configured :code:`ruamel.yaml` parser."""
+    stream = io.StringIO()
+    yaml_parser.dump(data, stream)
+    return stream.getvalue()
+
+
 def read_preserved_yaml(src: str) -> Any:
     """Get a :code:`ruamel.yaml` object from a YAML string.
 
@@ -46,7 +55,12 @@ def read_preserved_yaml(src: str) -> Any:
     return YAML(typ="rt").load(src)
 
 
-def write_yaml(definition: dict, output_path: Path | str) -> None:
+def write_yaml(
+    definition: dict,
+    output_path: Path | str,
+    *,
+    session: Session | None = None,
+) -> None:
     """Write a `dict` to disk with standardized YAML formatting."""
     stream = io.StringIO()
     yaml.dump(
@@ -56,4 +70,4 @@ def write_yaml(definition: dict, output_path: Path | str) -> None:
         Dumper=_IncreasedYamlIndent,
         default_flow_style=False,
     )
-    write(stream.getvalue(), output_path)
+    write(stream.getvalue(), output_path, session=session)
@@ -1,14 +1,17 @@
+import json
 import re
 from collections.abc import Callable
+from contextlib import suppress
 from pathlib import Path
 from textwrap import dedent
 from typing import cast
 
 import pytest
 import typer
-from attrs import evolve
+from typer.testing import CliRunner
 
 from compwa_policy import characterization
+from compwa_policy.cli import check_dev_files_main, hook_app
 from compwa_policy.cli._checks import (
     ALL_GROUPS,
     CHECK_DEV_FILES_PATTERN,
@@ -16,14 +19,28 @@ from compwa_policy.cli._checks import (
     check_dev_python_version,
     compute_context,
     dispatch,
+    prefetch_revisions,
     run_all,
     run_checks,
+    select_hooks,
 )
 from compwa_policy.cli._options import build_arguments
+from compwa_policy.errors import PolicyError
 from compwa_policy.repo import readthedocs
+from compwa_policy.utilities import check_hook as check_hook_module
 from compwa_policy.utilities import match
-from compwa_policy.utilities.check_hook import CheckContext, Group
+from compwa_policy.utilities.caching import get_repository_cache_dir
+from compwa_policy.utilities.check_hook import (
+    CheckContext,
+    CheckHook,
+    FileSet,
+    Group,
+    LazyCheckHook,
+)
+from compwa_policy.utilities.precommit.revisions import get_revision_resolver
+from compwa_policy.utilities.schedule import build_dependencies
 from compwa_policy.utilities.session import Session
+from compwa_policy.utilities.storage import GitTree, use_storage
 
 _PYPROJECT = dedent("""
     [project]
@@ -59,8 +76,8 @@ _EXPECTED_CHECK_HOOKS = (
     ("pytest", "python"),
     ("pyupgrade", "python"),
     ("ruff", "python"),
-    ("upgrade_lock", "github"),
     ("dependabot", "github"),
+    ("upgrade_lock", "github"),
     ("readthedocs", "repo"),
     ("deprecated", "repo"),
     ("vscode", "repo"),
@@ -72,7 +89,7 @@ _EXPECTED_CHECK_HOOKS = (
 
 
 def _clear_caches() -> None:
-    match._git_ls_files_cmd.cache_clear()
+    match._load_repository_index.cache_clear()
     characterization.has_documentation.cache_clear()
     characterization.has_notebooks.cache_clear()
     characterization.has_python_code.cache_clear()
@@ -147,26 +164,33 @@ def describe_all_groups():
 def describe_check_hooks():
     def preserve_the_original_flat_dispatch_order():
         actual = tuple(
-            (hook.run.__module__.rsplit(".", maxsplit=1)[-1], hook.group)
+            (hook.module.rsplit(".", maxsplit=1)[-1], hook.group)
             for hook in CHECK_HOOKS
         )
         assert actual == _EXPECTED_CHECK_HOOKS
 
+    def declare_the_same_group_as_their_check_module():
+        for hook in CHECK_HOOKS:
+            implementation = hook.load()
+            assert implementation.run.__module__ == hook.module
+            assert implementation.group == hook.group
+
     @pytest.mark.parametrize("group", sorted(ALL_GROUPS))
     def dispatch_a_group_as_a_subsequence_of_the_canonical_order(
         group: Group,
         monkeypatch: pytest.MonkeyPatch,
     ):
         calls = []
-        hooks = tuple(
-            evolve(
-                hook,
+        implementations = {
+            hook.module: CheckHook(
+                hook.group,
                 run=lambda _session, _args, _ctx, name=name: calls.append(name),
-                enabled=lambda _args, _ctx: True,
             )
             for hook, (name, _) in zip(CHECK_HOOKS, _EXPECTED_CHECK_HOOKS, strict=True)
+        }
+        monkeypatch.setattr(
+            check_hook_module, "_import_check_hook", implementations.__getitem__
         )
-        monkeypatch.setattr("compwa_policy.cli._checks.CHECK_HOOKS", hooks)
         args = build_arguments(dev_python_version="3.12")
         context = CheckContext(False, False, [], {})
 
@@ -196,6 +220,32 @@ def describe_check_hooks():
         assert re.search(CHECK_DEV_FILES_PATTERN, "src/package/module.py") is None
 
 
+def describe_select_hooks():
+    def selects_every_hook_when_files_are_unknown():
+        assert select_hooks() == CHECK_HOOKS
+
+    def preserves_the_canonical_order_for_modified_files():
+        selected = select_hooks(filenames=["pyproject.toml"])
+        assert selected
+        assert len(selected) < len(CHECK_HOOKS)
+        assert selected == tuple(
+            hook for hook in CHECK_HOOKS if hook.files.matches("pyproject.toml")
+        )
+
+    def matches_files_below_trigger_directories():
+        selected = select_hooks(filenames=[".github/workflows/ci.yml"])
+        names = {hook.module.rsplit(".", maxsplit=1)[-1] for hook in selected}
+        assert {"workflows", "dependabot"} <= names
+
+    def skips_every_hook_for_ordinary_source_files():
+        assert select_hooks(filenames=["src/package/module.py"]) == ()
+
+    def respects_groups():
+        selected = select_hooks(frozenset({"env"}), filenames=["pyproject.toml"])
+        assert selected
+        assert {hook.group for hook in selected} == {"env"}
+
+
 def _runnable_repo(directory: Path, git_commit: Callable[[Path], None]) -> None:
     (directory / ".pre-commit-config.yaml").write_text("repos: []\n")
     (directory / "pyproject.toml").write_text(
@@ -239,6 +289,142 @@ def describe_run_all():
         assert not capsys.readouterr().out
         assert _snapshot_files(tmp_path) == before
 
+    def skips_checks_that_are_not_triggered(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture,
+        git_commit: Callable[[Path], None],
+    ):
+        _runnable_repo(tmp_path, git_commit)
+        monkeypatch.chdir(tmp_path)
+        before = _snapshot_files(tmp_path)
+        args = build_arguments(dev_python_version="3.12", package_manager="uv")
+        assert run_all(args, filenames=["src/x/module.py"]) == 0
+        assert not capsys.readouterr().out
+        assert _snapshot_files(tmp_path) == before
+
+    def runs_checks_triggered_by_modified_files(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture,
+        git_commit: Callable[[Path], None],
+    ):
+        _runnable_repo(tmp_path, git_commit)
+        monkeypatch.chdir(tmp_path)
+        args = build_arguments(dev_python_version="3.12", package_manager="uv")
+        assert run_all(args, filenames=[".pre-commit-config.yaml"]) == 1
+        capsys.readouterr()
+
+    def prints_a_diff_without_writing(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture,
+        git_commit: Callable[[Path], None],
+    ):
+        _runnable_repo(tmp_path, git_commit)
+        monkeypatch.chdir(tmp_path)
+        before = _snapshot_files(tmp_path)
+        args = build_arguments(dev_python_version="3.12", package_manager="uv")
+        assert run_all(args, diff=True) == 1
+        output = capsys.readouterr().out
+        assert "--- a/pyproject.toml\n+++ b/pyproject.toml\n" in output
+        assert _snapshot_files(tmp_path) == before
+
+    def reports_the_changes_of_a_commit(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture,
+        git_commit: Callable[[Path], None],
+    ):
+        _runnable_repo(tmp_path, git_commit)
+        (tmp_path / "pyproject.toml").unlink()
+        monkeypatch.chdir(tmp_path)
+        before = _snapshot_files(tmp_path)
+        with GitTree("HEAD") as tree, use_storage(tree):
+            args = build_arguments(dev_python_version="3.12", package_manager="uv")
+            assert run_all(args, diff=True, dry_run=True) == 1
+        output = capsys.readouterr().out
+        assert "--- a/pyproject.toml\n+++ b/pyproject.toml\n" in output
+        assert _snapshot_files(tmp_path) == before
+        assert not get_repository_cache_dir().exists()
+
+
+def describe_check_dev_files_command():
+    @pytest.mark.parametrize(
+        ("arguments", "expected"),
+        [
+            ([], (None, True, False, None)),
+            (["pyproject.toml"], ([Path("pyproject.toml")], True, False, None)),
+            (["--all", "pyproject.toml"], (None, True, False, None)),
+            (["--no-cache"], (None, False, False, None)),
+            (["--diff"], (None, True, True, None)),
+            (["--jobs", "1"], (None, True, False, 1)),
+        ],
+    )
+    def forwards_modified_files(
+        arguments: list[str],
+        expected: tuple[list[Path] | None, bool, bool, int | None],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.chdir(tmp_path)
+        calls = []
+
+        def fake_run_all(
+            _args,
+            filenames=None,
+            *,
+            use_cache=True,
+            diff=False,
+            dry_run=False,
+            jobs=None,
+        ):
+            assert not dry_run
+            calls.append((filenames, use_cache, diff, jobs))
+            return 0
+
+        monkeypatch.setattr("compwa_policy.cli.run_all", fake_run_all)
+        result = CliRunner().invoke(hook_app, arguments)
+        assert result.exit_code == 0, result.output
+        assert calls == [expected]
+
+    def writes_profiles(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        git_commit: Callable[[Path], None],
+    ):
+        _runnable_repo(tmp_path, git_commit)
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(
+            hook_app,
+            [
+                "--dev-python-version=3.12",
+                "--no-cache",
+                "--profile",
+                "--profile-json=profile.json",
+                "--profile-trace=trace.json",
+            ],
+        )
+        assert result.exit_code == 1, result.output
+        assert re.search(r"^check +wall \[ms\]", result.output, re.MULTILINE)
+        profiles = json.loads((tmp_path / "profile.json").read_text())
+        names = [profile["name"] for profile in profiles]
+        assert names[0] == "(prefetch revisions)"
+        assert names[-1] == "(flush)"
+        assert "format.precommit" in names
+        assert sum(profile["files_written"] for profile in profiles) > 0
+        trace = json.loads((tmp_path / "trace.json").read_text())
+        assert {event["name"] for event in trace["traceEvents"]} >= set(names)
+
+    def forwards_subcommands_to_the_policy_command(
+        monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+    ):
+        monkeypatch.setattr("sys.argv", ["check-dev-files", "migrate", "--help"])
+        with pytest.raises(SystemExit) as exception:
+            check_dev_files_main()
+        assert exception.value.code == 0
+        assert "check-dev-files migrate" in capsys.readouterr().out
+
 
 def describe_run_checks():
     def aggregates_config_changelogs_into_collected_changes(
@@ -258,6 +444,204 @@ def describe_run_checks():
             assert set(session.pyproject.changelog) <= set(changes)
 
 
+def _populated_repo(directory: Path, git_commit: Callable[[Path], None]) -> None:
+    files = {
+        ".constraints/py3.12.txt": "numpy==2.0.0\n",
+        ".cspell.json": "{}\n",
+        ".envrc": "layout anaconda\n",
+        ".prettierignore": "*.ipynb\n",
+        ".vscode/settings.json": '{"editor.formatOnSave": false}\n',
+        "commitlint.config.js": "module.exports = {};\n",
+        "docs/index.ipynb": '{"cells": [], "metadata": {}, "nbformat": 4}\n',
+        "environment.yml": "name: x\ndependencies:\n  - python==3.12.*\n",
+        "labels.toml": "",
+        "README.md": "# x\n",
+        "requirements.txt": "labels\nnumpy\n",
+    }
+    for name, content in files.items():
+        path = directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    _runnable_repo(directory, git_commit)
+
+
+def _run_checks_in(
+    directory: Path, monkeypatch: pytest.MonkeyPatch, jobs: int | None
+) -> tuple[list[str], dict[str, bytes]]:
+    monkeypatch.chdir(directory)
+    _clear_caches()
+    args = build_arguments(
+        dev_python_version="3.12", package_manager="uv", repo_name="x"
+    )
+    ctx = compute_context(args)
+    with Session.load() as session:
+        run_checks(session, args, ctx, jobs=jobs)
+        changes = session.flush()
+    return changes, _snapshot_files(directory)
+
+
+def _legacy_repo(directory: Path, git_commit: Callable[[Path], None]) -> None:
+    files = {
+        ".flake8": "[flake8]\n",
+        ".github/ISSUE_TEMPLATE/bug_report.md": "",
+        ".github/pull_request_template.md": "",
+        ".gitpod.yml": "tasks: []\n",
+        ".markdownlint.json": "{}\n",
+        ".mypy.ini": "[mypy]\n",
+        ".prettierrc": "{}\n",
+        ".pydocstyle": "[pydocstyle]\n",
+        ".pylintrc": "[MASTER]\n",
+        ".python-version": "3.12\n",
+        ".readthedocs.yml": "version: 2\n",
+        ".taplo.toml": "",
+        ".tombi.toml": "",
+        ".zenodo.json": '{"title": "x", "creators": [{"name": "Doe, Jane"}]}\n',
+        "LICENSE": "",
+        "binder/apt.txt": "graphviz\n",
+        "docs/_relink_references.py": "",
+        "docs/conf.py": "",
+        "pyrightconfig.json": "{}\n",
+        "setup.py": "",
+        "taplo.toml": "",
+        "tests/test_x.py": "",
+    }
+    for name, content in files.items():
+        path = directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    _populated_repo(directory, git_commit)
+
+
+def _is_covered(files: FileSet, path: Path) -> bool:
+    return files.matches(path) or path in files.directories
+
+
+def describe_run_checks_in_parallel():
+    def declare_the_files_they_modify():
+        for hook in CHECK_HOOKS:
+            assert hook.writes != FileSet(), hook.module
+            assert hook.conflicts_with(hook), hook.module
+
+    @pytest.mark.parametrize("populate", [_populated_repo, _legacy_repo])
+    def use_only_the_files_they_declare(
+        populate: Callable[[Path, Callable[[Path], None]], None],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        git_commit: Callable[[Path], None],
+    ):
+        populate(tmp_path, git_commit)
+        monkeypatch.chdir(tmp_path)
+        args = build_arguments(
+            dev_python_version="3.12", package_manager="uv", repo_name="x"
+        )
+        ctx = compute_context(args)
+        undeclared: list[tuple[str, str, str]] = []
+        with Session.load(dry_run=True) as session:
+            for hook in CHECK_HOOKS:
+                before = {
+                    key: (resource.changed, resource.snapshot())
+                    for key, resource in session.resources.items()
+                }
+                with (
+                    session.record_usage() as usage,
+                    session.record_queries() as queries,
+                    suppress(PolicyError),
+                ):
+                    hook(session, args, ctx)
+                undeclared.extend(
+                    (hook.module, "reads", str(path))
+                    for path in sorted(queries)
+                    if not _is_covered(hook.reads, path)
+                )
+                for key in usage:
+                    resource = session.resources[key]
+                    after = (resource.changed, resource.snapshot())
+                    modified = after != before.get(key, (False, after[1]))
+                    for path in resource.files:
+                        if not _is_covered(hook.reads, path):
+                            undeclared.append((hook.module, "reads", str(path)))
+                        if modified and not _is_covered(hook.writes, path):
+                            undeclared.append((hook.module, "writes", str(path)))
+        assert undeclared == []
+
+    def runs_checks_without_shared_files_concurrently():
+        dependencies = build_dependencies(CHECK_HOOKS)
+        independent = [
+            hook for hook, d in zip(CHECK_HOOKS, dependencies, strict=True) if not d
+        ]
+        assert len(independent) > 1
+
+    def produces_the_same_changes_and_files_as_a_sequential_run(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        git_commit: Callable[[Path], None],
+    ):
+        _populated_repo(tmp_path / "sequential", git_commit)
+        expected = _run_checks_in(tmp_path / "sequential", monkeypatch, jobs=1)
+        assert expected[0]
+        for i in range(3):
+            directory = tmp_path / f"parallel-{i}"
+            _populated_repo(directory, git_commit)
+            assert _run_checks_in(directory, monkeypatch, jobs=8) == expected
+
+
+def describe_prefetch_revisions():
+    def declare_the_precommit_repos_they_add(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        git_commit: Callable[[Path], None],
+    ):
+        _populated_repo(tmp_path, git_commit)
+        monkeypatch.chdir(tmp_path)
+        _clear_caches()
+        args = build_arguments(
+            dev_python_version="3.12",
+            package_manager="uv",
+            repo_name="x",
+            type_checker=["ty"],
+        )
+        ctx = compute_context(args)
+        added: dict[str, set[str]] = {}
+        current: list[LazyCheckHook] = []
+
+        def resolve(repo_url: str) -> None:
+            added.setdefault(current[-1].module, set()).add(repo_url)
+
+        monkeypatch.setattr(get_revision_resolver(), "resolve", resolve)
+        with Session.load() as session:
+            for hook in CHECK_HOOKS:
+                current.append(hook)
+                hook(session, args, ctx)
+        assert added
+        for hook in CHECK_HOOKS:
+            assert added.get(hook.module, set()) <= set(hook.precommit_repos)
+
+    def resolves_repos_that_are_not_yet_listed(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        git_commit: Callable[[Path], None],
+    ):
+        _runnable_repo(tmp_path, git_commit)
+        (tmp_path / ".pre-commit-config.yaml").write_text(
+            "repos:\n"
+            "  - repo: https://github.com/astral-sh/ruff-pre-commit\n"
+            "    rev: v0.1.0\n"
+            "    hooks:\n"
+            "      - id: ruff-check\n"
+        )
+        monkeypatch.chdir(tmp_path)
+        args = build_arguments(dev_python_version="3.12", package_manager="uv")
+        prefetched: list[str] = []
+        monkeypatch.setattr(get_revision_resolver(), "prefetch", prefetched.extend)
+        prefetch_revisions(args, compute_context(args), CHECK_HOOKS)
+        assert "https://github.com/psf/black-pre-commit-mirror" not in prefetched
+        assert "https://github.com/astral-sh/ruff-pre-commit" not in prefetched
+        assert (
+            "https://github.com/editorconfig-checker/editorconfig-checker.python"
+            in (prefetched)
+        )
+
+
 def describe_dispatch():
     def raises_typer_exit(
         tmp_path: Path,
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import os
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from compwa_policy.cli import _checks, _fingerprint
+from compwa_policy.cli._checks import CHECK_DEV_FILES, run_all
+from compwa_policy.cli._fingerprint import (
+    compute_fingerprint,
+    get_fingerprint_path,
+    has_fingerprint,
+    store_fingerprint,
+)
+from compwa_policy.cli._options import build_arguments
+from compwa_policy.utilities import match
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _fingerprint_of(**overrides: str) -> str:
+    match._load_repository_index.cache_clear()
+    args = build_arguments(dev_python_version="3.12", **overrides)
+    return compute_fingerprint(args, CHECK_DEV_FILES)
+
+
+def describe_compute_fingerprint():
+    @pytest.mark.usefixtures("repository")
+    def is_stable():
+        assert _fingerprint_of() == _fingerprint_of()
+
+    def ignores_content_of_files_that_trigger_no_check(repository: Path):
+        before = _fingerprint_of()
+        (repository / "src" / "x" / "module.py").write_text("x = 2\n")
+        assert _fingerprint_of() == before
+
+    def covers_files_that_trigger_checks(repository: Path):
+        before = _fingerprint_of()
+        (repository / ".pre-commit-config.yaml").write_text("repos: []  # edit\n")
+        assert _fingerprint_of() != before
+
+    def covers_added_files(repository: Path):
+        before = _fingerprint_of()
+        (repository / "notebook.ipynb").write_text("{}")
+        assert _fingerprint_of() != before
+
+    @pytest.mark.usefixtures("repository")
+    def covers_arguments():
+        assert _fingerprint_of(repo_name="a") != _fingerprint_of(repo_name="b")
+
+    @pytest.mark.usefixtures("repository")
+    def covers_templates(
+        tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+    ):
+        template_dir = tmp_path_factory.mktemp("templates")
+        (template_dir / "ci.yml").write_text("on: push\n")
+        monkeypatch.setattr(_fingerprint, "TEMPLATE_DIRECTORIES", (template_dir,))
+        monkeypatch.setattr(_fingerprint, "COMPWA_POLICY_DIR", template_dir.parent)
+        before = _fingerprint_of()
+        (template_dir / "ci.yml").write_text("on: pull_request\n")
+        assert _fingerprint_of() != before
+
+
+def describe_has_fingerprint():
+    @pytest.mark.usefixtures("repository")
+    def matches_stored_fingerprint():
+        assert not has_fingerprint("abc")
+        store_fingerprint("abc")
+        assert has_fingerprint("abc")
+        assert not has_fingerprint("def")
+
+    @pytest.mark.usefixtures("repository")
+    def expires():
+        store_fingerprint("abc")
+        expired = time.time() - _fingerprint.MAX_AGE.total_seconds() - 1
+        os.utime(get_fingerprint_path(), (expired, expired))
+        assert not has_fingerprint("abc")
+
+
+def describe_run_all():
+    @pytest.fixture
+    def runs(monkeypatch: pytest.MonkeyPatch) -> list[bool]:
+        calls: list[bool] = []
+
+        def fake_run(*_args, use_cache: bool = True, **_kwargs) -> int:
+            calls.append(use_cache)
+            return 0
+
+        monkeypatch.setattr(_checks, "_run", fake_run)
+        return calls
+
+    @pytest.mark.usefixtures("repository")
+    def skips_run_without_changes(runs: list[bool]):
+        args = build_arguments(dev_python_version="3.12")
+        assert run_all(args) == 0
+        assert run_all(args) == 0
+        assert runs == [True]
+
+    @pytest.mark.usefixtures("repository")
+    def does_not_store_fingerprint_of_incremental_runs(runs: list[bool]):
+        args = build_arguments(dev_python_version="3.12")
+        assert run_all(args, filenames=["pyproject.toml"]) == 0
+        assert run_all(args) == 0
+        assert runs == [True, True]
+
+    @pytest.mark.usefixtures("repository")
+    def does_not_compute_fingerprint_of_incremental_runs(
+        runs: list[bool], monkeypatch: pytest.MonkeyPatch
+    ):
+        computed: list[str] = []
+
+        def recording_compute_fingerprint(*args) -> str:
+            computed.append(compute_fingerprint(*args))
+            return computed[-1]
+
+        monkeypatch.setattr(
+            _checks, "compute_fingerprint", recording_compute_fingerprint
+        )
+        args = build_arguments(dev_python_version="3.12")
+        assert run_all(args) == 0
+        assert run_all(args, filenames=["pyproject.toml"]) == 0
+        assert len(computed) == 1
+        assert runs == [True, True]
+
+    @pytest.mark.usefixtures("repository")
+    def can_ignore_cache(runs: list[bool]):
+        args = build_arguments(dev_python_version="3.12")
+        assert run_all(args) == 0
+        assert run_all(args, use_cache=False) == 0
+        assert runs == [True, False]
+
+    @pytest.mark.usefixtures("repository")
+    def stores_fingerprint_only_after_runs_without_changes(
+        capsys: pytest.CaptureFixture,
+    ):
+        args = build_arguments(dev_python_version="3.12", package_manager="uv")
+        assert run_all(args) == 1
+        capsys.readouterr()
+        assert not get_fingerprint_path().exists()
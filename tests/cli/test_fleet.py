@@ -0,0 +1,89 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from compwa_policy.cli import app
+from compwa_policy.cli.fleet import check_repository, run_fleet
+from compwa_policy.utilities.caching import get_repository_cache_dir
+
+
+@pytest.fixture
+def _restore_working_directory(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(Path.cwd())
+
+
+@pytest.mark.usefixtures("_restore_working_directory")
+def describe_check_repository():
+    def captures_the_changes_of_a_repository(
+        tmp_path: Path, create_repository: Callable[..., Path]
+    ):
+        repository = create_repository(tmp_path / "a", name="a")
+        report = check_repository(repository)
+        assert report.directory == repository
+        assert report.exit_code == 1
+        assert ".pre-commit-config.yaml" in report.output
+        assert Path.cwd() == repository
+
+    def does_not_reuse_results_of_another_repository(
+        tmp_path: Path, create_repository: Callable[..., Path]
+    ):
+        with_notebook = create_repository(tmp_path / "a", name="a", notebook=True)
+        without_notebook = create_repository(tmp_path / "b", name="b")
+        check_repository(with_notebook)
+        check_repository(without_notebook)
+        assert "nbstripout" in (with_notebook / ".pre-commit-config.yaml").read_text()
+        assert (
+            "nbstripout"
+            not in (without_notebook / ".pre-commit-config.yaml").read_text()
+        )
+
+    def uses_the_cache_of_a_repository_only_if_enabled(
+        tmp_path: Path, create_repository: Callable[..., Path]
+    ):
+        first = create_repository(tmp_path / "a", name="a")
+        second = create_repository(tmp_path / "b", name="b")
+        check_repository(first)
+        assert not get_repository_cache_dir(first).exists()
+        check_repository(second, repository_cache=True)
+        assert get_repository_cache_dir(second).exists()
+
+    def reports_errors(tmp_path: Path, create_repository: Callable[..., Path]):
+        repository = create_repository(tmp_path / "a", name="a")
+        (repository / "pyproject.toml").write_text("[project\n")
+        report = check_repository(repository)
+        assert report.exit_code == 1
+        assert report.output
+
+
+def describe_run_fleet():
+    def checks_repositories_in_worker_processes(
+        tmp_path: Path, create_repository: Callable[..., Path]
+    ):
+        directories = [
+            create_repository(tmp_path / name, name=name) for name in ("a", "b", "c")
+        ]
+        reports = run_fleet(directories, max_workers=2)
+        assert [report.directory for report in reports] == directories
+        assert [report.exit_code for report in reports] == [1, 1, 1]
+        for directory in directories:
+            assert (directory / ".github" / "workflows" / "ci.yml").exists()
+            assert (
+                f'name = "{directory.name}"'
+                in (directory / "pyproject.toml").read_text()
+            )
+
+
+def describe_fleet_command():
+    def prints_one_report(tmp_path: Path, create_repository: Callable[..., Path]):
+        directories = [
+            create_repository(tmp_path / name, name=name) for name in ("a", "b")
+        ]
+        result = CliRunner().invoke(
+            app, ["fleet", "--jobs", "2", *map(str, directories)]
+        )
+        assert result.exit_code == 1
+        assert f"== {directories[0]} ==" in result.output
+        assert f"== {directories[1]} ==" in result.output
+        assert "Checked 2 repositories: 2 with changes or errors" in result.output
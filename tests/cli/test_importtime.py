@@ -0,0 +1,68 @@
+import re
+import subprocess  # noqa: S404
+import sys
+
+import pytest
+
+from compwa_policy.cli._checks import CHECK_HOOKS
+
+_HELP_IMPORT_BUDGET_MS = 500
+_IMPORT_TIME_LINE = re.compile(
+    r"^import time:\s+\d+ \|\s+(?P<cumulative>\d+) \| +(?P<module>\S+)$"
+)
+
+
+def _import_times(*args: str) -> dict[str, int]:
+    """Run the :program:`policy` CLI under :code:`-X importtime`.
+
+    Returns the cumulative import time in microseconds of each imported module.
+    """
+    process = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "from compwa_policy.cli import main; main()",
+            *args,
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    import_times: dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match is not None:
+            import_times[match["module"]] = int(match["cumulative"])
+    return import_times
+
+
+def describe_policy_help():
+    @pytest.fixture(scope="module")
+    def import_times() -> dict[str, int]:
+        return _import_times("--help")
+
+    def does_not_import_check_modules(import_times: dict[str, int]):
+        check_modules = {hook.module for hook in CHECK_HOOKS}
+        assert check_modules.isdisjoint(import_times)
+
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "html2text",
+            "jinja2",
+            "pydantic_settings",
+            "ruamel.yaml",
+            "setuptools",
+            "tomlkit",
+        ],
+    )
+    def does_not_import_heavy_dependencies(import_times: dict[str, int], module: str):
+        assert module not in import_times
+
+    def stays_within_import_budget():
+        fastest_ms = min(
+            _import_times("--help")["compwa_policy.cli"] / 1000 for _ in range(3)
+        )
+        assert fastest_ms < _HELP_IMPORT_BUDGET_MS
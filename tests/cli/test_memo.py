@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import pickle  # noqa: S403
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+import pytest
+from attrs import evolve
+
+from compwa_policy.cli._checks import run_all
+from compwa_policy.cli._memo import MAX_SIZE, HookMemo, get_memo_path
+from compwa_policy.cli._options import build_arguments
+from compwa_policy.utilities import check_hook as check_hook_module
+from compwa_policy.utilities.check_hook import (
+    CheckContext,
+    FileSet,
+    LazyCheckHook,
+    check_hook,
+)
+from compwa_policy.utilities.session import Session
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+
+    from compwa_policy import Arguments
+
+_CONTEXT = CheckContext(
+    is_python_repo=True,
+    has_notebooks=False,
+    doc_apt_packages=[],
+    environment_variables={},
+)
+
+
+@pytest.fixture
+def repository(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    create_repository: Callable[..., Path],
+) -> Path:
+    create_repository(tmp_path, files={"README.md": "# Alpha\n"})
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[str]]:
+    """Register a check module that records each time that its check runs."""
+    calls: list[str] = []
+
+    @check_hook(group="repo")
+    def check(session: Session, args: Arguments, context: CheckContext) -> None:
+        _ = args, context
+        calls.append("run")
+        readme = session.get_path("README.md")
+        readme.write_text(readme.read_text().upper(), "Capitalized README.md")
+        pyproject = session.pyproject
+        assert pyproject is not None
+        pyproject.add_dependency("attrs")
+        session.changelog.append("Checked README.md")
+
+    module = ModuleType(_HOOK.module)
+    module.check = check  # ty:ignore[unresolved-attribute]
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    check_hook_module._import_check_hook.cache_clear()
+    yield calls
+    check_hook_module._import_check_hook.cache_clear()
+
+
+_HOOK = LazyCheckHook(
+    "memo_test_check",
+    group="repo",
+    files=FileSet.create("README.md", "pyproject.toml"),
+)
+
+
+def _run(path: Path, max_size: int = MAX_SIZE) -> tuple[list[str], str, str]:
+    memo = HookMemo(path, max_size)
+    args = build_arguments(dev_python_version="3.12")
+    with Session(dry_run=True) as session:
+        memo.run(_HOOK, session, args, _CONTEXT)
+        changes = session.flush()
+        readme = session.get_path("README.md").read_text()
+        pyproject = session.pyproject
+        assert pyproject is not None
+    memo.save()
+    return changes, readme, pyproject.dumps()
+
+
+def describe_hook_memo():
+    @pytest.mark.usefixtures("repository")
+    def replays_changes_without_running_the_check(calls: list[str], tmp_path: Path):
+        path = tmp_path / ".cache" / "memo.pickle"
+        expected = _run(path)
+        assert calls == ["run"]
+        assert _run(path) == expected
+        assert calls == ["run"]
+        changes, readme, pyproject = expected
+        assert changes == [
+            "Checked README.md",
+            "Capitalized README.md",
+            "Listed attrs as a dependency",
+        ]
+        assert readme == "# ALPHA\n"
+        assert 'dependencies = ["attrs"]' in pyproject
+
+    def runs_the_check_only_if_a_file_that_it_reads_changed(
+        calls: list[str], repository: Path, tmp_path: Path
+    ):
+        path = tmp_path / "memo.pickle"
+        _run(path)
+        (repository / "src" / "x" / "module.py").write_text("x = 2\n")
+        _run(path)
+        assert calls == ["run"]
+        (repository / "README.md").write_text("# Beta\n")
+        _, readme, _ = _run(path)
+        assert readme == "# BETA\n"
+        assert calls == ["run", "run"]
+
+    def runs_the_check_again_if_a_probed_directory_is_created(repository: Path):
+        hook = evolve(_HOOK, probes=FileSet.create("tests"))
+        args = build_arguments(dev_python_version="3.12")
+
+        def compute_key() -> str | None:
+            return HookMemo(None).compute_key(hook, Session(), args, _CONTEXT)
+
+        key = compute_key()
+        assert key is not None
+        (repository / "tests").mkdir()
+        assert compute_key() != key
+
+    def evicts_the_least_recently_used_entries(
+        calls: list[str], repository: Path, tmp_path: Path
+    ):
+        path = tmp_path / "memo.pickle"
+        _run(path)
+        size = HookMemo(path).size
+        (repository / "README.md").write_text("# Gamma\n")
+        _run(path, max_size=size)
+        assert HookMemo(path).size == size
+        _run(path)
+        assert calls == ["run", "run"]
+        (repository / "README.md").write_text("# Alpha\n")
+        _run(path)
+        assert calls == ["run", "run", "run"]
+
+
+class _Exploit:
+    def __init__(self, marker: Path) -> None:
+        self.marker = marker
+
+    def __reduce__(self) -> tuple[Callable[..., None], tuple[Path]]:
+        return type(self.marker).touch, (self.marker,)
+
+
+def describe_run_all():
+    def never_loads_pickles_from_the_repository(
+        repository: Path, tmp_path: Path, capsys: pytest.CaptureFixture
+    ):
+        marker = tmp_path.parent / f"{tmp_path.name}-exploited"
+        cache_dir = repository / ".cache" / "compwa-policy"
+        cache_dir.mkdir(parents=True)
+        (cache_dir / "hooks.pickle").write_bytes(pickle.dumps(_Exploit(marker)))
+        args = build_arguments(dev_python_version="3.12")
+        run_all(args)
+        run_all(args)
+        capsys.readouterr()
+        assert not marker.exists()
+        assert get_memo_path().exists()
+        assert not get_memo_path().is_relative_to(repository)
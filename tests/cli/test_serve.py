@@ -0,0 +1,158 @@
+import io
+import os
+import socket
+import stat
+import threading
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+import typer
+
+from compwa_policy.cli.serve import PolicyServer, run_request
+from compwa_policy.client import get_socket_path, request
+from compwa_policy.utilities.precommit.revisions import get_revision_resolver
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> Path:
+    return tmp_path / "policy.sock"
+
+
+@pytest.fixture
+def server(socket_path: Path) -> Iterator[PolicyServer]:
+    with PolicyServer(socket_path) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            yield server
+        finally:
+            server.shutdown()
+            thread.join()
+
+
+@pytest.mark.usefixtures("server")
+def describe_policy_server():
+    def runs_checks_in_the_directory_of_the_client(
+        socket_path: Path,
+        tmp_path: Path,
+        git_add: Callable[[Path], None],
+        create_repository: Callable[..., Path],
+    ):
+        repository = create_repository(tmp_path / "repo")
+        cwd = Path.cwd()
+        stdout = io.StringIO()
+        arguments = ["--dev-python-version=3.12", "--no-cache"]
+        exit_code = request(
+            arguments, repository, socket_path=socket_path, stdout=stdout
+        )
+        assert exit_code == 1
+        assert "Created .github/workflows/ci.yml workflow" in stdout.getvalue()
+        assert (repository / ".github" / "workflows" / "ci.yml").exists()
+        assert Path.cwd() == cwd
+
+        git_add(repository)
+        stdout = io.StringIO()
+        exit_code = request(
+            arguments, repository, socket_path=socket_path, stdout=stdout
+        )
+        assert not stdout.getvalue()
+        assert exit_code == 0
+
+    def forwards_usage_errors(socket_path: Path, tmp_path: Path):
+        stderr = io.StringIO()
+        exit_code = request(
+            ["--unknown"], tmp_path, socket_path=socket_path, stderr=stderr
+        )
+        assert exit_code == 2
+        assert "--unknown" in stderr.getvalue()
+
+    def uses_the_environment_of_the_client(
+        socket_path: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        create_repository: Callable[..., Path],
+    ):
+        repository = create_repository(tmp_path / "repo")
+        not_a_directory = tmp_path / "mirror"
+        not_a_directory.touch()
+        arguments = ["--dev-python-version=3.12", "--no-cache"]
+        stderr = io.StringIO()
+        exit_code = request(
+            arguments,
+            repository,
+            environment={"COMPWA_POLICY_MIRROR_DIR": str(not_a_directory)},
+            socket_path=socket_path,
+            stderr=stderr,
+        )
+        assert exit_code == 2
+        assert "--mirror-dir" in stderr.getvalue()
+        assert "COMPWA_POLICY_MIRROR_DIR" not in os.environ
+
+        monkeypatch.setenv("COMPWA_POLICY_MIRROR_DIR", str(not_a_directory))
+        exit_code = request(
+            arguments,
+            repository,
+            environment={},
+            socket_path=socket_path,
+            stdout=io.StringIO(),
+        )
+        assert exit_code == 1
+        assert os.environ["COMPWA_POLICY_MIRROR_DIR"] == str(not_a_directory)
+
+    def refuses_to_start_twice(socket_path: Path):
+        with pytest.raises(typer.BadParameter, match="already listening"):
+            PolicyServer(socket_path)
+
+    def is_only_accessible_to_the_user(socket_path: Path):
+        assert stat.S_IMODE(socket_path.stat().st_mode) == 0o600
+
+
+def describe_socket_directory():
+    def is_created_privately(tmp_path: Path):
+        socket_path = tmp_path / "runtime" / "policy.sock"
+        with PolicyServer(socket_path):
+            mode = socket_path.parent.stat().st_mode
+        assert stat.S_IMODE(mode) == 0o700
+
+    def is_refused_if_other_users_can_write_to_it(tmp_path: Path):
+        directory = tmp_path / "shared"
+        directory.mkdir()
+        directory.chmod(0o777)
+        with pytest.raises(typer.BadParameter, match="Other users can write"):
+            PolicyServer(directory / "policy.sock")
+
+    def defaults_to_a_directory_of_the_user(monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv("COMPWA_POLICY_SOCKET", raising=False)
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        assert get_socket_path().parent.name == f"compwa-policy-{os.getuid()}"
+
+
+def describe_run_request():
+    def forgets_revisions_of_earlier_runs(tmp_path: Path):
+        resolver = get_revision_resolver()
+        resolver.add_resolved({"https://github.com/ComPWA/policy": None})
+        stderr = io.StringIO()
+        assert run_request(tmp_path, ["--unknown"], io.StringIO(), stderr) == 2
+        assert "https://github.com/ComPWA/policy" not in resolver.get_resolved()
+
+
+def describe_request():
+    def returns_none_without_daemon(tmp_path: Path):
+        assert request([], tmp_path, socket_path=tmp_path / "missing.sock") is None
+
+    def ignores_sockets_of_other_users(
+        socket_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        user = os.getuid()
+        with PolicyServer(socket_path):
+            monkeypatch.setattr(os, "getuid", lambda: user + 1)
+            assert request([], socket_path=socket_path) is None
+
+    def replaces_stale_sockets(socket_path: Path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(str(socket_path))
+        assert request([], socket_path=socket_path) is None
+        with PolicyServer(socket_path):
+            assert socket_path.exists()
+        assert not socket_path.exists()
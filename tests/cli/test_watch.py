@@ -0,0 +1,128 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from compwa_policy.cli.watch import FileWatcher, run_modified
+from compwa_policy.utilities.check_hook import FileSet
+from compwa_policy.utilities.match import RepositoryIndex
+from compwa_policy.utilities.precommit.revisions import get_revision_resolver
+from compwa_policy.utilities.transaction import FileTransaction
+
+
+def describe_file_watcher():
+    def reports_modified_trigger_files(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        create_repository: Callable[..., Path],
+    ):
+        create_repository(tmp_path)
+        monkeypatch.chdir(tmp_path)
+        watcher = FileWatcher(FileSet.create("pyproject.toml", directories=[".github"]))
+        assert not watcher.poll()
+
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "y"\n')
+        (tmp_path / "src" / "x" / "module.py").write_text("x = 2\n")
+        (tmp_path / ".github").mkdir()
+        (tmp_path / ".github" / "dependabot.yml").touch()
+        assert watcher.poll() == [".github/dependabot.yml", "pyproject.toml"]
+        assert not watcher.poll()
+
+        (tmp_path / "pyproject.toml").unlink()
+        assert watcher.poll() == ["pyproject.toml"]
+
+    def ignores_files_that_git_ignores(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        create_repository: Callable[..., Path],
+    ):
+        create_repository(tmp_path)
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".gitignore").write_text(".venv/\n")
+        watcher = FileWatcher(FileSet.create(patterns=[r".*\.toml"]))
+        (tmp_path / ".venv").mkdir()
+        (tmp_path / ".venv" / "pyvenv.toml").touch()
+        assert not watcher.poll()
+
+    def lists_files_only_if_a_directory_changes(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        create_repository: Callable[..., Path],
+    ):
+        create_repository(tmp_path)
+        monkeypatch.chdir(tmp_path)
+        loads: list[RepositoryIndex] = []
+        load = RepositoryIndex.load
+
+        def recording_load() -> RepositoryIndex:
+            loads.append(load())
+            return loads[-1]
+
+        monkeypatch.setattr(RepositoryIndex, "load", recording_load)
+        watcher = FileWatcher(FileSet.create(patterns=[r".*\.(py|toml)"]))
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "y"\n')
+        assert watcher.poll() == ["pyproject.toml"]
+        assert not watcher.poll()
+        assert len(loads) == 1
+
+        (tmp_path / "src" / "x" / "other.py").touch()
+        assert watcher.poll() == ["src/x/other.py"]
+        assert len(loads) == 2
+
+    def reports_files_modified_while_checks_run(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        create_repository: Callable[..., Path],
+    ):
+        create_repository(tmp_path)
+        monkeypatch.chdir(tmp_path)
+        watcher = FileWatcher(FileSet.create(patterns=[r".*\.(toml|yaml)"]))
+        with watcher.accept_writes():
+            with FileTransaction() as transaction:
+                transaction.write_text("pyproject.toml", '[project]\nname = "y"\n')
+                transaction.write_text("taplo.toml", "")
+            (tmp_path / ".pre-commit-config.yaml").write_text("repos:\n")
+        assert watcher.poll() == [".pre-commit-config.yaml"]
+
+        with watcher.accept_writes(), FileTransaction() as transaction:
+            transaction.remove("taplo.toml")
+        assert not watcher.poll()
+
+
+def describe_run_modified():
+    def runs_only_triggered_checks(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture,
+        create_repository: Callable[..., Path],
+    ):
+        create_repository(tmp_path)
+        monkeypatch.chdir(tmp_path)
+        assert run_modified(["src/x/module.py"], use_cache=False) == 0
+        assert not capsys.readouterr().out
+        assert run_modified([".pre-commit-config.yaml"], use_cache=False) == 1
+        assert capsys.readouterr().out
+
+    def reports_errors_without_raising(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture,
+        create_repository: Callable[..., Path],
+    ):
+        create_repository(tmp_path)
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "pyproject.toml").write_text("[project\n")
+        assert run_modified(["pyproject.toml"], use_cache=False) == 1
+        assert "Error" in capsys.readouterr().out
+
+    def forgets_revisions_of_earlier_runs(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        create_repository: Callable[..., Path],
+    ):
+        create_repository(tmp_path)
+        monkeypatch.chdir(tmp_path)
+        resolver = get_revision_resolver()
+        resolver.add_resolved({"https://github.com/ComPWA/policy": None})
+        assert run_modified(["src/x/module.py"], use_cache=False) == 0
+        assert "https://github.com/ComPWA/policy" not in resolver.get_resolved()
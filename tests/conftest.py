@@ -1,18 +1,18 @@
 import os
 import subprocess  # noqa: S404
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from pathlib import Path
 from typing import Any
 
 import pytest
 
-from compwa_policy import characterization
 from compwa_policy.cli._options import build_arguments
-from compwa_policy.repo import readthedocs
-from compwa_policy.utilities import match
+from compwa_policy.utilities.caching import clear_repository_caches
 from compwa_policy.utilities.check_hook import CheckContext, CheckHook
-from compwa_policy.utilities.precommit import getters
+from compwa_policy.utilities.parse_cache import get_parse_cache
+from compwa_policy.utilities.precommit import revisions
 from compwa_policy.utilities.session import Session
+from compwa_policy.utilities.templates import get_template_cache
 
 GitCommand = Callable[[Path], None]
 
@@ -79,6 +79,56 @@ def git_commit(git_init: GitCommand, git_add: GitCommand) -> GitCommand:
     return run
 
 
+@pytest.fixture
+def create_repository(git_commit: GitCommand) -> Callable[..., Path]:
+    """Write and commit a minimal Python repository that every check can run on.
+
+    Its ``[tool.compwa.policy]`` table holds the options that the checks require, so
+    that :program:`policy` runs without arguments. Additional *files* are written
+    before the commit.
+    """
+
+    def create(
+        directory: Path,
+        *,
+        name: str = "x",
+        notebook: bool = False,
+        files: Mapping[str, str] | None = None,
+    ) -> Path:
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / ".pre-commit-config.yaml").write_text("repos: []\n")
+        (directory / "pyproject.toml").write_text(
+            f'[project]\nname = "{name}"\nrequires-python = ">=3.12"\n'
+            "\n[tool.compwa.policy]\n"
+            'dev-python-version = "3.12"\n'
+            'package-manager = "uv"\n'
+        )
+        (directory / "src" / "x").mkdir(parents=True)
+        (directory / "src" / "x" / "module.py").write_text("x = 1\n")
+        if notebook:
+            (directory / "index.ipynb").write_text(
+                '{"cells": [], "metadata": {}, "nbformat": 4, "nbformat_minor": 5}\n'
+            )
+        for path, content in (files or {}).items():
+            (directory / path).write_text(content)
+        git_commit(directory)
+        return directory
+
+    return create
+
+
+@pytest.fixture
+def repository(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    create_repository: Callable[..., Path],
+) -> Path:
+    """Create a repository with `create_repository` and work in it."""
+    create_repository(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
 @pytest.fixture(scope="session")
 def _hermetic_gitconfig(tmp_path_factory: pytest.TempPathFactory) -> Path:
     config = tmp_path_factory.mktemp("gitconfig") / "config"
@@ -119,11 +169,21 @@ def _clear_git_ls_files_cache() -> None:
     that builds a repository in a ``tmp_path`` would otherwise see a stale result cached
     by an earlier test running in a different working directory.
     """
-    match._git_ls_files_cmd.cache_clear()
-    characterization.has_documentation.cache_clear()
-    characterization.has_notebooks.cache_clear()
-    characterization.has_python_code.cache_clear()
-    readthedocs._determine_docs_dir.cache_clear()
+    clear_repository_caches()
+
+
+@pytest.fixture(autouse=True)
+def _reset_parse_cache() -> None:
+    """Start every test with an empty, in-memory-only parse cache.
+
+    A CLI run points the shared `.ParseCache` to a persistent directory relative to the
+    working directory, and the template cache to the user cache directory, which would
+    otherwise leak into later tests.
+    """
+    cache = get_parse_cache()
+    cache.clear()
+    cache.directory = None
+    get_template_cache().directory = None
 
 
 @pytest.fixture(autouse=True)
@@ -135,4 +195,22 @@ def _offline_git_ls_remote(monkeypatch: pytest.MonkeyPatch) -> None:
     fixture (see ``tests/utilities/precommit/test_getters.py``) to exercise the real
     implementation.
     """
-    monkeypatch.setattr(getters, "_git_ls_remote_tags", lambda _repo_url: "")
+    monkeypatch.setattr(revisions, "_git_ls_remote_tags", lambda _repo_url: "")
+
+
+@pytest.fixture(autouse=True)
+def _isolate_revision_resolver(
+    monkeypatch: pytest.MonkeyPatch, tmp_path_factory: pytest.TempPathFactory
+) -> None:
+    """Start every test with a fresh `.RevisionResolver` and an empty user cache.
+
+    The resolver remembers revisions for the rest of the process, and a CLI run persists
+    them under the user cache directory, which should not be the developer's own.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+    resolver = revisions.get_revision_resolver()
+    resolver.clear()
+    monkeypatch.setattr(resolver, "path", None)
+    monkeypatch.setattr(resolver, "ttl", revisions.DEFAULT_TTL)
+    monkeypatch.setattr(resolver, "offline", False)
+    monkeypatch.setattr(resolver, "mirror_dir", None)
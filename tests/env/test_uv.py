@@ -23,7 +23,8 @@ def describe_remove_uv_lock():
     def removes_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
         (tmp_path / "uv.lock").write_text("# lock\n")
-        changes = _remove_uv_lock()
+        with Session() as session:
+            changes = _remove_uv_lock(session)
         assert any("Removed uv.lock" in m for m in changes)
         assert not (tmp_path / "uv.lock").exists()
 
@@ -45,7 +46,8 @@ def describe_remove_pip_constraint_files():
         constraints = tmp_path / ".constraints"
         constraints.mkdir()
         (constraints / "py3.10.txt").write_text("numpy==1.0\n")
-        changes = _remove_pip_constraint_files()
+        with Session() as session:
+            changes = _remove_pip_constraint_files(session)
         assert any("Removed deprecated" in m for m in changes)
         assert not constraints.exists()
 
@@ -132,7 +134,8 @@ def describe_update_editor_config():
         (tmp_path / ".editorconfig").write_text("root = true\n")
         git_add(tmp_path)
         monkeypatch.chdir(tmp_path)
-        changes = _update_editor_config()
+        with Session() as session:
+            changes = _update_editor_config(session)
         assert any("uv.lock" in m for m in changes)
         assert "[uv.lock]" in (tmp_path / ".editorconfig").read_text()
 
@@ -290,7 +290,7 @@ def describe_update_conda_environment():
     def sets_legacy_flag(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
         (tmp_path / "environment.yml").write_text("dependencies:\n  - python\n")
-        with ModifiablePrecommit.load(
+        pc = ModifiablePrecommit.load(
             io.StringIO(
                 dedent("""
                 repos:
@@ -300,8 +300,9 @@ def describe_update_conda_environment():
                       - id: prettier
                 """).lstrip()
             )
-        ) as pc:
-            precommit._update_conda_environment(pc)
+        )
+        with Session.load(pc) as session:
+            precommit._update_conda_environment(session, pc)
         assert any("Set PRETTIER_LEGACY_CLI" in m for m in pc.changelog)
         assert "PRETTIER_LEGACY_CLI" in (tmp_path / "environment.yml").read_text()
 
@@ -310,8 +311,9 @@ def describe_update_conda_environment():
         (tmp_path / "environment.yml").write_text(
             "variables:\n  PRETTIER_LEGACY_CLI: 1\n"
         )
-        with ModifiablePrecommit.load(io.StringIO("repos: []\n")) as pc:
-            precommit._update_conda_environment(pc)
+        pc = ModifiablePrecommit.load(io.StringIO("repos: []\n"))
+        with Session.load(pc) as session:
+            precommit._update_conda_environment(session, pc)
         assert any("Removed PRETTIER_LEGACY_CLI" in m for m in pc.changelog)
         assert "PRETTIER_LEGACY_CLI" not in (tmp_path / "environment.yml").read_text()
 
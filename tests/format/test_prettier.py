@@ -71,7 +71,8 @@ def describe_update_prettier_ignore():
     def removes_forbidden_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
         (tmp_path / ".prettierignore").write_text(".cspell.json\nbuild/\n")
-        changes = _update_prettier_ignore()
+        with Session() as session:
+            changes = _update_prettier_ignore(session)
         assert any("Removed forbidden paths" in m for m in changes)
         assert ".cspell.json" not in (tmp_path / ".prettierignore").read_text()
 
@@ -79,7 +80,8 @@ def describe_update_prettier_ignore():
         monkeypatch.chdir(tmp_path)
         (tmp_path / "LICENSE").touch()
         (tmp_path / ".prettierignore").write_text("build/\n")
-        changes = _update_prettier_ignore()
+        with Session() as session:
+            changes = _update_prettier_ignore(session)
         assert any("Added paths" in m for m in changes)
         assert "LICENSE" in (tmp_path / ".prettierignore").read_text()
 
@@ -87,7 +89,8 @@ def describe_update_prettier_ignore():
         monkeypatch.chdir(tmp_path)
         (tmp_path / "pixi.lock").touch()
         (tmp_path / "uv.lock").touch()  # Prettier ignores TOML lock files
-        changes = _update_prettier_ignore()
+        with Session() as session:
+            changes = _update_prettier_ignore(session)
         assert any("Added paths" in m for m in changes)
         prettier_ignore = (tmp_path / ".prettierignore").read_text()
         assert "pixi.lock" in prettier_ignore
@@ -96,7 +99,8 @@ def describe_update_prettier_ignore():
     def removes_empty_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
         (tmp_path / ".prettierignore").write_text("")
-        changes = _update_prettier_ignore()
+        with Session() as session:
+            changes = _update_prettier_ignore(session)
         assert any("is not needed" in m for m in changes)
         assert not (tmp_path / ".prettierignore").exists()
 
@@ -103,7 +103,8 @@ def describe_rename_taplo_config():
     def renames_to_dotfile(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
         (tmp_path / "taplo.toml").write_text("include = []\n")
-        changes = _rename_taplo_config()
+        with Session() as session:
+            changes = _rename_taplo_config(session)
         assert any("Renamed taplo.toml" in m for m in changes)
         assert not (tmp_path / "taplo.toml").exists()
         assert (tmp_path / ".taplo.toml").exists()
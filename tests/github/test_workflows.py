@@ -4,7 +4,9 @@ from pathlib import Path
 
 import pytest
 
+from compwa_policy.github import release_drafter
 from compwa_policy.github.workflows import check, remove_workflow
+from compwa_policy.utilities import CONFIG_PATH
 from compwa_policy.utilities.precommit import ModifiablePrecommit
 from compwa_policy.utilities.pyproject import PythonVersion
 from compwa_policy.utilities.session import Session
@@ -124,6 +126,16 @@ def describe_main():
         ci = (workflows_repo / _WORKFLOW_DIR / "ci.yml").read_text()
         assert "style:" not in ci  # style job outsourced to pre-commit.ci
 
+    def sees_files_that_an_earlier_check_created(workflows_repo: Path, run_check):
+        with Session.load(_precommit()) as session:
+            session.get_path(CONFIG_PATH.readthedocs).write_text("version: 2\n")
+            run_check(check, session, github_pages=False, no_cd=True)
+            run_check(release_drafter.check, session, repo_name="my-package")
+        ci = (workflows_repo / _WORKFLOW_DIR / "ci.yml").read_text()
+        assert "gh-pages" not in ci
+        drafter = workflows_repo / CONFIG_PATH.release_drafter_config
+        assert "https://my-package.rtfd.io" in drafter.read_text()
+
     def removes_doc_and_test_jobs(
         tmp_path: Path,
         monkeypatch: pytest.MonkeyPatch,
@@ -145,13 +157,15 @@ def describe_main():
 def describe_remove_workflow():
     def is_noop_when_absent(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
-        assert not remove_workflow("ci-tests.yml")  # nothing to remove
+        with Session() as session:
+            assert not remove_workflow(session, "ci-tests.yml")  # nothing to remove
 
     def removes_present_workflow(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
         workflow = tmp_path / _WORKFLOW_DIR / "ci-tests.yml"
         workflow.parent.mkdir(parents=True)
         workflow.touch()
-        changes = remove_workflow("ci-tests.yml")
+        with Session() as session:
+            changes = remove_workflow(session, "ci-tests.yml")
         assert any("Removed deprecated ci-tests.yml" in m for m in changes)
         assert not workflow.exists()
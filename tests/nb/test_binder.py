@@ -64,7 +64,8 @@ def describe_update_apt_txt():
         apt_txt = tmp_path / ".binder" / "apt.txt"
         apt_txt.parent.mkdir()
         apt_txt.write_text("graphviz\n")
-        changes = binder._update_apt_txt([])
+        with Session() as session:
+            changes = binder._update_apt_txt(session, [])
         assert any("Removed" in m for m in changes)
         assert not apt_txt.exists()
 
@@ -72,7 +73,8 @@ def describe_update_apt_txt():
         tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ):
         monkeypatch.chdir(tmp_path)
-        binder._update_apt_txt([])  # no packages, no file -> no changes
+        with Session() as session:
+            binder._update_apt_txt(session, [])  # no packages, no file -> no changes
 
 
 def describe_update_post_build():
@@ -90,7 +92,8 @@ def describe_make_executable():
         script = tmp_path / "postBuild"
         script.write_text("#!/bin/bash\n")
         script.chmod(0o644)
-        changes = binder._make_executable(script)
+        with Session() as session:
+            changes = binder._make_executable(session, script)
         assert any("made executable" in m for m in changes)
         assert os.access(script, os.X_OK)
 
@@ -98,5 +101,6 @@ def describe_make_executable():
         script = tmp_path / "postBuild"
         script.write_text("#!/bin/bash\n")
         script.chmod(0o755)
-        binder._make_executable(script)  # already executable -> no changes
+        with Session() as session:
+            binder._make_executable(session, script)  # already executable
         assert script.stat().st_mode & stat.S_IXUSR
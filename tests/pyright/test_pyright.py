@@ -39,14 +39,24 @@ def _write_precommit(tmp_path: Path, content: str) -> Path:
 def describe_merge_config_into_pyproject():
     def is_noop_without_config(tmp_path: Path):
         pyproject_path = _write_pyproject(tmp_path, "[project]\nname = 'x'\n")
-        with ModifiablePyproject.load(pyproject_path) as pyproject:
-            _merge_config_into_pyproject(pyproject, tmp_path / "pyrightconfig.json")
+        with (
+            Session() as session,
+            ModifiablePyproject.load(pyproject_path) as pyproject,
+        ):
+            _merge_config_into_pyproject(
+                session, pyproject, tmp_path / "pyrightconfig.json"
+            )
 
     def imports_from_json(this_dir: Path, tmp_path: Path):
         pyproject_path = _write_pyproject(tmp_path, "")
         old_config_path = this_dir / "pyrightconfig.json"
-        with ModifiablePyproject.load(pyproject_path) as pyproject:
-            _merge_config_into_pyproject(pyproject, old_config_path, remove=False)
+        with (
+            Session() as session,
+            ModifiablePyproject.load(pyproject_path) as pyproject,
+        ):
+            _merge_config_into_pyproject(
+                session, pyproject, old_config_path, remove=False
+            )
         assert any(
             re.search(
                 rf"Imported pyright configuration from {re.escape(str(old_config_path))}",
@@ -37,16 +37,22 @@ def describe_merge_mypy_into_pyproject():
             ignore_missing_imports = True
             """).lstrip()
         )
-        with ModifiablePyproject.load(io.StringIO("")) as pyproject:
-            _merge_mypy_into_pyproject(pyproject)
+        with (
+            Session() as session,
+            ModifiablePyproject.load(io.StringIO("")) as pyproject,
+        ):
+            _merge_mypy_into_pyproject(session, pyproject)
         assert any("Imported mypy configuration" in m for m in pyproject.changelog)
         assert "[tool.mypy]" in pyproject.dumps()
         assert not (tmp_path / ".mypy.ini").exists()
 
     def is_noop_without_ini(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
-        with ModifiablePyproject.load(io.StringIO("")) as pyproject:
-            _merge_mypy_into_pyproject(pyproject)  # nothing to import
+        with (
+            Session() as session,
+            ModifiablePyproject.load(io.StringIO("")) as pyproject,
+        ):
+            _merge_mypy_into_pyproject(session, pyproject)  # nothing to import
 
 
 def describe_update_precommit_config():
@@ -24,7 +24,7 @@ def describe_update_license_files():
         pyproject_path = tmp_path / "pyproject.toml"
         pyproject_path.write_text('[project]\nname = "x"\n')
         with ModifiablePyproject.load(pyproject_path) as pyproject:
-            _update_license_files(pyproject)
+            _update_license_files(Session(), pyproject)
         assert pyproject.get_table("project")["license-files"] == ["LICENSE"]
         assert 'license-files = ["LICENSE"]' in pyproject_path.read_text()
 
@@ -36,7 +36,7 @@ def describe_update_license_files():
             '[project]\nname = "x"\nlicense-files = ["COPYING"]\n'
         )
         with ModifiablePyproject.load(pyproject_path) as pyproject:
-            _update_license_files(pyproject)
+            _update_license_files(Session(), pyproject)
         assert pyproject.get_table("project")["license-files"] == [
             "COPYING",
             "LICENSE",
@@ -53,7 +53,7 @@ def describe_update_license_files():
             '[tool.setuptools]\nlicense-files = ["LICENSE"]\n'
         )
         with ModifiablePyproject.load(pyproject_path) as pyproject:
-            _update_license_files(pyproject)
+            _update_license_files(Session(), pyproject)
         assert "license-files" not in pyproject.get_table("tool.setuptools")
 
     @pytest.mark.parametrize(
@@ -82,7 +82,7 @@ def describe_update_license_files():
             "]\n"
         )
         with ModifiablePyproject.load(pyproject_path) as pyproject:
-            _update_license_files(pyproject)
+            _update_license_files(Session(), pyproject)
         assert pyproject.get_table("project")["classifiers"] == [
             "Development Status :: 4 - Beta"
         ]
@@ -100,7 +100,7 @@ def describe_update_license_files():
         pyproject_path = tmp_path / "pyproject.toml"
         pyproject_path.write_text(pyproject_contents)
         with ModifiablePyproject.load(pyproject_path) as pyproject:
-            _update_license_files(pyproject)
+            _update_license_files(Session(), pyproject)
         assert "license-files" not in pyproject_path.read_text()
 
 
@@ -214,7 +214,7 @@ def describe_update_python_version_classifiers():
         """).lstrip()
         with ModifiablePyproject.load(io.StringIO(config)) as pyproject:
             _update_python_version_classifiers(
-                pyproject, excluded_python_versions=set()
+                Session(), pyproject, excluded_python_versions=set()
             )
         assert any(
             "Updated Python version classifiers" in m for m in pyproject.changelog
@@ -234,7 +234,7 @@ def describe_update_python_version_classifiers():
         """).lstrip()
         with ModifiablePyproject.load(io.StringIO(config)) as pyproject:
             _update_python_version_classifiers(
-                pyproject, excluded_python_versions=set()
+                Session(), pyproject, excluded_python_versions=set()
             )  # no classifiers and no tests/ dir -> no-op
 
 
@@ -95,20 +95,26 @@ def describe_merge_pytest_into_pyproject():
     def imports_and_removes_ini(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
         (tmp_path / "pytest.ini").write_text("[pytest]\nminversion = 7.0\n")
-        with ModifiablePyproject.load(
-            io.StringIO("[project]\nname = 'x'\n")
-        ) as pyproject:
-            _merge_pytest_into_pyproject(pyproject)
+        with (
+            Session() as session,
+            ModifiablePyproject.load(
+                io.StringIO("[project]\nname = 'x'\n")
+            ) as pyproject,
+        ):
+            _merge_pytest_into_pyproject(session, pyproject)
         assert any("Imported pytest configuration" in m for m in pyproject.changelog)
         assert not (tmp_path / "pytest.ini").exists()
         assert "ini_options" in pyproject.dumps()
 
     def is_noop_without_ini(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
-        with ModifiablePyproject.load(
-            io.StringIO("[project]\nname = 'x'\n")
-        ) as pyproject:
-            _merge_pytest_into_pyproject(pyproject)  # no pytest.ini -> no-op
+        with (
+            Session() as session,
+            ModifiablePyproject.load(
+                io.StringIO("[project]\nname = 'x'\n")
+            ) as pyproject,
+        ):
+            _merge_pytest_into_pyproject(session, pyproject)  # no pytest.ini -> no-op
 
 
 def describe_merge_coverage_into_pyproject():
@@ -117,10 +123,13 @@ def describe_merge_coverage_into_pyproject():
         (tmp_path / "pytest.ini").write_text(
             "[coverage:run]\nbranch = True\nsource = my_pkg\n"
         )
-        with ModifiablePyproject.load(
-            io.StringIO("[project]\nname = 'x'\n")
-        ) as pyproject:
-            _merge_coverage_into_pyproject(pyproject)
+        with (
+            Session() as session,
+            ModifiablePyproject.load(
+                io.StringIO("[project]\nname = 'x'\n")
+            ) as pyproject,
+        ):
+            _merge_coverage_into_pyproject(session, pyproject)
         assert any(
             "Imported Coverage.py configuration" in m for m in pyproject.changelog
         )
@@ -132,10 +141,15 @@ def describe_merge_coverage_into_pyproject():
     ):
         monkeypatch.chdir(tmp_path)
         (tmp_path / "pytest.ini").write_text("[pytest]\nminversion = 7.0\n")
-        with ModifiablePyproject.load(
-            io.StringIO("[project]\nname = 'x'\n")
-        ) as pyproject:
-            _merge_coverage_into_pyproject(pyproject)  # no [coverage:run] -> no-op
+        with (
+            Session() as session,
+            ModifiablePyproject.load(
+                io.StringIO("[project]\nname = 'x'\n")
+            ) as pyproject,
+        ):
+            _merge_coverage_into_pyproject(
+                session, pyproject
+            )  # no [coverage:run] -> no-op
 
 
 def describe_update_codecov_settings():
@@ -64,7 +64,8 @@ def describe_convert_zenodo_json():
     def writes_citation_cff(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
         (tmp_path / ".zenodo.json").write_text(json.dumps(_ZENODO))
-        changes = citation.convert_zenodo_json()
+        with Session() as session:
+            changes = citation.convert_zenodo_json(session)
         assert any("Converted" in m for m in changes)
         assert not (tmp_path / ".zenodo.json").exists()
         assert (tmp_path / "CITATION.cff").exists()
@@ -74,7 +75,8 @@ def describe_remove_zenodo_json():
     def removes_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
         (tmp_path / ".zenodo.json").write_text("{}")
-        changes = citation.remove_zenodo_json()
+        with Session() as session:
+            changes = citation.remove_zenodo_json(session)
         assert any("Removed" in m for m in changes)
         assert not (tmp_path / ".zenodo.json").exists()
 
@@ -84,26 +86,27 @@ def describe_check_citation_keys():
         monkeypatch.chdir(tmp_path)
         (tmp_path / "CITATION.cff").write_text("cff-version: 1.2.0\n")
         with pytest.raises(PolicyError, match=r"missing the following keys"):
-            citation.check_citation_keys()
+            citation.check_citation_keys(Session())
 
     def reports_empty_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
         (tmp_path / "CITATION.cff").write_text("")
         with pytest.raises(PolicyError, match=r"is empty"):
-            citation.check_citation_keys()
+            citation.check_citation_keys(Session())
 
     def accepts_complete_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
         (tmp_path / "CITATION.cff").write_text(_VALID_CITATION)
-        citation.check_citation_keys()  # all expected keys present -> no error
+        citation.check_citation_keys(Session())  # all keys present -> no error
 
 
 def describe_add_json_schema_precommit():
     def adds_hook(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
         (tmp_path / "CITATION.cff").write_text(_VALID_CITATION)
-        with ModifiablePrecommit.load(io.StringIO("repos: []\n")) as precommit:
-            citation.add_json_schema_precommit(precommit)
+        precommit = ModifiablePrecommit.load(io.StringIO("repos: []\n"))
+        with Session.load(precommit) as session:
+            citation.add_json_schema_precommit(session)
         assert any("Updated pre-commit hook" in m for m in precommit.changelog)
         assert "check-jsonschema" in precommit.dumps()
 
@@ -126,10 +129,9 @@ def describe_add_json_schema_precommit():
                       - CITATION.cff
                     pass_filenames: false
         """).lstrip()
-        with ModifiablePrecommit.load(io.StringIO(existing)) as precommit:
-            citation.add_json_schema_precommit(
-                precommit
-            )  # already present -> no change
+        precommit = ModifiablePrecommit.load(io.StringIO(existing))
+        with Session.load(precommit) as session:
+            citation.add_json_schema_precommit(session)  # already present
 
     def replaces_outdated_hook(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
@@ -146,8 +148,9 @@ def describe_add_json_schema_precommit():
                       - https://example.test/outdated-schema.json
                       - CITATION.cff
         """).lstrip()
-        with ModifiablePrecommit.load(io.StringIO(existing)) as precommit:
-            citation.add_json_schema_precommit(precommit)
+        precommit = ModifiablePrecommit.load(io.StringIO(existing))
+        with Session.load(precommit) as session:
+            citation.add_json_schema_precommit(session)
         assert any("Updated pre-commit hook" in m for m in precommit.changelog)
         result = precommit.dumps()
         assert "outdated-schema" not in result  # stale args replaced
@@ -155,8 +158,9 @@ def describe_add_json_schema_precommit():
 
     def is_noop_without_citation(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
-        with ModifiablePrecommit.load(io.StringIO("repos: []\n")) as precommit:
-            citation.add_json_schema_precommit(precommit)  # no CITATION.cff -> no-op
+        precommit = ModifiablePrecommit.load(io.StringIO("repos: []\n"))
+        with Session.load(precommit) as session:
+            citation.add_json_schema_precommit(session)  # no CITATION.cff -> no-op
 
     def appends_to_existing_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
@@ -170,8 +174,9 @@ def describe_add_json_schema_precommit():
                     name: Check GitHub Workflows
                     files: ^\\.github/workflows/
         """).lstrip()
-        with ModifiablePrecommit.load(io.StringIO(existing)) as precommit:
-            citation.add_json_schema_precommit(precommit)
+        precommit = ModifiablePrecommit.load(io.StringIO(existing))
+        with Session.load(precommit) as session:
+            citation.add_json_schema_precommit(session)
         assert any("Updated pre-commit hook" in m for m in precommit.changelog)
         result = precommit.dumps()
         assert "Check GitHub Workflows" in result  # original hook kept
@@ -13,7 +13,7 @@ from compwa_policy.utilities.session import Session
 def describe_remove_relink_references():
     def is_noop_without_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
-        _remove_relink_references("docs")  # nothing to remove
+        _remove_relink_references(Session(), "docs")  # nothing to remove
 
     def raises_when_present(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.chdir(tmp_path)
@@ -21,7 +21,7 @@ def describe_remove_relink_references():
         docs.mkdir()
         (docs / "_relink_references.py").touch()
         with pytest.raises(PolicyError, match=r"sphinx-api-relink"):
-            _remove_relink_references("docs")
+            _remove_relink_references(Session(), "docs")
 
 
 def describe_check():
@@ -147,7 +147,7 @@ def describe_check_expected_sections():
         with pytest.raises(
             PolicyError, match=r"missing task definitions: doc, doclive"
         ):
-            _check_expected_sections(pyproject, has_notebooks=False)
+            _check_expected_sections(Session(), pyproject, has_notebooks=False)
 
 
 def describe_check_no_uv_run():
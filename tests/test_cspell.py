@@ -14,6 +14,7 @@ from compwa_policy.format.cspell import (
     check,
 )
 from compwa_policy.utilities import COMPWA_POLICY_DIR, CONFIG_PATH
+from compwa_policy.utilities.cspell import ModifiableCspellConfig
 from compwa_policy.utilities.precommit import ModifiablePrecommit
 from compwa_policy.utilities.session import Session
 
@@ -97,7 +98,9 @@ def describe_update_config_content():
         )
         template["language"] = "xx-XX"
         (tmp_path / ".cspell.json").write_text(json.dumps(template))
-        changes = _update_config_content()
+        with Session() as session:
+            _update_config_content(session.get(ModifiableCspellConfig))
+            changes = session.collect_changes()
         assert any("has been updated" in m for m in changes)
         config = json.loads((tmp_path / ".cspell.json").read_text())
         assert config["language"] == "en-US"
@@ -110,7 +113,9 @@ def describe_update_config_content():
         git_init(tmp_path)
         monkeypatch.chdir(tmp_path)
         (tmp_path / ".cspell.json").write_text("{}")
-        changes = _update_config_content()
+        with Session() as session:
+            _update_config_content(session.get(ModifiableCspellConfig))
+            changes = session.collect_changes()
         assert any("has been updated" in m for m in changes)
         config = json.loads((tmp_path / ".cspell.json").read_text())
         assert config["language"] == "en-US"
@@ -122,11 +127,58 @@ def describe_sort_config_entries():
         (tmp_path / ".cspell.json").write_text(
             json.dumps({"words": ["zebra", "apple", "mango"]})
         )
-        changes = _sort_config_entries()
+        with Session() as session:
+            _sort_config_entries(session.get(ModifiableCspellConfig))
+            changes = session.collect_changes()
         assert any("sorted alphabetically" in m for m in changes)
         config = json.loads((tmp_path / ".cspell.json").read_text())
         assert config["words"] == ["apple", "mango", "zebra"]
 
+    def skips_sections_that_are_known_to_be_sorted(
+        tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".cspell.json").write_text(json.dumps({"words": ["b", "a"]}))
+        config = ModifiableCspellConfig.load()
+        config.set_section("ignoreWords", ["y", "x"], is_sorted=True)
+        assert config.sort_sections() == ["words"]
+        assert config.document["ignoreWords"] == ["y", "x"]
+        assert not config.sort_sections()
+
+
+def describe_modifiable_cspell_config():
+    def renames_legacy_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "cspell.json").write_text('{"words": ["a"]}')
+        with Session() as session:
+            config = session.get(ModifiableCspellConfig)
+            assert config.exists
+            changes = session.collect_changes()
+        assert changes == ["File cspell.json has been renamed to .cspell.json"]
+        assert not (tmp_path / "cspell.json").exists()
+        assert json.loads((tmp_path / ".cspell.json").read_text()) == {"words": ["a"]}
+
+    def deduplicates_words(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".cspell.json").write_text('{"words": ["b", "a", "b", "a"]}')
+        config = ModifiableCspellConfig.load()
+        assert config.deduplicate_section("words")
+        assert not config.deduplicate_section("words")
+        assert config.document["words"] == ["b", "a"]
+
+    def writes_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".cspell.json").write_text('{"words": ["b", "a", "a"]}')
+        with Session() as session:
+            config = session.get(ModifiableCspellConfig)
+            config.deduplicate_section("words")
+            config.sort_sections()
+            assert (
+                tmp_path / ".cspell.json"
+            ).read_text() == '{"words": ["b", "a", "a"]}'
+        result = (tmp_path / ".cspell.json").read_text()
+        assert result == '{\n  "words": [\n    "a",\n    "b"\n  ]\n}\n'
+
 
 def describe_main():
     def updates_existing_config(
@@ -153,3 +153,26 @@ def describe_precommit():
         precommit = Precommit.load(this_dir / ".pre-commit-config.yaml")
         yaml = precommit.dumps()
         assert yaml == example_config
+
+    def finds_repos_without_round_trip_parsing(
+        this_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        def fail() -> None:
+            msg = "The round-trip parser should not be used"
+            raise AssertionError(msg)
+
+        monkeypatch.setattr(
+            "compwa_policy.utilities.precommit.create_prettier_round_trip_yaml", fail
+        )
+        precommit = Precommit.load(this_dir / ".pre-commit-config.yaml")
+        repo = precommit.find_repo(r".*/ComPWA/policy")
+        assert repo is not None
+        assert repo["repo"] == "https://github.com/ComPWA/policy"
+        with pytest.raises(AssertionError, match="round-trip parser"):
+            _ = precommit.document
+
+    def finds_modifiable_repos_in_round_trip_document(this_dir: Path):
+        precommit = ModifiablePrecommit.load(this_dir / ".pre-commit-config.yaml")
+        repo = precommit.find_repo(r".*/ComPWA/policy")
+        assert repo is not None
+        assert any(r is repo for r in precommit.document["repos"])
@@ -3,7 +3,7 @@ from pathlib import Path
 
 import pytest
 
-from compwa_policy.utilities.precommit import Precommit, getters
+from compwa_policy.utilities.precommit import Precommit, getters, revisions
 from compwa_policy.utilities.precommit.getters import find_repo, find_repo_with_index
 
 
@@ -73,25 +73,15 @@ def describe_get_latest_rev():
         ls_remote = (
             "sha1\trefs/tags/0.0.1\nsha2\trefs/tags/0.0.10\nsha3\trefs/tags/0.0.2\n"
         )
-        monkeypatch.setattr(getters, "_git_ls_remote_tags", lambda _url: ls_remote)
+        monkeypatch.setattr(revisions, "_git_ls_remote_tags", lambda _url: ls_remote)
         assert getters.get_latest_rev("https://example.test/repo") == "0.0.10"
 
     def ignores_non_version_tags(monkeypatch: pytest.MonkeyPatch) -> None:
         ls_remote = "sha1\trefs/tags/nightly\nsha2\trefs/tags/1.2.3\n"
-        monkeypatch.setattr(getters, "_git_ls_remote_tags", lambda _url: ls_remote)
+        monkeypatch.setattr(revisions, "_git_ls_remote_tags", lambda _url: ls_remote)
         assert getters.get_latest_rev("https://example.test/repo") == "1.2.3"
 
     def falls_back_without_tags(monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setattr(getters, "_git_ls_remote_tags", lambda _url: "")
+        monkeypatch.setattr(revisions, "_git_ls_remote_tags", lambda _url: "")
         assert getters.get_latest_rev("https://example.test/repo") == "PLEASE-UPDATE"
         assert getters.get_latest_rev("https://x", fallback="1.0.0") == "1.0.0"
-
-
-def describe_git_ls_remote_tags():
-    def returns_empty_when_offline(monkeypatch: pytest.MonkeyPatch) -> None:
-        def _raise(*_a: object, **_k: object) -> str:
-            msg = "no network"
-            raise OSError(msg)
-
-        monkeypatch.setattr(getters.subprocess, "check_output", _raise)
-        assert not getters._git_ls_remote_tags("https://example.test/repo")
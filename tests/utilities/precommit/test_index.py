@@ -0,0 +1,68 @@
+from textwrap import dedent
+
+from compwa_policy.utilities.precommit import ModifiablePrecommit, Precommit
+from compwa_policy.utilities.precommit.struct import Hook, Repo
+
+_CONFIG = dedent("""
+    repos:
+      - repo: meta
+        hooks:
+          - id: check-hooks-apply
+
+      - repo: https://github.com/ComPWA/policy
+        rev: 0.3.0
+        hooks:
+          - id: check-dev-files
+          - id: colab-toc-visible
+
+      - repo: local
+        hooks:
+          - id: ty
+            name: ty
+            entry: ty check
+            language: system
+""").lstrip()
+
+
+def describe_precommit_index():
+    def finds_repos_and_hooks():
+        index = Precommit.load(_CONFIG).index
+        idx_and_repo = index.find_repo_with_index(r"ComPWA/policy")
+        assert idx_and_repo is not None
+        assert idx_and_repo[0] == 1
+        assert index.find_repo("non-existent") is None
+        hook = index.find_hook(r"^colab")
+        assert hook is not None
+        assert hook["id"] == "colab-toc-visible"
+        assert index.find_hook_position("ty") == (2, 0)
+        assert index.find_hook_position("ty", repo_url="meta") is None
+
+    def follows_modifications_by_setters():
+        precommit = ModifiablePrecommit.load(_CONFIG)
+        index = precommit.index
+        with precommit:
+            precommit.remove_hook("check-hooks-apply")
+            precommit.update_hook(
+                "https://github.com/ComPWA/policy", Hook(id="check-dev-files-2")
+            )
+            precommit.update_single_hook_repo(
+                Repo(
+                    repo="https://github.com/psf/black",
+                    rev="24.1.0",
+                    hooks=[Hook(id="black")],
+                )
+            )
+        assert precommit.index is index
+        assert index.find_hook_position("check-hooks-apply") is None
+        assert index.find_hook_position("check-dev-files-2") == (0, 1)
+        assert index.find_hook_position("black") == (1, 0)
+        assert index.find_hook_position("ty", repo_url="local") == (2, 0)
+
+    def rebuilds_after_recorded_modifications():
+        precommit = ModifiablePrecommit.load(_CONFIG)
+        index = precommit.index
+        with precommit:
+            precommit.document["repos"].pop(0)
+            precommit.changelog.append("Removed meta repo")
+        assert precommit.index is not index
+        assert precommit.index.find_hook_position("ty") == (1, 0)
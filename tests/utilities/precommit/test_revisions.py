@@ -0,0 +1,146 @@
+import json
+import subprocess  # noqa: S404
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from compwa_policy.utilities.precommit import revisions
+from compwa_policy.utilities.precommit.revisions import RevisionResolver
+
+
+@pytest.fixture(autouse=True)
+def _offline_git_ls_remote() -> None:
+    """Override the global offline patch so the real implementation is exercised."""
+
+
+def _create_bare_repo(path: Path, *tags: str) -> str:
+    """Create a bare repository with the given tags and return its file URL."""
+    work_dir = path.with_name(f"{path.name}-work")
+    work_dir.mkdir(parents=True)
+    git = ["git", "-C", str(work_dir)]
+    subprocess.run([*git, "init", "-q"], check=True)  # noqa: S603
+    subprocess.run([*git, "commit", "-qm", "init", "--allow-empty"], check=True)  # noqa: S603
+    for tag in tags:
+        subprocess.run([*git, "tag", tag], check=True)  # noqa: S603
+    subprocess.run(  # noqa: S603
+        ["git", "clone", "-q", "--bare", str(work_dir), str(path)],  # noqa: S607
+        check=True,
+    )
+    return path.as_uri()
+
+
+def _add_tag(repo_url: str, tag: str) -> None:
+    bare_repo = repo_url.removeprefix("file://")
+    work_dir = Path(bare_repo).with_name(f"{Path(bare_repo).name}-work")
+    subprocess.run(["git", "-C", str(work_dir), "tag", tag], check=True)  # noqa: S603, S607
+    subprocess.run(  # noqa: S603
+        ["git", "-C", str(work_dir), "push", "-q", bare_repo, tag],  # noqa: S607
+        check=True,
+    )
+
+
+def describe_revision_resolver():
+    def resolves_the_highest_version_tag(tmp_path: Path):
+        url = _create_bare_repo(tmp_path / "hooks.git", "v0.9.0", "v0.10.0", "nightly")
+        assert RevisionResolver().resolve(url) == "v0.10.0"
+
+    def returns_none_for_unreachable_repos(tmp_path: Path):
+        assert RevisionResolver().resolve((tmp_path / "missing").as_uri()) is None
+
+    def resolves_each_url_once_per_run(tmp_path: Path):
+        url = _create_bare_repo(tmp_path / "hooks.git", "1.0.0")
+        resolver = RevisionResolver()
+        assert resolver.resolve(url) == "1.0.0"
+        _add_tag(url, "1.1.0")
+        assert resolver.resolve(url) == "1.0.0"
+        resolver.clear()
+        assert resolver.resolve(url) == "1.1.0"
+
+    def reuses_persisted_revisions_until_they_expire(tmp_path: Path):
+        url = _create_bare_repo(tmp_path / "hooks.git", "1.0.0")
+        cache_file = tmp_path / "cache" / "latest-revs.json"
+        assert RevisionResolver(cache_file).resolve(url) == "1.0.0"
+        _add_tag(url, "1.1.0")
+        assert RevisionResolver(cache_file).resolve(url) == "1.0.0"
+        assert RevisionResolver(cache_file, ttl=timedelta(0)).resolve(url) == "1.1.0"
+
+    def falls_back_to_expired_revisions(tmp_path: Path):
+        cache_file = tmp_path / "latest-revs.json"
+        url = (tmp_path / "missing").as_uri()
+        expired = time.time() - 2 * revisions.DEFAULT_TTL.total_seconds()
+        cache_file.write_text(json.dumps({url: {"rev": "2.0.0", "time": expired}}))
+        assert RevisionResolver(cache_file).resolve(url) == "2.0.0"
+
+    def ignores_corrupt_cache_files(tmp_path: Path):
+        url = _create_bare_repo(tmp_path / "hooks.git", "1.0.0")
+        cache_file = tmp_path / "latest-revs.json"
+        cache_file.write_text("not json")
+        assert RevisionResolver(cache_file).resolve(url) == "1.0.0"
+        assert json.loads(cache_file.read_text())[url]["rev"] == "1.0.0"
+
+    def prefetches_revisions_concurrently(
+        tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        urls = [
+            _create_bare_repo(tmp_path / f"hooks{i}.git", f"{i}.0.0") for i in range(3)
+        ]
+        resolver = RevisionResolver()
+        resolver.prefetch([*urls, urls[0]])
+        monkeypatch.setattr(revisions, "_git_ls_remote_tags", pytest.fail)
+        assert [resolver.resolve(url) for url in urls] == ["0.0.0", "1.0.0", "2.0.0"]
+
+    def describe_offline():
+        def uses_cached_revisions_regardless_of_their_age(
+            tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        ):
+            url = "https://github.com/ComPWA/policy"
+            cache_file = tmp_path / "latest-revs.json"
+            cache_file.write_text(json.dumps({url: {"rev": "0.3.0", "time": 0}}))
+            monkeypatch.setattr(revisions, "_git_ls_remote_tags", pytest.fail)
+            resolver = RevisionResolver(cache_file, offline=True)
+            assert resolver.resolve(url) == "0.3.0"
+
+        def resolves_from_a_mirror_directory(
+            tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        ):
+            mirror_dir = tmp_path / "mirrors"
+            _create_bare_repo(
+                mirror_dir / "github.com" / "ComPWA" / "policy.git", "0.4.0"
+            )
+            real_ls_remote = revisions._git_ls_remote_tags
+            queried: list[str] = []
+
+            def ls_remote(repo_url: str) -> str:
+                queried.append(repo_url)
+                return real_ls_remote(repo_url)
+
+            monkeypatch.setattr(revisions, "_git_ls_remote_tags", ls_remote)
+            resolver = RevisionResolver(offline=True, mirror_dir=mirror_dir)
+            assert resolver.resolve("https://github.com/ComPWA/policy") == "0.4.0"
+            assert resolver.resolve("https://github.com/ComPWA/other") is None
+            assert queried == [str(mirror_dir / "github.com/ComPWA/policy.git")]
+
+        def does_not_persist_mirror_revisions(tmp_path: Path):
+            mirror_dir = tmp_path / "mirrors"
+            path = mirror_dir / "github.com" / "ComPWA" / "policy"
+            _create_bare_repo(path, "0.4.0")
+            cache_file = tmp_path / "latest-revs.json"
+            resolver = RevisionResolver(cache_file, offline=True, mirror_dir=mirror_dir)
+            assert resolver.resolve("https://github.com/ComPWA/policy") == "0.4.0"
+            assert not cache_file.exists()
+
+
+def describe_git_ls_remote_tags():
+    def returns_empty_when_offline(monkeypatch: pytest.MonkeyPatch) -> None:
+        def _raise(*_a: object, **_k: object) -> str:
+            msg = "no network"
+            raise OSError(msg)
+
+        monkeypatch.setattr(revisions.subprocess, "check_output", _raise)
+        assert not revisions._git_ls_remote_tags("https://example.test/repo")
+
+    def lists_tags_of_local_repositories(tmp_path: Path):
+        url = _create_bare_repo(tmp_path / "hooks.git", "1.0.0")
+        assert revisions._git_ls_remote_tags(url).endswith("refs/tags/1.0.0\n")
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from textwrap import dedent
+from typing import TYPE_CHECKING
+
+from compwa_policy.utilities.pyproject import (
+    ModifiablePyproject,
+    _dependencies,
+    has_dependency,
+)
+
+if TYPE_CHECKING:
+    import pytest
+
+_SOURCE = dedent("""
+    [project]
+    name = "my-package"
+    dependencies = ["attrs", "PyYAML>=6"]
+
+    [project.optional-dependencies]
+    viz = ["graphviz"]
+
+    [dependency-groups]
+    dev = ["ruff", {include-group = "test"}]
+    test = ["pytest"]
+""").lstrip()
+
+
+def describe_dependency_index():
+    def parses_only_the_sections_that_changed(monkeypatch: pytest.MonkeyPatch):
+        parsed: list[str | None] = []
+        get_name = _dependencies._get_name
+
+        def recording_get_name(definition: str | None) -> str | None:
+            parsed.append(definition)
+            return get_name(definition)
+
+        monkeypatch.setattr(_dependencies, "_get_name", recording_get_name)
+        pyproject = ModifiablePyproject.load(_SOURCE)
+        with pyproject:
+            assert has_dependency(pyproject, "pyyaml")
+            assert not has_dependency(pyproject, "graphviz")
+            assert len(parsed) == 6
+            parsed.clear()
+            pyproject.get_table("dependency-groups")["test"].append("pytest-cov")
+            assert has_dependency(pyproject, ("coverage", "pytest-cov"))
+            assert parsed == ["pytest", "pytest-cov"]
+
+    def removes_only_listed_packages():
+        pyproject = ModifiablePyproject.load(_SOURCE)
+        with pyproject:
+            pyproject.remove_dependencies(["tox", "black"])
+            assert not pyproject.is_materialized
+            pyproject.remove_dependencies(["tox", "graphviz", "ruff", "attrs"])
+            assert pyproject.changelog == [
+                "Removed graphviz from dependencies",
+                "Removed ruff from dependencies",
+                "Removed attrs from dependencies",
+            ]
+            assert not has_dependency(pyproject, "ruff")
+        assert "optional-dependencies" not in pyproject.dumps()
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from collections.abc import MutableMapping, MutableSequence
+from textwrap import dedent
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import rtoml
+import tomlkit
+from tomlkit.exceptions import ConvertError
+
+from compwa_policy.utilities.pyproject import ModifiablePyproject, has_dependency
+from compwa_policy.utilities.pyproject._lazy import LazyDocument, peek
+from compwa_policy.utilities.toml import to_inline_table, to_toml_array
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_SOURCE = dedent("""
+    [project]
+    name = 'my-package'
+    dependencies = ["attrs", "sympy>=1.10"]
+
+    [dependency-groups]
+    style = [
+        "ruff",  # linter
+        { include-group = "types" },
+    ]
+    types = ["types-PyYAML"]
+
+    [[tool.tombi.schemas]]
+    root = "tool.x"
+    path = "x.json"
+
+    [tool.ruff]
+    preview = true
+""").lstrip()
+
+
+def _render_like_tomlkit(edit: Callable[[MutableMapping[str, Any]], None]) -> str:
+    """Apply *edit* to a `.LazyDocument` and check that it renders like tomlkit."""
+    expected = tomlkit.loads(_SOURCE)
+    edit(expected)
+    document = LazyDocument(rtoml.loads(_SOURCE), lambda: tomlkit.loads(_SOURCE))
+    edit(document.root)
+    assert tomlkit.dumps(document.roundtrip) == tomlkit.dumps(expected)
+    return tomlkit.dumps(expected)
+
+
+def describe_lazy_document():
+    def reads_without_building_the_tomlkit_document():
+        pyproject = ModifiablePyproject.load(_SOURCE)
+        with pyproject:
+            assert pyproject.get_package_name() == "my-package"
+            ruff = pyproject.get_table("tool.ruff", create=True)
+            assert ruff == {"preview": True}
+            assert pyproject.get_table("dependency-groups")["types"] == ["types-PyYAML"]
+            assert has_dependency(pyproject, "sympy")
+            ruff["preview"] = True
+            assert not pyproject.is_materialized
+            ruff["preview"] = False
+            assert pyproject.is_materialized
+        assert "preview = false" in pyproject.dumps()
+
+    def binds_earlier_views_to_the_modified_document():
+        def edit(document: MutableMapping[str, Any]) -> None:
+            tool = document["tool"]
+            groups = document["dependency-groups"]
+            dependencies = document["project"]["dependencies"]
+            tool["ruff"]["preview"] = False
+            dependencies.append("numpy")
+            groups["style"].insert(1, "ty")
+            del groups["types"]
+
+        rendered = _render_like_tomlkit(edit)
+        assert 'dependencies = ["attrs", "sympy>=1.10", "numpy"]' in rendered
+        assert '"ruff",  # linter\n    "ty",' in rendered
+
+    def keeps_the_formatting_of_values_that_are_written_back():
+        def edit(document: MutableMapping[str, Any]) -> None:
+            groups = document["dependency-groups"]
+            tombi = document["tool"]["tombi"]
+            document["project"]["name"] = "my-package"
+            groups["lint"] = to_toml_array(groups["style"])
+            tombi["schemas"] = [*tombi["schemas"], {"root": "tool.y", "path": "y"}]
+
+        rendered = _render_like_tomlkit(edit)
+        assert "lint = [\n" in rendered
+        assert '{ include-group = "types" }' in rendered
+        assert rendered.count("[[tool.tombi.schemas]]") == 2
+
+    def returns_views_that_are_not_dict_or_list_instances():
+        def count_tables(table: Any) -> int:
+            """Count sub-tables like a caller that checks for a `dict`."""
+            return sum(isinstance(value, dict) for value in table.values())
+
+        document = LazyDocument(rtoml.loads(_SOURCE), lambda: tomlkit.loads(_SOURCE))
+        tool = document.root["tool"]
+        schemas = tool["tombi"]["schemas"]
+        assert isinstance(tool, MutableMapping)
+        assert isinstance(schemas, MutableSequence)
+        assert not isinstance(tool, dict)
+        assert not isinstance(schemas, list)
+        assert count_tables(document.root) == 0
+        assert count_tables(peek(document.root)) == 3
+        assert isinstance(peek(schemas), list)
+        assert not document.is_materialized
+
+    def does_not_register_a_tomlkit_encoder():
+        document = LazyDocument(rtoml.loads(_SOURCE), lambda: tomlkit.loads(_SOURCE))
+        dependencies = document.root["project"]["dependencies"]
+        with pytest.raises(ConvertError):
+            tomlkit.item(dependencies)
+        table = to_inline_table({"dependencies": dependencies})
+        assert table.as_string() == '{ dependencies = ["attrs", "sympy>=1.10"] }'
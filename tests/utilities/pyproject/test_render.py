@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from textwrap import dedent
+from typing import TYPE_CHECKING
+
+import rtoml
+import tomlkit
+from tomlkit.container import Container
+
+from compwa_policy.utilities.pyproject import ModifiablePyproject
+from compwa_policy.utilities.pyproject._lazy import LazyDocument, resolve_view
+from compwa_policy.utilities.toml import to_toml_array
+
+if TYPE_CHECKING:
+    import pytest
+    from tomlkit.items import Key, Table
+
+_SOURCE = dedent("""
+    [project]
+    name = "my-package"
+    dependencies = ["attrs"]
+
+    [dependency-groups]
+    dev = ["ruff"]
+    test = ["pytest"]
+
+    [tool.mypy]
+    strict = true
+
+    [tool.ruff]
+    preview = true
+    [tool.ruff.lint]
+    select = ["ALL"]
+
+    [[tool.tombi.schemas]]
+    root = "tool.x"
+""").lstrip()
+
+
+def _load() -> LazyDocument:
+    return LazyDocument(rtoml.loads(_SOURCE), lambda: tomlkit.loads(_SOURCE), _SOURCE)
+
+
+def describe_incremental_renderer():
+    def renders_only_the_tables_that_were_touched(monkeypatch: pytest.MonkeyPatch):
+        document = _load()
+        document.root["dependency-groups"]["dev"].append("ty")
+        expected = document.roundtrip.as_string()
+        assert document.dumps() == expected
+        rendered: list[str] = []
+        render_table = Container._render_table
+
+        def recording_render_table(
+            self: Container, key: Key, table: Table, prefix: str | None = None
+        ) -> str:
+            rendered.append(key.as_string())
+            return render_table(self, key, table, prefix)
+
+        monkeypatch.setattr(Container, "_render_table", recording_render_table)
+        assert document.dumps() == expected
+        assert rendered == []
+        document.root["tool"]["ruff"]["lint"]["select"] = ["E", "F"]
+        rendered_text = document.dumps()
+        assert rendered == ["ruff", "lint"]
+        assert rendered_text == document.roundtrip.as_string()
+
+    def renders_like_tomlkit_after_each_modification():
+        document = _load()
+        root = document.root
+        dev = root["dependency-groups"]["dev"]
+        edits = [
+            lambda: dev.insert(0, "mypy"),
+            lambda: root["tool"].__setitem__("pyright", {"strict": ["src"]}),
+            lambda: root["tool"]["ruff"].pop("lint"),
+            lambda: root["dependency-groups"].__delitem__("test"),
+            lambda: root.__setitem__("build-system", {"requires": ["hatchling"]}),
+            lambda: root["tool"]["tombi"]["schemas"].append({"root": "tool.y"}),
+            lambda: root["project"].__setitem__("name", "other"),
+        ]
+        for edit in edits:
+            edit()
+            assert document.dumps() == document.roundtrip.as_string()
+
+    def renders_items_that_are_modified_outside_the_views():
+        document = _load()
+        groups = document.root["dependency-groups"]
+        groups["lint"] = to_toml_array(groups["dev"])
+        assert document.dumps() == document.roundtrip.as_string()
+        dev = resolve_view(groups["dev"])
+        mypy = resolve_view(document.root["tool"]["mypy"])
+        document.root["tool"]["mypy"] = mypy
+        assert document.dumps() == document.roundtrip.as_string()
+        dev.append("ty")
+        mypy["strict"] = False
+        rendered = document.dumps()
+        assert rendered == document.roundtrip.as_string()
+        assert 'dev = ["ruff", "ty"]' in rendered
+        assert "strict = false" in rendered
+
+    def returns_the_source_of_an_unmodified_document():
+        pyproject = ModifiablePyproject.load(_SOURCE.replace(" = ", "="))
+        assert pyproject.dumps() == _SOURCE.replace(" = ", "=")
+        assert not pyproject.is_materialized
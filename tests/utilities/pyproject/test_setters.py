@@ -6,8 +6,10 @@ import tomlkit
 from compwa_policy.utilities.pyproject import load_pyproject_toml
 from compwa_policy.utilities.pyproject._struct import PyprojectTOML
 from compwa_policy.utilities.pyproject.setters import (
+    add_dependencies,
     add_dependency,
     create_sub_table,
+    remove_dependencies,
     remove_dependency,
 )
 
@@ -111,6 +113,37 @@ def describe_add_dependency():
         assert new_content == expected
 
 
+def describe_add_dependencies():
+    def adds_packages_that_are_not_listed_yet():
+        src = dedent("""
+            [project]
+            name = "my-package"
+
+            [dependency-groups]
+            dev = [{include-group = "test"}]
+            test = ["pytest"]
+        """)
+        pyproject = load_pyproject_toml(src, modifiable=True)
+        added = add_dependencies(
+            pyproject, ["pytest", "pytest-cov", "ruff", "ruff"], dependency_group="test"
+        )
+        assert added == ["pytest-cov", "ruff"]
+        new_content = tomlkit.dumps(pyproject)
+        expected = dedent("""
+            [project]
+            name = "my-package"
+
+            [dependency-groups]
+            dev = [{include-group = "test"}]
+            test = [
+                "pytest",
+                "pytest-cov",
+                "ruff",
+            ]
+        """)
+        assert new_content == expected
+
+
 def describe_remove_dependency():
     def removes_from_main_dependencies(pyproject_example: PyprojectTOML):
         remove_dependency(pyproject_example, "attrs")
@@ -146,6 +179,24 @@ def describe_remove_dependency():
         assert new_content == expected
 
 
+def describe_remove_dependencies():
+    def removes_packages_from_each_section(pyproject_example: PyprojectTOML):
+        removed = remove_dependencies(
+            pyproject_example, ["ruff", "black", "mypy"], ignored_sections=["style"]
+        )
+        assert removed == ["ruff", "mypy"]
+        new_content = tomlkit.dumps(pyproject_example)
+        expected = dedent("""
+            [project]
+            name = "my-package"
+            dependencies = ["attrs"]
+
+            [project.optional-dependencies]
+            style = ["ruff"]
+        """)
+        assert new_content == expected
+
+
 def describe_create_sub_table():
     @pytest.mark.parametrize("table_key", ["project", "project.optional-dependencies"])
     def creates_table(table_key: str):
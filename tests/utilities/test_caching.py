@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import importlib
+import inspect
+import pkgutil
+from typing import TYPE_CHECKING
+
+import compwa_policy
+from compwa_policy.characterization import has_notebooks
+from compwa_policy.utilities.caching import (
+    clear_repository_caches,
+    get_repository_cache_dir,
+    get_repository_caches,
+    get_user_cache_dir,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    import pytest
+
+_INDEPENDENT_CACHES = {
+    "compwa_policy.cli._memo._hash_source_files",
+    "compwa_policy.utilities.check_hook._compile",
+    "compwa_policy.utilities.check_hook._import_check_hook",
+    "compwa_policy.utilities.match._compile_alternation",
+    "compwa_policy.utilities.match._compile_pathspec",
+    "compwa_policy.utilities.match._pattern_regex",
+    "compwa_policy.utilities.precommit.getters.compile_pattern",
+    "compwa_policy.utilities.precommit.struct._get_required_keys",
+    "compwa_policy.utilities.pyproject.setters._get_dependency_name",
+    "compwa_policy.utilities.templates._get_jinja_environment",
+}
+"""Cached functions whose results do not depend on the working directory."""
+
+
+def _collect_cached_functions() -> dict[str, object]:
+    cached_functions: dict[str, object] = {}
+    modules = pkgutil.walk_packages(compwa_policy.__path__, "compwa_policy.")
+    for module_info in modules:
+        module = importlib.import_module(module_info.name)
+        for name, value in inspect.getmembers(
+            module, lambda v: hasattr(v, "cache_clear")
+        ):
+            if getattr(value, "__module__", None) == module.__name__:
+                cached_functions[f"{module.__name__}.{name}"] = value
+    return cached_functions
+
+
+def describe_repository_cache():
+    def registers_every_cache_that_depends_on_the_repository():
+        cached_functions = _collect_cached_functions()
+        registered = set(map(id, get_repository_caches()))
+        unregistered = {
+            name
+            for name, function in cached_functions.items()
+            if id(function) not in registered
+        }
+        assert unregistered == _INDEPENDENT_CACHES
+
+    def forgets_results_of_the_previous_repository(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        git_init: Callable[[Path], None],
+    ):
+        git_init(tmp_path)
+        monkeypatch.chdir(tmp_path)
+        clear_repository_caches()
+        assert not has_notebooks()
+        (tmp_path / "demo.ipynb").write_text("{}")
+        assert not has_notebooks()
+        clear_repository_caches()
+        assert has_notebooks()
+
+
+def describe_get_user_cache_dir():
+    def respects_xdg_cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert get_user_cache_dir() == tmp_path / "compwa-policy"
+
+    def defaults_to_home_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv("XDG_CACHE_HOME")
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert get_user_cache_dir() == tmp_path / ".cache" / "compwa-policy"
+
+
+def describe_get_repository_cache_dir():
+    def is_outside_the_repository(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        monkeypatch.chdir(first)
+        directory = get_repository_cache_dir()
+        assert directory.is_relative_to(tmp_path / "cache" / "compwa-policy")
+        assert directory == get_repository_cache_dir(first)
+        assert directory != get_repository_cache_dir(second)
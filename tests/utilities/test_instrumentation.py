@@ -0,0 +1,96 @@
+import json
+import subprocess  # noqa: S404
+import threading
+from pathlib import Path
+
+from compwa_policy.utilities.check_hook import CheckContext, CheckHook
+from compwa_policy.utilities.instrumentation import (
+    HookProfile,
+    get_profiler,
+    measure,
+    profiling,
+    to_chrome_trace,
+    to_json,
+)
+from compwa_policy.utilities.parse_cache import ParseCache
+
+
+def describe_profiling():
+    def is_disabled_by_default():
+        assert get_profiler() is None
+        with profiling(enabled=False) as profiler:
+            assert profiler is None
+            with measure("noop"):
+                pass
+
+    def counts_files_and_subprocesses(tmp_path: Path):
+        path = tmp_path / "config.txt"
+        with profiling() as profiler:
+            assert profiler is not None
+            with measure("step"):
+                path.write_text("a = 1\n")
+                path.read_text()
+                cache = ParseCache()
+                cache.parse(path, "text", bytes.decode)
+                cache.parse(path, "text", bytes.decode)
+                subprocess.run(["git", "--version"], check=True, capture_output=True)  # noqa: S607
+        assert get_profiler() is None
+        (profile,) = profiler.profiles
+        assert profile.name == "step"
+        assert profile.files_written == 1
+        assert profile.files_read == 3
+        assert profile.files_parsed == 1
+        assert profile.subprocesses == ("git --version",)
+        assert profile.wall_time >= profile.cpu_time >= 0
+
+    def only_counts_activity_of_the_measuring_thread(tmp_path: Path):
+        path = tmp_path / "file.txt"
+        path.write_text("")
+        started, finished = threading.Event(), threading.Event()
+
+        def read_in_background() -> None:
+            started.wait(timeout=5)
+            path.read_text()
+            finished.set()
+
+        thread = threading.Thread(target=read_in_background)
+        thread.start()
+        with profiling() as profiler, measure("idle"):
+            started.set()
+            finished.wait(timeout=5)
+        thread.join()
+        assert profiler is not None
+        assert profiler.profiles[0].files_read == 0
+
+    def records_check_hook_calls():
+        def run(*_: object) -> None:
+            pass
+
+        hook = CheckHook("repo", run)
+        context = CheckContext(False, False, [], {})
+        with profiling() as profiler:
+            hook(None, None, context)  # type: ignore[arg-type]
+        assert profiler is not None
+        assert [p.name for p in profiler.profiles] == [
+            "tests.utilities.test_instrumentation"
+        ]
+
+
+def describe_to_json():
+    def is_serializable():
+        profile = HookProfile("repo.citation", 0.0, 0.1, 0.05, subprocesses=("git",))
+        data = json.loads(json.dumps(to_json([profile])))
+        assert data[0]["name"] == "repo.citation"
+        assert data[0]["subprocesses"] == ["git"]
+
+
+def describe_to_chrome_trace():
+    def names_threads():
+        trace = to_chrome_trace([
+            HookProfile("a", 0.0, 0.1, 0.1, thread="MainThread"),
+            HookProfile("b", 0.0, 0.1, 0.1, thread="check_0"),
+        ])
+        metadata = [e for e in trace["traceEvents"] if e["ph"] == "M"]
+        events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        assert [e["args"]["name"] for e in metadata] == ["MainThread", "check_0"]
+        assert [e["tid"] for e in events] == [0, 1]
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import subprocess  # noqa: S404
+from typing import TYPE_CHECKING
+
+import pytest
+
+from compwa_policy.utilities.match import (
+    RepositoryIndex,
+    matches_files,
+    select_matching_patterns,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+def describe_repository_index():
+    @pytest.fixture
+    def index(tmp_path: Path, git_commit: Callable[[Path], None]) -> RepositoryIndex:
+        (tmp_path / "docs" / "api").mkdir(parents=True)
+        (tmp_path / "docs" / "conf.py").touch()
+        (tmp_path / "docs" / "api" / "index.md").touch()
+        (tmp_path / "pyproject.toml").touch()
+        (tmp_path / ".gitignore").write_text("*.log\n")
+        git_commit(tmp_path)
+        (tmp_path / "README.md").touch()
+        (tmp_path / "debug.log").touch()
+        return RepositoryIndex.load(str(tmp_path))
+
+    @pytest.mark.parametrize(
+        ("pathspecs", "untracked"),
+        [
+            ((), False),
+            ((), True),
+            (("docs",), False),
+            (("docs/",), False),
+            (("*.md",), False),
+            (("*.md",), True),
+            (("**/*.md",), True),
+            (("docs/*.py",), False),
+            (("pyproject.toml", "docs/conf.py"), False),
+            (("*", ":!:docs"), True),
+            (("*", ":(exclude)*.toml"), True),
+            (("missing/*.py",), True),
+        ],
+    )
+    def matches_git_ls_files(
+        index: RepositoryIndex,
+        tmp_path: Path,
+        pathspecs: tuple[str, ...],
+        untracked: bool,
+    ):
+        command = ["git", "ls-files"]
+        if untracked:
+            command += ["--cached", "--others", "--exclude-standard"]
+        output = subprocess.check_output(  # noqa: S603
+            [*command, *pathspecs], cwd=tmp_path
+        ).decode()
+        expected = sorted(output.splitlines())
+        assert index.git_ls_files(*pathspecs, untracked=untracked) == expected
+
+    def distinguishes_untracked_files(index: RepositoryIndex):
+        assert not index.is_committed("README.md")
+        assert index.is_committed("README.md", untracked=True)
+        assert not index.is_committed("debug.log", untracked=True)
+
+    def is_dir(index: RepositoryIndex):
+        assert index.is_dir("docs")
+        assert index.is_dir("docs/api/")
+        assert not index.is_dir("docs/conf.py")
+        assert not index.is_dir("src")
+
+    def add_untracked(index: RepositoryIndex):
+        assert not index.is_committed(".github/workflows/*.yml", untracked=True)
+        index.add_untracked(".github/workflows/ci.yml")
+        assert index.is_committed(".github/workflows/*.yml", untracked=True)
+        assert not index.is_committed(".github/workflows/*.yml")
+        assert index.git_ls_files("docs") == ["docs/api/index.md", "docs/conf.py"]
+
+
+def describe_select_matching_patterns():
+    @pytest.mark.parametrize(
+        "files",
+        [
+            [],
+            ["pyproject.toml"],
+            [".cspell.json", "docs/conf.py", "docs/_build/html/index.html"],
+            ["./src/package/__init__.py", "tests/.vscode/settings.json", "uv.lock"],
+        ],
+    )
+    def is_equivalent_to_matching_each_pattern(files: list[str]):
+        patterns = [
+            "",
+            "# comment",
+            "!*.lock",
+            "**/*.json",
+            "**/*.py",
+            "*.lock",
+            "**/.vscode/**",
+            "/pyproject.toml",
+            "docs/",
+            "docs/_build",
+            "src/*/__init__.py",
+            "**/*.json",
+        ]
+        expected = [pattern for pattern in patterns if matches_files(pattern, files)]
+        assert select_matching_patterns(patterns, files) == expected
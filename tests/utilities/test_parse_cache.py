@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import os
+import stat
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from compwa_policy.utilities.parse_cache import ParseCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class CountingParser:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, content: bytes) -> Any:
+        self.calls += 1
+        return json.loads(content)
+
+
+def describe_parse_cache():
+    @pytest.fixture
+    def path(tmp_path: Path) -> Path:
+        path = tmp_path / "config.json"
+        path.write_text('{"key": ["value"]}')
+        return path
+
+    def parses_each_content_once_per_flavor(path: Path):
+        cache = ParseCache()
+        parser = CountingParser()
+        first = cache.parse(path, "json", parser)
+        assert cache.parse(path, "json", parser) is first
+        assert parser.calls == 1
+        cache.parse(path, "other-json", parser)
+        assert parser.calls == 2
+
+    def reparses_modified_content(path: Path):
+        cache = ParseCache()
+        parser = CountingParser()
+        cache.parse(path, "json", parser)
+        path.write_text('{"key": []}')
+        assert cache.parse(path, "json", parser) == {"key": []}
+        assert parser.calls == 2
+
+    def copies_mutable_results(path: Path):
+        cache = ParseCache()
+        parser = CountingParser()
+        first = cache.parse(path, "json", parser, mutable=True)
+        first["key"].append("modified")
+        second = cache.parse(path, "json", parser, mutable=True)
+        assert second == {"key": ["value"]}
+        assert parser.calls == 1
+
+    def persists_mutable_results(path: Path, tmp_path: Path):
+        directory = tmp_path / ".cache"
+        parser = CountingParser()
+        ParseCache(directory).parse(path, "json", parser, mutable=True)
+        assert stat.S_IMODE(directory.stat().st_mode) == 0o700
+        assert len(list(directory.glob("*.pickle"))) == 1
+
+        result = ParseCache(directory).parse(path, "json", parser, mutable=True)
+        assert result == {"key": ["value"]}
+        assert parser.calls == 1
+
+    def does_not_persist_shared_results(path: Path, tmp_path: Path):
+        directory = tmp_path / ".cache"
+        ParseCache(directory).parse(path, "json", CountingParser())
+        assert not directory.exists()
+
+    def ignores_corrupt_cache_files(path: Path, tmp_path: Path):
+        directory = tmp_path / ".cache"
+        ParseCache(directory).parse(path, "json", CountingParser(), mutable=True)
+        for pickled in directory.glob("*.pickle"):
+            pickled.write_bytes(b"corrupt")
+
+        parser = CountingParser()
+        result = ParseCache(directory).parse(path, "json", parser, mutable=True)
+        assert result == {"key": ["value"]}
+        assert parser.calls == 1
+
+    def skips_reading_files_with_unchanged_stamp(path: Path):
+        os.utime(path, ns=(0, 0))
+        cache = ParseCache()
+        parser = CountingParser()
+        first = cache.parse(path, "json", parser)
+        path.write_text('{"key": ["other"]}')
+        os.utime(path, ns=(0, 0))
+        assert cache.parse(path, "json", parser) is first
+        os.utime(path, ns=(1, 1))
+        assert cache.parse(path, "json", parser) == {"key": ["other"]}
+        assert parser.calls == 2
+
+    def reads_recently_modified_files(path: Path):
+        cache = ParseCache()
+        parser = CountingParser()
+        cache.parse(path, "json", parser)
+        mtime_ns = path.stat().st_mtime_ns
+        path.write_text('{"key": ["VALUE"]}')
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        assert cache.parse(path, "json", parser) == {"key": ["VALUE"]}
+        assert parser.calls == 2
+
+    def prunes_least_recently_used_files(path: Path, tmp_path: Path):
+        directory = tmp_path / ".cache"
+        cache = ParseCache(directory)
+        for index in range(3):
+            path.write_text(f'{{"key": {index}}}')
+            cache.parse(path, "json", CountingParser(), mutable=True)
+        files = sorted(directory.glob("*.pickle"))
+        now = time.time()
+        for age, pickled in enumerate(files):
+            os.utime(pickled, (now - age, now - age))
+        size = files[0].stat().st_size
+        cache.prune(max_size=2 * size)
+        assert sorted(directory.glob("*.pickle")) == files[:2]
+        cache.prune(max_age=timedelta(seconds=0.5))
+        assert sorted(directory.glob("*.pickle")) == files[:1]
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from compwa_policy.utilities.check_hook import FileSet, LazyCheckHook
+from compwa_policy.utilities.schedule import build_dependencies, run_in_parallel
+from compwa_policy.utilities.storage import MemoryStorage, get_storage, use_storage
+
+
+def _hook(files: FileSet, writes: FileSet | None = None) -> LazyCheckHook:
+    if writes is None:
+        return LazyCheckHook("module", group="repo", files=files)
+    return LazyCheckHook("module", group="repo", files=files, writes=writes)
+
+
+def describe_build_dependencies():
+    def orders_hooks_that_modify_the_same_file():
+        precommit = FileSet.create(".pre-commit-config.yaml")
+        hooks = [_hook(precommit, writes=precommit), _hook(precommit, writes=precommit)]
+        assert build_dependencies(hooks) == [frozenset(), frozenset({0})]
+
+    def orders_readers_after_earlier_writers_and_before_later_writers():
+        pyproject = FileSet.create("pyproject.toml")
+        hooks = [
+            _hook(pyproject, writes=pyproject),
+            _hook(pyproject),
+            _hook(pyproject, writes=pyproject),
+        ]
+        assert build_dependencies(hooks) == [
+            frozenset(),
+            frozenset({0}),
+            frozenset({0, 1}),
+        ]
+
+    def does_not_order_hooks_that_only_read_the_same_file():
+        pyproject = FileSet.create("pyproject.toml")
+        assert build_dependencies([_hook(pyproject), _hook(pyproject)]) == [
+            frozenset(),
+            frozenset(),
+        ]
+
+    def treats_directories_as_all_files_below_them():
+        hooks = [
+            _hook(
+                FileSet.create(directories=[".vscode"]),
+                writes=FileSet.create(directories=[".vscode"]),
+            ),
+            _hook(FileSet.create(".vscode/settings.json")),
+            _hook(FileSet.create(".envrc")),
+        ]
+        assert build_dependencies(hooks) == [frozenset(), frozenset({0}), frozenset()]
+
+
+def describe_run_in_parallel():
+    def runs_independent_tasks_concurrently():
+        barrier = threading.Barrier(2, timeout=5)
+        run_in_parallel(
+            [barrier.wait, barrier.wait],
+            [frozenset(), frozenset()],
+            max_workers=2,
+        )
+
+    def waits_for_dependencies():
+        finished: list[int] = []
+
+        def slow() -> None:
+            threading.Event().wait(0.05)
+            finished.append(0)
+
+        def dependent() -> None:
+            finished.append(1)
+
+        run_in_parallel([slow, dependent], [frozenset(), frozenset({0})], max_workers=2)
+        assert finished == [0, 1]
+
+    def raises_the_first_error_in_canonical_order():
+        started: list[int] = []
+
+        def task(position: int, error: bool = False):
+            def run() -> None:
+                started.append(position)
+                if error:
+                    msg = f"Task {position} failed"
+                    raise ValueError(msg)
+
+            return run
+
+        with pytest.raises(ValueError, match="Task 1 failed"):
+            run_in_parallel(
+                [task(0), task(1, error=True), task(2), task(3, error=True)],
+                [frozenset(), frozenset({0}), frozenset({1}), frozenset({0})],
+                max_workers=1,
+            )
+        assert sorted(started) == [0, 1, 3]
+
+    def runs_tasks_with_the_storage_of_the_caller():
+        storage = MemoryStorage({})
+        storages: list[object] = []
+
+        def task() -> None:
+            storages.append(get_storage())
+
+        with use_storage(storage):
+            run_in_parallel([task, task], [frozenset(), frozenset()], max_workers=2)
+        assert storages == [storage, storage]
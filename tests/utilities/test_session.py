@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import json
+import os
 from typing import TYPE_CHECKING, ClassVar
 
+import pytest
+
 from compwa_policy.repo.gitpod import _extract_extensions
 from compwa_policy.utilities import (
     append_safe,
@@ -17,10 +20,9 @@ from compwa_policy.utilities.resource import Changelog, ModifiableResource
 from compwa_policy.utilities.session import Session
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
-    import pytest
-
 
 class CountingResource(ModifiableResource):
     loads: ClassVar[int] = 0
@@ -120,6 +122,86 @@ def describe_session() -> None:
         assert not source.exists()
         assert renamed.read_text() == "keep\nadded\n"
 
+    def defers_permission_changes_until_flush(
+        tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        script = tmp_path / "postBuild"
+        script.write_text("#!/bin/bash\n")
+        script.chmod(0o644)
+
+        with Session() as session:
+            assert session.get_path(script).chmod(0o755)
+            assert not session.get_path(script).chmod(0o755)
+            assert not os.access(script, os.X_OK)
+
+        assert os.access(script, os.X_OK)
+
+    def orders_scoped_changes_by_position(
+        tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        with Session() as session:
+            with session.scope(1):
+                session.changelog.append("second check")
+                session.get_path("b.txt").write_text("b", "Wrote b.txt")
+            with session.scope(0):
+                session.changelog += ["first check"]
+                session.get_path("a.txt").write_text("a", "Wrote a.txt")
+                session.get_path("b.txt").read_text()
+            assert session.collect_changes() == [
+                "first check",
+                "second check",
+                "Wrote a.txt",
+                "Wrote b.txt",
+            ]
+
+    def answers_file_queries_with_pending_changes(
+        tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "existing.txt").write_text("old\n")
+        (tmp_path / "docs").mkdir()
+        with Session(dry_run=True) as session:
+            assert session.exists("existing.txt")
+            assert session.is_dir("docs")
+            assert not session.exists("binder/postBuild")
+            assert session.stat("existing.txt").st_size == 4
+
+            session.get_path("existing.txt").remove()
+            session.get_path("binder/postBuild").write_text("#!/bin/bash\n")
+            session.get_path("binder/postBuild").chmod(0o755)
+            assert not session.exists("existing.txt")
+            assert session.exists("binder/postBuild")
+            assert session.is_dir("binder")
+            assert not session.is_dir("binder/postBuild")
+            assert session.read_bytes("binder/postBuild") == b"#!/bin/bash\n"
+            assert session.stat("binder/postBuild").st_mode & 0o777 == 0o755
+            with pytest.raises(FileNotFoundError):
+                session.stat("existing.txt")
+
+        assert (tmp_path / "existing.txt").exists()
+        assert not (tmp_path / "binder").exists()
+
+    def lists_each_directory_once(
+        tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        listed: list[str] = []
+        scandir = os.scandir
+
+        def counting_scandir(path: Path) -> Iterator[os.DirEntry[str]]:
+            listed.append(str(path))
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+        session = Session()
+        for _ in range(3):
+            assert not session.exists("pyproject.toml")
+            assert not session.is_dir("docs")
+            assert not session.exists("docs/conf.py")
+        assert listed == [".", "docs"]
+
 
 def describe_pyproject_load() -> None:
     def uses_session_identity(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
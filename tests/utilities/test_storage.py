@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import os
+import stat
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from compwa_policy.github import release_drafter
+from compwa_policy.python import pyproject
+from compwa_policy.repo import readthedocs
+from compwa_policy.utilities.match import git_ls_files
+from compwa_policy.utilities.pyproject import Pyproject
+from compwa_policy.utilities.session import Session
+from compwa_policy.utilities.storage import (
+    GitTree,
+    MemoryStorage,
+    WorkingTree,
+    get_storage,
+    use_storage,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+_PYPROJECT = '[project]\nname = "demo"\n'
+
+
+def describe_memory_storage():
+    def lists_files_and_directories():
+        storage = MemoryStorage({"README.md": "# Demo\n", "docs/conf.py": b"x = 1\n"})
+        assert storage.list_directory(".") == {"README.md": False, "docs": True}
+        assert storage.list_directory("docs") == {"conf.py": False}
+        assert storage.list_directory("src") == {}
+        assert storage.is_dir("docs")
+        assert not storage.is_dir("README.md")
+        assert storage.stat("docs/conf.py").st_size == 6
+        assert storage.read_text("./docs/../README.md") == "# Demo\n"
+        with pytest.raises(FileNotFoundError):
+            storage.read_bytes("LICENSE")
+        with pytest.raises(IsADirectoryError):
+            storage.read_bytes("docs")
+
+    def replaces_the_working_tree_in_a_context():
+        storage = MemoryStorage({"pyproject.toml": _PYPROJECT, "docs/conf.py": ""})
+        assert isinstance(get_storage(), WorkingTree)
+        with use_storage(storage):
+            assert get_storage() is storage
+            assert Pyproject.load().get_package_name() == "demo"
+            assert git_ls_files("docs") == ["docs/conf.py"]
+        assert isinstance(get_storage(), WorkingTree)
+
+    def is_replaced_for_the_current_thread_only():
+        storage = MemoryStorage({})
+        replaced = threading.Event()
+        restored = threading.Event()
+
+        def use_in_background() -> None:
+            with use_storage(storage):
+                replaced.set()
+                restored.wait(timeout=5)
+
+        thread = threading.Thread(target=use_in_background)
+        thread.start()
+        replaced.wait(timeout=5)
+        try:
+            assert isinstance(get_storage(), WorkingTree)
+        finally:
+            restored.set()
+            thread.join()
+
+
+def describe_git_tree():
+    def reads_committed_files_without_checkout(
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        git_commit: Callable[[Path], None],
+    ):
+        (tmp_path / "pyproject.toml").write_text(_PYPROJECT)
+        script = tmp_path / "scripts" / "run.sh"
+        script.parent.mkdir()
+        script.write_text("#!/bin/sh\n")
+        script.chmod(0o755)
+        (tmp_path / "run.sh").symlink_to("scripts/run.sh")
+        git_commit(tmp_path)
+        (tmp_path / "pyproject.toml").write_text("# modified\n")
+        (tmp_path / "untracked.txt").touch()
+        monkeypatch.chdir(tmp_path)
+        with GitTree("HEAD") as tree:
+            assert tree.read_text("pyproject.toml") == _PYPROJECT
+            assert tree.read_text("run.sh") == "#!/bin/sh\n"
+            assert tree.read_bytes(tmp_path / "scripts" / "run.sh") == b"#!/bin/sh\n"
+            assert stat.S_IMODE(tree.stat("scripts/run.sh").st_mode) == 0o755
+            assert tree.is_dir("scripts")
+            assert tree.list_directory(".") == {
+                "pyproject.toml": False,
+                "run.sh": False,
+                "scripts": True,
+            }
+            assert not tree.exists("untracked.txt")
+            index = tree.load_repository_index()
+            assert index.git_ls_files("*.sh") == ["run.sh", "scripts/run.sh"]
+
+    def rejects_unknown_revisions(tmp_path: Path, git_commit: Callable[[Path], None]):
+        git_commit(tmp_path)
+        with pytest.raises(ValueError, match=r"Cannot read the files of 'unknown'"):
+            GitTree("unknown", directory=tmp_path)
+
+
+def describe_session_on_storage():
+    def renders_changes_against_stored_files(
+        tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        storage = MemoryStorage({"README.md": "# Demo\n", "docs/conf.py": "x = 1\n"})
+        with Session(dry_run=True, storage=storage) as session:
+            readme = session.get_path("README.md")
+            assert readme.read_text() == "# Demo\n"
+            readme.write_text("# Demo project\n", message="Renamed project")
+            session.get_path("docs").remove(message="Removed docs")
+            assert session.read_bytes("README.md") == b"# Demo project\n"
+            assert not session.exists("docs")
+            assert session.flush() == ["Renamed project", "Removed docs"]
+            diff = session.diff()
+        assert "-# Demo\n+# Demo project\n" in diff
+        assert "--- a/docs/conf.py\n+++ /dev/null\n" in diff
+        assert os.listdir(tmp_path) == []
+
+    def probes_only_the_stored_files(
+        tmp_path: Path, monkeypatch: pytest.MonkeyPatch, run_check
+    ):
+        monkeypatch.chdir(tmp_path)
+        storage = MemoryStorage({
+            ".readthedocs.yml": "version: 2\n",
+            "docs/conf.py": "project = 'demo'\n",
+            "pyproject.toml": _PYPROJECT + 'requires-python = ">=3.12"\n',
+            "tests/test_demo.py": "",
+        })
+        with use_storage(storage), Session(dry_run=True) as session:
+            run_check(pyproject.check, session)
+            run_check(readthedocs.check, session)
+            config = release_drafter._get_expected_config(session, "demo", "Demo", "x")
+            diff = session.diff()
+        assert "Programming Language :: Python :: 3.12" in diff
+        assert "+  configuration: docs/conf.py\n" in diff
+        assert "https://demo.rtfd.io" in config["template"]
+        assert os.listdir(tmp_path) == []
+
+    def has_to_be_a_dry_run():
+        with pytest.raises(ValueError, match=r"must be a dry run"):
+            Session(storage=MemoryStorage({}))
@@ -0,0 +1,98 @@
+import json
+from pathlib import Path
+
+import pytest
+import tomlkit
+from ruamel.yaml.comments import CommentedMap
+
+from compwa_policy.utilities import COMPWA_POLICY_DIR, yaml
+from compwa_policy.utilities.instrumentation import measure, profiling
+from compwa_policy.utilities.templates import (
+    get_template_cache,
+    load_json_template,
+    load_toml_template,
+    load_yaml_template,
+    read_template,
+    render_template,
+)
+from compwa_policy.utilities.yaml import create_prettier_round_trip_yaml
+
+_CI_WORKFLOW = Path(".github/workflows/ci.yml")
+
+
+def describe_load_yaml_template():
+    def parses_like_the_round_trip_parser():
+        expected = create_prettier_round_trip_yaml().load(
+            COMPWA_POLICY_DIR / _CI_WORKFLOW
+        )
+        template = load_yaml_template(_CI_WORKFLOW)
+        assert isinstance(template, CommentedMap)
+        assert template == expected
+
+    def hands_out_independent_copies():
+        first = load_yaml_template(_CI_WORKFLOW)
+        first["jobs"].clear()
+        second = load_yaml_template(_CI_WORKFLOW)
+        assert second["jobs"]
+        assert first is not second
+
+    def parses_each_template_once():
+        get_template_cache().clear()
+        with profiling() as profiler, measure("templates"):
+            for _ in range(3):
+                load_yaml_template(_CI_WORKFLOW)
+        assert profiler is not None
+        assert profiler.profiles[0].files_parsed == 1
+
+    def persists_parsed_templates(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        cache = get_template_cache()
+        cache.clear()
+        cache.directory = tmp_path
+        load_yaml_template(_CI_WORKFLOW)
+        assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+        def fail_to_parse(_: bytes) -> None:
+            msg = "The template should not be parsed again"
+            raise AssertionError(msg)
+
+        parser = create_prettier_round_trip_yaml()
+        monkeypatch.setattr(parser, "load", fail_to_parse)
+        monkeypatch.setattr(yaml, "create_prettier_round_trip_yaml", lambda: parser)
+        cache.clear()
+        assert load_yaml_template(_CI_WORKFLOW)["jobs"]
+
+
+def describe_load_json_template():
+    def hands_out_independent_copies():
+        path = Path(".template/.cspell.json")
+        first = load_json_template(path)
+        assert first == json.loads((COMPWA_POLICY_DIR / path).read_text())
+        first.clear()
+        assert load_json_template(path)
+
+
+def describe_load_toml_template():
+    def hands_out_independent_copies():
+        path = Path(".template/.taplo.toml")
+        first = load_toml_template(path)
+        assert first == tomlkit.loads((COMPWA_POLICY_DIR / path).read_text())
+        del first["exclude"]
+        assert "exclude" in load_toml_template(path)
+
+
+def describe_read_template():
+    def reads_package_files():
+        content = read_template(".github/workflows/pr-linting.yml")
+        assert (
+            content
+            == (COMPWA_POLICY_DIR / ".github/workflows/pr-linting.yml").read_text()
+        )
+
+
+def describe_render_template():
+    def renders_jinja_templates():
+        content = render_template(
+            "CONTRIBUTING.md.jinja",
+            {"ORGANIZATION": "ComPWA", "REPO_NAME": "policy", "RUNNER": ""},
+        )
+        assert "ComPWA/policy" in content
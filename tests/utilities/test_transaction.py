@@ -0,0 +1,211 @@
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from compwa_policy.utilities.instrumentation import measure, profiling
+from compwa_policy.utilities.session import Session
+from compwa_policy.utilities.transaction import FileTransaction
+
+
+def _list_files(directory: Path) -> list[str]:
+    return sorted(str(p.relative_to(directory)) for p in directory.rglob("*"))
+
+
+def describe_file_transaction():
+    def writes_nothing_before_commit(tmp_path: Path):
+        path = tmp_path / "pyproject.toml"
+        path.write_text("old\n")
+        transaction = FileTransaction()
+        transaction.write_text(path, "new\n")
+        transaction.write_text(tmp_path / "sub" / "new.txt", "content\n")
+        assert path.read_text() == "old\n"
+        assert not (tmp_path / "sub" / "new.txt").exists()
+        transaction.commit()
+        assert path.read_text() == "new\n"
+        assert (tmp_path / "sub" / "new.txt").read_text() == "content\n"
+        assert _list_files(tmp_path) == ["pyproject.toml", "sub", "sub/new.txt"]
+
+    def rolls_back_on_errors(tmp_path: Path):
+        path = tmp_path / "pyproject.toml"
+        path.write_text("old\n")
+        obsolete = tmp_path / "obsolete.txt"
+        obsolete.touch()
+
+        def interrupt() -> None:
+            with FileTransaction() as transaction:
+                transaction.write_text(path, "new\n")
+                transaction.remove(obsolete)
+                msg = "interrupted"
+                raise RuntimeError(msg)
+
+        with pytest.raises(RuntimeError, match="interrupted"):
+            interrupt()
+        assert path.read_text() == "old\n"
+        assert _list_files(tmp_path) == ["obsolete.txt", "pyproject.toml"]
+
+    def removes_temporary_files_if_a_replacement_fails(
+        tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        replace = os.replace
+        replaced: list[str] = []
+
+        def failing_replace(source: Path, target: Path) -> None:
+            if replaced:
+                msg = "disk full"
+                raise OSError(msg)
+            replace(source, target)
+            replaced.append(Path(target).name)
+
+        monkeypatch.setattr(os, "replace", failing_replace)
+        transaction = FileTransaction()
+        for name in ["a.txt", "b.txt", "c.txt"]:
+            transaction.write_text(tmp_path / name, "new\n")
+        with pytest.raises(OSError, match="disk full"):
+            transaction.commit()
+        assert _list_files(tmp_path) == replaced
+
+    def removes_files_and_directories(tmp_path: Path):
+        directory = tmp_path / ".constraints"
+        directory.mkdir()
+        (directory / "py3.12.txt").touch()
+        file = tmp_path / "uv.lock"
+        file.touch()
+        with FileTransaction() as transaction:
+            transaction.remove(directory)
+            transaction.remove(file)
+            transaction.remove(tmp_path / "missing.txt")
+        assert not _list_files(tmp_path)
+
+    def keeps_the_last_staged_change(tmp_path: Path):
+        path = tmp_path / "README.md"
+        with FileTransaction() as transaction:
+            transaction.write_text(path, "first\n")
+            transaction.remove(path)
+            transaction.write_text(path, "second\n")
+        assert path.read_text() == "second\n"
+        assert _list_files(tmp_path) == ["README.md"]
+
+    def preserves_permissions(tmp_path: Path):
+        script = tmp_path / "postBuild"
+        script.write_text("old\n")
+        script.chmod(0o750)
+        made_executable = tmp_path / "apt.sh"
+        with FileTransaction() as transaction:
+            transaction.write_text(script, "new\n")
+            transaction.write_text(made_executable, "", mode=0o755)
+        assert stat.S_IMODE(script.stat().st_mode) == 0o750
+        assert os.access(made_executable, os.X_OK)
+
+    def writes_through_symbolic_links(tmp_path: Path):
+        target = tmp_path / "CONTRIBUTING.md"
+        target.write_text("old\n")
+        link = tmp_path / "docs.md"
+        link.symlink_to(target)
+        with FileTransaction() as transaction:
+            transaction.write_text(link, "new\n")
+        assert link.is_symlink()
+        assert target.read_text() == "new\n"
+
+    def reports_bytes_written(tmp_path: Path):
+        with profiling() as profiler, measure("(flush)"):
+            with FileTransaction() as transaction:
+                transaction.write_text(tmp_path / "a.txt", "abc")
+                transaction.write_bytes(tmp_path / "b.txt", b"\x00" * 10)
+            assert transaction.written == {
+                tmp_path / "a.txt": 3,
+                tmp_path / "b.txt": 10,
+            }
+        assert profiler is not None
+        assert profiler.profiles[0].bytes_written == 13
+
+    def renders_staged_changes_as_diff(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.chdir(tmp_path)
+        Path("README.md").write_text("# Title\nold\n")
+        Path("obsolete.txt").write_text("gone\n")
+        transaction = FileTransaction()
+        transaction.write_text("README.md", "# Title\nnew\n")
+        transaction.write_text("new.txt", "added\n")
+        transaction.remove("obsolete.txt")
+        assert transaction.diff() == (
+            "--- a/README.md\n"
+            "+++ b/README.md\n"
+            "@@ -1,2 +1,2 @@\n"
+            " # Title\n"
+            "-old\n"
+            "+new\n"
+            "--- /dev/null\n"
+            "+++ b/new.txt\n"
+            "@@ -0,0 +1 @@\n"
+            "+added\n"
+            "--- a/obsolete.txt\n"
+            "+++ /dev/null\n"
+            "@@ -1 +0,0 @@\n"
+            "-gone\n"
+        )
+        transaction.rollback()
+        assert _list_files(tmp_path) == ["README.md", "obsolete.txt"]
+
+    def renders_mode_changes_as_diff(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.chdir(tmp_path)
+        Path("apt.sh").write_text("apt install\n")
+        Path("apt.sh").chmod(0o644)
+        transaction = FileTransaction()
+        transaction.write_text("apt.sh", "apt install\n", mode=0o755)
+        transaction.write_text("postBuild", "", mode=0o755)
+        assert transaction.diff() == (
+            "diff --git a/apt.sh b/apt.sh\n"
+            "old mode 100644\n"
+            "new mode 100755\n"
+            "diff --git a/postBuild b/postBuild\n"
+            "new file mode 100755\n"
+        )
+        transaction.rollback()
+
+
+def describe_session_flush():
+    def records_bytes_per_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "unchanged.txt").write_text("same")
+        with Session() as session:
+            session.get_path("unchanged.txt").write_text("same")
+            session.get_path("changed.txt").write_text("12345")
+        assert session.written == {Path("changed.txt"): 5}
+        assert _list_files(tmp_path) == ["changed.txt", "unchanged.txt"]
+
+    def writes_nothing_in_a_dry_run(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "README.md").write_text("old\n")
+        with Session(dry_run=True) as session:
+            session.get_path("README.md").write_text("new\n", "Updated README.md")
+            session.get_path("new.txt").write_text("added\n")
+            assert session.flush() == ["Updated README.md"]
+        assert session.diff() == (
+            "--- a/README.md\n"
+            "+++ b/README.md\n"
+            "@@ -1 +1 @@\n"
+            "-old\n"
+            "+new\n"
+            "--- /dev/null\n"
+            "+++ b/new.txt\n"
+            "@@ -0,0 +1 @@\n"
+            "+added\n"
+        )
+        assert not session.written
+        assert _list_files(tmp_path) == ["README.md"]
+        assert (tmp_path / "README.md").read_text() == "old\n"
+
+    def renders_permission_changes_in_a_dry_run(
+        tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "postBuild").write_text("pip install\n")
+        (tmp_path / "postBuild").chmod(0o644)
+        with Session(dry_run=True) as session:
+            session.get_path("postBuild").chmod(0o755, "Made postBuild executable")
+            assert session.flush() == ["Made postBuild executable"]
+        assert session.diff() == (
+            "diff --git a/postBuild b/postBuild\nold mode 100644\nnew mode 100755\n"
+        )
+        assert not os.access(tmp_path / "postBuild", os.X_OK)